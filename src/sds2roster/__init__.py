@@ -4,12 +4,39 @@ __version__ = "0.1.0"
 __author__ = "SDS2Roster Team"
 __license__ = "MIT"
 
-from sds2roster.converter import SDSToOneRosterConverter
-from sds2roster.models.sds import SDSDataModel
-from sds2roster.models.oneroster import OneRosterDataModel
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sds2roster.converter import SDSToOneRosterConverter
+    from sds2roster.models.oneroster import OneRosterDataModel
+    from sds2roster.models.sds import SDSDataModel
+
+# Public names and their modules, imported on first access so that importing
+# the package (and the CLI) does not load Pydantic and every model up front
+_LAZY_IMPORTS = {
+    "SDSToOneRosterConverter": "sds2roster.converter",
+    "SDSDataModel": "sds2roster.models.sds",
+    "OneRosterDataModel": "sds2roster.models.oneroster",
+}
 
 __all__ = [
     "SDSToOneRosterConverter",
     "SDSDataModel",
     "OneRosterDataModel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes including the lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,32 @@
 """Azure integration modules."""
 
-from sds2roster.azure.blob_storage import BlobStorageClient
-from sds2roster.azure.table_storage import TableStorageClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sds2roster.azure.blob_storage import BlobStorageClient
+    from sds2roster.azure.table_storage import TableStorageClient
+
+# Each client loads its own Azure SDK package when it is first used, so the
+# Table Storage commands never import azure-storage-blob and vice versa
+_LAZY_IMPORTS = {
+    "BlobStorageClient": "sds2roster.azure.blob_storage",
+    "TableStorageClient": "sds2roster.azure.table_storage",
+}
 
 __all__ = ["BlobStorageClient", "TableStorageClient"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a client class on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes including the client classes."""
+    return sorted(set(globals()) | set(__all__))
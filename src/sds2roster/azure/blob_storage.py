@@ -1,20 +1,67 @@
 """Azure Blob Storage client for SDS2Roster."""
 
+import gzip
+import io
 import logging
+import shutil
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
 
 from azure.core.exceptions import ResourceNotFoundError
-from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.storage.blob import (
+    BlobBlock,
+    BlobClient,
+    BlobServiceClient,
+    ContainerClient,
+    ContentSettings,
+)
+
+from ..instrumentation import stage
 
 logger = logging.getLogger(__name__)
 
+#: Default number of blobs the directory methods transfer at the same time
+DEFAULT_TRANSFER_WORKERS = 4
+
+#: Default number of parallel block transfers per blob. The SDK only splits
+#: blobs larger than its single-request size (64 MiB for uploads, 32 MiB for
+#: downloads) into blocks or ranged GETs.
+DEFAULT_MAX_CONCURRENCY = 4
+
+#: Default size of the blocks ``open_write`` stages, the SDK's own upload block size
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+
+#: Content settings of CSV files uploaded with ``compress=True``
+GZIP_CSV_CONTENT_SETTINGS = ContentSettings(content_type="text/csv", content_encoding="gzip")
+
+# Size of the pieces a file is read in while it is compressed for upload
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+_Result = TypeVar("_Result")
+
 
 class BlobStorageClient:
     """Client for Azure Blob Storage operations.
 
     This client provides methods for uploading and downloading CSV files
     from Azure Blob Storage, supporting both SDS and OneRoster formats.
+
+    ``upload_directory`` and ``download_directory`` transfer up to ``workers``
+    files at the same time on a thread pool, and large files are transferred as
+    blocks or byte ranges over ``max_concurrency`` parallel connections each.
+    The SDK clients are thread-safe, so one client serves all threads.
+    Downloads are written to disk chunk by chunk, so memory use does not grow
+    with the blob size.
+
+    ``open_text`` and ``open_write`` read and write blobs as streams, so data
+    can be parsed while it downloads and generated while it uploads.
+
+    With ``compress=True``, uploads are gzip-compressed on the fly and stored
+    with ``Content-Encoding: gzip``; downloads of such blobs are decompressed
+    on the fly, so the local files are the original CSV either way.
     """
 
     def __init__(
@@ -62,13 +109,22 @@ class BlobStorageClient:
             self.container_client.create_container()
 
     def upload_file(
-        self, file_path: Union[str, Path], blob_name: Optional[str] = None
+        self,
+        file_path: Union[str, Path],
+        blob_name: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compress: bool = False,
     ) -> str:
         """Upload a file to blob storage.
 
         Args:
             file_path: Path to the file to upload
             blob_name: Name for the blob (defaults to file name)
+            max_concurrency: Parallel block uploads for files above the SDK's
+                single-request size
+            compress: Gzip the file while it is uploaded and store the blob
+                with ``Content-Encoding: gzip``. The file is compressed into
+                4 MiB blocks as it is read, without a compressed copy on disk.
 
         Returns:
             URL of the uploaded blob
@@ -85,43 +141,83 @@ class BlobStorageClient:
 
         logger.info(f"Uploading {file_path} to {blob_name}")
 
-        with open(file_path, "rb") as data:
+        if compress:
+            with open(file_path, "rb") as data, self.open_write(
+                blob_name,
+                max_concurrency=max_concurrency,
+                content_settings=GZIP_CSV_CONTENT_SETTINGS,
+            ) as output:
+                # mtime=0 keeps the compressed bytes the same for the same file
+                with gzip.GzipFile(fileobj=output, mode="wb", mtime=0) as compressed:
+                    shutil.copyfileobj(data, compressed, _COPY_BUFFER_SIZE)
+            return output.url
+
+        with stage("azure.blob.upload", file_path), open(file_path, "rb") as data:
             blob_client = self.container_client.get_blob_client(blob_name)
-            blob_client.upload_blob(data, overwrite=True)
+            blob_client.upload_blob(data, overwrite=True, max_concurrency=max_concurrency)
 
         return blob_client.url
 
     def upload_directory(
-        self, directory: Union[str, Path], prefix: str = ""
+        self,
+        directory: Union[str, Path],
+        prefix: str = "",
+        workers: int = DEFAULT_TRANSFER_WORKERS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        compress: bool = False,
     ) -> Dict[str, str]:
-        """Upload all files in a directory to blob storage.
+        """Upload all CSV files in a directory to blob storage.
 
         Args:
             directory: Path to the directory
             prefix: Optional prefix for blob names
+            workers: Number of files uploaded at the same time; 1 uploads them
+                one after another
+            max_concurrency: Parallel block uploads per large file
+            compress: Upload the files gzip-encoded, as in ``upload_file``
 
         Returns:
-            Dictionary mapping filenames to URLs
+            Dictionary mapping filenames to URLs, in directory listing order
         """
         directory = Path(directory)
         if not directory.is_dir():
             raise NotADirectoryError(f"Not a directory: {directory}")
 
-        uploaded = {}
-        for file_path in directory.glob("*.csv"):
+        def upload(file_path: Path) -> Callable[[], str]:
             blob_name = f"{prefix}{file_path.name}" if prefix else file_path.name
-            url = self.upload_file(file_path, blob_name)
-            uploaded[file_path.name] = url
-            logger.info(f"Uploaded {file_path.name} -> {blob_name}")
 
-        return uploaded
+            def call() -> str:
+                url = self.upload_file(
+                    file_path, blob_name, max_concurrency=max_concurrency, compress=compress
+                )
+                logger.info(f"Uploaded {file_path.name} -> {blob_name}")
+                return url
+
+            return call
+
+        return self._transfer_all(
+            [(file_path.name, upload(file_path)) for file_path in directory.glob("*.csv")],
+            workers,
+        )
 
-    def download_file(self, blob_name: str, destination: Union[str, Path]) -> Path:
+    def download_file(
+        self,
+        blob_name: str,
+        destination: Union[str, Path],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Path:
         """Download a blob to a local file.
 
+        The blob is streamed to the file: after the first request (up to the
+        SDK's 32 MiB single-request size) the rest is fetched in 4 MiB ranges,
+        ``max_concurrency`` at a time, and each range is written as it arrives.
+        A blob stored with ``Content-Encoding: gzip`` is decompressed as it
+        arrives, so the file holds the original content.
+
         Args:
             blob_name: Name of the blob to download
             destination: Local file path for download
+            max_concurrency: Parallel ranged GETs for large blobs
 
         Returns:
             Path to downloaded file
@@ -136,38 +232,179 @@ class BlobStorageClient:
         destination.parent.mkdir(parents=True, exist_ok=True)
 
         blob_client = self.container_client.get_blob_client(blob_name)
-        with open(destination, "wb") as file:
-            data = blob_client.download_blob()
-            file.write(data.readall())
-        
+        with stage("azure.blob.download", destination), open(destination, "wb") as file:
+            self._download_into(blob_client, file, max_concurrency)
+
         return destination
 
     def download_directory(
-        self, destination: Union[str, Path], prefix: str = ""
+        self,
+        destination: Union[str, Path],
+        prefix: str = "",
+        workers: int = DEFAULT_TRANSFER_WORKERS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> List[Path]:
-        """Download all blobs with a given prefix.
+        """Download all CSV blobs with a given prefix.
 
         Args:
             destination: Local directory path
             prefix: Optional prefix filter for blobs
+            workers: Number of blobs downloaded at the same time; 1 downloads
+                them one after another
+            max_concurrency: Parallel ranged GETs per large blob
 
         Returns:
-            List of downloaded file paths
+            List of downloaded file paths, in blob listing order
         """
         destination = Path(destination)
         destination.mkdir(parents=True, exist_ok=True)
 
-        downloaded = []
+        def download(blob_name: str) -> Callable[[], Path]:
+            file_path = destination / Path(blob_name).name
+
+            def call() -> Path:
+                self.download_file(blob_name, file_path, max_concurrency=max_concurrency)
+                logger.info(f"Downloaded {blob_name}")
+                return file_path
+
+            return call
+
         blob_list = self.container_client.list_blobs(name_starts_with=prefix)
+        downloaded = self._transfer_all(
+            [(blob.name, download(blob.name)) for blob in blob_list if blob.name.endswith(".csv")],
+            workers,
+        )
+        return list(downloaded.values())
+
+    @staticmethod
+    def _download_into(blob_client: BlobClient, stream: IO[bytes], max_concurrency: int) -> None:
+        """Download a blob into a binary stream, decoding gzip content encoding.
+
+        The SDK would decompress each response on its own, which breaks
+        once a large blob is fetched in several ranges, so the raw bytes are
+        requested and decompressed here as one stream. A parallel
+        ``readinto`` writes ranges out of order at seek offsets, so gzip
+        content is fed to the decompressor chunk by chunk, in order.
+
+        Args:
+            blob_client: Client of the blob to download
+            stream: Writable binary stream for the content
+            max_concurrency: Parallel ranged GETs for large blobs
+        """
+        downloader = blob_client.download_blob(max_concurrency=max_concurrency, decompress=False)
+        if downloader.properties.content_settings.content_encoding != "gzip":
+            downloader.readinto(stream)
+            return
+
+        for data in _gunzip_chunks(downloader.chunks()):
+            stream.write(data)
+
+    @staticmethod
+    def _download_chunks(blob_client: BlobClient) -> Iterator[bytes]:
+        """Start a blob download and return its chunks, decoding gzip content encoding.
+
+        As in ``_download_into``, the raw bytes are requested, since the SDK
+        cannot decompress a blob that arrives in several ranges.
+
+        Args:
+            blob_client: Client of the blob to download
+
+        Returns:
+            Iterator over the (decompressed) content in order
+        """
+        downloader = blob_client.download_blob(decompress=False)
+        if downloader.properties.content_settings.content_encoding != "gzip":
+            return downloader.chunks()
+        return _gunzip_chunks(downloader.chunks())
+
+    @staticmethod
+    def _transfer_all(
+        transfers: List[tuple[str, Callable[[], _Result]]], workers: int
+    ) -> Dict[str, _Result]:
+        """Run transfer calls sequentially or on a bounded thread pool.
+
+        Args:
+            transfers: (key, transfer call) pairs in result order
+            workers: Maximum number of concurrent transfers
+
+        Returns:
+            Dictionary mapping each key to the result of its call
+
+        Raises:
+            Exception: The error of the first failed transfer in result order;
+                transfers that have not started yet are cancelled
+        """
+        if workers <= 1 or len(transfers) <= 1:
+            return {key: transfer() for key, transfer in transfers}
+
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(transfers)), thread_name_prefix="sds2roster-blob"
+        ) as executor:
+            futures: List[tuple[str, Future]] = [
+                (key, executor.submit(transfer)) for key, transfer in transfers
+            ]
+            try:
+                return {key: future.result() for key, future in futures}
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    def open_text(self, blob_name: str, encoding: str = "utf-8") -> IO[str]:
+        """Open a blob as a text stream that is decoded while it downloads.
+
+        The blob is fetched chunk by chunk (``download_blob().chunks()``) when
+        the stream is read, gzip content encoding is decompressed as the chunks
+        arrive, and the bytes go through the incremental decoder of
+        a ``TextIOWrapper``, so characters split across chunks are decoded
+        correctly and only the current chunk is held in memory. The download
+        starts on the first read; a missing blob raises
+        ``ResourceNotFoundError`` there. ``SDSCSVParser`` accepts the stream in
+        place of a file path.
+
+        Args:
+            blob_name: Name of the blob
+            encoding: Text encoding of the blob
 
-        for blob in blob_list:
-            if blob.name.endswith(".csv"):
-                file_path = destination / Path(blob.name).name
-                self.download_file(blob.name, file_path)
-                downloaded.append(file_path)
-                logger.info(f"Downloaded {blob.name}")
+        Returns:
+            Readable text stream named after the blob
+        """
+        blob_client = self.container_client.get_blob_client(blob_name)
+        raw = _ChunkReader(lambda: self._download_chunks(blob_client), blob_name)
+        return io.TextIOWrapper(io.BufferedReader(raw), encoding=encoding)
+
+    def open_write(
+        self,
+        blob_name: str,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        content_settings: Optional[ContentSettings] = None,
+    ) -> "BlobBlockWriter":
+        """Open a binary stream that uploads to a blob in blocks while it is written.
+
+        Written bytes are collected into blocks of block_size, and each full
+        block is staged (``stage_block``) on a background thread while the
+        caller goes on writing. Closing the stream stages the last block and
+        commits the block list, which replaces the blob. Leaving a with block
+        with an exception discards the upload instead; uncommitted blocks are
+        never visible and are removed by the service.
+
+        ``OneRosterCSVWriter`` takes ``lambda path: client.open_write(path.as_posix())``
+        as its sink to write the OneRoster files straight to the container.
+
+        Args:
+            blob_name: Name of the blob
+            block_size: Size of the staged blocks in bytes
+            max_concurrency: Maximum number of blocks uploading at the same
+                time; writing waits while that many are in flight
+            content_settings: Content type, encoding and other headers stored
+                with the blob when it is committed
 
-        return downloaded
+        Returns:
+            Writable binary stream
+        """
+        logger.info(f"Writing blob {blob_name} in blocks")
+        blob_client = self.container_client.get_blob_client(blob_name)
+        return BlobBlockWriter(blob_client, block_size, max_concurrency, content_settings)
 
     def list_blobs(self, prefix: str = "") -> List[str]:
         """List all blobs in the container.
@@ -228,8 +465,11 @@ class BlobStorageClient:
             ResourceNotFoundError: If blob doesn't exist
         """
         blob_client = self.container_client.get_blob_client(blob_name)
-        download_stream = blob_client.download_blob()
-        return download_stream.readall().decode("utf-8")
+        content = io.BytesIO()
+        with stage("azure.blob.download") as timed:
+            self._download_into(blob_client, content, DEFAULT_MAX_CONCURRENCY)
+            timed.bytes = content.tell()
+        return content.getvalue().decode("utf-8")
 
     def write_csv_content(self, blob_name: str, content: str) -> str:
         """Write CSV content to a blob.
@@ -243,5 +483,207 @@ class BlobStorageClient:
         """
         logger.info(f"Writing CSV content to {blob_name}")
         blob_client = self.container_client.get_blob_client(blob_name)
-        blob_client.upload_blob(content.encode("utf-8"), overwrite=True)
+        with stage("azure.blob.upload") as timed:
+            data = content.encode("utf-8")
+            timed.bytes = len(data)
+            blob_client.upload_blob(data, overwrite=True)
         return blob_client.url
+
+
+class _ChunkReader(io.RawIOBase):
+    """Raw binary stream over the chunks of a blob download."""
+
+    def __init__(self, open_chunks: Callable[[], Iterator[bytes]], name: str) -> None:
+        """Initialize the reader.
+
+        Args:
+            open_chunks: Starts the download and returns its chunk iterator
+            name: Blob name, reported as the stream name
+        """
+        super().__init__()
+        self.name = name
+        self._open_chunks: Optional[Callable[[], Iterator[bytes]]] = open_chunks
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        """Return True; the stream is readable."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Copy the next downloaded bytes into a writable buffer.
+
+        Returns:
+            Number of bytes copied, 0 at the end of the blob
+        """
+        while not self._pending:
+            if self._open_chunks is not None:
+                self._chunks = self._open_chunks()
+                self._open_chunks = None
+            if self._chunks is None:
+                return 0
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                # Drop the downloader and its buffered first chunk
+                self._chunks = None
+                return 0
+            self._pending = memoryview(chunk)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        """Close the stream and release the download."""
+        self._open_chunks = None
+        self._chunks = None
+        self._pending = memoryview(b"")
+        super().close()
+
+
+class BlobBlockWriter(io.BufferedIOBase):
+    """Writable binary stream that uploads a block blob block by block.
+
+    At most ``max_concurrency`` blocks are uploading while one more is being
+    filled, so memory use is bounded by ``(max_concurrency + 1) * block_size``
+    whatever the blob size. Use ``BlobStorageClient.open_write`` to create one.
+    """
+
+    def __init__(
+        self,
+        blob_client: BlobClient,
+        block_size: int,
+        max_concurrency: int,
+        content_settings: Optional[ContentSettings] = None,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            blob_client: Client of the blob to write
+            block_size: Size of the staged blocks in bytes
+            max_concurrency: Maximum number of blocks uploading at the same time
+            content_settings: Headers stored with the blob when it is committed
+        """
+        super().__init__()
+        self.name = blob_client.blob_name
+        self.url = blob_client.url
+        self._blob_client = blob_client
+        self._content_settings = content_settings
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._block_ids: List[str] = []
+        self._pending: List[Future] = []
+        self._size = 0
+        self._discarded = False
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="sds2roster-block"
+        )
+
+    def writable(self) -> bool:
+        """Return True; the stream is writable."""
+        return True
+
+    def write(self, data: Any) -> int:
+        """Buffer bytes and stage every block that is full.
+
+        Returns:
+            Number of bytes written, always all of them
+
+        Raises:
+            Exception: The error of a block upload that failed since the last call
+        """
+        if self.closed:
+            raise ValueError("write to closed blob stream")
+        written = memoryview(data).nbytes
+        self._buffer += data
+        self._size += written
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._stage_block(block)
+        return written
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far."""
+        return self._size
+
+    def discard(self) -> None:
+        """Close the stream without committing; the blob is left unchanged."""
+        self._discarded = True
+        self.close()
+
+    def close(self) -> None:
+        """Stage the last block, wait for all uploads and commit the block list."""
+        if self.closed:
+            return
+        try:
+            if not self._discarded:
+                with stage("azure.blob.upload") as timed:
+                    if self._buffer or not self._block_ids:
+                        self._stage_block(bytes(self._buffer))
+                    self._buffer = bytearray()
+                    for future in self._pending:
+                        future.result()
+                    self._blob_client.commit_block_list(
+                        [BlobBlock(block_id) for block_id in self._block_ids],
+                        content_settings=self._content_settings,
+                    )
+                    timed.bytes = self._size
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._buffer = bytearray()
+            super().close()
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        """Commit the blob, or discard it if the with block raised an exception."""
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+    def _stage_block(self, block: bytes) -> None:
+        """Upload a block on the thread pool once fewer than max_concurrency are in flight."""
+        # Surface failed uploads as early as possible
+        for future in self._pending:
+            if future.done():
+                future.result()
+        self._pending = [future for future in self._pending if not future.done()]
+
+        self._slots.acquire()
+        # Block IDs must all have the same length; the SDK base64-encodes them
+        block_id = f"{len(self._block_ids):08d}"
+        self._block_ids.append(block_id)
+        try:
+            future = self._executor.submit(self._blob_client.stage_block, block_id, block)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append(future)
+
+
+def _gunzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress a gzip stream that arrives in chunks.
+
+    Args:
+        chunks: Compressed bytes in order
+
+    Yields:
+        Decompressed bytes
+
+    Raises:
+        ValueError: If the gzip stream ended early
+    """
+    # wbits=31 reads the gzip header and trailer
+    decompressor = zlib.decompressobj(wbits=31)
+    for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        if data:
+            yield data
+    data = decompressor.flush()
+    if data:
+        yield data
+    if not decompressor.eof:
+        raise ValueError("Compressed blob ended before the end of its gzip stream")
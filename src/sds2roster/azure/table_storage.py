@@ -1,20 +1,55 @@
 """Azure Table Storage client for logging and tracking conversions."""
 
+import base64
+import json
 import logging
-from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.data.tables import TableClient, TableServiceClient
 
+from ..instrumentation import stage
+
 logger = logging.getLogger(__name__)
 
+#: Maximum number of operations in one entity group transaction
+MAX_BATCH_SIZE = 100
+
+#: Maximum number of entities the service returns per query request
+MAX_PAGE_SIZE = 1000
+
+#: Properties list_conversions returns by default, the columns of ``azure list-jobs``
+CONVERSION_COLUMNS = [
+    "PartitionKey",
+    "RowKey",
+    "ConversionId",
+    "SourceType",
+    "TargetType",
+    "Status",
+    "Timestamp",
+]
+
+# .NET ticks (100 ns since 0001-01-01) of datetime.max; reverse-time RowKeys
+# count down from it so that newer keys sort first
+_MAX_TICKS = 3155378975999999999
+_EPOCH_TICKS = 621355968000000000
+
 
 class TableStorageClient:
     """Client for Azure Table Storage operations.
 
     This client provides methods for logging conversion operations,
     tracking conversion history, and storing metadata.
+
+    Table Storage returns entities in PartitionKey and RowKey order. With
+    ``newest_first=True``, conversions are logged under reverse-time RowKeys
+    (``<inverted ticks>_<conversion ID>``), so ``list_conversions`` returns the
+    most recent conversions of a source type first and listing recent jobs
+    takes a single small request. The conversion ID is then stored in the
+    ``ConversionId`` property, and lookups by ID query that property.
     """
 
     def __init__(
@@ -23,6 +58,7 @@ class TableStorageClient:
         account_name: Optional[str] = None,
         account_key: Optional[str] = None,
         table_name: str = "ConversionHistory",
+        newest_first: bool = False,
     ) -> None:
         """Initialize Table Storage client.
 
@@ -31,6 +67,7 @@ class TableStorageClient:
             account_name: Storage account name (alternative to connection string)
             account_key: Storage account key (alternative to connection string)
             table_name: Name of the table
+            newest_first: Log conversions under reverse-time RowKeys
 
         Raises:
             ValueError: If neither connection_string nor account credentials provided
@@ -50,6 +87,7 @@ class TableStorageClient:
             )
 
         self.table_name = table_name
+        self.newest_first = newest_first
         self.table_client: TableClient = self.table_service_client.get_table_client(
             table_name
         )
@@ -81,13 +119,16 @@ class TableStorageClient:
         Returns:
             Entity dictionary with all properties
         """
+        now = datetime.now(UTC)
+        row_key = reverse_time_key(conversion_id, now) if self.newest_first else conversion_id
         entity = {
             "PartitionKey": source_type,
-            "RowKey": conversion_id,
+            "RowKey": row_key,
+            "ConversionId": conversion_id,
             "SourceType": source_type,
             "TargetType": target_type,
             "Status": status,
-            "Timestamp": datetime.now(UTC).isoformat(),
+            "Timestamp": now.isoformat(),
         }
 
         # Add metadata fields
@@ -100,7 +141,9 @@ class TableStorageClient:
         logger.info(
             f"Logging conversion: {conversion_id} ({source_type} -> {target_type}): {status}"
         )
-        self.table_client.create_entity(entity)
+        with stage("azure.table.write") as timed:
+            self.table_client.create_entity(entity)
+            timed.rows = 1
 
         return entity
 
@@ -121,7 +164,7 @@ class TableStorageClient:
         """
         entity = {
             "PartitionKey": source_type,
-            "RowKey": conversion_id,
+            "RowKey": self._row_key(conversion_id, source_type),
             "Status": status,
             "LastUpdated": datetime.now(UTC).isoformat(),
         }
@@ -130,7 +173,9 @@ class TableStorageClient:
             entity["ErrorMessage"] = error_message
 
         logger.info(f"Updating conversion {conversion_id}: {status}")
-        self.table_client.update_entity(entity, mode="merge")
+        with stage("azure.table.write") as timed:
+            self.table_client.update_entity(entity, mode="merge")
+            timed.rows = 1
 
     def get_conversion(
         self, conversion_id: str, source_type: str
@@ -146,7 +191,7 @@ class TableStorageClient:
         """
         try:
             entity = self.table_client.get_entity(
-                partition_key=source_type, row_key=conversion_id
+                partition_key=source_type, row_key=self._row_key(conversion_id, source_type)
             )
             return dict(entity)
         except ResourceNotFoundError:
@@ -158,6 +203,7 @@ class TableStorageClient:
         source_type: Optional[str] = None,
         status: Optional[str] = None,
         limit: int = 100,
+        select: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """List conversion records with optional filters.
 
@@ -165,24 +211,68 @@ class TableStorageClient:
             source_type: Optional filter by source type
             status: Optional filter by status
             limit: Maximum number of records to return
+            select: Properties to return (default: all)
 
         Returns:
-            List of entity dictionaries
+            List of entity dictionaries, at most limit
         """
-        # Build filter query
-        filters = []
-        if source_type:
-            filters.append(f"PartitionKey eq '{source_type}'")
-        if status:
-            filters.append(f"Status eq '{status}'")
+        conversions, _ = self.list_conversions_page(
+            source_type=source_type, status=status, limit=limit, select=select
+        )
+        return conversions
 
-        query_filter = " and ".join(filters) if filters else None
+    def list_conversions_page(
+        self,
+        source_type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        continuation_token: Optional[str] = None,
+        select: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List one page of conversion records.
 
-        entities = self.table_client.query_entities(
-            query_filter=query_filter, results_per_page=limit
-        )
+        Each request asks the service for no more than the records still
+        missing (``$top``), so no more than limit records are transferred. The
+        service may end a page early, for example at a partition boundary;
+        the next request then continues where it stopped.
 
-        return [dict(entity) for entity in entities]
+        Args:
+            source_type: Optional filter by source type
+            status: Optional filter by status
+            limit: Maximum number of records to return
+            continuation_token: Token returned with the previous page
+            select: Properties to return, for example CONVERSION_COLUMNS
+                (default: all)
+
+        Returns:
+            Tuple of (entity dictionaries, token of the next page or None at the end)
+
+        Raises:
+            ValueError: If continuation_token is not a token from this method
+        """
+        query_filter, parameters = self._conversion_filter(source_type, status)
+        token = _decode_token(continuation_token) if continuation_token else None
+
+        conversions: List[Dict[str, Any]] = []
+        with stage("azure.table.query") as timed:
+            while len(conversions) < limit:
+                # A None filter selects all entities. Table continuation tokens are
+                # dictionaries of the next keys, which the SDK annotates as str.
+                pages = self.table_client.query_entities(
+                    query_filter,  # type: ignore[arg-type]
+                    parameters=parameters,
+                    select=select,
+                    results_per_page=min(limit - len(conversions), MAX_PAGE_SIZE),
+                ).by_page(
+                    continuation_token=token  # type: ignore[arg-type]
+                )
+                conversions.extend(_conversion_dict(entity) for entity in next(pages, []))
+                token = pages.continuation_token  # type: ignore[attr-defined]
+                if not token:
+                    break
+            timed.rows = len(conversions)
+
+        return conversions, _encode_token(token)
 
     def delete_conversion(self, conversion_id: str, source_type: str) -> None:
         """Delete a conversion record.
@@ -193,7 +283,7 @@ class TableStorageClient:
         """
         logger.info(f"Deleting conversion: {conversion_id}")
         self.table_client.delete_entity(
-            partition_key=source_type, row_key=conversion_id
+            partition_key=source_type, row_key=self._row_key(conversion_id, source_type)
         )
 
     def get_conversion_stats(
@@ -201,29 +291,40 @@ class TableStorageClient:
     ) -> Dict[str, int]:
         """Get statistics about conversions.
 
+        Every matching record is counted; only the Status property is
+        transferred, in pages of 1,000 records.
+
         Args:
             source_type: Optional filter by source type
 
         Returns:
             Dictionary with conversion statistics
         """
-        conversions = self.list_conversions(source_type=source_type, limit=1000)
-
+        query_filter, parameters = self._conversion_filter(source_type, None)
         stats = {
-            "total": len(conversions),
+            "total": 0,
             "success": 0,
             "failed": 0,
             "in_progress": 0,
         }
 
-        for conversion in conversions:
-            status = conversion.get("Status", "").lower()
-            if status == "success":
-                stats["success"] += 1
-            elif status == "failed":
-                stats["failed"] += 1
-            elif status == "in_progress":
-                stats["in_progress"] += 1
+        with stage("azure.table.query") as timed:
+            entities = self.table_client.query_entities(
+                query_filter,  # type: ignore[arg-type]
+                parameters=parameters,
+                select=["Status"],
+                results_per_page=MAX_PAGE_SIZE,
+            )
+            for conversion in entities:
+                stats["total"] += 1
+                status = (conversion.get("Status") or "").lower()
+                if status == "success":
+                    stats["success"] += 1
+                elif status == "failed":
+                    stats["failed"] += 1
+                elif status == "in_progress":
+                    stats["in_progress"] += 1
+            timed.rows = stats["total"]
 
         return stats
 
@@ -250,30 +351,204 @@ class TableStorageClient:
             entity[f"Count_{safe_key}"] = count
 
         logger.info(f"Logging entity counts for conversion: {conversion_id}")
-        self.table_client.create_entity(entity)
+        with stage("azure.table.write") as timed:
+            self.table_client.create_entity(entity)
+            timed.rows = 1
 
-    def cleanup_old_records(self, days: int = 30) -> int:
+    def cleanup_old_records(self, days: int = 30, workers: int = 1) -> int:
         """Delete conversion records older than specified days.
 
+        The service selects the records by their last-modified ``Timestamp``
+        and returns only their keys. Records are deleted in transactions of up
+        to 100 records of one partition, so a cleanup takes about one round
+        trip per 100 records instead of one per record.
+
         Args:
             days: Number of days to keep
+            workers: Number of transactions submitted at the same time; 1
+                submits them one after another
 
         Returns:
             Number of deleted records
         """
-        cutoff_date = datetime.now(UTC).timestamp() - (days * 24 * 60 * 60)
-        entities = self.table_client.list_entities()
+        cutoff = datetime.now(UTC) - timedelta(days=days)
+        entities = self.table_client.query_entities(
+            query_filter="Timestamp lt @cutoff",
+            parameters={"cutoff": cutoff},
+            select=["PartitionKey", "RowKey"],
+        )
 
-        deleted_count = 0
-        for entity in entities:
-            # Azure Table Storage Timestamp is in datetime format
-            timestamp = entity.get("Timestamp")
-            if timestamp and timestamp.timestamp() < cutoff_date:
-                self.table_client.delete_entity(
-                    partition_key=entity["PartitionKey"], row_key=entity["RowKey"]
-                )
-                deleted_count += 1
-                logger.debug(f"Deleted old record: {entity['RowKey']}")
+        with stage("azure.table.delete") as timed:
+            deleted_count = self._submit_transactions(self._batch_deletes(entities), workers)
+            timed.rows = deleted_count
 
         logger.info(f"Deleted {deleted_count} old conversion records")
         return deleted_count
+
+    def _row_key(self, conversion_id: str, source_type: str) -> str:
+        """Return the RowKey a conversion is logged under.
+
+        With newest_first, the partition is queried for the ConversionId
+        property. Records logged without a reverse-time RowKey are found by
+        their conversion ID.
+
+        Args:
+            conversion_id: Unique identifier for the conversion
+            source_type: Source data format (partition key)
+
+        Returns:
+            RowKey of the conversion record
+        """
+        if not self.newest_first:
+            return conversion_id
+        entities = self.table_client.query_entities(
+            "PartitionKey eq @source_type and ConversionId eq @conversion_id",
+            parameters={"source_type": source_type, "conversion_id": conversion_id},
+            select=["RowKey"],
+            results_per_page=1,
+        )
+        for entity in entities:
+            row_key: str = entity["RowKey"]
+            return row_key
+        return conversion_id
+
+    @staticmethod
+    def _conversion_filter(
+        source_type: Optional[str], status: Optional[str]
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Build the query filter and its parameters for conversion listings.
+
+        Args:
+            source_type: Optional filter by source type
+            status: Optional filter by status
+
+        Returns:
+            Tuple of (filter or None for all records, filter parameters)
+        """
+        conditions = []
+        parameters: Dict[str, Any] = {}
+        if source_type:
+            conditions.append("PartitionKey eq @source_type")
+            parameters["source_type"] = source_type
+        if status:
+            conditions.append("Status eq @status")
+            parameters["status"] = status
+        return " and ".join(conditions) or None, parameters
+
+    @staticmethod
+    def _batch_deletes(entities: Iterable[Dict[str, Any]]) -> Iterator[List[tuple]]:
+        """Group entities into delete transactions of one partition each.
+
+        Query results are ordered by partition, so consecutive entities are
+        grouped until the partition changes or the batch is full.
+
+        Args:
+            entities: Entities with at least PartitionKey and RowKey
+
+        Yields:
+            Lists of up to MAX_BATCH_SIZE delete operations
+        """
+        batch: List[tuple] = []
+        for entity in entities:
+            if batch and (
+                len(batch) == MAX_BATCH_SIZE
+                or batch[0][1]["PartitionKey"] != entity["PartitionKey"]
+            ):
+                yield batch
+                batch = []
+            keys = {"PartitionKey": entity["PartitionKey"], "RowKey": entity["RowKey"]}
+            batch.append(("delete", keys))
+        if batch:
+            yield batch
+
+    def _submit_transactions(self, batches: Iterable[List[tuple]], workers: int) -> int:
+        """Submit delete transactions sequentially or on a bounded thread pool.
+
+        Args:
+            batches: Delete operations grouped into transactions
+            workers: Maximum number of transactions in flight
+
+        Returns:
+            Number of deleted entities
+
+        Raises:
+            TableTransactionError: If a transaction fails; transactions that
+                have not been submitted yet are skipped
+        """
+
+        def submit(batch: List[tuple]) -> int:
+            self.table_client.submit_transaction(batch)
+            logger.debug(f"Deleted {len(batch)} old records of {batch[0][1]['PartitionKey']}")
+            return len(batch)
+
+        if workers <= 1:
+            return sum(submit(batch) for batch in batches)
+
+        deleted = 0
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="sds2roster-table"
+        ) as executor:
+            # Only a few batches are read ahead of the transactions in flight
+            pending: Deque[Future] = deque()
+            try:
+                for batch in batches:
+                    if len(pending) >= 2 * workers:
+                        deleted += pending.popleft().result()
+                    pending.append(executor.submit(submit, batch))
+                while pending:
+                    deleted += pending.popleft().result()
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+        return deleted
+
+
+def reverse_time_key(conversion_id: str, when: Optional[datetime] = None) -> str:
+    """Return a RowKey that sorts newer conversions before older ones.
+
+    Args:
+        conversion_id: Unique identifier for the conversion
+        when: Time of the conversion (default: now)
+
+    Returns:
+        ``<inverted ticks>_<conversion ID>``, the ticks zero-padded to 19 digits
+    """
+    when = when or datetime.now(UTC)
+    delta = when - datetime(1970, 1, 1, tzinfo=UTC)
+    ticks = _EPOCH_TICKS + (delta // timedelta(microseconds=1)) * 10
+    return f"{_MAX_TICKS - ticks:019d}_{conversion_id}"
+
+
+def _conversion_dict(entity: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a conversion entity as a dictionary with its service Timestamp.
+
+    The SDK moves the service-maintained Timestamp into the entity metadata;
+    it is copied back when the record has no Timestamp property of its own.
+    """
+    conversion = dict(entity)
+    metadata = getattr(entity, "metadata", None) or {}
+    if conversion.get("Timestamp") is None and metadata.get("timestamp") is not None:
+        conversion["Timestamp"] = metadata["timestamp"]
+    return conversion
+
+
+def _encode_token(token: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Encode a service continuation token as an opaque command-line safe string."""
+    if not token:
+        return None
+    return base64.urlsafe_b64encode(json.dumps(token).encode("utf-8")).decode("ascii")
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Decode a continuation token returned by _encode_token.
+
+    Raises:
+        ValueError: If token was not returned by _encode_token
+    """
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid continuation token: {token}") from e
+    if not isinstance(decoded, dict) or "PartitionKey" not in decoded:
+        raise ValueError(f"Invalid continuation token: {token}")
+    return decoded
@@ -0,0 +1,344 @@
+"""Stage-level benchmark of the SDS to OneRoster conversion.
+
+The harness generates a synthetic SDS dataset of a given size, then times each
+stage separately: ``parse_all``, every ``_convert_*`` step of
+``SDSToOneRosterConverter`` and every ``write_*`` method of
+``OneRosterCSVWriter``. Each stage is run several times and reported by its
+median. One extra run traces allocations to record the tracemalloc peak of
+every stage, and each dataset size is measured in its own process so that the
+peak RSS belongs to that size alone. Like ``sds2roster convert``, the stages
+work on compact records rather than Pydantic models.
+
+The result is a JSON-serializable dictionary; ``sds2roster bench`` writes it
+to a file so runs on different hardware can be compared.
+"""
+
+import csv
+import gc
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Sized
+
+from sds2roster import __version__
+from sds2roster.converter import SDSToOneRosterConverter
+from sds2roster.models.oneroster import OneRosterDataModel
+from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+from sds2roster.parsers.sds_parser import SDSCSVParser
+from sds2roster.utils.validators import ValidationLevel
+
+#: Dataset sizes (number of students) of the non-functional requirements table
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+#: Converter steps, in the order ``SDSToOneRosterConverter.convert`` runs them
+CONVERT_STAGES = (
+    "organizations",
+    "users",
+    "courses",
+    "classes",
+    "enrollments",
+    "academic_sessions",
+    "roles",
+)
+
+#: Writer steps, in the order ``OneRosterCSVWriter.write_all`` runs them
+WRITE_STAGES = (
+    "manifest",
+    "orgs",
+    "users",
+    "courses",
+    "classes",
+    "enrollments",
+    "academic_sessions",
+    "roles",
+)
+
+SDS_FILES = {
+    "school_file": "school.csv",
+    "student_file": "student.csv",
+    "teacher_file": "teacher.csv",
+    "section_file": "section.csv",
+    "student_enrollment_file": "studentEnrollment.csv",
+    "teacher_roster_file": "teacherRoster.csv",
+}
+
+
+def write_sds_dataset(
+    directory: Path, num_students: int, num_sections: Optional[int] = None
+) -> Path:
+    """Write a synthetic SDS CSV dataset with the real SDS column headers.
+
+    Every student is enrolled in three sections; schools have 1,000 students
+    and every fifth section shares a teacher.
+
+    Args:
+        directory: Output directory (created if needed)
+        num_students: Number of students
+        num_sections: Number of sections (default: one per 20 students, at least 50)
+
+    Returns:
+        The output directory
+    """
+    if num_sections is None:
+        num_sections = max(50, num_students // 20)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    num_schools = max(1, num_students // 1000)
+    num_teachers = max(1, num_sections // 5)
+
+    def write(name: str, header: list[str], rows: Iterable[tuple[str, ...]]) -> None:
+        with open(directory / name, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+    write(
+        "school.csv",
+        ["SIS ID", "Name", "School Number"],
+        ((f"SCH{i:04d}", f"School {i}", f"S{i:04d}") for i in range(num_schools)),
+    )
+    write(
+        "student.csv",
+        ["SIS ID", "School SIS ID", "Username", "First Name", "Last Name", "Grade"],
+        (
+            (f"STU{i:07d}", f"SCH{i % num_schools:04d}", f"s{i}", f"First{i}", f"Last{i}", "10")
+            for i in range(num_students)
+        ),
+    )
+    write(
+        "teacher.csv",
+        ["SIS ID", "School SIS ID", "Username", "First Name", "Last Name"],
+        (
+            (f"TCH{i:05d}", f"SCH{i % num_schools:04d}", f"t{i}", f"Teacher{i}", f"Last{i}")
+            for i in range(num_teachers)
+        ),
+    )
+    write(
+        "section.csv",
+        [
+            "SIS ID", "School SIS ID", "Section Name", "Term SIS ID", "Term Name",
+            "Term Start Date", "Term End Date", "Course Name", "Course Number",
+        ],
+        (
+            (
+                f"SEC{i:06d}", f"SCH{i % num_schools:04d}", f"Section {i}", "TERM2024",
+                "2024 Fall", "2024-09-01", "2024-12-20", f"Course {i % 50}", f"C{i % 50:03d}",
+            )
+            for i in range(num_sections)
+        ),
+    )
+    write(
+        "studentEnrollment.csv",
+        ["Section SIS ID", "SIS ID"],
+        (
+            (f"SEC{(i * 7 + k) % num_sections:06d}", f"STU{i:07d}")
+            for i in range(num_students)
+            for k in range(3)
+        ),
+    )
+    write(
+        "teacherRoster.csv",
+        ["Section SIS ID", "SIS ID"],
+        ((f"SEC{i:06d}", f"TCH{i % num_teachers:05d}") for i in range(num_sections)),
+    )
+    return directory
+
+
+def run_stages(
+    sds_dir: Path,
+    output_dir: Path,
+    validation: ValidationLevel = ValidationLevel.FULL,
+    trace_memory: bool = False,
+) -> dict[str, dict[str, float]]:
+    """Parse, convert and write a dataset once, timing every stage.
+
+    Args:
+        sds_dir: Directory with the six SDS CSV files
+        output_dir: Directory for the OneRoster CSV files
+        validation: Validation level for parsing and conversion
+        trace_memory: Also record the tracemalloc peak of each stage (slower)
+
+    Returns:
+        Stage name -> {"seconds", "rows"[, "tracemalloc_peak_bytes"]}, in run order
+    """
+    stages: dict[str, dict[str, float]] = {}
+
+    def stage(name: str, function: Callable[..., Any], *args: Any) -> Any:
+        gc.collect()
+        if trace_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+
+        stages[name] = {"seconds": elapsed}
+        if trace_memory:
+            stages[name]["tracemalloc_peak_bytes"] = tracemalloc.get_traced_memory()[1] - baseline
+        return result
+
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        parser = SDSCSVParser(validation=validation, compact=True)
+        sds_data = stage(
+            "parse_all",
+            lambda: parser.parse_all(
+                school_file=sds_dir / SDS_FILES["school_file"],
+                student_file=sds_dir / SDS_FILES["student_file"],
+                teacher_file=sds_dir / SDS_FILES["teacher_file"],
+                section_file=sds_dir / SDS_FILES["section_file"],
+                student_enrollment_file=sds_dir / SDS_FILES["student_enrollment_file"],
+                teacher_roster_file=sds_dir / SDS_FILES["teacher_roster_file"],
+            ),
+        )
+        stages["parse_all"]["rows"] = sum(
+            len(entities)
+            for entities in (
+                sds_data.schools,
+                sds_data.students,
+                sds_data.teachers,
+                sds_data.sections,
+                sds_data.enrollments,
+            )
+        )
+
+        converter = SDSToOneRosterConverter(validation=validation, compact=True)
+        converted: dict[str, list[Any]] = {}
+        for name in CONVERT_STAGES:
+            convert_stage = getattr(converter, f"_convert_{name}")
+            converted[name] = stage(f"convert_{name}", convert_stage, sds_data)
+            stages[f"convert_{name}"]["rows"] = len(converted[name])
+
+        data_model = OneRosterDataModel.model_construct(
+            orgs=converted["organizations"],
+            users=converted["users"],
+            courses=converted["courses"],
+            classes=converted["classes"],
+            enrollments=converted["enrollments"],
+            academic_sessions=converted["academic_sessions"],
+            roles=converted["roles"],
+        )
+        del sds_data, converted
+
+        writer = OneRosterCSVWriter(output_dir)
+        for name in WRITE_STAGES:
+            if name == "manifest":
+                stage("write_manifest", writer.write_manifest)
+                stages["write_manifest"]["rows"] = 0
+                continue
+            stage(f"write_{name}", getattr(writer, f"write_{name}"), data_model)
+            records: Sized = getattr(data_model, name)
+            stages[f"write_{name}"]["rows"] = len(records)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return stages
+
+
+def benchmark_size(
+    num_students: int,
+    repetitions: int = 3,
+    validation: ValidationLevel = ValidationLevel.FULL,
+    work_dir: Optional[Path] = None,
+) -> dict[str, Any]:
+    """Benchmark one dataset size in the current process.
+
+    Args:
+        num_students: Number of students in the generated dataset
+        repetitions: Number of timed runs per stage
+        validation: Validation level for parsing and conversion
+        work_dir: Directory for the generated dataset and output (default: a
+            temporary directory that is removed afterwards)
+
+    Returns:
+        Per-stage medians, rows/s and tracemalloc peaks, plus the peak RSS
+    """
+    with tempfile.TemporaryDirectory(dir=work_dir) as temp:
+        sds_dir = write_sds_dataset(Path(temp) / "sds", num_students)
+        output_dir = Path(temp) / "oneroster"
+
+        runs = [run_stages(sds_dir, output_dir, validation) for _ in range(repetitions)]
+        traced = run_stages(sds_dir, output_dir, validation, trace_memory=True)
+
+    stages = {}
+    for name, traced_stage in traced.items():
+        seconds = [run[name]["seconds"] for run in runs]
+        median = statistics.median(seconds)
+        rows = traced_stage["rows"]
+        stages[name] = {
+            "median_s": median,
+            "min_s": min(seconds),
+            "runs_s": seconds,
+            "rows": rows,
+            "rows_per_s": rows / median if median > 0 else None,
+            "tracemalloc_peak_bytes": traced_stage["tracemalloc_peak_bytes"],
+        }
+
+    total = statistics.median(sum(stage["seconds"] for stage in run.values()) for run in runs)
+    return {
+        "students": num_students,
+        "total_median_s": total,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "stages": stages,
+    }
+
+
+def run_benchmark(
+    sizes: Iterable[int],
+    repetitions: int = 3,
+    validation: ValidationLevel = ValidationLevel.FULL,
+    work_dir: Optional[Path] = None,
+    isolate: bool = True,
+) -> dict[str, Any]:
+    """Benchmark several dataset sizes.
+
+    Args:
+        sizes: Numbers of students, e.g. ``SIZES.values()``
+        repetitions: Number of timed runs per stage
+        validation: Validation level for parsing and conversion
+        work_dir: Directory for temporary datasets (default: the system temp dir)
+        isolate: Measure each size in a fresh worker process, so the peak RSS
+            of one size does not include the previous ones
+
+    Returns:
+        JSON-serializable results with the environment and one entry per size
+    """
+    results = []
+    for num_students in sizes:
+        args = (num_students, repetitions, ValidationLevel(validation), work_dir)
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                results.append(executor.submit(benchmark_size, *args).result())
+        else:
+            results.append(benchmark_size(*args))
+
+    return {
+        "sds2roster_version": __version__,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "validation": ValidationLevel(validation).value,
+        "repetitions": repetitions,
+        "results": results,
+    }
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Return the peak resident set size of this process, or None if unavailable."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,277 @@
+"""Content-addressed cache of converted OneRoster files.
+
+The output of a conversion depends on the SDS input files, the converter
+version and the output profile, so the key is a SHA-256 digest of those. The
+one other input is the conversion date: a term without a start or end date in
+section.csv gets the date (and its school year the year) of the conversion,
+so the key of such input also holds the current UTC date. A cache hit
+restores the stored OneRoster CSV files instead of parsing and converting
+again. Entries live in a local directory with size-bounded LRU eviction, or
+under a Blob Storage prefix shared by several nodes.
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Protocol
+
+from sds2roster import __version__
+
+if TYPE_CHECKING:
+    from sds2roster.azure.blob_storage import BlobStorageClient
+
+logger = logging.getLogger(__name__)
+
+#: Bumped when the layout of cache entries changes
+CACHE_FORMAT_VERSION = 1
+
+#: Name of the entry file holding the metadata; it is stored last and marks
+#: the entry as complete
+ENTRY_FILE_NAME = "entry.json"
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def cache_key(
+    input_files: Iterable[Path], profile: str = "", conversion_date: Optional[date] = None
+) -> str:
+    """Compute the cache key of a conversion.
+
+    Args:
+        input_files: SDS input files; their names and contents are hashed
+        profile: Options that affect the output (e.g. the validation level)
+        conversion_date: Date the output depends on, from ``conversion_date``
+
+    Returns:
+        SHA-256 hex digest of the inputs, converter version and profile
+    """
+    digest = hashlib.sha256()
+    digest.update(f"sds2roster {__version__}\0cache {CACHE_FORMAT_VERSION}\0".encode())
+    digest.update(f"{profile}\0".encode())
+    if conversion_date is not None:
+        digest.update(f"date={conversion_date.isoformat()}\0".encode())
+    for path in input_files:
+        file_digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            while chunk := file.read(_HASH_CHUNK_SIZE):
+                file_digest.update(chunk)
+        digest.update(f"{path.name}\0{file_digest.hexdigest()}\0".encode())
+    return digest.hexdigest()
+
+
+def conversion_date(section_file: Path) -> Optional[date]:
+    """Return the current UTC date if the output of section_file depends on it.
+
+    The converter fills in a missing term start or end date with the
+    conversion timestamp, and a missing start date also sets the school year.
+
+    Args:
+        section_file: SDS section.csv
+
+    Returns:
+        Today's UTC date if a section has a term without a start or end date,
+        otherwise None
+    """
+    with open(section_file, encoding="utf-8", newline="") as file:
+        for row in csv.DictReader(file):
+            if row.get("Term SIS ID") and not (
+                row.get("Term Start Date") and row.get("Term End Date")
+            ):
+                return datetime.now(timezone.utc).date()
+    return None
+
+
+class ConversionCache(Protocol):
+    """Storage backend for converted OneRoster files."""
+
+    def get(self, key: str, destination: Path) -> Optional[dict[str, Any]]:
+        """Restore the files of an entry into destination.
+
+        Args:
+            key: Cache key from ``cache_key``
+            destination: Output directory to restore the files into
+
+        Returns:
+            Metadata stored with the entry, or None on a cache miss
+        """
+        ...
+
+    def put(self, key: str, files: Iterable[Path], metadata: dict[str, Any]) -> None:
+        """Store files under key.
+
+        Args:
+            key: Cache key from ``cache_key``
+            files: Output files to store
+            metadata: JSON-serializable metadata returned by ``get``
+        """
+        ...
+
+
+class LocalConversionCache:
+    """Cache in a local directory with size-bounded LRU eviction.
+
+    Each entry is a subdirectory named after its key. A hit refreshes the
+    modification time of the entry file, and after each store the least
+    recently used entries are removed until the cache fits in max_bytes.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (created if needed)
+            max_bytes: Maximum total size of all entries
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str, destination: Path) -> Optional[dict[str, Any]]:
+        """Restore the files of an entry into destination.
+
+        Args:
+            key: Cache key from ``cache_key``
+            destination: Output directory to restore the files into
+
+        Returns:
+            Metadata stored with the entry, or None on a cache miss
+        """
+        entry_dir = self.directory / key
+        entry_file = entry_dir / ENTRY_FILE_NAME
+        try:
+            metadata = json.loads(entry_file.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+        destination.mkdir(parents=True, exist_ok=True)
+        for name in metadata["files"]:
+            shutil.copyfile(entry_dir / name, destination / name)
+
+        os.utime(entry_file)
+        stored: dict[str, Any] = metadata["metadata"]
+        return stored
+
+    def put(self, key: str, files: Iterable[Path], metadata: dict[str, Any]) -> None:
+        """Store files under key and evict least recently used entries.
+
+        Args:
+            key: Cache key from ``cache_key``
+            files: Output files to store
+            metadata: JSON-serializable metadata returned by ``get``
+        """
+        entry_dir = self.directory / key
+        if (entry_dir / ENTRY_FILE_NAME).exists():
+            return
+
+        # Build the entry next to its final place and rename it, so that
+        # concurrent runs never see a partial entry
+        staging_dir = Path(tempfile.mkdtemp(prefix=f".{key}.", dir=self.directory))
+        try:
+            names = []
+            for path in files:
+                shutil.copyfile(path, staging_dir / path.name)
+                names.append(path.name)
+            (staging_dir / ENTRY_FILE_NAME).write_text(
+                json.dumps({"files": names, "metadata": metadata}), encoding="utf-8"
+            )
+            os.rename(staging_dir, entry_dir)
+        except OSError:
+            # Another run stored the same entry first
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if not (entry_dir / ENTRY_FILE_NAME).exists():
+                raise
+            return
+
+        self._evict(keep=key)
+
+    def _evict(self, keep: str) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes.
+
+        Args:
+            keep: Key of the entry that was just stored
+        """
+        entries = []
+        total = 0
+        for entry_dir in self.directory.iterdir():
+            entry_file = entry_dir / ENTRY_FILE_NAME
+            if entry_dir.name.startswith(".") or not entry_file.exists():
+                continue
+            size = sum(path.stat().st_size for path in entry_dir.iterdir())
+            entries.append((entry_file.stat().st_mtime, entry_dir, size))
+            total += size
+
+        for _, entry_dir, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry_dir.name == keep:
+                continue
+            logger.info(f"Evicting cache entry {entry_dir.name}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+
+
+class BlobConversionCache:
+    """Cache under a Blob Storage prefix, shared by every node using the container.
+
+    Each entry is stored as ``<prefix><key>/<file name>``; the entry file is
+    uploaded last, so an entry is only visible once all of its files exist.
+    Eviction is left to the container's lifecycle management policy.
+    """
+
+    def __init__(self, client: "BlobStorageClient", prefix: str = "cache/") -> None:
+        """Initialize the cache.
+
+        Args:
+            client: Blob Storage client of the cache container
+            prefix: Blob name prefix of all entries
+        """
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str, destination: Path) -> Optional[dict[str, Any]]:
+        """Download the files of an entry into destination.
+
+        Args:
+            key: Cache key from ``cache_key``
+            destination: Output directory to restore the files into
+
+        Returns:
+            Metadata stored with the entry, or None on a cache miss
+        """
+        entry_blob = f"{self.prefix}{key}/{ENTRY_FILE_NAME}"
+        if not self.client.blob_exists(entry_blob):
+            return None
+
+        entry = json.loads(self.client.read_csv_content(entry_blob))
+        destination.mkdir(parents=True, exist_ok=True)
+        for name in entry["files"]:
+            self.client.download_file(f"{self.prefix}{key}/{name}", destination / name)
+
+        stored: dict[str, Any] = entry["metadata"]
+        return stored
+
+    def put(self, key: str, files: Iterable[Path], metadata: dict[str, Any]) -> None:
+        """Upload files under key.
+
+        Args:
+            key: Cache key from ``cache_key``
+            files: Output files to store
+            metadata: JSON-serializable metadata returned by ``get``
+        """
+        names = []
+        for path in files:
+            self.client.upload_file(path, f"{self.prefix}{key}/{path.name}")
+            names.append(path.name)
+
+        self.client.write_csv_content(
+            f"{self.prefix}{key}/{ENTRY_FILE_NAME}",
+            json.dumps({"files": names, "metadata": metadata}),
+        )
@@ -1,19 +1,28 @@
 """Command-line interface for SDS2Roster."""
 
 import os
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Callable, Iterator, Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from sds2roster import __version__
-from sds2roster.converter import SDSToOneRosterConverter
-from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
-from sds2roster.parsers.sds_parser import SDSCSVParser
+from sds2roster.profiling import CPUProfileMode
+from sds2roster.utils.validators import ValidationLevel
+
+# The parsers, the converter and the Pydantic models are imported inside the
+# commands that use them, so that short commands such as version and the
+# Azure job commands start quickly (see tests/unit/test_import_time.py)
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from sds2roster.azure.blob_storage import BlobStorageClient
+    from sds2roster.cache import ConversionCache
+    from sds2roster.delta import DeltaTracker
 
 app = typer.Typer(
     name="sds2roster",
@@ -24,6 +33,25 @@ azure_app = typer.Typer(help="Azure integration commands")
 app.add_typer(azure_app, name="azure")
 console = Console()
 
+REQUIRED_FILES = [
+    "school.csv",
+    "student.csv",
+    "teacher.csv",
+    "section.csv",
+    "studentEnrollment.csv",
+    "teacherRoster.csv",
+]
+
+# parse_all argument of each required file, in REQUIRED_FILES order
+INPUT_ARGUMENTS = [
+    "school_file",
+    "student_file",
+    "teacher_file",
+    "section_file",
+    "student_enrollment_file",
+    "teacher_roster_file",
+]
+
 
 def _validate_input_directory(input_path: Path) -> None:
     """Validate that the input directory exists and is a directory."""
@@ -38,17 +66,8 @@ def _validate_input_directory(input_path: Path) -> None:
 
 def _check_required_files(input_path: Path) -> list[str]:
     """Check for required SDS files and return list of missing files."""
-    required_files = [
-        "school.csv",
-        "student.csv",
-        "teacher.csv",
-        "section.csv",
-        "studentEnrollment.csv",
-        "teacherRoster.csv",
-    ]
-
     missing_files = []
-    for file in required_files:
+    for file in REQUIRED_FILES:
         if not (input_path / file).exists():
             missing_files.append(file)
 
@@ -64,20 +83,11 @@ def _display_missing_files_error(missing_files: list[str]) -> None:
 
 def _check_and_display_files(input_path: Path) -> tuple[list[str], list[str]]:
     """Check required files and display status. Returns (missing_files, found_files)."""
-    required_files = [
-        "school.csv",
-        "student.csv",
-        "teacher.csv",
-        "section.csv",
-        "studentEnrollment.csv",
-        "teacherRoster.csv",
-    ]
-
     console.print("[cyan]Checking required files...[/cyan]")
     missing_files = []
     found_files = []
 
-    for file in required_files:
+    for file in REQUIRED_FILES:
         if (input_path / file).exists():
             found_files.append(file)
             console.print(f"  [green]OK[/green] {file}")
@@ -89,11 +99,702 @@ def _check_and_display_files(input_path: Path) -> tuple[list[str], list[str]]:
     return missing_files, found_files
 
 
+def _open_cache(
+    cache_dir: Optional[Path], cache_max_size: int, cache_container: Optional[str]
+) -> Optional["ConversionCache"]:
+    """Open the conversion cache selected on the command line.
+
+    Args:
+        cache_dir: Local cache directory
+        cache_max_size: Maximum size of the local cache in MB
+        cache_container: Azure Blob container of a shared cache
+
+    Returns:
+        Cache backend, or None if no cache was selected
+    """
+    if cache_dir is not None and cache_container is not None:
+        console.print("[red]Error: --cache and --cache-container cannot be combined[/red]")
+        raise typer.Exit(code=1)
+
+    if cache_dir is not None:
+        from sds2roster.cache import LocalConversionCache
+
+        return LocalConversionCache(cache_dir, max_bytes=cache_max_size * 1024 * 1024)
+
+    if cache_container is None:
+        return None
+
+    try:
+        from sds2roster.azure.blob_storage import BlobStorageClient
+        from sds2roster.cache import BlobConversionCache
+    except ImportError:
+        console.print(
+            "[red]Error: Azure dependencies not installed. "
+            "Run: pip install sds2roster[azure][/red]"
+        )
+        raise typer.Exit(code=1)
+
+    conn_str = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
+    if not conn_str:
+        console.print(
+            "[red]Error: Azure connection string not provided. "
+            "Set AZURE_STORAGE_CONNECTION_STRING[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    client = BlobStorageClient(connection_string=conn_str, container_name=cache_container)
+    return BlobConversionCache(client)
+
+
+def _blob_client(container: str) -> "BlobStorageClient":
+    """Connect to a Blob container with AZURE_STORAGE_CONNECTION_STRING."""
+    try:
+        from sds2roster.azure.blob_storage import BlobStorageClient
+    except ImportError:
+        console.print(
+            "[red]Error: Azure dependencies not installed. "
+            "Run: pip install sds2roster[azure][/red]"
+        )
+        raise typer.Exit(code=1)
+
+    conn_str = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
+    if not conn_str:
+        console.print(
+            "[red]Error: Azure connection string not provided. "
+            "Set AZURE_STORAGE_CONNECTION_STRING[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    return BlobStorageClient(connection_string=conn_str, container_name=container)
+
+
+def _open_blob_inputs(container: str, input_path: Path, stack: ExitStack) -> dict[str, IO[str]]:
+    """Open the SDS files under a Blob Storage prefix as text streams.
+
+    Args:
+        container: Azure Blob container of the SDS files
+        input_path: Blob prefix of the SDS files
+        stack: Exit stack that closes the streams
+
+    Returns:
+        Streams keyed by parse_all argument name
+    """
+    client = _blob_client(container)
+    prefix = input_path.as_posix().strip("/")
+    prefix = "" if prefix in ("", ".") else f"{prefix}/"
+
+    missing_files = [name for name in REQUIRED_FILES if not client.blob_exists(prefix + name)]
+    if missing_files:
+        _display_missing_files_error(missing_files)
+        raise typer.Exit(code=1)
+
+    return {
+        argument: stack.enter_context(client.open_text(prefix + name))
+        for argument, name in zip(INPUT_ARGUMENTS, REQUIRED_FILES)
+    }
+
+
+def _blob_output_sink(container: str) -> Callable[[Path], BinaryIO]:
+    """Return a writer sink that uploads each output file to a Blob container.
+
+    Args:
+        container: Azure Blob container of the OneRoster files
+
+    Returns:
+        Sink opening a block upload stream named after the output file path
+    """
+    client = _blob_client(container)
+
+    def open_output(file_path: Path) -> BinaryIO:
+        return client.open_write(  # type: ignore[return-value]
+            file_path.as_posix().lstrip("/")
+        )
+
+    return open_output
+
+
+@contextmanager
+def _output_sink(
+    output_path: Path, open_output: Optional[Callable[[Path], BinaryIO]], zip_output: bool
+) -> Iterator[Optional[Callable[[Path], BinaryIO]]]:
+    """Provide the writer sink of the output options for the duration of a conversion.
+
+    Args:
+        output_path: OneRoster output directory, or zip file with zip_output
+        open_output: Blob output stream opener, or None for local output
+        zip_output: Package the files as one zip archive at output_path
+
+    Yields:
+        Writer sink, or None to write local files
+    """
+    if not zip_output:
+        yield open_output
+        return
+
+    from sds2roster.parsers.oneroster_writer import ZipPackage
+
+    output: BinaryIO
+    if open_output is None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output = open(output_path, "wb")
+    else:
+        output = open_output(output_path)
+
+    try:
+        with ZipPackage(output) as package:
+            yield package
+    except BaseException:
+        # Do not leave a partial package behind
+        if open_output is None:
+            output_path.unlink(missing_ok=True)
+        raise
+
+
+def _convert_in_memory(
+    input_path: Path,
+    output_path: Path,
+    verbose: bool,
+    jobs: int = 1,
+    validation: ValidationLevel = ValidationLevel.FULL,
+    delta: Optional["DeltaTracker"] = None,
+    input_files: Optional[dict[str, Any]] = None,
+    sink: Optional[Callable[[Path], BinaryIO]] = None,
+) -> tuple[dict[str, int], dict[str, Path]]:
+    """Parse, convert and write with complete in-memory data models.
+
+    Args:
+        input_path: SDS CSV files directory
+        output_path: OneRoster output directory
+        verbose: Print entity counts
+        jobs: Number of worker processes used for parsing and conversion, and
+            threads used for writing
+        validation: Validation level for parsing and conversion
+        delta: Tracker that fingerprints written rows and filters them to a delta
+        input_files: SDS files (paths or text streams) keyed by parse_all
+            argument name, in place of the files in input_path
+        sink: Output stream opener of the writer, in place of local files
+
+    Returns:
+        Tuple of (number of generated records per OneRoster file type,
+        written file paths keyed by file type)
+    """
+    from sds2roster.converter import SDSToOneRosterConverter
+    from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+    from sds2roster.parsers.sds_parser import SDSCSVParser
+
+    with _progress() as progress:
+        # Parse SDS files
+        task = progress.add_task("[cyan]Parsing SDS CSV files...", total=None)
+        # Compact records instead of Pydantic models keep the data models small
+        parser = SDSCSVParser(validation=validation, compact=True)
+        if input_files is None:
+            input_files = {
+                argument: input_path / name
+                for argument, name in zip(INPUT_ARGUMENTS, REQUIRED_FILES)
+            }
+        sds_data = parser.parse_all(**input_files, workers=jobs)
+        progress.update(task, completed=True)
+
+        if verbose:
+            console.print(f"  Parsed {len(sds_data.schools)} schools")
+            console.print(f"  Parsed {len(sds_data.students)} students")
+            console.print(f"  Parsed {len(sds_data.teachers)} teachers")
+            console.print(f"  Parsed {len(sds_data.sections)} sections")
+            console.print(f"  Parsed {len(sds_data.enrollments)} enrollments")
+            console.print()
+
+        # Convert to OneRoster
+        task = progress.add_task("[cyan]Converting to OneRoster format...", total=None)
+        converter = SDSToOneRosterConverter(validation=validation, compact=True)
+        oneroster_data = converter.convert(sds_data, workers=jobs)
+        progress.update(task, completed=True)
+
+        counts = {
+            "orgs": len(oneroster_data.orgs),
+            "users": len(oneroster_data.users),
+            "courses": len(oneroster_data.courses),
+            "classes": len(oneroster_data.classes),
+            "enrollments": len(oneroster_data.enrollments),
+            "academicSessions": len(oneroster_data.academic_sessions),
+            "roles": len(oneroster_data.roles),
+        }
+
+        if verbose:
+            _display_generated_counts(counts)
+
+        # Write OneRoster files
+        task = progress.add_task("[cyan]Writing OneRoster CSV files...", total=None)
+        writer = OneRosterCSVWriter(output_path, delta=delta, sink=sink)
+        written_files = writer.write_all(oneroster_data, workers=jobs)
+        progress.update(task, completed=True)
+
+    return counts, written_files
+
+
+def _convert_streaming(
+    input_path: Path,
+    output_path: Path,
+    verbose: bool,
+    validation: ValidationLevel = ValidationLevel.FULL,
+    delta: Optional["DeltaTracker"] = None,
+    sink: Optional[Callable[[Path], BinaryIO]] = None,
+) -> tuple[dict[str, int], dict[str, Path]]:
+    """Stream rows from the SDS files through conversion into the OneRoster files.
+
+    Args:
+        input_path: SDS CSV files directory
+        output_path: OneRoster output directory
+        verbose: Print entity counts
+        validation: Validation level for parsing and conversion
+        delta: Tracker that fingerprints written rows and filters them to a delta
+        sink: Output stream opener of the writer, in place of local files
+
+    Returns:
+        Tuple of (number of generated records per OneRoster file type,
+        written file paths keyed by file type)
+    """
+    from sds2roster.converter import SDSToOneRosterConverter
+    from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+    from sds2roster.parsers.sds_parser import SDSCSVParser
+    from sds2roster.pipeline import StreamingPipeline
+
+    with _progress() as progress:
+        task = progress.add_task("[cyan]Streaming SDS to OneRoster conversion...", total=None)
+        pipeline = StreamingPipeline(
+            SDSCSVParser(validation=validation, compact=True),
+            OneRosterCSVWriter(output_path, delta=delta, sink=sink),
+            SDSToOneRosterConverter(validation=validation, compact=True),
+        )
+        result = pipeline.run(
+            school_file=input_path / "school.csv",
+            student_file=input_path / "student.csv",
+            teacher_file=input_path / "teacher.csv",
+            section_file=input_path / "section.csv",
+            student_enrollment_file=input_path / "studentEnrollment.csv",
+            teacher_roster_file=input_path / "teacherRoster.csv",
+        )
+        progress.update(task, completed=True)
+
+    if verbose:
+        _display_generated_counts(result.counts)
+
+    return result.counts, result.written_files
+
+
+def _convert_columnar(
+    input_path: Path,
+    output_path: Path,
+    verbose: bool,
+    jobs: int = 1,
+    validation: ValidationLevel = ValidationLevel.FULL,
+    delta: Optional["DeltaTracker"] = None,
+    sink: Optional[Callable[[Path], BinaryIO]] = None,
+) -> tuple[dict[str, int], dict[str, Path]]:
+    """Parse, convert and write whole columns at a time with pandas.
+
+    Args:
+        input_path: SDS CSV files directory
+        output_path: OneRoster output directory
+        verbose: Print entity counts
+        jobs: Number of threads used for writing
+        validation: Validation level for parsing; ``full`` and ``schema-once``
+            both run the header and bulk required-field checks
+        delta: Tracker that fingerprints written rows and filters them to a delta
+        sink: Output stream opener of the writer, in place of local files
+
+    Returns:
+        Tuple of (number of generated records per OneRoster file type,
+        written file paths keyed by file type)
+    """
+    # pandas is only imported when the columnar path is used
+    from sds2roster.columnar_converter import ColumnarConverter
+    from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+    from sds2roster.parsers.sds_columnar import SDSColumnarParser
+
+    with _progress() as progress:
+        task = progress.add_task("[cyan]Parsing SDS CSV files...", total=None)
+        parser = SDSColumnarParser(validation=validation)
+        sds_data = parser.parse_all(
+            school_file=input_path / "school.csv",
+            student_file=input_path / "student.csv",
+            teacher_file=input_path / "teacher.csv",
+            section_file=input_path / "section.csv",
+            student_enrollment_file=input_path / "studentEnrollment.csv",
+            teacher_roster_file=input_path / "teacherRoster.csv",
+        )
+        progress.update(task, completed=True)
+
+        task = progress.add_task("[cyan]Converting to OneRoster format...", total=None)
+        oneroster_data = ColumnarConverter().convert(sds_data)
+        progress.update(task, completed=True)
+
+        counts = {
+            "orgs": len(oneroster_data.orgs),
+            "users": len(oneroster_data.users),
+            "courses": len(oneroster_data.courses),
+            "classes": len(oneroster_data.classes),
+            "enrollments": len(oneroster_data.enrollments),
+            "academicSessions": len(oneroster_data.academic_sessions),
+            "roles": len(oneroster_data.roles),
+        }
+
+        if verbose:
+            _display_generated_counts(counts)
+
+        task = progress.add_task("[cyan]Writing OneRoster CSV files...", total=None)
+        writer = OneRosterCSVWriter(output_path, delta=delta, sink=sink)
+        written_files = writer.write_frames(oneroster_data, workers=jobs)
+        progress.update(task, completed=True)
+
+    return counts, written_files
+
+
+def _progress() -> "Progress":
+    """Return the spinner progress display used while files are processed."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+
+
+def _display_generated_counts(counts: dict[str, int]) -> None:
+    """Display the number of generated records per OneRoster file type."""
+    console.print(f"  Generated {counts['orgs']} organizations")
+    console.print(f"  Generated {counts['users']} users")
+    console.print(f"  Generated {counts['courses']} courses")
+    console.print(f"  Generated {counts['classes']} classes")
+    console.print(f"  Generated {counts['enrollments']} enrollments")
+    console.print(f"  Generated {counts['academicSessions']} academic sessions")
+    console.print()
+
+
+def _check_convert_options(
+    input_path: Path,
+    *,
+    from_blob: bool,
+    to_blob: bool,
+    stream: bool,
+    columnar: bool,
+    jobs: int,
+    zip_output: bool,
+    uses_cache: bool,
+    uses_state: bool,
+) -> None:
+    """Check the local input files and reject option combinations convert cannot run.
+
+    Args:
+        input_path: SDS input directory, or blob prefix with from_blob
+        from_blob: Whether the input is read from a Blob container
+        to_blob: Whether the output is uploaded to a Blob container
+        stream: Whether rows are streamed one at a time
+        columnar: Whether whole columns are converted with pandas
+        jobs: Number of parallel workers
+        zip_output: Whether the output is one zip package
+        uses_cache: Whether a conversion cache is selected
+        uses_state: Whether --since or --save-state is given
+
+    Raises:
+        typer.Exit: If the input files are missing or the options conflict
+    """
+    if not from_blob:
+        # Validate input directory
+        _validate_input_directory(input_path)
+
+        # Check for required SDS files
+        missing_files = _check_required_files(input_path)
+
+        if missing_files:
+            _display_missing_files_error(missing_files)
+            raise typer.Exit(code=1)
+    elif stream or columnar or uses_cache:
+        # These modes read the input files by path
+        console.print(
+            "[red]Error: --input-container cannot be combined with --stream, --columnar "
+            "or the cache[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    if (to_blob or zip_output) and (uses_cache or uses_state):
+        # The state file and cached files are read from a local output directory
+        option = "--zip" if zip_output else "--output-container"
+        console.print(
+            f"[red]Error: {option} cannot be combined with --since, --save-state "
+            "or the cache[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    if uses_cache and uses_state:
+        console.print(
+            "[red]Error: the cache cannot be combined with --since or --save-state[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    if stream and columnar:
+        console.print("[red]Error: --stream and --columnar cannot be combined[/red]")
+        raise typer.Exit(code=1)
+
+    if stream and jobs > 1:
+        # Streaming converts one row at a time on a single thread
+        console.print("[red]Error: --stream and --jobs cannot be combined[/red]")
+        raise typer.Exit(code=1)
+
+
+def _open_delta(since: Optional[Path], save_state: bool) -> Optional["DeltaTracker"]:
+    """Create the row change tracker selected on the command line.
+
+    Args:
+        since: Previous output directory or state file for an incremental run
+        save_state: Save row fingerprints without a previous state
+
+    Returns:
+        Delta tracker, or None if neither option was given
+
+    Raises:
+        typer.Exit: If the previous state cannot be loaded
+    """
+    from sds2roster.delta import DeltaTracker, FingerprintStore
+
+    if since is not None:
+        try:
+            return DeltaTracker(FingerprintStore.load(since))
+        except FileNotFoundError as e:
+            console.print(f"[red]Error: Previous state not found: {e.filename}[/red]")
+            raise typer.Exit(code=1) from e
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(code=1) from e
+
+    return DeltaTracker() if save_state else None
+
+
+def _restore_from_cache(
+    cache: Optional["ConversionCache"],
+    input_path: Path,
+    output_path: Path,
+    validation: ValidationLevel,
+) -> tuple[Optional[str], Optional[dict[str, int]]]:
+    """Restore the output of identical input from the cache.
+
+    Args:
+        cache: Cache backend, or None if no cache was selected
+        input_path: SDS input directory
+        output_path: OneRoster output directory
+        validation: Validation level, part of the cache key
+
+    Returns:
+        Cache key of the input (None without a cache), and the record counts if
+        the output was restored
+    """
+    if cache is None:
+        return None, None
+
+    from sds2roster.cache import cache_key, conversion_date
+
+    key = cache_key(
+        [input_path / name for name in REQUIRED_FILES],
+        profile=f"validate={validation.value}",
+        conversion_date=conversion_date(input_path / "section.csv"),
+    )
+    metadata = cache.get(key, output_path)
+    if metadata is None:
+        return key, None
+
+    console.print(f"[green]Restored output from cache ({key[:12]})[/green]")
+    return key, metadata["counts"]
+
+
+def _run_conversion(
+    input_path: Path,
+    output_path: Path,
+    verbose: bool,
+    *,
+    stream: bool,
+    columnar: bool,
+    jobs: int,
+    validation: ValidationLevel,
+    delta: Optional["DeltaTracker"],
+    input_files: Optional[dict[str, IO[str]]],
+    sink: Optional[Callable[[Path], BinaryIO]],
+) -> tuple[dict[str, int], dict[str, Path]]:
+    """Convert with the mode selected on the command line.
+
+    Returns:
+        Record counts per OneRoster file type, and the written files
+    """
+    if columnar:
+        return _convert_columnar(
+            input_path, output_path, verbose, jobs=jobs, validation=validation,
+            delta=delta, sink=sink,
+        )
+    if stream:
+        return _convert_streaming(
+            input_path, output_path, verbose, validation=validation, delta=delta, sink=sink
+        )
+    return _convert_in_memory(
+        input_path, output_path, verbose, jobs=jobs, validation=validation,
+        delta=delta, input_files=input_files, sink=sink,
+    )
+
+
+@contextmanager
+def _cpu_profiler(path: Optional[Path], mode: CPUProfileMode) -> Iterator[None]:
+    """Run the body of a with block under the CPU profiler if a profile file is given.
+
+    Args:
+        path: CPU profile output file, or None not to profile
+        mode: Profiler to use
+    """
+    if path is None:
+        yield
+        return
+
+    from sds2roster.profiling import cpu_profile
+
+    with cpu_profile(path, mode):
+        yield
+    console.print(f"CPU profile written to: [bold]{path}[/bold]")
+
+
+def _store_conversion(
+    output_path: Path,
+    counts: dict[str, int],
+    written_files: dict[str, Path],
+    delta: Optional["DeltaTracker"],
+    cache: Optional["ConversionCache"],
+    key: Optional[str],
+) -> None:
+    """Save the row fingerprints and cache the written files, as selected.
+
+    Args:
+        output_path: OneRoster output directory
+        counts: Record counts per OneRoster file type
+        written_files: Written files per file type
+        delta: Delta tracker of the conversion, or None
+        cache: Cache backend, or None
+        key: Cache key of the input, or None without a cache
+    """
+    if delta is not None:
+        delta.current.save(output_path)
+
+    if cache is not None and key is not None:
+        cache.put(key, written_files.values(), {"counts": counts})
+
+
+def _display_conversion_summary(
+    counts: dict[str, int],
+    delta: Optional["DeltaTracker"],
+    output_path: Path,
+    output_container: Optional[str],
+) -> None:
+    """Display the record counts, the changes of an incremental run and the output location."""
+    # Success summary
+    console.print()
+    console.print("[bold green]Conversion completed successfully![/bold green]")
+    console.print()
+
+    # Display summary table
+    table = Table(title="Conversion Summary")
+    table.add_column("Entity Type", style="cyan")
+    table.add_column("Count", style="green", justify="right")
+
+    table.add_row("Organizations", str(counts["orgs"]))
+    table.add_row("Users", str(counts["users"]))
+    table.add_row("Courses", str(counts["courses"]))
+    table.add_row("Classes", str(counts["classes"]))
+    table.add_row("Enrollments", str(counts["enrollments"]))
+    table.add_row("Academic Sessions", str(counts["academicSessions"]))
+
+    console.print(table)
+    console.print()
+
+    if delta is not None and delta.incremental:
+        for file_type, changes in delta.changes.items():
+            console.print(
+                f"  {file_type}: {changes['added']} added, {changes['changed']} changed, "
+                f"{changes['removed']} removed"
+            )
+        console.print()
+
+    if output_container is not None:
+        output_location = f"{output_container}/{output_path.as_posix().lstrip('/')}"
+        console.print(f"Output uploaded to: [bold]{output_location}[/bold]")
+    else:
+        console.print(f"Output written to: [bold]{output_path}[/bold]")
+
+
 @app.command()
 def convert(
     input_path: Path = typer.Argument(..., help="Path to SDS CSV files directory"),
     output_path: Path = typer.Argument(..., help="Path to output OneRoster CSV files"),
-    validate: bool = typer.Option(True, "--validate/--no-validate", help="Validate data"),
+    validate: bool = typer.Option(
+        True, "--validate/--no-validate", help="Validate data (--no-validate: level off)"
+    ),
+    validation: ValidationLevel = typer.Option(
+        ValidationLevel.FULL,
+        "--validation-level",
+        case_sensitive=False,
+        help="Validation level: full, schema-once (header and bulk checks) or off",
+    ),
+    stream: bool = typer.Option(
+        False, "--stream", help="Stream rows through conversion with bounded memory"
+    ),
+    columnar: bool = typer.Option(
+        False, "--columnar", help="Convert whole columns at a time with pandas (fastest)"
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of parallel workers for parsing, conversion and writing",
+    ),
+    since: Optional[Path] = typer.Option(
+        None,
+        "--since",
+        help="Write only rows changed since a previous output directory or state file",
+    ),
+    save_state: bool = typer.Option(
+        False, "--save-state", help="Save row fingerprints for a later --since run"
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None, "--cache", help="Reuse output of identical input from this cache directory"
+    ),
+    cache_max_size: int = typer.Option(
+        1024, "--cache-max-size", min=1, help="Maximum size of the cache directory in MB"
+    ),
+    cache_container: Optional[str] = typer.Option(
+        None,
+        "--cache-container",
+        help="Share cached output through this Azure Blob container",
+    ),
+    profile: Optional[Path] = typer.Option(
+        None, "--profile", help="Write a per-stage timing report (JSON) to this file"
+    ),
+    profile_cpu: Optional[Path] = typer.Option(
+        None, "--profile-cpu", help="Write a CPU profile of the conversion to this file"
+    ),
+    profile_cpu_mode: CPUProfileMode = typer.Option(
+        CPUProfileMode.CPROFILE,
+        "--profile-cpu-mode",
+        case_sensitive=False,
+        help="CPU profiler: cprofile (pstats file) or sampling (collapsed stacks)",
+    ),
+    input_container: Optional[str] = typer.Option(
+        None,
+        "--input-container",
+        help="Read the SDS files from this Azure Blob container; INPUT_PATH is the blob prefix",
+    ),
+    output_container: Optional[str] = typer.Option(
+        None,
+        "--output-container",
+        help="Upload the OneRoster files to this Azure Blob container; OUTPUT_PATH is the prefix",
+    ),
+    zip_output: bool = typer.Option(
+        False, "--zip", help="Write the OneRoster files as one zip package at OUTPUT_PATH"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ) -> None:
     """Convert SDS CSV files to OneRoster format.
@@ -102,95 +803,137 @@ def convert(
     converts them to OneRoster v1.2 format, and writes the output to the
     specified directory.
 
+    With --stream, rows are read, converted and written one at a time instead of
+    loading all data into memory first. Use it for very large districts.
+
+    With --jobs N, the six SDS files are parsed concurrently on N processes, the
+    data is converted in per-school shards on N processes and the OneRoster
+    files are written concurrently on N threads. --stream runs on one thread
+    and cannot be combined with --jobs.
+
+    --validation-level selects how rows are validated: full (every row, the
+    default), schema-once (headers once per file plus a bulk required-field
+    check) or off. --no-validate is the same as --validation-level off. The
+    cheaper levels are meant for input that was validated upstream.
+
+    With --columnar, files are loaded into pandas DataFrames and converted a
+    column at a time. The output files are identical; rows are checked with
+    bulk column checks rather than per-row models, so full behaves like
+    schema-once.
+
+    With --save-state, a fingerprint of every written row is saved as
+    .sds2roster-state.json.gz in the output directory. A later run with
+    --since <that directory or file> writes only added and changed rows, plus a
+    tobedeleted row for every removed record, and lists the files as delta in
+    the manifest. --since always saves the new state for the next run.
+
+    With --cache DIR (or --cache-container NAME for a cache shared through
+    Azure Blob Storage), the output is stored under the SHA-256 of the six
+    input files, the version and the validation level, plus the current UTC
+    date if a term has no start or end date. Converting identical input again
+    restores the stored files instead of parsing and converting.
+
+    With --profile FILE, a JSON report with the duration, row and byte counts,
+    throughput and memory change of every parse, convert, write and Azure stage
+    is written to FILE, also when the conversion fails.
+
+    With --profile-cpu FILE, parsing, conversion and writing run under a CPU
+    profiler: cProfile by default (a pstats file for python -m pstats or
+    snakeviz), or with --profile-cpu-mode sampling a low-overhead sampler that
+    writes collapsed stacks for flamegraph.pl or speedscope.
+
+    With --input-container NAME, the SDS files are read from the Azure Blob
+    container NAME under the prefix INPUT_PATH, decoded and parsed while they
+    download, without local copies. With --output-container NAME, the
+    OneRoster files are uploaded to the container NAME under the prefix
+    OUTPUT_PATH in 4 MiB blocks while they are written, again without local
+    copies. The connection string is read from AZURE_STORAGE_CONNECTION_STRING.
+
+    With --zip, OUTPUT_PATH names a zip file, and the manifest and the OneRoster
+    files are deflated straight into it as they are written, without the CSV
+    files on disk. With --output-container, the zip is uploaded as one blob.
+
     Example:
         sds2roster convert ./sds_data ./oneroster_output
+        sds2roster convert ./sds_data ./oneroster_output --stream
+        sds2roster convert ./sds_data ./oneroster_output --jobs 4
+        sds2roster convert ./sds_data ./oneroster_output --validation-level schema-once
+        sds2roster convert ./sds_data ./oneroster_output --columnar --jobs 4
+        sds2roster convert ./sds_data ./oneroster_output --save-state
+        sds2roster convert ./sds_data ./oneroster_delta --since ./oneroster_output
+        sds2roster convert ./sds_data ./oneroster_output --cache ~/.cache/sds2roster
+        sds2roster convert ./sds_data ./oneroster_output --profile profile.json
+        sds2roster convert ./sds_data ./oneroster_output --profile-cpu out.prof
+        sds2roster convert ./sds_data ./oneroster_output --profile-cpu stacks.txt \\
+            --profile-cpu-mode sampling
+        sds2roster convert tenant1/sds ./oneroster_output --input-container sds-files
+        sds2roster convert ./sds_data tenant1/oneroster --output-container oneroster
+        sds2roster convert ./sds_data ./oneroster.zip --zip
     """
+    from sds2roster.instrumentation import ProfileReport, add_hook, remove_hook
+
     console.print(f"[bold blue]SDS2Roster v{__version__}[/bold blue]")
     console.print()
 
-    # Validate input directory
-    _validate_input_directory(input_path)
-    
-    # Ensure output path is absolute
-    output_path = output_path.absolute()
-
-    # Check for required SDS files
-    missing_files = _check_required_files(input_path)
-
-    if missing_files:
-        _display_missing_files_error(missing_files)
-        raise typer.Exit(code=1)
+    uses_cache = cache_dir is not None or cache_container is not None
+    _check_convert_options(
+        input_path,
+        from_blob=input_container is not None,
+        to_blob=output_container is not None,
+        stream=stream,
+        columnar=columnar,
+        jobs=jobs,
+        zip_output=zip_output,
+        uses_cache=uses_cache,
+        uses_state=since is not None or save_state,
+    )
+
+    if output_container is None:
+        # Ensure output path is absolute
+        output_path = output_path.absolute()
+
+    if not validate:
+        validation = ValidationLevel.OFF
+
+    delta = _open_delta(since, save_state)
+    cache = _open_cache(cache_dir, cache_max_size, cache_container)
+
+    # Blob inputs are streamed by the parser and closed after the conversion
+    inputs = ExitStack()
+    input_files = (
+        _open_blob_inputs(input_container, input_path, inputs)
+        if input_container is not None
+        else None
+    )
+    open_output = _blob_output_sink(output_container) if output_container is not None else None
+
+    report = None
+    if profile is not None:
+        report = ProfileReport()
+        add_hook(report)
 
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            # Parse SDS files
-            task = progress.add_task("[cyan]Parsing SDS CSV files...", total=None)
-            parser = SDSCSVParser()
-            sds_data = parser.parse_all(
-                school_file=input_path / "school.csv",
-                student_file=input_path / "student.csv",
-                teacher_file=input_path / "teacher.csv",
-                section_file=input_path / "section.csv",
-                student_enrollment_file=input_path / "studentEnrollment.csv",
-                teacher_roster_file=input_path / "teacherRoster.csv",
-            )
-            progress.update(task, completed=True)
-
-            if verbose:
-                console.print(f"  Parsed {len(sds_data.schools)} schools")
-                console.print(f"  Parsed {len(sds_data.students)} students")
-                console.print(f"  Parsed {len(sds_data.teachers)} teachers")
-                console.print(f"  Parsed {len(sds_data.sections)} sections")
-                console.print(f"  Parsed {len(sds_data.enrollments)} enrollments")
-                console.print()
-
-            # Convert to OneRoster
-            task = progress.add_task("[cyan]Converting to OneRoster format...", total=None)
-            converter = SDSToOneRosterConverter()
-            oneroster_data = converter.convert(sds_data)
-            progress.update(task, completed=True)
-
-            if verbose:
-                console.print(f"  Generated {len(oneroster_data.orgs)} organizations")
-                console.print(f"  Generated {len(oneroster_data.users)} users")
-                console.print(f"  Generated {len(oneroster_data.courses)} courses")
-                console.print(f"  Generated {len(oneroster_data.classes)} classes")
-                console.print(f"  Generated {len(oneroster_data.enrollments)} enrollments")
-                console.print(
-                    f"  Generated {len(oneroster_data.academic_sessions)} academic sessions"
+        key, counts = _restore_from_cache(cache, input_path, output_path, validation)
+
+        if counts is None:
+            with _cpu_profiler(profile_cpu, profile_cpu_mode), _output_sink(
+                output_path, open_output, zip_output
+            ) as sink:
+                counts, written_files = _run_conversion(
+                    input_path,
+                    output_path,
+                    verbose,
+                    stream=stream,
+                    columnar=columnar,
+                    jobs=jobs,
+                    validation=validation,
+                    delta=delta,
+                    input_files=input_files,
+                    sink=sink,
                 )
-                console.print()
-
-            # Write OneRoster files
-            task = progress.add_task("[cyan]Writing OneRoster CSV files...", total=None)
-            writer = OneRosterCSVWriter(output_path)
-            writer.write_all(oneroster_data)
-            progress.update(task, completed=True)
+            _store_conversion(output_path, counts, written_files, delta, cache, key)
 
-        # Success summary
-        console.print()
-        console.print("[bold green]Conversion completed successfully![/bold green]")
-        console.print()
-
-        # Display summary table
-        table = Table(title="Conversion Summary")
-        table.add_column("Entity Type", style="cyan")
-        table.add_column("Count", style="green", justify="right")
-
-        table.add_row("Organizations", str(len(oneroster_data.orgs)))
-        table.add_row("Users", str(len(oneroster_data.users)))
-        table.add_row("Courses", str(len(oneroster_data.courses)))
-        table.add_row("Classes", str(len(oneroster_data.classes)))
-        table.add_row("Enrollments", str(len(oneroster_data.enrollments)))
-        table.add_row("Academic Sessions", str(len(oneroster_data.academic_sessions)))
-
-        console.print(table)
-        console.print()
-        console.print(f"Output written to: [bold]{output_path}[/bold]")
+        _display_conversion_summary(counts, delta, output_path, output_container)
 
     except FileNotFoundError as e:
         console.print(f"[red]Error: File not found: {e}[/red]")
@@ -200,6 +943,12 @@ def convert(
         if verbose:
             console.print_exception()
         raise typer.Exit(code=1) from e
+    finally:
+        inputs.close()
+        if report is not None and profile is not None:
+            remove_hook(report)
+            report.write(profile)
+            console.print(f"Profile written to: [bold]{profile}[/bold]")
 
 
 @app.command()
@@ -228,13 +977,11 @@ def validate(
         console.print("[red]Validation failed: Missing required files[/red]")
         raise typer.Exit(code=1)
 
+    from sds2roster.parsers.sds_parser import SDSCSVParser
+
     # Try to parse files
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("[cyan]Parsing SDS CSV files...", total=None)
             parser = SDSCSVParser()
             sds_data = parser.parse_all(
@@ -285,6 +1032,90 @@ def validate(
         raise typer.Exit(code=1) from e
 
 
+@app.command()
+def bench(
+    sizes: list[str] = typer.Option(
+        ["1k", "10k"],
+        "--size",
+        "-s",
+        help="Dataset size: 1k, 10k, 100k, 1m or a number of students (repeatable)",
+    ),
+    repetitions: int = typer.Option(
+        3, "--repetitions", "-r", min=1, help="Timed runs per stage; the median is reported"
+    ),
+    validation: ValidationLevel = typer.Option(
+        ValidationLevel.FULL,
+        "--validation-level",
+        case_sensitive=False,
+        help="Validation level: full, schema-once or off",
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write the results to this JSON file"
+    ),
+    work_dir: Optional[Path] = typer.Option(
+        None, "--work-dir", help="Directory for the generated datasets (default: temp dir)"
+    ),
+) -> None:
+    """Benchmark parsing, conversion and writing stage by stage.
+
+    Generates a synthetic SDS dataset for each size and times parse_all, every
+    conversion step and every OneRoster file write. Each stage is reported by
+    the median of several runs, with its tracemalloc peak; each size runs in
+    its own process and reports its peak RSS.
+
+    Example:
+        sds2roster bench
+        sds2roster bench --size 100k --size 1m --output bench.json
+    """
+    import json
+
+    from sds2roster.benchmark import SIZES, run_benchmark
+
+    try:
+        students = [SIZES[size.lower()] if size.lower() in SIZES else int(size) for size in sizes]
+    except ValueError:
+        console.print(f"[red]Error: Unknown size in {', '.join(sizes)}[/red]")
+        raise typer.Exit(code=1)
+
+    console.print(f"[bold blue]SDS2Roster v{__version__} benchmark[/bold blue]")
+    console.print()
+
+    with _progress() as progress:
+        task = progress.add_task("[cyan]Running benchmark...", total=None)
+        report = run_benchmark(
+            students, repetitions=repetitions, validation=validation, work_dir=work_dir
+        )
+        progress.update(task, completed=True)
+
+    for result in report["results"]:
+        table = Table(title=f"{result['students']:,} students")
+        table.add_column("Stage", style="cyan")
+        table.add_column("Median (s)", justify="right")
+        table.add_column("Rows/s", justify="right")
+        table.add_column("Alloc peak (MB)", justify="right")
+
+        for name, stage in result["stages"].items():
+            rows_per_s = stage["rows_per_s"]
+            table.add_row(
+                name,
+                f"{stage['median_s']:.3f}",
+                f"{rows_per_s:,.0f}" if rows_per_s and stage["rows"] else "",
+                f"{stage['tracemalloc_peak_bytes'] / 1024 / 1024:.1f}",
+            )
+
+        console.print(table)
+        peak_rss = result["peak_rss_bytes"]
+        console.print(
+            f"Total: {result['total_median_s']:.2f}s"
+            + (f", peak RSS {peak_rss / 1024 / 1024:.0f} MB" if peak_rss else "")
+        )
+        console.print()
+
+    if output is not None:
+        output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        console.print(f"Results written to: [bold]{output}[/bold]")
+
+
 @app.command()
 def version() -> None:
     """Show version information."""
@@ -307,11 +1138,28 @@ def azure_upload(
     connection_string: Optional[str] = typer.Option(
         None, "--connection-string", help="Azure Storage connection string"
     ),
+    jobs: int = typer.Option(
+        4, "--jobs", "-j", min=1, help="Number of files uploaded at the same time"
+    ),
+    max_concurrency: int = typer.Option(
+        4, "--max-concurrency", min=1, help="Parallel block uploads per file larger than 64 MiB"
+    ),
+    compress: bool = typer.Option(
+        False, "--gzip", help="Upload gzip-compressed blobs with Content-Encoding: gzip"
+    ),
 ) -> None:
     """Upload CSV files to Azure Blob Storage.
 
+    Files are uploaded --jobs at a time, and files larger than 64 MiB are
+    split into blocks that are uploaded over --max-concurrency connections.
+
+    With --gzip, each file is compressed while it is uploaded and stored with
+    Content-Encoding: gzip; azure download restores the original files.
+
     Example:
         sds2roster azure upload ./data --container sds-files --prefix input/
+        sds2roster azure upload ./data --container sds-files --jobs 8
+        sds2roster azure upload ./oneroster --container oneroster --gzip
     """
     try:
         from sds2roster.azure.blob_storage import BlobStorageClient
@@ -336,13 +1184,21 @@ def azure_upload(
     console.print(f"Prefix: [cyan]{prefix or '(root)'}[/cyan]")
     console.print()
 
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         client = BlobStorageClient(connection_string=conn_str, container_name=container)
         with Progress(
             SpinnerColumn(), TextColumn("[progress.description]{task.description}")
         ) as progress:
             task = progress.add_task("Uploading files...", total=None)
-            urls = client.upload_directory(input_path, prefix=prefix)
+            urls = client.upload_directory(
+                input_path,
+                prefix=prefix,
+                workers=jobs,
+                max_concurrency=max_concurrency,
+                compress=compress,
+            )
             progress.update(task, completed=True)
 
         console.print(f"[green]Successfully uploaded {len(urls)} files[/green]")
@@ -362,11 +1218,24 @@ def azure_download(
     connection_string: Optional[str] = typer.Option(
         None, "--connection-string", help="Azure Storage connection string"
     ),
+    jobs: int = typer.Option(
+        4, "--jobs", "-j", min=1, help="Number of files downloaded at the same time"
+    ),
+    max_concurrency: int = typer.Option(
+        4, "--max-concurrency", min=1, help="Parallel ranged GETs per file larger than 32 MiB"
+    ),
 ) -> None:
     """Download CSV files from Azure Blob Storage.
 
+    Files are downloaded --jobs at a time and streamed to disk in chunks, so
+    memory use does not grow with the file size. Files larger than 32 MiB are
+    fetched in byte ranges over --max-concurrency connections. Blobs stored
+    with Content-Encoding: gzip (azure upload --gzip) are decompressed as they
+    arrive.
+
     Example:
         sds2roster azure download ./data --container sds-files --prefix output/
+        sds2roster azure download ./data --container sds-files --jobs 8
     """
     try:
         from sds2roster.azure.blob_storage import BlobStorageClient
@@ -390,13 +1259,17 @@ def azure_download(
     console.print(f"Prefix: [cyan]{prefix or '(all)'}[/cyan]")
     console.print()
 
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         client = BlobStorageClient(connection_string=conn_str, container_name=container)
         with Progress(
             SpinnerColumn(), TextColumn("[progress.description]{task.description}")
         ) as progress:
             task = progress.add_task("Downloading files...", total=None)
-            files = client.download_directory(output_path, prefix=prefix)
+            files = client.download_directory(
+                output_path, prefix=prefix, workers=jobs, max_concurrency=max_concurrency
+            )
             progress.update(task, completed=True)
 
         console.print(f"[green]Successfully downloaded {len(files)} files[/green]")
@@ -414,6 +1287,11 @@ def azure_log(
     source_type: str = typer.Option("SDS", "--source", "-s", help="Source data type"),
     target_type: str = typer.Option("OneRoster", "--target", "-t", help="Target data type"),
     status: str = typer.Option("success", "--status", help="Job status"),
+    newest_first: bool = typer.Option(
+        False,
+        "--newest-first",
+        help="Log under a reverse-time RowKey so that list-jobs shows the newest jobs first",
+    ),
     connection_string: Optional[str] = typer.Option(
         None, "--connection-string", help="Azure Table Storage connection string"
     ),
@@ -421,7 +1299,7 @@ def azure_log(
     """Log a conversion job to Azure Table Storage.
 
     Example:
-        sds2roster azure log job-123 --status success
+        sds2roster azure log job-123 --status success --newest-first
     """
     try:
         from sds2roster.azure.table_storage import TableStorageClient
@@ -441,7 +1319,7 @@ def azure_log(
         raise typer.Exit(code=1)
 
     try:
-        client = TableStorageClient(connection_string=conn_str)
+        client = TableStorageClient(connection_string=conn_str, newest_first=newest_first)
         client.log_conversion(
             conversion_id=conversion_id,
             source_type=source_type,
@@ -465,17 +1343,24 @@ def azure_list_jobs(
     source_type: Optional[str] = typer.Option(None, "--source", "-s", help="Filter by source type"),
     status: Optional[str] = typer.Option(None, "--status", help="Filter by status"),
     limit: int = typer.Option(20, "--limit", "-n", help="Maximum number of jobs to list"),
+    next_token: Optional[str] = typer.Option(
+        None, "--next-token", help="Continue a listing from the token printed by the last page"
+    ),
     connection_string: Optional[str] = typer.Option(
         None, "--connection-string", help="Azure Table Storage connection string"
     ),
 ) -> None:
     """List conversion jobs from Azure Table Storage.
 
+    Only one page of up to --limit jobs, with the displayed columns only, is
+    fetched. Jobs logged with ``azure log --newest-first`` are listed newest
+    first within their source type.
+
     Example:
         sds2roster azure list-jobs --source SDS --status success --limit 10
     """
     try:
-        from sds2roster.azure.table_storage import TableStorageClient
+        from sds2roster.azure.table_storage import CONVERSION_COLUMNS, TableStorageClient
     except ImportError:
         console.print(
             "[red]Error: Azure dependencies not installed. "
@@ -493,7 +1378,13 @@ def azure_list_jobs(
 
     try:
         client = TableStorageClient(connection_string=conn_str)
-        conversions = client.list_conversions(source_type=source_type, status=status, limit=limit)
+        conversions, token = client.list_conversions_page(
+            source_type=source_type,
+            status=status,
+            limit=limit,
+            continuation_token=next_token,
+            select=CONVERSION_COLUMNS,
+        )
 
         if not conversions:
             console.print("[yellow]No conversion jobs found[/yellow]")
@@ -508,15 +1399,17 @@ def azure_list_jobs(
 
         for conv in conversions:
             table.add_row(
-                conv.get("RowKey", "N/A"),
+                conv.get("ConversionId") or conv.get("RowKey", "N/A"),
                 conv.get("SourceType", "N/A"),
                 conv.get("TargetType", "N/A"),
                 conv.get("Status", "N/A"),
-                conv.get("Timestamp", "N/A"),
+                str(conv.get("Timestamp") or "N/A"),
             )
 
         console.print(table)
         console.print(f"\n[dim]Total: {len(conversions)} jobs[/dim]")
+        if token:
+            console.print(f"[dim]More jobs: --next-token {token}[/dim]")
 
     except Exception as e:
         console.print(f"[red]Error listing jobs: {e}[/red]")
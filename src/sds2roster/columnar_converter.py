@@ -0,0 +1,438 @@
+"""Vectorized SDS to OneRoster conversion over columnar frames.
+
+This module converts the frames of ``SDSColumnarParser`` into OneRoster frames
+with whole-column operations instead of one model per row: the enrollment to
+section to school lookup is a hash join, course and term deduplication use
+``drop_duplicates``, and GUID and metadata JSON columns are generated in batches.
+``OneRosterCSVWriter.write_frames`` writes the result to the same CSV files the
+object-based ``SDSToOneRosterConverter`` produces.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import stage
+from .models.oneroster import (
+    ClassType,
+    OneRosterAcademicSession,
+    OneRosterClass,
+    OneRosterCourse,
+    OneRosterDataModel,
+    OneRosterEnrollment,
+    OneRosterOrg,
+    OneRosterRole,
+    OneRosterStatus,
+    OneRosterUser,
+    OrgType,
+)
+from .models.sds import SDSEnrollment, SDSSchool, SDSSection, SDSStudent, SDSTeacher
+from .parsers.sds_columnar import STRING_DTYPE, SDSColumnarData, frame_to_models
+from .utils.validators import (
+    ValidationLevel,
+    create_metadata_json,
+    create_metadata_jsons,
+    create_user_ids_jsons,
+    generate_guids,
+)
+
+# Columns shared by students and teachers when both are converted to users and roles
+_PEOPLE_COLUMNS = [
+    "sis_id",
+    "school_sis_id",
+    "username",
+    "first_name",
+    "last_name",
+    "middle_name",
+    "secondary_email",
+]
+
+
+class OneRosterColumnarData:
+    """OneRoster data held as one DataFrame per entity type.
+
+    Each frame has one column per field of the matching OneRoster model, in model
+    field order. Enum fields hold the Enum values, missing optional values are
+    None or NA, and rows are in the order ``SDSToOneRosterConverter`` produces.
+    """
+
+    def __init__(
+        self,
+        orgs: pd.DataFrame,
+        users: pd.DataFrame,
+        courses: pd.DataFrame,
+        classes: pd.DataFrame,
+        enrollments: pd.DataFrame,
+        academic_sessions: pd.DataFrame,
+        roles: pd.DataFrame,
+    ) -> None:
+        """Initialize columnar OneRoster data.
+
+        Args:
+            orgs: Organization frame
+            users: User frame (students first, then teachers)
+            courses: Course frame
+            classes: Class frame
+            enrollments: Enrollment frame
+            academic_sessions: Academic session frame
+            roles: Role frame (students first, then teachers)
+        """
+        self.orgs = orgs
+        self.users = users
+        self.courses = courses
+        self.classes = classes
+        self.enrollments = enrollments
+        self.academic_sessions = academic_sessions
+        self.roles = roles
+
+    def to_data_model(
+        self, validation: ValidationLevel = ValidationLevel.OFF
+    ) -> OneRosterDataModel:
+        """Build a ``OneRosterDataModel`` view of the frames.
+
+        Args:
+            validation: ``full`` validates every row with its Pydantic model. The
+                other levels build the models without validation.
+
+        Returns:
+            OneRosterDataModel equal to the one ``SDSToOneRosterConverter.convert``
+            returns for the same conversion timestamp
+        """
+        validation = ValidationLevel(validation)
+
+        model = (
+            OneRosterDataModel
+            if validation is ValidationLevel.FULL
+            else OneRosterDataModel.model_construct
+        )
+        return model(
+            orgs=frame_to_models(self.orgs, OneRosterOrg, validation),
+            users=frame_to_models(self.users, OneRosterUser, validation),
+            courses=frame_to_models(self.courses, OneRosterCourse, validation),
+            classes=frame_to_models(self.classes, OneRosterClass, validation),
+            enrollments=frame_to_models(self.enrollments, OneRosterEnrollment, validation),
+            academic_sessions=frame_to_models(
+                self.academic_sessions, OneRosterAcademicSession, validation
+            ),
+            roles=frame_to_models(self.roles, OneRosterRole, validation),
+        )
+
+
+class ColumnarConverter:
+    """Convert columnar SDS frames to columnar OneRoster frames.
+
+    The mapping is the same as ``SDSToOneRosterConverter``, applied to whole
+    columns. Each distinct SIS ID gets its GUID computed once and the result is
+    spread back over the rows that reference it. Only per-row values that cannot
+    be shared (enrollment and role GUIDs, metadata JSON) are computed per row,
+    in batches.
+
+    The input frames are not validated again; use the parser's validation level
+    to control the checks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the converter."""
+        self.conversion_timestamp = datetime.now(timezone.utc)
+
+    def convert(self, sds_data: SDSColumnarData) -> OneRosterColumnarData:
+        """Convert columnar SDS data to columnar OneRoster data.
+
+        Args:
+            sds_data: SDS frames from ``SDSColumnarParser.parse_all``
+
+        Returns:
+            OneRoster frames
+
+        Raises:
+            ValueError: If a SIS ID used to generate a GUID is empty
+        """
+        with stage("convert") as timed:
+            oneroster_data = self._convert(sds_data)
+            timed.rows = sum(
+                len(frame)
+                for frame in (
+                    oneroster_data.orgs,
+                    oneroster_data.users,
+                    oneroster_data.courses,
+                    oneroster_data.classes,
+                    oneroster_data.enrollments,
+                    oneroster_data.academic_sessions,
+                    oneroster_data.roles,
+                )
+            )
+        return oneroster_data
+
+    def _convert(self, sds_data: SDSColumnarData) -> OneRosterColumnarData:
+        """Convert the frames; see ``convert``."""
+        schools = _with_fields(sds_data.schools, SDSSchool)
+        sections = _with_fields(sds_data.sections, SDSSection)
+        enrollments = _with_fields(sds_data.enrollments, SDSEnrollment)
+
+        # Students first, then teachers, as in SDSToOneRosterConverter.iter_users
+        students = _with_fields(sds_data.students, SDSStudent)
+        teachers = _with_fields(sds_data.teachers, SDSTeacher)
+        people = pd.concat(
+            [
+                students[[*_PEOPLE_COLUMNS, "grade"]].assign(role="student"),
+                teachers[_PEOPLE_COLUMNS].assign(role="teacher"),
+            ],
+            ignore_index=True,
+        )
+        user_sourced_ids = _guid_column("user", people["sis_id"])
+        user_org_sourced_ids = _guid_column("org", people["school_sis_id"])
+
+        return OneRosterColumnarData(
+            orgs=self._convert_orgs(schools),
+            users=self._convert_users(people, user_sourced_ids, user_org_sourced_ids),
+            courses=self._convert_courses(sections),
+            classes=self._convert_classes(sections),
+            enrollments=self._convert_enrollments(enrollments, sections),
+            academic_sessions=self._convert_academic_sessions(sections),
+            roles=self._convert_roles(people, user_sourced_ids, user_org_sourced_ids),
+        )
+
+    def _convert_orgs(self, schools: pd.DataFrame) -> pd.DataFrame:
+        """Convert the school frame to an organization frame."""
+        return self._frame(
+            OneRosterOrg,
+            len(schools),
+            sourced_id=_guid_column("org", schools["sis_id"]),
+            name=schools["name"].array,
+            type=OrgType.SCHOOL.value,
+            identifier=schools["school_number"].array,
+            metadata=create_metadata_jsons(schools["sis_id"].tolist()),
+        )
+
+    def _convert_users(
+        self, people: pd.DataFrame, sourced_ids: np.ndarray, org_sourced_ids: np.ndarray
+    ) -> pd.DataFrame:
+        """Convert the combined student and teacher frame to a user frame."""
+        return self._frame(
+            OneRosterUser,
+            len(people),
+            sourced_id=sourced_ids,
+            enabled_user=True,
+            org_sourced_ids=org_sourced_ids,
+            role=people["role"].to_numpy(),
+            username=people["username"].array,
+            user_ids=create_user_ids_jsons(people["sis_id"].tolist()),
+            given_name=people["first_name"].array,
+            family_name=people["last_name"].array,
+            middle_name=people["middle_name"].array,
+            email=people["secondary_email"].array,
+            grades=people["grade"].array,
+        )
+
+    def _convert_courses(self, sections: pd.DataFrame) -> pd.DataFrame:
+        """Convert the section frame to a frame of unique courses."""
+        course_ids = _course_ids(sections)
+
+        # The first section of each course wins
+        first = course_ids.drop_duplicates().index
+        courses = sections.loc[first]
+        course_ids = course_ids.loc[first]
+
+        # Use course_name, or section_name as fallback
+        titles = courses["course_name"].where(
+            _is_present(courses["course_name"]), courses["section_name"]
+        )
+
+        metadata = create_metadata_jsons(course_ids.tolist())
+        descriptions = courses["course_description"]
+        for position in np.flatnonzero(_is_present(descriptions)):
+            metadata[position] = create_metadata_json(
+                course_ids.iat[position],
+                {"course_description": descriptions.iat[position]},
+            )
+
+        return self._frame(
+            OneRosterCourse,
+            len(courses),
+            sourced_id=_guid_column("course", course_ids),
+            title=titles.array,
+            course_code=courses["course_number"].array,
+            org_sourced_id=_guid_column("org", courses["school_sis_id"]),
+            metadata=metadata,
+        )
+
+    def _convert_classes(self, sections: pd.DataFrame) -> pd.DataFrame:
+        """Convert the section frame to a class frame."""
+        # Generate term GUIDs only for sections with term information
+        term_sis_ids = sections["term_sis_id"]
+        has_term = _is_present(term_sis_ids)
+        term_sourced_ids = np.full(len(sections), None, dtype=object)
+        term_sourced_ids[has_term] = _guid_column("term", term_sis_ids[has_term])
+
+        return self._frame(
+            OneRosterClass,
+            len(sections),
+            sourced_id=_guid_column("class", sections["sis_id"]),
+            title=sections["section_name"].array,
+            class_code=sections["section_number"].array,
+            class_type=ClassType.SCHEDULED.value,
+            course_sourced_id=_guid_column("course", _course_ids(sections)),
+            school_sourced_id=_guid_column("org", sections["school_sis_id"]),
+            term_sourced_ids=term_sourced_ids,
+            metadata=create_metadata_jsons(sections["sis_id"].tolist()),
+        )
+
+    def _convert_enrollments(
+        self, enrollments: pd.DataFrame, sections: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Convert the enrollment frame to a OneRoster enrollment frame.
+
+        The school of each enrollment comes from a hash join on the section SIS
+        ID. The first section with a given SIS ID wins, and enrollments in
+        unknown sections are skipped.
+        """
+        section_schools = sections.drop_duplicates("sis_id").set_index("sis_id")[
+            "school_sis_id"
+        ]
+        school_sis_ids = enrollments["section_sis_id"].map(section_schools)
+
+        known = _is_present(school_sis_ids)
+        enrollments = enrollments[known]
+        school_sis_ids = school_sis_ids[known]
+
+        section_sis_ids = enrollments["section_sis_id"]
+        sis_ids = enrollments["sis_id"]
+        is_teacher = (enrollments["role"] == "teacher").to_numpy(dtype=bool)
+
+        # Teachers are primary by default
+        primary = np.full(len(enrollments), None, dtype=object)
+        primary[is_teacher] = True
+
+        return self._frame(
+            OneRosterEnrollment,
+            len(enrollments),
+            sourced_id=generate_guids(
+                "enrollment", (section_sis_ids + ":" + sis_ids).tolist()
+            ),
+            class_sourced_id=_guid_column("class", section_sis_ids),
+            school_sourced_id=_guid_column("org", school_sis_ids),
+            user_sourced_id=_guid_column("user", sis_ids),
+            role=np.where(is_teacher, "teacher", "student").astype(object),
+            primary=primary,
+        )
+
+    def _convert_academic_sessions(self, sections: pd.DataFrame) -> pd.DataFrame:
+        """Convert section term information to a frame of unique academic sessions."""
+        term_sis_ids = sections["term_sis_id"]
+        term_sis_ids = term_sis_ids[_is_present(term_sis_ids)]
+
+        # The first section of each term wins
+        first = term_sis_ids.drop_duplicates().index
+        terms = sections.loc[first]
+        term_sis_ids = term_sis_ids.loc[first]
+
+        # Terms are few, so the dates stay Python objects; a missing date falls
+        # back to the (UTC) conversion timestamp, which cannot share a naive
+        # datetime64 column
+        timestamp = self.conversion_timestamp
+        start_dates = _datetimes(terms["term_start_date"])
+        end_dates = _datetimes(terms["term_end_date"])
+
+        titles = terms["term_name"].where(_is_present(terms["term_name"]), term_sis_ids)
+
+        return self._frame(
+            OneRosterAcademicSession,
+            len(terms),
+            sourced_id=_guid_column("term", term_sis_ids),
+            title=titles.array,
+            type="term",
+            start_date=pd.Series([date or timestamp for date in start_dates], dtype=object),
+            end_date=pd.Series([date or timestamp for date in end_dates], dtype=object),
+            # School year from the term start date, or the current year
+            school_year=[str((date or timestamp).year) for date in start_dates],
+            metadata=create_metadata_jsons(term_sis_ids.tolist()),
+        )
+
+    def _convert_roles(
+        self, people: pd.DataFrame, user_sourced_ids: np.ndarray, org_sourced_ids: np.ndarray
+    ) -> pd.DataFrame:
+        """Convert the combined student and teacher frame to a role frame."""
+        return self._frame(
+            OneRosterRole,
+            len(people),
+            sourced_id=generate_guids(
+                "role", (people["sis_id"] + "_" + people["role"]).tolist()
+            ),
+            user_sourced_id=user_sourced_ids,
+            role_type="primary",
+            role=people["role"].to_numpy(),
+            org_sourced_id=org_sourced_ids,
+            user_profile_sourced_id="",
+        )
+
+    def _frame(self, model_cls: Any, length: int, **columns: Any) -> pd.DataFrame:
+        """Build a frame with one column per model field, in model field order.
+
+        Every record is active and carries the conversion timestamp. Scalars are
+        broadcast, and fields that are not passed get their default, None.
+        """
+        columns.setdefault("status", OneRosterStatus.ACTIVE.value)
+        columns.setdefault("date_last_modified", self.conversion_timestamp)
+        return pd.DataFrame(
+            {field: columns.get(field) for field in model_cls.model_fields},
+            index=pd.RangeIndex(length),
+        )
+
+
+def _with_fields(frame: pd.DataFrame, model_cls: Any) -> pd.DataFrame:
+    """Return the frame with exactly the model's columns; absent ones are NA text."""
+    return pd.DataFrame(
+        {
+            field: (
+                frame[field]
+                if field in frame.columns
+                else pd.Series(pd.NA, index=frame.index, dtype=STRING_DTYPE)
+            )
+            for field in model_cls.model_fields
+        },
+        index=frame.index,
+    )
+
+
+def _is_present(column: pd.Series) -> np.ndarray:
+    """Return a mask of values that are neither missing nor empty (truthy strings)."""
+    mask: np.ndarray = (column.fillna("") != "").to_numpy(dtype=bool)
+    return mask
+
+
+def _course_ids(sections: pd.DataFrame) -> pd.Series:
+    """Return the course ID of each section: course_number, or the section SIS ID."""
+    return sections["course_number"].where(
+        _is_present(sections["course_number"]), sections["sis_id"]
+    )
+
+
+def _guid_column(entity_type: str, sis_ids: pd.Series) -> np.ndarray:
+    """Generate the GUID column for a column of SIS IDs.
+
+    Each distinct SIS ID is hashed once; repeated SIS IDs share the GUID string.
+
+    Raises:
+        ValueError: If a SIS ID is missing or empty
+    """
+    codes, uniques = pd.factorize(sis_ids)
+    if (codes < 0).any():
+        raise ValueError("sis_id cannot be empty")
+    guids: np.ndarray = _object_array(generate_guids(entity_type, uniques.tolist()))[codes]
+    return guids
+
+
+def _datetimes(column: pd.Series) -> list[Optional[datetime]]:
+    """Convert a date column to ``datetime`` objects, with None for missing dates."""
+    if pd.api.types.is_datetime64_any_dtype(column.dtype):
+        return [None if value is pd.NaT else value for value in column.dt.to_pydatetime()]
+    return [None if pd.isna(value) else value for value in column]
+
+
+def _object_array(values: list[Any]) -> np.ndarray:
+    """Wrap a list in a 1-D object array without converting its items."""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
@@ -1,8 +1,13 @@
 """Converter module for transforming SDS data to OneRoster format."""
 
+import gc
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, Optional
 
-from sds2roster.models.oneroster import (
+from .instrumentation import stage
+from .models.oneroster import (
     ClassType,
     EnrollmentRole,
     OneRosterAcademicSession,
@@ -17,30 +22,135 @@ from sds2roster.models.oneroster import (
     OrgType,
     RoleType,
 )
-from .models.sds import SDSDataModel
+from .models.records import record_type, records_from_tuples, to_record
+from .models.sds import (
+    SDSDataModel,
+    SDSEnrollment,
+    SDSSchool,
+    SDSSection,
+    SDSStudent,
+    SDSTeacher,
+)
+from .models.trusted import TrustedModelBuilder, model_to_tuple, models_from_tuples
+from .utils.interning import ValuePool
 from .utils.validators import (
+    ValidationLevel,
     create_metadata_json,
     create_user_ids_json,
     generate_guid,
+    generate_guid_cached,
 )
 
+# Low-cardinality fields whose values are shared between the converted records
+SHARED_FIELDS: dict[type, tuple[str, ...]] = {
+    OneRosterOrg: ("date_last_modified",),
+    OneRosterUser: ("date_last_modified", "org_sourced_ids", "grades"),
+    OneRosterCourse: ("date_last_modified", "org_sourced_id", "school_year_sourced_id"),
+    OneRosterClass: (
+        "date_last_modified",
+        "course_sourced_id",
+        "school_sourced_id",
+        "term_sourced_ids",
+    ),
+    OneRosterEnrollment: ("date_last_modified", "class_sourced_id", "school_sourced_id"),
+    OneRosterAcademicSession: ("date_last_modified", "start_date", "end_date", "school_year"),
+    OneRosterRole: ("date_last_modified", "org_sourced_id", "role_type", "role"),
+}
+
 
 class SDSToOneRosterConverter:
     """Convert SDS data model to OneRoster data model.
 
     This class implements the complete transformation logic from Microsoft SDS
     CSV format to OneRoster v1.2 CSV format, following the data mapping specification.
+
+    Besides ``convert``, which works on a fully loaded ``SDSDataModel``, each entity
+    type has an ``iter_*`` generator that converts records one at a time. The
+    streaming pipeline uses these to convert without loading whole files.
+
+    GUIDs that are referenced from several records (orgs, users, classes, courses
+    and terms) go through ``generate_guid_cached``; GUIDs that are unique per row
+    (enrollment and role sourcedIds) use ``generate_guid`` so they do not evict
+    reusable cache entries.
+
+    At the ``full`` validation level every OneRoster record is validated by its
+    Pydantic model. At the cheaper levels the input is trusted, and since every
+    OneRoster field is derived from SDS fields or generated here, the records are
+    built without validation.
+
+    ``convert(sds_data, workers=N)`` splits the data by school and converts the
+    shards on a process pool. Users, classes, enrollments and roles all belong to
+    a single school; courses and terms, the only shared entities, are
+    deduplicated again when the shards are merged.
+
+    With ``compact=True`` the converter accepts the compact records of
+    ``SDSCSVParser(compact=True)`` and produces compact OneRoster records
+    (``sds2roster.models.records``) in place of Pydantic models; at the ``full``
+    level each record is still validated by its model first.
+
+    Values of the low-cardinality fields in ``SHARED_FIELDS`` (org, class,
+    course and term GUIDs, grades, roles and the conversion timestamp) are
+    dictionary encoded, so records repeating a value share one object. Per-user
+    GUIDs are not pooled, which keeps the pool small in streaming conversions.
     """
 
-    def __init__(self) -> None:
-        """Initialize the converter."""
+    def __init__(
+        self, validation: ValidationLevel = ValidationLevel.FULL, compact: bool = False
+    ) -> None:
+        """Initialize the converter.
+
+        Args:
+            validation: How thoroughly generated records are validated (default: full)
+            compact: Produce compact records instead of Pydantic models
+        """
         self.conversion_timestamp = datetime.now(timezone.utc)
+        self.validation = ValidationLevel(validation)
+        self.compact = compact
+
+        trusted = self.validation is not ValidationLevel.FULL
+        share_fields = ValuePool().share_fields
+
+        def builder(model_cls: Any) -> Callable[..., Any]:
+            build: Callable[..., Any]
+            if compact:
+                if trusted:
+                    build = record_type(model_cls)
+                else:
+
+                    def build(**values: Any) -> Any:
+                        return to_record(model_cls(**values))
+
+            else:
+                # Converted values are already stripped, so trusted builders skip it
+                build = TrustedModelBuilder(model_cls, strip=False) if trusted else model_cls
+
+            # Cached GUIDs may have been evicted and validation copies values,
+            # so repeated values are shared after building
+            shared = SHARED_FIELDS[model_cls]
+            return lambda **values: share_fields(build(**values), shared)
+
+        # Compact records are typed as the models they stand in for
+        self._build_org: Callable[..., OneRosterOrg] = builder(OneRosterOrg)
+        self._build_user: Callable[..., OneRosterUser] = builder(OneRosterUser)
+        self._build_course: Callable[..., OneRosterCourse] = builder(OneRosterCourse)
+        self._build_class: Callable[..., OneRosterClass] = builder(OneRosterClass)
+        self._build_enrollment: Callable[..., OneRosterEnrollment] = builder(OneRosterEnrollment)
+        self._build_academic_session: Callable[..., OneRosterAcademicSession] = builder(
+            OneRosterAcademicSession
+        )
+        self._build_role: Callable[..., OneRosterRole] = builder(OneRosterRole)
 
-    def convert(self, sds_data: SDSDataModel) -> OneRosterDataModel:
+    def convert(
+        self, sds_data: SDSDataModel, workers: Optional[int] = None
+    ) -> OneRosterDataModel:
         """Convert SDS data model to OneRoster data model.
 
         Args:
             sds_data: Complete SDS data model to convert
+            workers: Number of worker processes. If greater than 1, the data is
+                split into per-school shards that are converted in parallel;
+                otherwise it is converted in this process. Both modes return
+                equal data models.
 
         Returns:
             Complete OneRoster data model
@@ -48,28 +158,60 @@ class SDSToOneRosterConverter:
         Raises:
             ValueError: If data validation fails
         """
+        with stage("convert") as timed:
+            if workers is not None and workers > 1:
+                oneroster_data = self._convert_sharded(sds_data, workers)
+            else:
+                oneroster_data = self._convert_sequential(sds_data)
+            timed.rows = (
+                len(oneroster_data.orgs)
+                + len(oneroster_data.users)
+                + len(oneroster_data.courses)
+                + len(oneroster_data.classes)
+                + len(oneroster_data.enrollments)
+                + len(oneroster_data.academic_sessions)
+                + len(oneroster_data.roles)
+            )
+        return oneroster_data
+
+    def _convert_sequential(self, sds_data: SDSDataModel) -> OneRosterDataModel:
+        """Convert SDS data model to OneRoster data model in this process.
+
+        Args:
+            sds_data: Complete SDS data model to convert
+
+        Returns:
+            Complete OneRoster data model
+        """
         # Convert organizations (schools)
-        orgs = self._convert_organizations(sds_data)
+        orgs = self._convert_step("orgs", self._convert_organizations, sds_data)
 
         # Convert users (students and teachers)
-        users = self._convert_users(sds_data)
+        users = self._convert_step("users", self._convert_users, sds_data)
 
         # Convert courses (extracted from sections)
-        courses = self._convert_courses(sds_data)
+        courses = self._convert_step("courses", self._convert_courses, sds_data)
 
         # Convert classes (sections)
-        classes = self._convert_classes(sds_data)
+        classes = self._convert_step("classes", self._convert_classes, sds_data)
 
         # Convert enrollments
-        enrollments = self._convert_enrollments(sds_data)
+        enrollments = self._convert_step("enrollments", self._convert_enrollments, sds_data)
 
         # Convert academic sessions (from section term information)
-        academic_sessions = self._convert_academic_sessions(sds_data)
+        academic_sessions = self._convert_step(
+            "academicSessions", self._convert_academic_sessions, sds_data
+        )
 
         # Convert roles (user role assignments)
-        roles = self._convert_roles(sds_data)
+        roles = self._convert_step("roles", self._convert_roles, sds_data)
 
-        return OneRosterDataModel(
+        build_model = (
+            OneRosterDataModel
+            if self.validation is ValidationLevel.FULL and not self.compact
+            else OneRosterDataModel.model_construct
+        )
+        return build_model(
             orgs=orgs,
             users=users,
             courses=courses,
@@ -79,6 +221,106 @@ class SDSToOneRosterConverter:
             roles=roles,
         )
 
+    def _convert_sharded(self, sds_data: SDSDataModel, workers: int) -> OneRosterDataModel:
+        """Convert per-school shards of the data on a process pool.
+
+        Every record is tagged with the position it has in sequential output, so
+        merging the shards' results by position restores that order exactly.
+        Courses and terms are first deduplicated within each shard; after the
+        merge, the first occurrence across all shards wins, as in ``convert``.
+
+        Records travel between processes as plain tuples of field values, which
+        pickle much faster than model instances. If several shards fail, the
+        error of the first shard is raised.
+
+        Args:
+            sds_data: Complete SDS data model to convert
+            workers: Maximum number of worker processes
+
+        Returns:
+            Complete OneRoster data model, equal to the sequential result
+        """
+        shards = _shard_by_school(sds_data, workers)
+        if not shards:
+            return self._convert_sequential(sds_data)
+
+        # Unpickling and rebuilding allocate many acyclic objects; pausing the
+        # cyclic garbage collector meanwhile saves much of that cost
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+                futures: list[Future] = [
+                    executor.submit(
+                        _convert_shard, self.validation, self.conversion_timestamp, shard
+                    )
+                    for shard in shards
+                ]
+                try:
+                    results = [future.result() for future in futures]
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+
+            def merge(entity: str, model_cls: Any, dedupe: bool = False) -> list[Any]:
+                rows = sorted(
+                    (row for result in results for row in result[entity][0]),
+                    key=itemgetter(0),
+                )
+                if dedupe:
+                    # The first occurrence of each sourcedId wins
+                    seen: set[str] = set()
+                    unique = []
+                    for row in rows:
+                        sourced_id = row[1][0]
+                        if sourced_id not in seen:
+                            seen.add(sourced_id)
+                            unique.append(row)
+                    rows = unique
+
+                fields_set = next(
+                    (result[entity][1] for result in results if result[entity][1]), None
+                )
+                if self.compact:
+                    return records_from_tuples(model_cls, (row[1] for row in rows))
+                return models_from_tuples(model_cls, (row[1] for row in rows), fields_set)
+
+            return OneRosterDataModel.model_construct(
+                orgs=merge("orgs", OneRosterOrg),
+                # Students and teachers set different fields, so they merge separately
+                users=merge("student_users", OneRosterUser)
+                + merge("teacher_users", OneRosterUser),
+                courses=merge("courses", OneRosterCourse, dedupe=True),
+                classes=merge("classes", OneRosterClass),
+                enrollments=merge("enrollments", OneRosterEnrollment),
+                academic_sessions=merge(
+                    "academic_sessions", OneRosterAcademicSession, dedupe=True
+                ),
+                roles=merge("roles", OneRosterRole),
+            )
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    @staticmethod
+    def _convert_step(
+        file_type: str, convert: Callable[[SDSDataModel], list[Any]], sds_data: SDSDataModel
+    ) -> list[Any]:
+        """Run one conversion step as an instrumented stage.
+
+        Args:
+            file_type: OneRoster file type produced by the step
+            convert: Conversion method
+            sds_data: Complete SDS data model
+
+        Returns:
+            Converted records
+        """
+        with stage(f"convert:{file_type}") as timed:
+            records = convert(sds_data)
+            timed.rows = len(records)
+        return records
+
     def _convert_organizations(self, sds_data: SDSDataModel) -> list[OneRosterOrg]:
         """Convert SDS schools to OneRoster organizations.
 
@@ -88,22 +330,7 @@ class SDSToOneRosterConverter:
         Returns:
             List of OneRoster organizations
         """
-        orgs = []
-
-        for school in sds_data.schools:
-            org = OneRosterOrg(
-                sourced_id=generate_guid("org", school.sis_id),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                name=school.name,
-                type=OrgType.SCHOOL,
-                identifier=school.school_number,
-                parent_sourced_id=None,  # Can be set if district information is available
-                metadata=create_metadata_json(school.sis_id),
-            )
-            orgs.append(org)
-
-        return orgs
+        return list(self.iter_orgs(sds_data.schools))
 
     def _convert_users(self, sds_data: SDSDataModel) -> list[OneRosterUser]:
         """Convert SDS students and teachers to OneRoster users.
@@ -114,50 +341,7 @@ class SDSToOneRosterConverter:
         Returns:
             List of OneRoster users (students + teachers)
         """
-        users = []
-
-        # Convert students
-        for student in sds_data.students:
-            org_sourced_id = generate_guid("org", student.school_sis_id)
-
-            user = OneRosterUser(
-                sourced_id=generate_guid("user", student.sis_id),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                enabled_user=True,
-                org_sourced_ids=org_sourced_id,
-                role=RoleType.STUDENT,
-                username=student.username,
-                user_ids=create_user_ids_json(student.sis_id),
-                given_name=student.first_name,
-                family_name=student.last_name,
-                middle_name=student.middle_name,
-                email=student.secondary_email,
-                grades=student.grade,  # Single grade as string
-            )
-            users.append(user)
-
-        # Convert teachers
-        for teacher in sds_data.teachers:
-            org_sourced_id = generate_guid("org", teacher.school_sis_id)
-
-            user = OneRosterUser(
-                sourced_id=generate_guid("user", teacher.sis_id),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                enabled_user=True,
-                org_sourced_ids=org_sourced_id,
-                role=RoleType.TEACHER,
-                username=teacher.username,
-                user_ids=create_user_ids_json(teacher.sis_id),
-                given_name=teacher.first_name,
-                family_name=teacher.last_name,
-                middle_name=teacher.middle_name,
-                email=teacher.secondary_email,
-            )
-            users.append(user)
-
-        return users
+        return list(self.iter_users(sds_data.students, sds_data.teachers))
 
     def _convert_courses(self, sds_data: SDSDataModel) -> list[OneRosterCourse]:
         """Convert SDS sections to OneRoster courses.
@@ -171,40 +355,7 @@ class SDSToOneRosterConverter:
         Returns:
             List of unique OneRoster courses
         """
-        courses = []
-        seen_course_ids = set()
-
-        for section in sds_data.sections:
-            # Use course_number as course ID, or section SIS ID if not available
-            course_id = section.course_number or section.sis_id
-
-            # Skip if we've already created this course
-            if course_id in seen_course_ids:
-                continue
-
-            seen_course_ids.add(course_id)
-
-            # Use course_name, or section_name as fallback
-            course_title = section.course_name or section.section_name
-
-            org_sourced_id = generate_guid("org", section.school_sis_id)
-
-            course = OneRosterCourse(
-                sourced_id=generate_guid("course", course_id),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                title=course_title,
-                course_code=section.course_number,
-                org_sourced_id=org_sourced_id,
-                metadata=create_metadata_json(
-                    course_id, {"course_description": section.course_description}
-                )
-                if section.course_description
-                else create_metadata_json(course_id),
-            )
-            courses.append(course)
-
-        return courses
+        return list(self.iter_courses(sds_data.sections))
 
     def _convert_classes(self, sds_data: SDSDataModel) -> list[OneRosterClass]:
         """Convert SDS sections to OneRoster classes.
@@ -215,35 +366,7 @@ class SDSToOneRosterConverter:
         Returns:
             List of OneRoster classes
         """
-        classes = []
-
-        for section in sds_data.sections:
-            # Generate course GUID using course_number or section SIS ID
-            course_id = section.course_number or section.sis_id
-            course_sourced_id = generate_guid("course", course_id)
-
-            school_sourced_id = generate_guid("org", section.school_sis_id)
-
-            # Generate term GUID if term information exists
-            term_sourced_ids = None
-            if section.term_sis_id:
-                term_sourced_ids = generate_guid("term", section.term_sis_id)
-
-            cls = OneRosterClass(
-                sourced_id=generate_guid("class", section.sis_id),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                title=section.section_name,
-                class_code=section.section_number,
-                class_type=ClassType.SCHEDULED,  # Default to scheduled
-                course_sourced_id=course_sourced_id,
-                school_sourced_id=school_sourced_id,
-                term_sourced_ids=term_sourced_ids,
-                metadata=create_metadata_json(section.sis_id),
-            )
-            classes.append(cls)
-
-        return classes
+        return list(self.iter_classes(sds_data.sections))
 
     def _convert_enrollments(self, sds_data: SDSDataModel) -> list[OneRosterEnrollment]:
         """Convert SDS enrollments to OneRoster enrollments.
@@ -254,45 +377,15 @@ class SDSToOneRosterConverter:
         Returns:
             List of OneRoster enrollments
         """
-        enrollments = []
+        # Section lookups go through the data model's hash index, so this stage
+        # stays linear in the number of enrollments
+        get_section = sds_data.get_section_by_sis_id
 
-        for enrollment in sds_data.enrollments:
-            class_sourced_id = generate_guid("class", enrollment.section_sis_id)
-            user_sourced_id = generate_guid("user", enrollment.sis_id)
+        def school_for_section(section_sis_id: str) -> Optional[str]:
+            section = get_section(section_sis_id)
+            return section.school_sis_id if section else None
 
-            # Determine school from section
-            section = sds_data.get_section_by_sis_id(enrollment.section_sis_id)
-            if not section:
-                # Skip enrollment if section not found
-                continue
-
-            school_sourced_id = generate_guid("org", section.school_sis_id)
-
-            # Map role
-            role = (
-                EnrollmentRole.STUDENT
-                if enrollment.role == "student"
-                else EnrollmentRole.TEACHER
-            )
-
-            # Teachers are primary by default
-            primary = True if enrollment.role == "teacher" else None
-
-            oneroster_enrollment = OneRosterEnrollment(
-                sourced_id=generate_guid(
-                    "enrollment", f"{enrollment.section_sis_id}:{enrollment.sis_id}"
-                ),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                class_sourced_id=class_sourced_id,
-                school_sourced_id=school_sourced_id,
-                user_sourced_id=user_sourced_id,
-                role=role,
-                primary=primary,
-            )
-            enrollments.append(oneroster_enrollment)
-
-        return enrollments
+        return list(self.iter_enrollments(sds_data.enrollments, school_for_section))
 
     def _convert_academic_sessions(
         self, sds_data: SDSDataModel
@@ -307,10 +400,126 @@ class SDSToOneRosterConverter:
         Returns:
             List of unique OneRoster academic sessions
         """
-        sessions = []
-        seen_term_ids = set()
+        return list(self.iter_academic_sessions(sds_data.sections))
+
+    def _convert_roles(self, sds_data: SDSDataModel) -> list[OneRosterRole]:
+        """Convert SDS student and teacher data to OneRoster roles.
+
+        Args:
+            sds_data: SDS data model
+
+        Returns:
+            List of OneRoster roles
+        """
+        return list(self.iter_roles(sds_data.students, sds_data.teachers))
+
+    def iter_orgs(self, schools: Iterable[SDSSchool]) -> Iterator[OneRosterOrg]:
+        """Convert SDS schools to OneRoster organizations one at a time.
+
+        Args:
+            schools: SDS schools in output order
+
+        Yields:
+            OneRoster organizations
+        """
+        for school in schools:
+            yield self.school_to_org(school)
+
+    def iter_users(
+        self, students: Iterable[SDSStudent], teachers: Iterable[SDSTeacher]
+    ) -> Iterator[OneRosterUser]:
+        """Convert SDS students and teachers to OneRoster users one at a time.
+
+        Students are yielded first, followed by teachers.
+
+        Args:
+            students: SDS students in output order
+            teachers: SDS teachers in output order
+
+        Yields:
+            OneRoster users
+        """
+        for student in students:
+            yield self.student_to_user(student)
+
+        for teacher in teachers:
+            yield self.teacher_to_user(teacher)
+
+    def iter_courses(self, sections: Iterable[SDSSection]) -> Iterator[OneRosterCourse]:
+        """Convert SDS sections to unique OneRoster courses one at a time.
+
+        Only the set of course IDs seen so far is kept in memory.
+
+        Args:
+            sections: SDS sections in output order
+
+        Yields:
+            OneRoster courses, the first section of each course wins
+        """
+        seen_course_ids: set[str] = set()
+
+        for section in sections:
+            course_id = self.course_id_for(section)
+
+            # Skip if we've already created this course
+            if course_id in seen_course_ids:
+                continue
+
+            seen_course_ids.add(course_id)
+            yield self.section_to_course(section)
+
+    def iter_classes(self, sections: Iterable[SDSSection]) -> Iterator[OneRosterClass]:
+        """Convert SDS sections to OneRoster classes one at a time.
+
+        Args:
+            sections: SDS sections in output order
+
+        Yields:
+            OneRoster classes
+        """
+        for section in sections:
+            yield self.section_to_class(section)
+
+    def iter_enrollments(
+        self,
+        enrollments: Iterable[SDSEnrollment],
+        school_for_section: Callable[[str], Optional[str]],
+    ) -> Iterator[OneRosterEnrollment]:
+        """Convert SDS enrollments to OneRoster enrollments one at a time.
 
-        for section in sds_data.sections:
+        Args:
+            enrollments: SDS enrollments in output order
+            school_for_section: Returns the school SIS ID of a section SIS ID,
+                or None if the section is unknown
+
+        Yields:
+            OneRoster enrollments; enrollments in unknown sections are skipped
+        """
+        for enrollment in enrollments:
+            # Determine school from section
+            school_sis_id = school_for_section(enrollment.section_sis_id)
+            if not school_sis_id:
+                # Skip enrollment if section not found
+                continue
+
+            yield self.enrollment_to_oneroster(enrollment, school_sis_id)
+
+    def iter_academic_sessions(
+        self, sections: Iterable[SDSSection]
+    ) -> Iterator[OneRosterAcademicSession]:
+        """Convert SDS section terms to unique OneRoster academic sessions one at a time.
+
+        Only the set of term IDs seen so far is kept in memory.
+
+        Args:
+            sections: SDS sections in output order
+
+        Yields:
+            OneRoster academic sessions, the first section of each term wins
+        """
+        seen_term_ids: set[str] = set()
+
+        for section in sections:
             # Skip if no term information
             if not section.term_sis_id:
                 continue
@@ -320,67 +529,405 @@ class SDSToOneRosterConverter:
                 continue
 
             seen_term_ids.add(section.term_sis_id)
+            yield self.section_to_academic_session(section)
 
-            # Extract school year from term start date or use current year
-            school_year = (
-                str(section.term_start_date.year)
-                if section.term_start_date
-                else str(self.conversion_timestamp.year)
-            )
+    def iter_roles(
+        self, students: Iterable[SDSStudent], teachers: Iterable[SDSTeacher]
+    ) -> Iterator[OneRosterRole]:
+        """Convert SDS students and teachers to OneRoster roles one at a time.
 
-            session = OneRosterAcademicSession(
-                sourced_id=generate_guid("term", section.term_sis_id),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                title=section.term_name or section.term_sis_id,
-                type="term",  # Default type
-                start_date=section.term_start_date or self.conversion_timestamp,
-                end_date=section.term_end_date or self.conversion_timestamp,
-                school_year=school_year,
-                metadata=create_metadata_json(section.term_sis_id),
+        Args:
+            students: SDS students in output order
+            teachers: SDS teachers in output order
+
+        Yields:
+            OneRoster roles, students first
+        """
+        for student in students:
+            yield self.student_to_role(student)
+
+        for teacher in teachers:
+            yield self.teacher_to_role(teacher)
+
+    @staticmethod
+    def course_id_for(section: SDSSection) -> str:
+        """Return the course ID of a section.
+
+        Uses course_number as course ID, or section SIS ID if not available.
+        """
+        return section.course_number or section.sis_id
+
+    def school_to_org(self, school: SDSSchool) -> OneRosterOrg:
+        """Convert a single SDS school to a OneRoster organization."""
+        return self._build_org(
+            sourced_id=generate_guid_cached("org", school.sis_id),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            name=school.name,
+            type=OrgType.SCHOOL,
+            identifier=school.school_number,
+            parent_sourced_id=None,  # Can be set if district information is available
+            metadata=create_metadata_json(school.sis_id),
+        )
+
+    def student_to_user(self, student: SDSStudent) -> OneRosterUser:
+        """Convert a single SDS student to a OneRoster user."""
+        org_sourced_id = generate_guid_cached("org", student.school_sis_id)
+
+        return self._build_user(
+            sourced_id=generate_guid_cached("user", student.sis_id),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            enabled_user=True,
+            org_sourced_ids=org_sourced_id,
+            role=RoleType.STUDENT,
+            username=student.username,
+            user_ids=create_user_ids_json(student.sis_id),
+            given_name=student.first_name,
+            family_name=student.last_name,
+            middle_name=student.middle_name,
+            email=student.secondary_email,
+            grades=student.grade,  # Single grade as string
+        )
+
+    def teacher_to_user(self, teacher: SDSTeacher) -> OneRosterUser:
+        """Convert a single SDS teacher to a OneRoster user."""
+        org_sourced_id = generate_guid_cached("org", teacher.school_sis_id)
+
+        return self._build_user(
+            sourced_id=generate_guid_cached("user", teacher.sis_id),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            enabled_user=True,
+            org_sourced_ids=org_sourced_id,
+            role=RoleType.TEACHER,
+            username=teacher.username,
+            user_ids=create_user_ids_json(teacher.sis_id),
+            given_name=teacher.first_name,
+            family_name=teacher.last_name,
+            middle_name=teacher.middle_name,
+            email=teacher.secondary_email,
+        )
+
+    def section_to_course(self, section: SDSSection) -> OneRosterCourse:
+        """Convert a single SDS section to a OneRoster course (without deduplication)."""
+        course_id = self.course_id_for(section)
+
+        # Use course_name, or section_name as fallback
+        course_title = section.course_name or section.section_name
+
+        org_sourced_id = generate_guid_cached("org", section.school_sis_id)
+
+        return self._build_course(
+            sourced_id=generate_guid_cached("course", course_id),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            title=course_title,
+            course_code=section.course_number,
+            org_sourced_id=org_sourced_id,
+            metadata=create_metadata_json(
+                course_id, {"course_description": section.course_description}
             )
-            sessions.append(session)
+            if section.course_description
+            else create_metadata_json(course_id),
+        )
 
-        return sessions
+    def section_to_class(self, section: SDSSection) -> OneRosterClass:
+        """Convert a single SDS section to a OneRoster class."""
+        # Generate course GUID using course_number or section SIS ID
+        course_sourced_id = generate_guid_cached("course", self.course_id_for(section))
+
+        school_sourced_id = generate_guid_cached("org", section.school_sis_id)
+
+        # Generate term GUID if term information exists
+        term_sourced_ids = None
+        if section.term_sis_id:
+            term_sourced_ids = generate_guid_cached("term", section.term_sis_id)
+
+        return self._build_class(
+            sourced_id=generate_guid_cached("class", section.sis_id),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            title=section.section_name,
+            class_code=section.section_number,
+            class_type=ClassType.SCHEDULED,  # Default to scheduled
+            course_sourced_id=course_sourced_id,
+            school_sourced_id=school_sourced_id,
+            term_sourced_ids=term_sourced_ids,
+            metadata=create_metadata_json(section.sis_id),
+        )
 
-    def _convert_roles(self, sds_data: SDSDataModel) -> list[OneRosterRole]:
-        """Convert SDS student and teacher data to OneRoster roles.
+    def enrollment_to_oneroster(
+        self, enrollment: SDSEnrollment, school_sis_id: str
+    ) -> OneRosterEnrollment:
+        """Convert a single SDS enrollment to a OneRoster enrollment.
 
         Args:
-            sds_data: SDS data model
+            enrollment: SDS enrollment
+            school_sis_id: SIS ID of the school the enrollment's section belongs to
+        """
+        class_sourced_id = generate_guid_cached("class", enrollment.section_sis_id)
+        user_sourced_id = generate_guid_cached("user", enrollment.sis_id)
+        school_sourced_id = generate_guid_cached("org", school_sis_id)
+
+        # Map role
+        role = (
+            EnrollmentRole.STUDENT
+            if enrollment.role == "student"
+            else EnrollmentRole.TEACHER
+        )
 
-        Returns:
-            List of OneRoster roles
+        # Teachers are primary by default
+        primary = True if enrollment.role == "teacher" else None
+
+        return self._build_enrollment(
+            sourced_id=generate_guid(
+                "enrollment", f"{enrollment.section_sis_id}:{enrollment.sis_id}"
+            ),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            class_sourced_id=class_sourced_id,
+            school_sourced_id=school_sourced_id,
+            user_sourced_id=user_sourced_id,
+            role=role,
+            primary=primary,
+        )
+
+    def section_to_academic_session(self, section: SDSSection) -> OneRosterAcademicSession:
+        """Convert the term of a single SDS section to a OneRoster academic session.
+
+        The section must have a term SIS ID.
         """
-        roles = []
-
-        # Convert student roles
-        for student in sds_data.students:
-            role = OneRosterRole(
-                sourced_id=generate_guid("role", f"{student.sis_id}_student"),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                user_sourced_id=generate_guid("user", student.sis_id),
-                role_type="primary",
-                role="student",
-                org_sourced_id=generate_guid("org", student.school_sis_id),
-                user_profile_sourced_id="",
-            )
-            roles.append(role)
-
-        # Convert teacher roles
-        for teacher in sds_data.teachers:
-            role = OneRosterRole(
-                sourced_id=generate_guid("role", f"{teacher.sis_id}_teacher"),
-                status=OneRosterStatus.ACTIVE,
-                date_last_modified=self.conversion_timestamp,
-                user_sourced_id=generate_guid("user", teacher.sis_id),
-                role_type="primary",
-                role="teacher",
-                org_sourced_id=generate_guid("org", teacher.school_sis_id),
-                user_profile_sourced_id="",
+        term_sis_id = section.term_sis_id or ""
+
+        # Extract school year from term start date or use current year
+        school_year = (
+            str(section.term_start_date.year)
+            if section.term_start_date
+            else str(self.conversion_timestamp.year)
+        )
+
+        return self._build_academic_session(
+            sourced_id=generate_guid_cached("term", term_sis_id),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            title=section.term_name or term_sis_id,
+            type="term",  # Default type
+            start_date=section.term_start_date or self.conversion_timestamp,
+            end_date=section.term_end_date or self.conversion_timestamp,
+            school_year=school_year,
+            metadata=create_metadata_json(term_sis_id),
+        )
+
+    def student_to_role(self, student: SDSStudent) -> OneRosterRole:
+        """Convert a single SDS student to a OneRoster role."""
+        return self._build_role(
+            sourced_id=generate_guid("role", f"{student.sis_id}_student"),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            user_sourced_id=generate_guid_cached("user", student.sis_id),
+            role_type="primary",
+            role="student",
+            org_sourced_id=generate_guid_cached("org", student.school_sis_id),
+            user_profile_sourced_id="",
+        )
+
+    def teacher_to_role(self, teacher: SDSTeacher) -> OneRosterRole:
+        """Convert a single SDS teacher to a OneRoster role."""
+        return self._build_role(
+            sourced_id=generate_guid("role", f"{teacher.sis_id}_teacher"),
+            status=OneRosterStatus.ACTIVE,
+            date_last_modified=self.conversion_timestamp,
+            user_sourced_id=generate_guid_cached("user", teacher.sis_id),
+            role_type="primary",
+            role="teacher",
+            org_sourced_id=generate_guid_cached("org", teacher.school_sis_id),
+            user_profile_sourced_id="",
+        )
+
+
+# A shard holds (position, field tuple) rows per SDS entity type; enrollment
+# rows also carry the school SIS ID of their section
+_Shard = dict[str, list[tuple]]
+
+
+def _shard_by_school(sds_data: SDSDataModel, shard_count: int) -> list[_Shard]:
+    """Split SDS data into at most shard_count shards of whole schools.
+
+    Schools are assigned largest first to the shard with the fewest records, so
+    the shards are about equally expensive to convert. Positions are those of
+    the sequential output: teachers follow students, and enrollments in unknown
+    sections are left out, as ``convert`` skips them.
+
+    Args:
+        sds_data: Complete SDS data model
+        shard_count: Maximum number of shards
+
+    Returns:
+        Non-empty shards
+    """
+    shards = _assign_schools(list(_rows_by_school(sds_data).values()), shard_count)
+
+    # Convert each shard's rows in output order
+    for shard in shards:
+        for rows in shard.values():
+            rows.sort(key=itemgetter(0))
+
+    return shards
+
+
+def _empty_shard() -> _Shard:
+    """Return a shard without rows."""
+    return {entity: [] for entity in ("schools", "students", "teachers", "sections", "enrollments")}
+
+
+def _rows_by_school(sds_data: SDSDataModel) -> dict[str, _Shard]:
+    """Collect the (position, field tuple) rows of each school.
+
+    Args:
+        sds_data: Complete SDS data model
+
+    Returns:
+        Rows per entity type, keyed by school SIS ID
+    """
+    by_school: dict[str, _Shard] = {}
+
+    def rows_of(school_sis_id: str, entity: str) -> list[tuple]:
+        school_rows = by_school.get(school_sis_id)
+        if school_rows is None:
+            school_rows = by_school[school_sis_id] = _empty_shard()
+        return school_rows[entity]
+
+    for position, school in enumerate(sds_data.schools):
+        rows_of(school.sis_id, "schools").append((position, model_to_tuple(school)))
+
+    for position, student in enumerate(sds_data.students):
+        rows_of(student.school_sis_id, "students").append((position, model_to_tuple(student)))
+
+    offset = len(sds_data.students)
+    for position, teacher in enumerate(sds_data.teachers, offset):
+        rows_of(teacher.school_sis_id, "teachers").append((position, model_to_tuple(teacher)))
+
+    for position, section in enumerate(sds_data.sections):
+        rows_of(section.school_sis_id, "sections").append((position, model_to_tuple(section)))
+
+    get_section = sds_data.get_section_by_sis_id
+    for position, enrollment in enumerate(sds_data.enrollments):
+        enrollment_section = get_section(enrollment.section_sis_id)
+        school_sis_id = enrollment_section.school_sis_id if enrollment_section else None
+        if not school_sis_id:
+            # Skip enrollment if section not found
+            continue
+        rows_of(school_sis_id, "enrollments").append(
+            (position, model_to_tuple(enrollment), school_sis_id)
+        )
+
+    return by_school
+
+
+def _assign_schools(schools: list[_Shard], shard_count: int) -> list[_Shard]:
+    """Assign the rows of each school, largest first, to the shard with the fewest rows.
+
+    Args:
+        schools: Rows of each school
+        shard_count: Maximum number of shards
+
+    Returns:
+        Non-empty shards; rows are in assignment order
+    """
+
+    def size(school_rows: _Shard) -> int:
+        return sum(len(rows) for rows in school_rows.values())
+
+    shards = [_empty_shard() for _ in range(min(shard_count, len(schools)))]
+    shard_sizes = [0] * len(shards)
+    for school_rows in sorted(schools, key=size, reverse=True):
+        target = shard_sizes.index(min(shard_sizes))
+        for entity, rows in school_rows.items():
+            shards[target][entity].extend(rows)
+        shard_sizes[target] += size(school_rows)
+
+    return shards
+
+
+def _convert_shard(
+    validation: ValidationLevel, conversion_timestamp: datetime, shard: _Shard
+) -> dict[str, tuple[list[tuple[int, tuple]], frozenset[str]]]:
+    """Convert one shard in a worker process.
+
+    Args:
+        validation: Validation level of the worker's converter
+        conversion_timestamp: Timestamp shared by all shards
+        shard: Rows from ``_shard_by_school``
+
+    Returns:
+        For each OneRoster entity type, (position, field tuple) rows in position
+        order and the set of fields the converter set explicitly
+    """
+    converter = SDSToOneRosterConverter(validation=validation)
+    converter.conversion_timestamp = conversion_timestamp
+
+    def models(entity: str, model_cls: Any) -> list[tuple[int, Any]]:
+        rows = shard[entity]
+        return list(
+            zip(
+                (row[0] for row in rows),
+                models_from_tuples(model_cls, (row[1] for row in rows)),
             )
-            roles.append(role)
+        )
 
-        return roles
+    schools = models("schools", SDSSchool)
+    students = models("students", SDSStudent)
+    teachers = models("teachers", SDSTeacher)
+    sections = models("sections", SDSSection)
+    enrollments = [
+        (position, enrollment, row[2])
+        for (position, enrollment), row in zip(
+            models("enrollments", SDSEnrollment), shard["enrollments"]
+        )
+    ]
+
+    courses: list[tuple[int, Any]] = []
+    seen_course_ids: set[str] = set()
+    academic_sessions: list[tuple[int, Any]] = []
+    seen_term_ids: set[str] = set()
+    for position, section in sections:
+        course_id = converter.course_id_for(section)
+        if course_id not in seen_course_ids:
+            seen_course_ids.add(course_id)
+            courses.append((position, converter.section_to_course(section)))
 
+        if section.term_sis_id and section.term_sis_id not in seen_term_ids:
+            seen_term_ids.add(section.term_sis_id)
+            academic_sessions.append((position, converter.section_to_academic_session(section)))
+
+    converted: dict[str, list[tuple[int, Any]]] = {
+        "orgs": [(position, converter.school_to_org(school)) for position, school in schools],
+        "student_users": [
+            (position, converter.student_to_user(student)) for position, student in students
+        ],
+        "teacher_users": [
+            (position, converter.teacher_to_user(teacher)) for position, teacher in teachers
+        ],
+        "courses": courses,
+        "classes": [
+            (position, converter.section_to_class(section)) for position, section in sections
+        ],
+        "enrollments": [
+            (position, converter.enrollment_to_oneroster(enrollment, school_sis_id))
+            for position, enrollment, school_sis_id in enrollments
+        ],
+        "academic_sessions": academic_sessions,
+        "roles": [
+            *((position, converter.student_to_role(student)) for position, student in students),
+            *((position, converter.teacher_to_role(teacher)) for position, teacher in teachers),
+        ],
+    }
+
+    return {
+        entity: (
+            [(position, model_to_tuple(model)) for position, model in rows],
+            frozenset(rows[0][1].model_fields_set) if rows else frozenset(),
+        )
+        for entity, rows in converted.items()
+    }
@@ -0,0 +1,205 @@
+"""Incremental (delta) OneRoster output.
+
+A conversion can record a compact fingerprint of every row it writes, keyed by
+OneRoster file type and sourcedId. A later conversion compares its rows with
+those fingerprints and writes only the rows that were added, changed or
+removed since, as OneRoster delta files.
+"""
+
+import gzip
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+from .models.oneroster import OneRosterStatus
+from .utils.validators import format_iso8601
+
+#: File name of the fingerprint state inside an output directory
+STATE_FILE_NAME = ".sds2roster-state.json.gz"
+
+STATE_VERSION = 1
+
+
+def fingerprint_row(cells: Sequence[str]) -> str:
+    """Return a 64-bit fingerprint of a CSV row as 16 hex digits.
+
+    Args:
+        cells: Cell values of the row
+
+    Returns:
+        Fingerprint that changes when any cell changes
+    """
+    # The unit separator cannot occur in the cells, so joining is unambiguous
+    return hashlib.blake2b("\x1f".join(cells).encode("utf-8"), digest_size=8).hexdigest()
+
+
+class FingerprintStore:
+    """Row fingerprints per OneRoster file type, keyed by sourcedId.
+
+    Stored as gzip-compressed JSON. Rows keep the order in which they were
+    written, so rows removed in a later run are reported in a stable order.
+    """
+
+    def __init__(self, files: Optional[dict[str, dict[str, str]]] = None) -> None:
+        """Initialize the store.
+
+        Args:
+            files: File type -> {sourcedId: fingerprint} (default: empty)
+        """
+        self.files: dict[str, dict[str, str]] = files if files is not None else {}
+
+    @classmethod
+    def load(cls, path: Path) -> "FingerprintStore":
+        """Load a store from a state file or from an output directory containing one.
+
+        Args:
+            path: State file, or a previous output directory
+
+        Returns:
+            Loaded store
+
+        Raises:
+            FileNotFoundError: If the state file does not exist
+            ValueError: If the file is not a fingerprint state file
+        """
+        if path.is_dir():
+            path = path / STATE_FILE_NAME
+
+        data = path.read_bytes()
+        try:
+            state = json.loads(gzip.decompress(data))
+        except (OSError, EOFError, ValueError) as e:
+            raise ValueError(f"Invalid fingerprint state file: {path}") from e
+
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != STATE_VERSION
+            or not isinstance(state.get("files"), dict)
+        ):
+            raise ValueError(f"Unsupported fingerprint state file: {path}")
+
+        return cls(state["files"])
+
+    def save(self, path: Path) -> Path:
+        """Save the store to a state file.
+
+        Args:
+            path: State file, or an output directory to save it in
+
+        Returns:
+            Path to the written state file
+        """
+        if path.is_dir():
+            path = path / STATE_FILE_NAME
+
+        state = {"version": STATE_VERSION, "files": self.files}
+        data = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        # Fingerprints barely compress; level 1 is several times faster than the default
+        path.write_bytes(gzip.compress(data, compresslevel=1))
+        return path
+
+
+class DeltaTracker:
+    """Record row fingerprints while writing, and optionally filter to a delta.
+
+    Without a previous store every row is passed through and only fingerprinted,
+    which prepares the state for a later delta run. With a previous store only
+    added and changed rows are passed through, with status ``active``, followed
+    by a ``tobedeleted`` row for every sourcedId that is no longer present.
+    Emitted rows carry the tracker's timestamp as dateLastModified, since
+    OneRoster requires both columns in delta files.
+
+    Row cells must start with sourcedId, status and dateLastModified, as in all
+    OneRoster entity files written by ``OneRosterCSVWriter``.
+    """
+
+    def __init__(
+        self,
+        previous: Optional[FingerprintStore] = None,
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            previous: Fingerprints of the previous run; None writes full (bulk) files
+            timestamp: dateLastModified of emitted rows (default: now, UTC)
+        """
+        self.previous = previous
+        self.current = FingerprintStore()
+        self.date_last_modified = format_iso8601(
+            (timestamp or datetime.now(timezone.utc)).replace(tzinfo=None)
+        )
+        #: Number of emitted rows per file type and change kind
+        self.changes: dict[str, dict[str, int]] = {}
+
+    @property
+    def incremental(self) -> bool:
+        """Whether only changed rows are written."""
+        return self.previous is not None
+
+    def has_previous_rows(self, file_type: str) -> bool:
+        """Return True if the previous run wrote rows of file_type.
+
+        Such files must be written even without current rows, to delete the old rows.
+        """
+        return self.previous is not None and bool(self.previous.files.get(file_type))
+
+    def track(
+        self, file_type: str, fieldnames: Sequence[str], rows: Iterable[Sequence[str]]
+    ) -> Iterator[Sequence[str]]:
+        """Fingerprint rows of one file and yield the rows to write.
+
+        Args:
+            file_type: OneRoster file type (e.g. "users")
+            fieldnames: CSV column names of the file
+            rows: Bulk rows, one sequence of cell values per record
+
+        Yields:
+            All rows, or in incremental mode the added, changed and removed rows
+            (once per sourcedId)
+        """
+        current: dict[str, str] = {}
+        self.current.files[file_type] = current
+
+        # A sourcedId that occurs more than once keeps the fingerprint of its first
+        # row, as the converter keeps the first record, so reruns compare alike
+        if self.previous is None:
+            for row in rows:
+                if row[0] not in current:
+                    current[row[0]] = fingerprint_row(row)
+                yield row
+            return
+
+        previous = self.previous.files.get(file_type, {})
+        date_last_modified = self.date_last_modified
+        active = OneRosterStatus.ACTIVE.value
+        added = changed = 0
+
+        for row in rows:
+            sourced_id = row[0]
+            if sourced_id in current:
+                continue
+            fingerprint = fingerprint_row(row)
+            current[sourced_id] = fingerprint
+
+            previous_fingerprint = previous.get(sourced_id)
+            if previous_fingerprint == fingerprint:
+                continue
+            if previous_fingerprint is None:
+                added += 1
+            else:
+                changed += 1
+            yield (sourced_id, active, date_last_modified, *row[3:])
+
+        # Removed rows only need their sourcedId; the other columns stay empty
+        removed = 0
+        empty_cells = ("",) * (len(fieldnames) - 3)
+        deleted = OneRosterStatus.TOBEDELETED.value
+        for sourced_id in previous:
+            if sourced_id not in current:
+                removed += 1
+                yield (sourced_id, deleted, date_last_modified, *empty_cells)
+
+        self.changes[file_type] = {"added": added, "changed": changed, "removed": removed}
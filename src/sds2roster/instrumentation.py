@@ -0,0 +1,253 @@
+"""Stage-level instrumentation of conversions.
+
+The parser, converter, writer and Azure clients wrap each unit of work in
+``stage(name)``. Registered hooks are told when a stage starts and finishes,
+with its row count, byte count, duration and change in resident memory.
+
+Without registered hooks ``stage`` returns a shared no-op object, so the
+instrumented code pays only for one function call per stage::
+
+    with stage("parse:school.csv", path=file_path) as timed:
+        schools = list(rows)
+        timed.rows = len(schools)
+
+Stage names are ``<step>`` for a whole step (``parse``, ``convert``,
+``write``, ``stream``, ``azure.blob.upload``, ``azure.table.query``, ...)
+and ``<step>:<part>`` for the parts of a step, e.g. ``parse:student.csv`` or
+``convert:users``.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Protocol, TypeVar, Union
+
+_T = TypeVar("_T")
+
+_hooks: list["StageHook"] = []
+_hooks_lock = threading.Lock()
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class StageHook(Protocol):
+    """Receiver of stage events."""
+
+    def stage_started(self, stage: "Stage") -> None:
+        """Called when a stage starts."""
+        ...
+
+    def stage_finished(self, stage: "Stage") -> None:
+        """Called when a stage finishes, also if it raised an exception."""
+        ...
+
+
+class Stage:
+    """One measured unit of work.
+
+    Attributes:
+        name: Stage name
+        rows: Number of rows or records processed, if known
+        bytes: Number of bytes read or written, if known
+        duration_s: Wall-clock duration in seconds (set when the stage finishes)
+        memory_delta_bytes: Change in resident memory, if the platform reports it
+        failed: Whether the stage raised an exception
+    """
+
+    __slots__ = (
+        "name",
+        "rows",
+        "bytes",
+        "duration_s",
+        "memory_delta_bytes",
+        "failed",
+        "_path",
+        "_start",
+        "_rss",
+    )
+
+    def __init__(self, name: str, path: Optional[Path] = None) -> None:
+        """Initialize the stage.
+
+        Args:
+            name: Stage name
+            path: File whose size is recorded as the byte count when the stage ends
+        """
+        self.name = name
+        self.rows: Optional[int] = None
+        self.bytes: Optional[int] = None
+        self.duration_s = 0.0
+        self.memory_delta_bytes: Optional[int] = None
+        self.failed = False
+        self._path = path
+
+    def __enter__(self) -> "Stage":
+        for hook in tuple(_hooks):
+            hook.stage_started(self)
+        self._rss = _current_rss()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        self.duration_s = time.perf_counter() - self._start
+        rss = _current_rss()
+        if rss is not None and self._rss is not None:
+            self.memory_delta_bytes = rss - self._rss
+        if self.bytes is None and self._path is not None:
+            try:
+                self.bytes = os.path.getsize(self._path)
+            except OSError:
+                pass
+        self.failed = exc_type is not None
+
+        for hook in tuple(_hooks):
+            hook.stage_finished(self)
+
+    def count(self, rows: Iterable[_T]) -> Iterator[_T]:
+        """Pass rows through, counting them into ``rows``.
+
+        Args:
+            rows: Rows to count
+
+        Yields:
+            The same rows
+        """
+        self.rows = self.rows or 0
+        for row in rows:
+            self.rows += 1
+            yield row
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the stage as a JSON-serializable dictionary."""
+        rows_per_s = None
+        if self.rows is not None and self.duration_s > 0:
+            rows_per_s = self.rows / self.duration_s
+
+        return {
+            "name": self.name,
+            "duration_s": self.duration_s,
+            "rows": self.rows,
+            "rows_per_s": rows_per_s,
+            "bytes": self.bytes,
+            "memory_delta_bytes": self.memory_delta_bytes,
+            "failed": self.failed,
+        }
+
+
+class _NullStage:
+    """Stage returned when no hook is registered; records nothing.
+
+    It has the settable attributes of ``Stage``, so instrumented code can set
+    ``rows`` and ``bytes`` whichever of the two ``stage`` returns.
+    """
+
+    __slots__ = ("rows", "bytes")
+
+    rows: Optional[int]
+    bytes: Optional[int]
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        pass
+
+    def count(self, rows: Iterable[_T]) -> Iterable[_T]:
+        return rows
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str, path: Optional[Path] = None) -> Union[Stage, _NullStage]:
+    """Measure a unit of work if any hook is registered.
+
+    Args:
+        name: Stage name
+        path: File whose size is recorded as the byte count when the stage ends
+
+    Returns:
+        Context manager whose ``rows`` and ``bytes`` attributes may be set
+    """
+    if not _hooks:
+        return _NULL_STAGE
+    return Stage(name, path)
+
+
+def add_hook(hook: StageHook) -> None:
+    """Register a hook for all stages in this process."""
+    with _hooks_lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook: StageHook) -> None:
+    """Unregister a hook."""
+    with _hooks_lock:
+        _hooks.remove(hook)
+
+
+@contextmanager
+def registered(hook: StageHook) -> Iterator[StageHook]:
+    """Register a hook for the duration of a with block."""
+    add_hook(hook)
+    try:
+        yield hook
+    finally:
+        remove_hook(hook)
+
+
+class ProfileReport:
+    """Hook that collects finished stages into a per-stage report."""
+
+    def __init__(self) -> None:
+        """Initialize an empty report."""
+        self.stages: list[Stage] = []
+        self._start = time.perf_counter()
+
+    def stage_started(self, stage: Stage) -> None:
+        """Ignore stage starts; stages are recorded when they finish."""
+
+    def stage_finished(self, stage: Stage) -> None:
+        """Record a finished stage."""
+        self.stages.append(stage)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a JSON-serializable dictionary.
+
+        ``steps`` sums the durations of the top-level stages (names without a
+        colon) per name; ``stages`` lists every stage in the order it finished.
+        """
+        steps: dict[str, float] = {}
+        for finished in self.stages:
+            if ":" not in finished.name:
+                steps[finished.name] = steps.get(finished.name, 0.0) + finished.duration_s
+
+        return {
+            "elapsed_s": time.perf_counter() - self._start,
+            "steps": steps,
+            "stages": [finished.to_dict() for finished in self.stages],
+        }
+
+    def write(self, path: Path) -> Path:
+        """Write the report as JSON.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path to the written file
+        """
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+def _current_rss() -> Optional[int]:
+    """Return the current resident set size in bytes, or None if unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
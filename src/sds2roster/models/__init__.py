@@ -1,23 +1,27 @@
 """Data models package."""
 
-from sds2roster.models.oneroster import (
-    OneRosterAcademicSession,
-    OneRosterClass,
-    OneRosterCourse,
-    OneRosterDataModel,
-    OneRosterEnrollment,
-    OneRosterOrg,
-    OneRosterRole,
-    OneRosterUser,
-)
-from sds2roster.models.sds import (
-    SDSDataModel,
-    SDSEnrollment,
-    SDSSchool,
-    SDSSection,
-    SDSStudent,
-    SDSTeacher,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sds2roster.models.oneroster import (
+        OneRosterAcademicSession,
+        OneRosterClass,
+        OneRosterCourse,
+        OneRosterDataModel,
+        OneRosterEnrollment,
+        OneRosterOrg,
+        OneRosterRole,
+        OneRosterUser,
+    )
+    from sds2roster.models.sds import (
+        SDSDataModel,
+        SDSEnrollment,
+        SDSSchool,
+        SDSSection,
+        SDSStudent,
+        SDSTeacher,
+    )
 
 __all__ = [
     # SDS Models
@@ -37,3 +41,26 @@ __all__ = [
     "OneRosterAcademicSession",
     "OneRosterRole",
 ]
+
+
+# Models are imported on first access; importing one model module (or
+# sds2roster.models.records) does not build the schemas of the other
+_LAZY_IMPORTS = {
+    name: "sds2roster.models.sds" if name.startswith("SDS") else "sds2roster.models.oneroster"
+    for name in __all__
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a model class on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes including the model classes."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,151 @@
+"""Compact slotted records for the internal conversion pipeline.
+
+A Pydantic model instance keeps its field values in a per-instance ``__dict__``
+next to a fields-set ``set``; with the object headers that is about 490 bytes
+for a three-field ``SDSEnrollment``. The record types here are slotted
+dataclasses with the same field names, defaults and field order as their
+models, and take about 64 bytes for the same enrollment.
+
+Parsers, converters and writers only read attributes, so they work on records
+and models alike. The ``compact`` mode of ``SDSCSVParser`` and
+``SDSToOneRosterConverter`` keeps records from parsing to writing, and
+``to_model`` and ``to_models`` build Pydantic models at the API boundary when a
+caller asks for them. Records hold already validated (or trusted) values, so
+models are built without validating again.
+"""
+
+from dataclasses import make_dataclass
+from functools import lru_cache
+from itertools import starmap
+from operator import attrgetter
+from typing import Any, Iterable, TypeVar
+
+from pydantic import BaseModel
+
+from .oneroster import (
+    OneRosterAcademicSession,
+    OneRosterClass,
+    OneRosterCourse,
+    OneRosterEnrollment,
+    OneRosterOrg,
+    OneRosterRole,
+    OneRosterUser,
+)
+from .sds import SDSEnrollment, SDSSchool, SDSSection, SDSStudent, SDSTeacher
+from .trusted import TrustedModelBuilder
+
+_DataModel = TypeVar("_DataModel", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def record_type(model_cls: type[BaseModel]) -> type:
+    """Return the slotted record type of a model class.
+
+    Fields keep the model's order, so a record can be built positionally from
+    ``model_to_tuple`` output. Required fields default to None; records are only
+    built by the parser and converter, which always set them.
+
+    Args:
+        model_cls: Pydantic model class
+
+    Returns:
+        Dataclass named ``<model>Record`` with ``__slots__``
+    """
+    names = tuple(model_cls.model_fields)
+    values = attrgetter(*names)
+    builder = TrustedModelBuilder(model_cls, strip=False)
+
+    def astuple(self: Any) -> tuple:
+        """Return the field values as a tuple, in model field order."""
+        return values(self)
+
+    def to_model(self: Any) -> BaseModel:
+        """Build the Pydantic model of this record without validation."""
+        return builder.build(dict(zip(names, values(self))))
+
+    record_cls = make_dataclass(
+        f"{model_cls.__name__}Record",
+        [
+            (
+                name,
+                field.annotation,
+                None if field.is_required() else field.get_default(call_default_factory=True),
+            )
+            for name, field in model_cls.model_fields.items()
+        ],
+        namespace={"model_cls": model_cls, "astuple": astuple, "to_model": to_model},
+        slots=True,
+    )
+    # Module-level names below make the records picklable
+    record_cls.__module__ = __name__
+    return record_cls
+
+
+SDSSchoolRecord = record_type(SDSSchool)
+SDSStudentRecord = record_type(SDSStudent)
+SDSTeacherRecord = record_type(SDSTeacher)
+SDSSectionRecord = record_type(SDSSection)
+SDSEnrollmentRecord = record_type(SDSEnrollment)
+OneRosterOrgRecord = record_type(OneRosterOrg)
+OneRosterUserRecord = record_type(OneRosterUser)
+OneRosterCourseRecord = record_type(OneRosterCourse)
+OneRosterClassRecord = record_type(OneRosterClass)
+OneRosterEnrollmentRecord = record_type(OneRosterEnrollment)
+OneRosterAcademicSessionRecord = record_type(OneRosterAcademicSession)
+OneRosterRoleRecord = record_type(OneRosterRole)
+
+
+def to_record(model: BaseModel) -> Any:
+    """Return the compact record of a model instance."""
+    return record_type(type(model))(*model.__dict__.values())
+
+
+def records_from_tuples(model_cls: type[BaseModel], rows: Iterable[tuple]) -> list[Any]:
+    """Build records from field value tuples, as ``models_from_tuples`` builds models.
+
+    Args:
+        model_cls: Pydantic model class of the records
+        rows: One tuple of every field value per record, in model field order
+
+    Returns:
+        Records in row order
+    """
+    return list(starmap(record_type(model_cls), rows))
+
+
+def to_models(items: Iterable[Any]) -> list[Any]:
+    """Return a list with every record replaced by its Pydantic model.
+
+    Args:
+        items: Records or models
+
+    Returns:
+        Models in the same order; items that already are models are kept
+    """
+    return [item if isinstance(item, BaseModel) else item.to_model() for item in items]
+
+
+def to_model_data(data_model: _DataModel) -> _DataModel:
+    """Return a data model whose entity lists hold Pydantic models only.
+
+    Args:
+        data_model: ``SDSDataModel`` or ``OneRosterDataModel``, possibly holding records
+
+    Returns:
+        The same data model if it holds no records, otherwise an equal copy with models
+    """
+    lists = {
+        name: getattr(data_model, name)
+        for name in type(data_model).model_fields
+        if isinstance(getattr(data_model, name), list)
+    }
+    if not any(is_record(items[0]) for items in lists.values() if items):
+        return data_model
+
+    fields: dict[str, Any] = {name: to_models(items) for name, items in lists.items()}
+    return type(data_model).model_construct(**fields)
+
+
+def is_record(item: Any) -> bool:
+    """Return True if item is a compact record rather than a model."""
+    return hasattr(item, "to_model") and not isinstance(item, BaseModel)
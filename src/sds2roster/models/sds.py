@@ -5,9 +5,9 @@ This module contains Pydantic models for Microsoft SDS CSV format.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 
 class SDSStatus(str, Enum):
@@ -138,6 +138,36 @@ class SDSEnrollment(BaseModel):
         return v
 
 
+_IndexedEntity = TypeVar(
+    "_IndexedEntity", bound=Union[SDSSchool, SDSStudent, SDSTeacher, SDSSection]
+)
+
+
+class _IndexCache(dict):
+    """Per-instance SIS ID index cache.
+
+    The cache is derived state: it never takes part in model equality and is
+    dropped (not copied) on copy, deepcopy and pickling.
+    """
+
+    __hash__ = None
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IndexCache)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __copy__(self) -> "_IndexCache":
+        return _IndexCache()
+
+    def __deepcopy__(self, memo: dict) -> "_IndexCache":
+        return _IndexCache()
+
+    def __reduce_ex__(self, protocol: object) -> tuple:
+        return (_IndexCache, ())
+
+
 class SDSDataModel(BaseModel):
     """Complete SDS data model container."""
 
@@ -151,18 +181,87 @@ class SDSDataModel(BaseModel):
         default_factory=list, description="List of enrollments"
     )
 
+    # Lazily built SIS ID indexes, keyed by collection name. Each entry holds the
+    # list the index was built from, its length at build time and the mapping
+    # from SIS ID to list position.
+    _sis_id_indexes: _IndexCache = PrivateAttr(default_factory=_IndexCache)
+
+    def invalidate_indexes(self) -> None:
+        """Drop all cached SIS ID indexes.
+
+        Appending, removing or reassigning entities is detected automatically.
+        Call this after replacing an entity in place (``model.sections[i] = ...``)
+        so that the next lookup rebuilds the index.
+        """
+        self._sis_id_indexes.clear()
+
+    def _index_cache(self) -> _IndexCache:
+        """Return the SIS ID index cache.
+
+        The cache is read from the private storage slot directly: plain attribute
+        access to private attributes goes through ``BaseModel.__getattr__``, which
+        costs more than the lookup itself.
+        """
+        cache: _IndexCache = self.__pydantic_private__["_sis_id_indexes"]  # type: ignore[index]
+        return cache
+
+    def _lookup_by_sis_id(
+        self, collection: str, items: list[_IndexedEntity], sis_id: str
+    ) -> Optional[_IndexedEntity]:
+        """Look up an entity by SIS ID using a lazily built hash index.
+
+        The index is rebuilt whenever the underlying list has been reassigned or
+        has changed length, or when a hit no longer points at a matching entity.
+        The first entity with a given SIS ID wins, matching a linear scan.
+
+        Args:
+            collection: Name of the list field to search (e.g. "sections")
+            items: Current value of that list field
+            sis_id: SIS ID to look up
+
+        Returns:
+            Matching entity or None if not found
+        """
+        cached = self._index_cache().get(collection)
+
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            index = self._build_index(collection, items)
+        else:
+            index = cached[2]
+
+        position = index.get(sis_id)
+        if position is None:
+            return None
+
+        item = items[position]
+        if item.sis_id != sis_id:
+            # An entity was replaced in place; rebuild and retry once
+            position = self._build_index(collection, items).get(sis_id)
+            return items[position] if position is not None else None
+
+        return item
+
+    def _build_index(self, collection: str, items: list[_IndexedEntity]) -> dict[str, int]:
+        """Build and cache the SIS ID index for a collection."""
+        index: dict[str, int] = {}
+        for position, item in enumerate(items):
+            index.setdefault(item.sis_id, position)
+
+        self._index_cache()[collection] = (items, len(items), index)
+        return index
+
     def get_school_by_sis_id(self, sis_id: str) -> Optional[SDSSchool]:
         """Get school by SIS ID."""
-        return next((s for s in self.schools if s.sis_id == sis_id), None)
+        return self._lookup_by_sis_id("schools", self.schools, sis_id)
 
     def get_student_by_sis_id(self, sis_id: str) -> Optional[SDSStudent]:
         """Get student by SIS ID."""
-        return next((s for s in self.students if s.sis_id == sis_id), None)
+        return self._lookup_by_sis_id("students", self.students, sis_id)
 
     def get_teacher_by_sis_id(self, sis_id: str) -> Optional[SDSTeacher]:
         """Get teacher by SIS ID."""
-        return next((t for t in self.teachers if t.sis_id == sis_id), None)
+        return self._lookup_by_sis_id("teachers", self.teachers, sis_id)
 
     def get_section_by_sis_id(self, sis_id: str) -> Optional[SDSSection]:
         """Get section by SIS ID."""
-        return next((s for s in self.sections if s.sis_id == sis_id), None)
+        return self._lookup_by_sis_id("sections", self.sections, sis_id)
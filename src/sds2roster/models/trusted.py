@@ -0,0 +1,161 @@
+"""Fast construction of models from trusted input.
+
+Pydantic validation runs Python-level field validators for every row. For input
+that has already been validated upstream this is pure overhead, so the cheaper
+validation levels build models with ``TrustedModelBuilder`` instead. The built
+instances compare equal to validated ones and behave the same everywhere else.
+"""
+
+from typing import (
+    AbstractSet,
+    Any,
+    Generic,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+_Model = TypeVar("_Model", bound=BaseModel)
+
+
+def _is_string_field(annotation: Any) -> bool:
+    """Return True for ``str`` and ``Optional[str]`` annotations."""
+    if annotation is str:
+        return True
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return args == [str]
+    return False
+
+
+class TrustedModelBuilder(Generic[_Model]):
+    """Build model instances without running Pydantic validation.
+
+    Instances are created the same way ``BaseModel.__setstate__`` restores them
+    when unpickling, which is several times faster than both validation and
+    ``model_construct``. Fields that are not passed get their defaults, and the
+    field order of ``__dict__`` matches a validated instance.
+
+    If the model strips whitespace (``str_strip_whitespace``), string values are
+    stripped too, so building from raw CSV values gives the same result as
+    validation for valid input.
+    """
+
+    def __init__(self, model_cls: type[_Model], strip: Optional[bool] = None) -> None:
+        """Initialize the builder.
+
+        Args:
+            model_cls: Pydantic model class to build
+            strip: Strip string values. Defaults to the model's
+                ``str_strip_whitespace`` setting.
+        """
+        self.model_cls = model_cls
+
+        fields = model_cls.model_fields
+        # Required fields start as None and are always overwritten by build()
+        self._template: dict[str, Any] = {
+            name: None if field.is_required() else field.get_default(call_default_factory=True)
+            for name, field in fields.items()
+        }
+
+        string_fields = tuple(
+            name for name, field in fields.items() if _is_string_field(field.annotation)
+        )
+        if strip is None:
+            strip = bool(model_cls.model_config.get("str_strip_whitespace"))
+        self._strip_fields = string_fields if strip else ()
+
+        #: Required string fields; these must not be empty after stripping
+        self.required_fields: tuple[str, ...] = tuple(
+            name for name in string_fields if fields[name].is_required()
+        )
+
+    def clean(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Strip string values in place, as the model's validation would.
+
+        Args:
+            values: Field values keyed by field name
+
+        Returns:
+            The same dictionary
+        """
+        for name in self._strip_fields:
+            value = values.get(name)
+            if value.__class__ is str:
+                values[name] = value.strip()
+        return values
+
+    def build(self, values: dict[str, Any]) -> _Model:
+        """Build a model from already cleaned field values.
+
+        Args:
+            values: Field values keyed by field name
+
+        Returns:
+            Model instance; only the passed fields are marked as set
+        """
+        data = self._template.copy()
+        data.update(values)
+
+        model = self.model_cls.__new__(self.model_cls)
+        object.__setattr__(model, "__dict__", data)
+        object.__setattr__(model, "__pydantic_fields_set__", set(values))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
+    def __call__(self, **values: Any) -> _Model:
+        """Clean and build a model from keyword arguments."""
+        return self.build(self.clean(values))
+
+
+def model_to_tuple(model: Any) -> tuple:
+    """Return a model's field values as a tuple, in model field order.
+
+    Tuples pickle much faster than model instances, so worker processes send
+    these back and the parent restores them with ``models_from_tuples``.
+    Compact records (``sds2roster.models.records``) are accepted as well.
+    """
+    state = getattr(model, "__dict__", None)
+    return tuple(state.values()) if state is not None else model.astuple()
+
+
+def models_from_tuples(
+    model_cls: type[_Model],
+    rows: Iterable[tuple],
+    fields_set: Optional[AbstractSet[str]] = None,
+) -> list[_Model]:
+    """Rebuild already validated models from field value tuples.
+
+    This restores instance state the same way ``BaseModel.__setstate__`` does when
+    unpickling, which is several times faster than ``model_construct`` for large
+    row counts.
+
+    Args:
+        model_cls: Pydantic model class to build
+        rows: One tuple of every field value per model, in model field order
+        fields_set: Fields to mark as explicitly set (default: all fields)
+
+    Returns:
+        Models in row order
+    """
+    fields = list(model_cls.model_fields)
+    fields_set = frozenset(fields if fields_set is None else fields_set)
+    new = model_cls.__new__
+    set_attr = object.__setattr__
+
+    models = []
+    for values in rows:
+        model = new(model_cls)
+        set_attr(model, "__dict__", dict(zip(fields, values)))
+        set_attr(model, "__pydantic_fields_set__", set(fields_set))
+        set_attr(model, "__pydantic_extra__", None)
+        set_attr(model, "__pydantic_private__", None)
+        models.append(model)
+
+    return models
@@ -1,9 +1,36 @@
 """CSV parsers for SDS and OneRoster formats."""
 
-from .sds_parser import SDSCSVParser
-from .oneroster_writer import OneRosterCSVWriter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .oneroster_writer import OneRosterCSVWriter, ZipPackage
+    from .sds_parser import SDSCSVParser
+
+# Importing one parser module does not load the others
+_LAZY_IMPORTS = {
+    "SDSCSVParser": ".sds_parser",
+    "OneRosterCSVWriter": ".oneroster_writer",
+    "ZipPackage": ".oneroster_writer",
+}
 
 __all__ = [
     "SDSCSVParser",
     "OneRosterCSVWriter",
+    "ZipPackage",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a parser class on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes including the parser classes."""
+    return sorted(set(globals()) | set(__all__))
@@ -4,9 +4,112 @@ This module provides functionality to write OneRoster data models to CSV files.
 """
 
 import csv
+import io
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-
-from ..models.oneroster import OneRosterDataModel
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Optional, Sequence
+
+from ..delta import DeltaTracker
+from ..instrumentation import stage
+from ..models.oneroster import (
+    OneRosterAcademicSession,
+    OneRosterClass,
+    OneRosterCourse,
+    OneRosterDataModel,
+    OneRosterEnrollment,
+    OneRosterOrg,
+    OneRosterRole,
+    OneRosterUser,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from ..columnar_converter import OneRosterColumnarData
+
+ORGS_FIELDNAMES = [
+    "sourcedId",
+    "status",
+    "dateLastModified",
+    "name",
+    "type",
+    "identifier",
+    "parentSourcedId",
+]
+
+USERS_FIELDNAMES = [
+    "sourcedId",
+    "status",
+    "dateLastModified",
+    "enabledUser",
+    "username",
+    "givenName",
+    "familyName",
+    "middleName",
+    "email",
+    "grades",
+    "password",
+    "userMasterIdentifier",
+]
+
+COURSES_FIELDNAMES = [
+    "sourcedId",
+    "status",
+    "dateLastModified",
+    "schoolYearSourcedId",
+    "title",
+    "orgSourcedId",
+]
+
+CLASSES_FIELDNAMES = [
+    "sourcedId",
+    "status",
+    "dateLastModified",
+    "title",
+    "courseSourcedId",
+    "classType",
+    "schoolSourcedId",
+    "termSourcedIds",
+]
+
+ENROLLMENTS_FIELDNAMES = [
+    "sourcedId",
+    "status",
+    "dateLastModified",
+    "classSourcedId",
+    "schoolSourcedId",
+    "userSourcedId",
+    "role",
+    "primary",
+]
+
+ACADEMIC_SESSIONS_FIELDNAMES = [
+    "sourcedId",
+    "status",
+    "dateLastModified",
+    "title",
+    "type",
+    "startDate",
+    "endDate",
+    "parentSourcedId",
+    "schoolYear",
+]
+
+ROLES_FIELDNAMES = [
+    "sourcedId",
+    "status",
+    "dateLastModified",
+    "userSourcedId",
+    "roleType",
+    "role",
+    "orgSourcedId",
+    "userProfileSourcedId",
+]
 
 
 class OneRosterCSVWriter:
@@ -14,16 +117,59 @@ class OneRosterCSVWriter:
 
     This class writes OneRoster data models to CSV files following
     OneRoster v1.2 CSV specification.
+
+    ``write_records`` writes any iterable of records one row at a time, which lets
+    the streaming pipeline write files without materializing a data model.
+    ``write_frames`` writes the frames of the columnar converter.
+
+    With a ``DeltaTracker``, every entity file row is fingerprinted as it is
+    written. In incremental mode only added, changed and removed rows are
+    written, and the manifest lists the entity files as ``delta``.
+
+    With a ``sink``, files are not written to the local disk but to the binary
+    streams the sink opens, such as ``BlobStorageClient.open_write``, which
+    uploads each file in blocks while its rows are still being formatted, or
+    a ``ZipPackage``, which writes them as entries of one zip archive.
     """
 
-    def __init__(self, output_dir: Path) -> None:
+    def __init__(
+        self,
+        output_dir: Path,
+        delta: Optional[DeltaTracker] = None,
+        sink: Optional[Callable[[Path], BinaryIO]] = None,
+    ) -> None:
         """Initialize OneRoster CSV writer.
 
         Args:
             output_dir: Directory where CSV files will be written
+            delta: Tracker that fingerprints written rows and, in incremental
+                mode, reduces the files to changed rows (default: none)
+            sink: Opens the binary output stream of a file path under
+                output_dir, in place of a local file. Leaving the stream's
+                with block completes the file, or discards it if an exception
+                was raised. output_dir is then only used to name the files and
+                is not created (default: local files)
         """
         self.output_dir = output_dir
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.delta = delta
+        self.sink = sink
+        if sink is None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # file type -> (default file name, CSV columns, row formatter)
+        self._file_specs: dict[str, tuple[str, list[str], Callable[[Any], dict[str, str]]]] = {
+            "orgs": ("orgs.csv", ORGS_FIELDNAMES, self._org_row),
+            "users": ("users.csv", USERS_FIELDNAMES, self._user_row),
+            "courses": ("courses.csv", COURSES_FIELDNAMES, self._course_row),
+            "classes": ("classes.csv", CLASSES_FIELDNAMES, self._class_row),
+            "enrollments": ("enrollments.csv", ENROLLMENTS_FIELDNAMES, self._enrollment_row),
+            "academicSessions": (
+                "academicSessions.csv",
+                ACADEMIC_SESSIONS_FIELDNAMES,
+                self._academic_session_row,
+            ),
+            "roles": ("roles.csv", ROLES_FIELDNAMES, self._role_row),
+        }
 
     def write_orgs(self, data_model: OneRosterDataModel, file_name: str = "orgs.csv") -> Path:
         """Write organizations to orgs.csv.
@@ -35,42 +181,9 @@ class OneRosterCSVWriter:
         Returns:
             Path to written file
         """
-        file_path = self.output_dir / file_name
-
-        with open(file_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "sourcedId",
-                    "status",
-                    "dateLastModified",
-                    "name",
-                    "type",
-                    "identifier",
-                    "parentSourcedId",
-                ],
-            )
-            writer.writeheader()
-
-            for org in data_model.orgs:
-                # Find parent sourced ID
-                parent_sourced_id = ""
-                if hasattr(org, 'parent_sourced_id') and org.parent_sourced_id:
-                    parent_sourced_id = org.parent_sourced_id
-                
-                writer.writerow(
-                    {
-                        "sourcedId": org.sourced_id,
-                        "status": "",  # Empty per sample
-                        "dateLastModified": "",  # Empty per sample
-                        "name": org.name,
-                        "type": org.type.value,
-                        "identifier": org.identifier or "",
-                        "parentSourcedId": parent_sourced_id,
-                    }
-                )
-
-        return file_path
+        return self._write_csv(
+            file_name, ORGS_FIELDNAMES, map(self._org_row, data_model.orgs), "orgs"
+        )
 
     def write_users(self, data_model: OneRosterDataModel, file_name: str = "users.csv") -> Path:
         """Write users to users.csv.
@@ -82,47 +195,9 @@ class OneRosterCSVWriter:
         Returns:
             Path to written file
         """
-        file_path = self.output_dir / file_name
-
-        with open(file_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "sourcedId",
-                    "status",
-                    "dateLastModified",
-                    "enabledUser",
-                    "username",
-                    "givenName",
-                    "familyName",
-                    "middleName",
-                    "email",
-                    "grades",
-                    "password",
-                    "userMasterIdentifier",
-                ],
-            )
-            writer.writeheader()
-
-            for user in data_model.users:
-                writer.writerow(
-                    {
-                        "sourcedId": user.sourced_id,
-                        "status": "",  # Empty per sample
-                        "dateLastModified": "",  # Empty per sample
-                        "enabledUser": str(user.enabled_user).upper(),
-                        "username": user.username,
-                        "givenName": user.given_name,
-                        "familyName": user.family_name,
-                        "middleName": user.middle_name or "",
-                        "email": user.email or "",
-                        "grades": user.grades or "",
-                        "password": user.password or "",
-                        "userMasterIdentifier": user.sourced_id.lower(),  # Lowercase sourcedId
-                    }
-                )
-
-        return file_path
+        return self._write_csv(
+            file_name, USERS_FIELDNAMES, map(self._user_row, data_model.users), "users"
+        )
 
     def write_courses(
         self, data_model: OneRosterDataModel, file_name: str = "courses.csv"
@@ -136,35 +211,9 @@ class OneRosterCSVWriter:
         Returns:
             Path to written file
         """
-        file_path = self.output_dir / file_name
-
-        with open(file_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "sourcedId",
-                    "status",
-                    "dateLastModified",
-                    "schoolYearSourcedId",
-                    "title",
-                    "orgSourcedId",
-                ],
-            )
-            writer.writeheader()
-
-            for course in data_model.courses:
-                writer.writerow(
-                    {
-                        "sourcedId": course.sourced_id,
-                        "status": "",  # Empty per sample
-                        "dateLastModified": "",  # Empty per sample
-                        "schoolYearSourcedId": course.school_year_sourced_id or "",
-                        "title": course.title,
-                        "orgSourcedId": course.org_sourced_id,
-                    }
-                )
-
-        return file_path
+        return self._write_csv(
+            file_name, COURSES_FIELDNAMES, map(self._course_row, data_model.courses), "courses"
+        )
 
     def write_classes(
         self, data_model: OneRosterDataModel, file_name: str = "classes.csv"
@@ -178,39 +227,9 @@ class OneRosterCSVWriter:
         Returns:
             Path to written file
         """
-        file_path = self.output_dir / file_name
-
-        with open(file_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "sourcedId",
-                    "status",
-                    "dateLastModified",
-                    "title",
-                    "courseSourcedId",
-                    "classType",
-                    "schoolSourcedId",
-                    "termSourcedIds",
-                ],
-            )
-            writer.writeheader()
-
-            for cls in data_model.classes:
-                writer.writerow(
-                    {
-                        "sourcedId": cls.sourced_id,
-                        "status": "",  # Empty per sample
-                        "dateLastModified": "",  # Empty per sample
-                        "title": cls.title,
-                        "courseSourcedId": cls.course_sourced_id,
-                        "classType": cls.class_type.value,
-                        "schoolSourcedId": cls.school_sourced_id,
-                        "termSourcedIds": cls.term_sourced_ids or "",
-                    }
-                )
-
-        return file_path
+        return self._write_csv(
+            file_name, CLASSES_FIELDNAMES, map(self._class_row, data_model.classes), "classes"
+        )
 
     def write_enrollments(
         self, data_model: OneRosterDataModel, file_name: str = "enrollments.csv"
@@ -224,44 +243,12 @@ class OneRosterCSVWriter:
         Returns:
             Path to written file
         """
-        file_path = self.output_dir / file_name
-
-        with open(file_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "sourcedId",
-                    "status",
-                    "dateLastModified",
-                    "classSourcedId",
-                    "schoolSourcedId",
-                    "userSourcedId",
-                    "role",
-                    "primary",
-                ],
-            )
-            writer.writeheader()
-
-            for enrollment in data_model.enrollments:
-                # Format primary field
-                primary = ""
-                if enrollment.primary is not None:
-                    primary = str(enrollment.primary).upper()
-
-                writer.writerow(
-                    {
-                        "sourcedId": enrollment.sourced_id,
-                        "status": "",  # Empty per sample
-                        "dateLastModified": "",  # Empty per sample
-                        "classSourcedId": enrollment.class_sourced_id,
-                        "schoolSourcedId": enrollment.school_sourced_id,
-                        "userSourcedId": enrollment.user_sourced_id,
-                        "role": enrollment.role.value,
-                        "primary": primary,
-                    }
-                )
-
-        return file_path
+        return self._write_csv(
+            file_name,
+            ENROLLMENTS_FIELDNAMES,
+            map(self._enrollment_row, data_model.enrollments),
+            "enrollments",
+        )
 
     def write_academic_sessions(
         self, data_model: OneRosterDataModel, file_name: str = "academicSessions.csv"
@@ -275,41 +262,12 @@ class OneRosterCSVWriter:
         Returns:
             Path to written file
         """
-        file_path = self.output_dir / file_name
-
-        with open(file_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "sourcedId",
-                    "status",
-                    "dateLastModified",
-                    "title",
-                    "type",
-                    "startDate",
-                    "endDate",
-                    "parentSourcedId",
-                    "schoolYear",
-                ],
-            )
-            writer.writeheader()
-
-            for session in data_model.academic_sessions:
-                writer.writerow(
-                    {
-                        "sourcedId": session.sourced_id,
-                        "status": "",  # Empty per sample
-                        "dateLastModified": "",  # Empty per sample
-                        "title": session.title,
-                        "type": session.type,
-                        "startDate": session.start_date.strftime("%Y-%m-%d"),
-                        "endDate": session.end_date.strftime("%Y-%m-%d"),
-                        "parentSourcedId": session.parent_sourced_id or "",
-                        "schoolYear": session.school_year,
-                    }
-                )
-
-        return file_path
+        return self._write_csv(
+            file_name,
+            ACADEMIC_SESSIONS_FIELDNAMES,
+            map(self._academic_session_row, data_model.academic_sessions),
+            "academicSessions",
+        )
 
     def write_manifest(self, file_name: str = "manifest.csv") -> Path:
         """Write manifest.csv.
@@ -320,45 +278,46 @@ class OneRosterCSVWriter:
         Returns:
             Path to written file
         """
-        file_path = self.output_dir / file_name
+        # Entity files only hold changed rows when writing a delta
+        mode = "delta" if self.delta is not None and self.delta.incremental else "bulk"
 
         # Manifest properties based on OneRoster 1.2 specification
         manifest_properties = [
             ("manifest.version", "1.0"),
             ("oneroster.version", "1.2"),
-            ("file.academicSessions", "bulk"),
+            ("file.academicSessions", mode),
             ("file.categories", "absent"),
-            ("file.classes", "bulk"),
+            ("file.classes", mode),
             ("file.classResources", "absent"),
-            ("file.courses", "bulk"),
+            ("file.courses", mode),
             ("file.courseResources", "absent"),
             ("file.demographics", "absent"),
-            ("file.enrollments", "bulk"),
+            ("file.enrollments", mode),
             ("file.lineItemLearningObjectiveIds", "absent"),
             ("file.lineItems", "absent"),
             ("file.lineItemScoreScales", "absent"),
-            ("file.orgs", "bulk"),
+            ("file.orgs", mode),
             ("file.resources", "absent"),
             ("file.resultLearningObjectiveIds", "absent"),
             ("file.results", "absent"),
             ("file.resultScoreScales", "absent"),
-            ("file.roles", "bulk"),
+            ("file.roles", mode),
             ("file.scoreScales", "absent"),
             ("file.userProfiles", "absent"),
             ("file.userResources", "absent"),
-            ("file.users", "bulk"),
+            ("file.users", mode),
             ("source.systemName", "SDS2Roster"),
             ("source.systemCode", "v0.2.0"),
         ]
 
-        with open(file_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["propertyName", "value"])
-            writer.writeheader()
-
-            for prop_name, prop_value in manifest_properties:
-                writer.writerow({"propertyName": prop_name, "value": prop_value})
-
-        return file_path
+        return self._write_csv(
+            file_name,
+            ["propertyName", "value"],
+            (
+                {"propertyName": prop_name, "value": prop_value}
+                for prop_name, prop_value in manifest_properties
+            ),
+        )
 
     def write_roles(self, data_model: OneRosterDataModel, file_name: str = "roles.csv") -> Path:
         """Write roles to roles.csv.
@@ -370,76 +329,571 @@ class OneRosterCSVWriter:
         Returns:
             Path to written file
         """
-        file_path = self.output_dir / file_name
+        # Generate roles from data model if available
+        roles = data_model.roles if hasattr(data_model, 'roles') else []
+        return self._write_csv(file_name, ROLES_FIELDNAMES, map(self._role_row, roles), "roles")
 
-        with open(file_path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "sourcedId",
-                    "status",
-                    "dateLastModified",
-                    "userSourcedId",
-                    "roleType",
-                    "role",
-                    "orgSourcedId",
-                    "userProfileSourcedId",
-                ],
-            )
-            writer.writeheader()
-
-            # Generate roles from data model if available
-            if hasattr(data_model, 'roles'):
-                for role in data_model.roles:
-                    writer.writerow(
-                        {
-                            "sourcedId": role.sourced_id,
-                            "status": "",  # Empty per sample
-                            "dateLastModified": "",  # Empty per sample
-                            "userSourcedId": role.user_sourced_id,
-                            "roleType": role.role_type,
-                            "role": role.role,
-                            "orgSourcedId": role.org_sourced_id,
-                            "userProfileSourcedId": role.user_profile_sourced_id or "",
-                        }
-                    )
+    def write_records(
+        self, file_type: str, records: Iterable[Any], file_name: Optional[str] = None
+    ) -> tuple[Optional[Path], int]:
+        """Write OneRoster records to a CSV file one row at a time.
 
-        return file_path
+        The file is only created once the first record arrives, mirroring
+        ``write_all``, which skips entity types without records. A delta run
+        also writes the file if the previous run had rows to delete.
+
+        Args:
+            file_type: OneRoster file type as used by ``write_all`` (e.g. "users")
+            records: Records of the matching OneRoster model type
+            file_name: Output file name (default: the standard name for file_type)
 
-    def write_all(self, data_model: OneRosterDataModel) -> dict[str, Path]:
+        Returns:
+            Tuple of (path to written file or None if there were no records, row count)
+
+        Raises:
+            ValueError: If file_type is unknown
+        """
+        if file_type not in self._file_specs:
+            raise ValueError(f"Unknown OneRoster file type: {file_type}")
+
+        default_name, fieldnames, format_row = self._file_specs[file_type]
+
+        iterator = iter(records)
+        first = next(iterator, None)
+        if first is None and not self._has_removals(file_type):
+            return None, 0
+
+        count = 0
+
+        def rows() -> Iterable[dict[str, str]]:
+            nonlocal count
+            if first is None:
+                return
+            yield format_row(first)
+            count += 1
+            for record in iterator:
+                yield format_row(record)
+                count += 1
+
+        file_path = self._write_csv(file_name or default_name, fieldnames, rows(), file_type)
+        return file_path, count
+
+    def write_all(
+        self, data_model: OneRosterDataModel, workers: Optional[int] = None
+    ) -> dict[str, Path]:
         """Write all OneRoster CSV files.
 
         Args:
             data_model: Complete OneRoster data model
+            workers: Number of writer threads. If greater than 1, each file is
+                written on its own worker so slow output volumes are used in
+                parallel; otherwise files are written one after another. The
+                output bytes are the same in both modes.
 
         Returns:
             Dictionary mapping file type to written file path
         """
-        written_files = {}
+        # (file type, write call) in output order. Always write manifest first.
+        tasks: list[tuple[str, Callable[[], Path]]] = [("manifest", self.write_manifest)]
+
+        if data_model.orgs or self._has_removals("orgs"):
+            tasks.append(("orgs", partial(self.write_orgs, data_model)))
+
+        if data_model.users or self._has_removals("users"):
+            tasks.append(("users", partial(self.write_users, data_model)))
+
+        if data_model.courses or self._has_removals("courses"):
+            tasks.append(("courses", partial(self.write_courses, data_model)))
+
+        if data_model.classes or self._has_removals("classes"):
+            tasks.append(("classes", partial(self.write_classes, data_model)))
+
+        if data_model.enrollments or self._has_removals("enrollments"):
+            tasks.append(("enrollments", partial(self.write_enrollments, data_model)))
+
+        if data_model.academic_sessions or self._has_removals("academicSessions"):
+            tasks.append(
+                ("academicSessions", partial(self.write_academic_sessions, data_model))
+            )
+
+        # Write roles if available
+        if (hasattr(data_model, 'roles') and data_model.roles) or self._has_removals("roles"):
+            tasks.append(("roles", partial(self.write_roles, data_model)))
+
+        return self._run_tasks(tasks, workers)
+
+    def write_frames(
+        self, data: "OneRosterColumnarData", workers: Optional[int] = None
+    ) -> dict[str, Path]:
+        """Write all OneRoster CSV files from columnar data.
+
+        Produces the same files, byte for byte, as ``write_all`` with the
+        equivalent data model. Cells are formatted a whole column at a time.
+
+        Args:
+            data: OneRoster frames from ``ColumnarConverter.convert``
+            workers: Number of writer threads, as in ``write_all``
+
+        Returns:
+            Dictionary mapping file type to written file path
+        """
+        # file type -> (frame, column formatter), in write_all's output order
+        frames: list[tuple[str, "pd.DataFrame", Callable[["pd.DataFrame"], list[Any]]]] = [
+            ("orgs", data.orgs, self._org_columns),
+            ("users", data.users, self._user_columns),
+            ("courses", data.courses, self._course_columns),
+            ("classes", data.classes, self._class_columns),
+            ("enrollments", data.enrollments, self._enrollment_columns),
+            ("academicSessions", data.academic_sessions, self._academic_session_columns),
+            ("roles", data.roles, self._role_columns),
+        ]
+
+        def write_frame(
+            file_type: str,
+            frame: "pd.DataFrame",
+            format_columns: Callable[["pd.DataFrame"], list[Any]],
+        ) -> Path:
+            file_name, fieldnames, _ = self._file_specs[file_type]
+            return self._write_rows(
+                file_name, fieldnames, zip(*format_columns(frame)), file_type
+            )
 
         # Always write manifest first
-        written_files["manifest"] = self.write_manifest()
+        tasks: list[tuple[str, Callable[[], Path]]] = [("manifest", self.write_manifest)]
+        tasks.extend(
+            (file_type, partial(write_frame, file_type, frame, format_columns))
+            for file_type, frame, format_columns in frames
+            if not frame.empty or self._has_removals(file_type)
+        )
+
+        return self._run_tasks(tasks, workers)
+
+    def _has_removals(self, file_type: str) -> bool:
+        """Return True if a delta run must write file_type to delete previous rows."""
+        return (
+            self.delta is not None
+            and self.delta.incremental
+            and self.delta.has_previous_rows(file_type)
+        )
+
+    @staticmethod
+    def _run_tasks(
+        tasks: list[tuple[str, Callable[[], Path]]], workers: Optional[int]
+    ) -> dict[str, Path]:
+        """Run file write calls sequentially or on a thread pool.
 
-        if data_model.orgs:
-            written_files["orgs"] = self.write_orgs(data_model)
+        Args:
+            tasks: (file type, write call) pairs in output order
+            workers: Number of writer threads; None or 1 writes sequentially
+
+        Returns:
+            Dictionary mapping file type to written file path
+        """
+        with stage("write"):
+            if workers is None or workers <= 1:
+                return {file_type: write() for file_type, write in tasks}
+
+            with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                futures: list[tuple[str, Future]] = [
+                    (file_type, executor.submit(write)) for file_type, write in tasks
+                ]
+                # Collect in output order so the mapping and any raised error
+                # are the same as in sequential mode
+                return {file_type: future.result() for file_type, future in futures}
+
+    def _write_csv(
+        self,
+        file_name: str,
+        fieldnames: list[str],
+        rows: Iterable[dict[str, str]],
+        file_type: Optional[str] = None,
+    ) -> Path:
+        """Write rows to a CSV file in the output directory.
 
-        if data_model.users:
-            written_files["users"] = self.write_users(data_model)
+        Args:
+            file_name: Output file name
+            fieldnames: CSV column names
+            rows: Row dictionaries keyed by column name
+            file_type: OneRoster file type of entity files (None for the manifest)
 
-        if data_model.courses:
-            written_files["courses"] = self.write_courses(data_model)
+        Returns:
+            Path to written file
+        """
+        return self._write_rows(
+            file_name, fieldnames, map(itemgetter(*fieldnames), rows), file_type
+        )
+
+    def _write_rows(
+        self,
+        file_name: str,
+        fieldnames: list[str],
+        rows: Iterable[Sequence[str]],
+        file_type: Optional[str] = None,
+    ) -> Path:
+        """Write a header and rows of cell values to a CSV file in the output directory or sink.
 
-        if data_model.classes:
-            written_files["classes"] = self.write_classes(data_model)
+        Args:
+            file_name: Output file name
+            fieldnames: CSV column names
+            rows: Cell values in fieldnames order
+            file_type: OneRoster file type of entity files, which go through the
+                delta tracker if there is one (None for the manifest)
 
-        if data_model.enrollments:
-            written_files["enrollments"] = self.write_enrollments(data_model)
+        Returns:
+            Path to written file
+        """
+        if file_type is not None and self.delta is not None:
+            rows = self.delta.track(file_type, fieldnames, rows)
 
-        if data_model.academic_sessions:
-            written_files["academicSessions"] = self.write_academic_sessions(data_model)
+        file_path = self.output_dir / file_name
+        open_output = self.sink or _open_file
+
+        with stage(f"write:{file_name}") as timed:
+            with open_output(file_path) as output:
+                f = io.TextIOWrapper(output, encoding="utf-8", newline="")
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(timed.count(rows))
+                f.flush()
+                timed.bytes = output.tell()
+                # Leave closing (or discarding) the output to its with block
+                f.detach()
 
-        # Write roles if available
-        if hasattr(data_model, 'roles') and data_model.roles:
-            written_files["roles"] = self.write_roles(data_model)
+        return file_path
 
-        return written_files
+    @staticmethod
+    def _org_row(org: OneRosterOrg) -> dict[str, str]:
+        """Format an organization as an orgs.csv row."""
+        # Find parent sourced ID
+        parent_sourced_id = ""
+        if hasattr(org, 'parent_sourced_id') and org.parent_sourced_id:
+            parent_sourced_id = org.parent_sourced_id
+
+        return {
+            "sourcedId": org.sourced_id,
+            "status": "",  # Empty per sample
+            "dateLastModified": "",  # Empty per sample
+            "name": org.name,
+            "type": org.type.value,
+            "identifier": org.identifier or "",
+            "parentSourcedId": parent_sourced_id,
+        }
+
+    @staticmethod
+    def _user_row(user: OneRosterUser) -> dict[str, str]:
+        """Format a user as a users.csv row."""
+        return {
+            "sourcedId": user.sourced_id,
+            "status": "",  # Empty per sample
+            "dateLastModified": "",  # Empty per sample
+            "enabledUser": str(user.enabled_user).upper(),
+            "username": user.username,
+            "givenName": user.given_name,
+            "familyName": user.family_name,
+            "middleName": user.middle_name or "",
+            "email": user.email or "",
+            "grades": user.grades or "",
+            "password": user.password or "",
+            "userMasterIdentifier": user.sourced_id.lower(),  # Lowercase sourcedId
+        }
+
+    @staticmethod
+    def _course_row(course: OneRosterCourse) -> dict[str, str]:
+        """Format a course as a courses.csv row."""
+        return {
+            "sourcedId": course.sourced_id,
+            "status": "",  # Empty per sample
+            "dateLastModified": "",  # Empty per sample
+            "schoolYearSourcedId": course.school_year_sourced_id or "",
+            "title": course.title,
+            "orgSourcedId": course.org_sourced_id,
+        }
+
+    @staticmethod
+    def _class_row(cls: OneRosterClass) -> dict[str, str]:
+        """Format a class as a classes.csv row."""
+        return {
+            "sourcedId": cls.sourced_id,
+            "status": "",  # Empty per sample
+            "dateLastModified": "",  # Empty per sample
+            "title": cls.title,
+            "courseSourcedId": cls.course_sourced_id,
+            "classType": cls.class_type.value,
+            "schoolSourcedId": cls.school_sourced_id,
+            "termSourcedIds": cls.term_sourced_ids or "",
+        }
+
+    @staticmethod
+    def _enrollment_row(enrollment: OneRosterEnrollment) -> dict[str, str]:
+        """Format an enrollment as an enrollments.csv row."""
+        # Format primary field
+        primary = ""
+        if enrollment.primary is not None:
+            primary = str(enrollment.primary).upper()
+
+        return {
+            "sourcedId": enrollment.sourced_id,
+            "status": "",  # Empty per sample
+            "dateLastModified": "",  # Empty per sample
+            "classSourcedId": enrollment.class_sourced_id,
+            "schoolSourcedId": enrollment.school_sourced_id,
+            "userSourcedId": enrollment.user_sourced_id,
+            "role": enrollment.role.value,
+            "primary": primary,
+        }
+
+    @staticmethod
+    def _academic_session_row(session: OneRosterAcademicSession) -> dict[str, str]:
+        """Format an academic session as an academicSessions.csv row."""
+        return {
+            "sourcedId": session.sourced_id,
+            "status": "",  # Empty per sample
+            "dateLastModified": "",  # Empty per sample
+            "title": session.title,
+            "type": session.type,
+            "startDate": session.start_date.strftime("%Y-%m-%d"),
+            "endDate": session.end_date.strftime("%Y-%m-%d"),
+            "parentSourcedId": session.parent_sourced_id or "",
+            "schoolYear": session.school_year,
+        }
+
+    @staticmethod
+    def _role_row(role: OneRosterRole) -> dict[str, str]:
+        """Format a role as a roles.csv row."""
+        return {
+            "sourcedId": role.sourced_id,
+            "status": "",  # Empty per sample
+            "dateLastModified": "",  # Empty per sample
+            "userSourcedId": role.user_sourced_id,
+            "roleType": role.role_type,
+            "role": role.role,
+            "orgSourcedId": role.org_sourced_id,
+            "userProfileSourcedId": role.user_profile_sourced_id or "",
+        }
+
+    # Column formatters for write_frames. Each returns the CSV columns in
+    # fieldnames order with the same cell text as the matching *_row formatter.
+
+    @staticmethod
+    def _org_columns(orgs: "pd.DataFrame") -> list[Any]:
+        """Format an organization frame as orgs.csv columns."""
+        return [
+            orgs["sourced_id"].tolist(),
+            repeat(""),  # status, empty per sample
+            repeat(""),  # dateLastModified, empty per sample
+            _text(orgs["name"]),
+            orgs["type"].tolist(),
+            _text(orgs["identifier"]),
+            _text(orgs["parent_sourced_id"]),
+        ]
+
+    @staticmethod
+    def _user_columns(users: "pd.DataFrame") -> list[Any]:
+        """Format a user frame as users.csv columns."""
+        return [
+            users["sourced_id"].tolist(),
+            repeat(""),  # status, empty per sample
+            repeat(""),  # dateLastModified, empty per sample
+            _flag(users["enabled_user"]),
+            _text(users["username"]),
+            _text(users["given_name"]),
+            _text(users["family_name"]),
+            _text(users["middle_name"]),
+            _text(users["email"]),
+            _text(users["grades"]),
+            _text(users["password"]),
+            users["sourced_id"].str.lower().tolist(),  # Lowercase sourcedId
+        ]
+
+    @staticmethod
+    def _course_columns(courses: "pd.DataFrame") -> list[Any]:
+        """Format a course frame as courses.csv columns."""
+        return [
+            courses["sourced_id"].tolist(),
+            repeat(""),  # status, empty per sample
+            repeat(""),  # dateLastModified, empty per sample
+            _text(courses["school_year_sourced_id"]),
+            _text(courses["title"]),
+            courses["org_sourced_id"].tolist(),
+        ]
+
+    @staticmethod
+    def _class_columns(classes: "pd.DataFrame") -> list[Any]:
+        """Format a class frame as classes.csv columns."""
+        return [
+            classes["sourced_id"].tolist(),
+            repeat(""),  # status, empty per sample
+            repeat(""),  # dateLastModified, empty per sample
+            _text(classes["title"]),
+            classes["course_sourced_id"].tolist(),
+            classes["class_type"].tolist(),
+            classes["school_sourced_id"].tolist(),
+            _text(classes["term_sourced_ids"]),
+        ]
+
+    @staticmethod
+    def _enrollment_columns(enrollments: "pd.DataFrame") -> list[Any]:
+        """Format an enrollment frame as enrollments.csv columns."""
+        return [
+            enrollments["sourced_id"].tolist(),
+            repeat(""),  # status, empty per sample
+            repeat(""),  # dateLastModified, empty per sample
+            enrollments["class_sourced_id"].tolist(),
+            enrollments["school_sourced_id"].tolist(),
+            enrollments["user_sourced_id"].tolist(),
+            enrollments["role"].tolist(),
+            _flag(enrollments["primary"]),
+        ]
+
+    @staticmethod
+    def _academic_session_columns(sessions: "pd.DataFrame") -> list[Any]:
+        """Format an academic session frame as academicSessions.csv columns."""
+        return [
+            sessions["sourced_id"].tolist(),
+            repeat(""),  # status, empty per sample
+            repeat(""),  # dateLastModified, empty per sample
+            _text(sessions["title"]),
+            sessions["type"].tolist(),
+            [date.strftime("%Y-%m-%d") for date in sessions["start_date"]],
+            [date.strftime("%Y-%m-%d") for date in sessions["end_date"]],
+            _text(sessions["parent_sourced_id"]),
+            sessions["school_year"].tolist(),
+        ]
+
+    @staticmethod
+    def _role_columns(roles: "pd.DataFrame") -> list[Any]:
+        """Format a role frame as roles.csv columns."""
+        return [
+            roles["sourced_id"].tolist(),
+            repeat(""),  # status, empty per sample
+            repeat(""),  # dateLastModified, empty per sample
+            roles["user_sourced_id"].tolist(),
+            roles["role_type"].tolist(),
+            roles["role"].tolist(),
+            roles["org_sourced_id"].tolist(),
+            _text(roles["user_profile_sourced_id"]),
+        ]
+
+
+class ZipPackage:
+    """Writer sink that packages the OneRoster files as one zip archive.
+
+    Each file is deflated into its archive entry while it is written, so the
+    bulk package is produced without the CSV files on disk. The archive can be
+    written to any writable binary stream; without seek support (for example
+    ``BlobStorageClient.open_write``) entries are written with data
+    descriptors. Entries are written one at a time; with ``write_all(...,
+    workers=N)`` the writer threads take turns. Entry sizes are not known
+    up front, so every entry is written with zip64 size fields and may grow
+    past 4 GiB.
+
+    Example:
+        with ZipPackage(open("oneroster.zip", "wb")) as package:
+            OneRosterCSVWriter(Path("oneroster"), sink=package).write_all(data_model)
+    """
+
+    def __init__(self, output: BinaryIO, compresslevel: Optional[int] = None) -> None:
+        """Initialize the package.
+
+        Args:
+            output: Writable binary stream of the archive, closed with the package
+            compresslevel: Deflate level from 0 to 9 (default: zlib's default, 6)
+        """
+        self._output = output
+        self._archive = zipfile.ZipFile(
+            output, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+        )
+        self._entry_lock = threading.Lock()
+
+    def __call__(self, file_path: Path) -> BinaryIO:
+        """Open the archive entry of a file, named after the file name.
+
+        Waits until the entry that is being written, if any, is closed.
+        """
+        self._entry_lock.acquire()
+        try:
+            entry = self._archive.open(file_path.name, "w", force_zip64=True)
+        except BaseException:
+            self._entry_lock.release()
+            raise
+        return _ZipEntry(entry, self._entry_lock)  # type: ignore[return-value]
+
+    def close(self) -> None:
+        """Write the archive directory and close the output stream."""
+        try:
+            self._archive.close()
+        finally:
+            self._output.close()
+
+    def __enter__(self) -> "ZipPackage":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        """Close the package; after an exception the output stream decides what to keep."""
+        if exc_type is None:
+            self.close()
+            return
+        try:
+            self._archive.close()
+        finally:
+            # BlobStorageClient.open_write streams discard the upload
+            self._output.__exit__(exc_type, exc, traceback)
+
+
+class _ZipEntry(io.BufferedIOBase):
+    """Writable archive entry that lets the next entry start once it is closed."""
+
+    def __init__(self, entry: IO[bytes], lock: threading.Lock) -> None:
+        """Initialize the entry.
+
+        Args:
+            entry: Entry stream from ``ZipFile.open``
+            lock: Lock held while the entry is open
+        """
+        super().__init__()
+        self._entry = entry
+        self._lock = lock
+        self._size = 0
+
+    def writable(self) -> bool:
+        """Return True; the entry is writable."""
+        return True
+
+    def write(self, data: Any) -> int:
+        """Compress bytes into the entry."""
+        written = self._entry.write(data)
+        self._size += written
+        return written
+
+    def tell(self) -> int:
+        """Return the number of uncompressed bytes written so far."""
+        return self._size
+
+    def close(self) -> None:
+        """Finish the entry and release the archive."""
+        if self.closed:
+            return
+        try:
+            self._entry.close()
+        finally:
+            self._lock.release()
+            super().close()
+
+
+def _open_file(file_path: Path) -> BinaryIO:
+    """Open a local output file for binary writing; the default writer sink."""
+    return open(file_path, "wb")
+
+
+def _text(column: "pd.Series") -> list[str]:
+    """Format an optional text column; missing values become empty cells."""
+    values: list[str] = column.fillna("").tolist()
+    return values
+
+
+def _flag(column: "pd.Series") -> list[str]:
+    """Format an optional boolean column as TRUE/FALSE; missing values become empty cells."""
+    return [
+        "" if missing else str(value).upper()
+        for value, missing in zip(column.tolist(), column.isna().tolist())
+    ]
@@ -0,0 +1,511 @@
+"""Columnar SDS CSV parser.
+
+This module loads Microsoft School Data Sync (SDS) CSV files into pandas
+DataFrames with one typed column per SDS model field, as an alternative to the
+row-based ``SDSCSVParser``. Whitespace stripping, Status normalization, date
+parsing and required-field checks run as vectorized column operations.
+"""
+
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional, get_args
+
+import pandas as pd
+
+from ..instrumentation import stage
+from ..models.sds import (
+    SDSDataModel,
+    SDSEnrollment,
+    SDSSchool,
+    SDSSection,
+    SDSStatus,
+    SDSStudent,
+    SDSTeacher,
+)
+from ..models.trusted import TrustedModelBuilder
+from ..utils.validators import ValidationLevel
+from .sds_parser import (
+    ENROLLMENT_COLUMNS,
+    SCHOOL_COLUMNS,
+    SECTION_COLUMNS,
+    STUDENT_COLUMNS,
+    TEACHER_COLUMNS,
+)
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    #: String dtype of text columns: pyarrow-backed when pyarrow is installed
+    STRING_DTYPE = pd.StringDtype("python")
+else:
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+
+#: Dtype of the ``status`` column
+STATUS_DTYPE = pd.CategoricalDtype([status.value for status in SDSStatus])
+
+#: Dtype of the enrollment ``role`` column
+ROLE_DTYPE = pd.CategoricalDtype(["student", "teacher"])
+
+# SDS model field -> CSV column, in model field order. Status and term dates are
+# derived from their raw columns separately.
+SCHOOL_FIELDS = {"sis_id": "SIS ID", "name": "Name", "school_number": "School Number"}
+STUDENT_FIELDS = {
+    "sis_id": "SIS ID",
+    "school_sis_id": "School SIS ID",
+    "username": "Username",
+    "first_name": "First Name",
+    "last_name": "Last Name",
+    "middle_name": "Middle Name",
+    "grade": "Grade",
+    "secondary_email": "Secondary Email",
+    "student_number": "Student Number",
+}
+TEACHER_FIELDS = {
+    "sis_id": "SIS ID",
+    "school_sis_id": "School SIS ID",
+    "username": "Username",
+    "first_name": "First Name",
+    "last_name": "Last Name",
+    "middle_name": "Middle Name",
+    "secondary_email": "Secondary Email",
+    "teacher_number": "Teacher Number",
+}
+SECTION_FIELDS = {
+    "sis_id": "SIS ID",
+    "school_sis_id": "School SIS ID",
+    "section_name": "Section Name",
+    "section_number": "Section Number",
+    "term_sis_id": "Term SIS ID",
+    "term_name": "Term Name",
+    "course_name": "Course Name",
+    "course_number": "Course Number",
+    "course_description": "Course Description",
+}
+ENROLLMENT_FIELDS = {"section_sis_id": "Section SIS ID", "sis_id": "SIS ID"}
+
+SECTION_DATE_FIELDS = {"term_start_date": "Term Start Date", "term_end_date": "Term End Date"}
+
+
+class SDSColumnarData:
+    """SDS data held as one DataFrame per entity type.
+
+    Each frame has one column per field of the matching SDS model, in model field
+    order. Text columns use ``STRING_DTYPE``, ``status`` and ``role`` are
+    categorical and term dates are datetime columns. Missing optional values are
+    ``pd.NA``. Enrollments hold student enrollments followed by teacher
+    enrollments, as in ``SDSDataModel``.
+    """
+
+    def __init__(
+        self,
+        schools: pd.DataFrame,
+        students: pd.DataFrame,
+        teachers: pd.DataFrame,
+        sections: pd.DataFrame,
+        enrollments: pd.DataFrame,
+    ) -> None:
+        """Initialize columnar SDS data.
+
+        Args:
+            schools: School frame
+            students: Student frame
+            teachers: Teacher frame
+            sections: Section frame
+            enrollments: Enrollment frame (students first, then teachers)
+        """
+        self.schools = schools
+        self.students = students
+        self.teachers = teachers
+        self.sections = sections
+        self.enrollments = enrollments
+
+    def to_data_model(self, validation: ValidationLevel = ValidationLevel.OFF) -> SDSDataModel:
+        """Build an ``SDSDataModel`` view of the frames.
+
+        The models are built on demand; the frames do not keep a reference to them.
+
+        Args:
+            validation: ``full`` validates every row with its Pydantic model. The
+                other levels trust the frames, which the parser already checked.
+
+        Returns:
+            SDSDataModel equal to the one ``SDSCSVParser.parse_all`` returns
+        """
+        validation = ValidationLevel(validation)
+
+        model = SDSDataModel if validation is ValidationLevel.FULL else SDSDataModel.model_construct
+        return model(
+            schools=frame_to_models(self.schools, SDSSchool, validation),
+            students=frame_to_models(self.students, SDSStudent, validation),
+            teachers=frame_to_models(self.teachers, SDSTeacher, validation),
+            sections=frame_to_models(self.sections, SDSSection, validation),
+            enrollments=frame_to_models(self.enrollments, SDSEnrollment, validation),
+        )
+
+
+class SDSColumnarParser:
+    """Columnar parser for SDS CSV files.
+
+    Each file is read in one pass into a DataFrame that keeps only the columns
+    mapped to SDS model fields; any other columns in the file are never
+    materialized. Values are stripped like Pydantic's ``str_strip_whitespace``,
+    and Status and term dates get the same interpretation as in ``SDSCSVParser``.
+
+    Unless validation is ``off``, each file's header is checked for the required
+    columns and required fields are checked for empty values, both as bulk
+    column operations. The frames hold no per-row Python objects, so the
+    ``full`` level only matters for ``SDSColumnarData.to_data_model``.
+    """
+
+    def __init__(
+        self,
+        base_path: Optional[Path] = None,
+        validation: ValidationLevel = ValidationLevel.SCHEMA_ONCE,
+    ) -> None:
+        """Initialize columnar SDS parser.
+
+        Args:
+            base_path: Base directory path containing SDS CSV files.
+                      If None, file paths must be provided as absolute paths.
+            validation: Whether headers and required fields are checked
+                (default: schema-once; ``off`` skips the checks)
+        """
+        self.base_path = base_path or Path.cwd()
+        self.validation = ValidationLevel(validation)
+
+    def parse_schools(self, file_path: Path) -> pd.DataFrame:
+        """Parse school.csv into a frame with SDSSchool columns.
+
+        Args:
+            file_path: Path to school.csv file
+
+        Returns:
+            School frame
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid
+        """
+        raw = self._read_csv(file_path, SCHOOL_FIELDS, SCHOOL_COLUMNS)
+        frame = self._text_columns(raw, SCHOOL_FIELDS)
+        self._check_required(frame, SDSSchool, file_path)
+        return frame
+
+    def parse_students(self, file_path: Path) -> pd.DataFrame:
+        """Parse student.csv into a frame with SDSStudent columns.
+
+        Args:
+            file_path: Path to student.csv file
+
+        Returns:
+            Student frame
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid
+        """
+        raw = self._read_csv(file_path, STUDENT_FIELDS, STUDENT_COLUMNS, ("Status",))
+        frame = self._text_columns(raw, STUDENT_FIELDS)
+        frame["status"] = self._status_column(raw)
+        self._check_required(frame, SDSStudent, file_path)
+        return frame
+
+    def parse_teachers(self, file_path: Path) -> pd.DataFrame:
+        """Parse teacher.csv into a frame with SDSTeacher columns.
+
+        Args:
+            file_path: Path to teacher.csv file
+
+        Returns:
+            Teacher frame
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid
+        """
+        raw = self._read_csv(file_path, TEACHER_FIELDS, TEACHER_COLUMNS, ("Status",))
+        frame = self._text_columns(raw, TEACHER_FIELDS)
+        frame["status"] = self._status_column(raw)
+        self._check_required(frame, SDSTeacher, file_path)
+        return frame
+
+    def parse_sections(self, file_path: Path) -> pd.DataFrame:
+        """Parse section.csv into a frame with SDSSection columns.
+
+        Args:
+            file_path: Path to section.csv file
+
+        Returns:
+            Section frame
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid
+        """
+        raw = self._read_csv(
+            file_path,
+            SECTION_FIELDS,
+            SECTION_COLUMNS,
+            ("Status", *SECTION_DATE_FIELDS.values()),
+        )
+        frame = self._text_columns(raw, SECTION_FIELDS)
+        for field, column in SECTION_DATE_FIELDS.items():
+            frame[field] = self._date_column(raw, column)
+        frame["status"] = self._status_column(raw)
+
+        # Restore model field order (dates sit between term name and course name)
+        frame = frame[list(SDSSection.model_fields)]
+        self._check_required(frame, SDSSection, file_path)
+        return frame
+
+    def parse_enrollments(self, file_path: Path, role: str = "student") -> pd.DataFrame:
+        """Parse an enrollment CSV file into a frame with SDSEnrollment columns.
+
+        Args:
+            file_path: Path to studentEnrollment.csv or teacherRoster.csv
+            role: Role type - "student" or "teacher"
+
+        Returns:
+            Enrollment frame
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid or role is invalid
+        """
+        role = role.lower()
+        if role not in ("student", "teacher"):
+            raise ValueError("Role must be 'student' or 'teacher'")
+
+        raw = self._read_csv(file_path, ENROLLMENT_FIELDS, ENROLLMENT_COLUMNS)
+        frame = self._text_columns(raw, ENROLLMENT_FIELDS)
+        frame["role"] = pd.Series(role, index=frame.index, dtype=ROLE_DTYPE)
+        self._check_required(frame, SDSEnrollment, file_path)
+        return frame
+
+    def parse_all(
+        self,
+        school_file: Path,
+        student_file: Path,
+        teacher_file: Path,
+        section_file: Path,
+        student_enrollment_file: Path,
+        teacher_roster_file: Path,
+    ) -> SDSColumnarData:
+        """Parse all SDS CSV files into frames.
+
+        Args:
+            school_file: Path to school.csv
+            student_file: Path to student.csv
+            teacher_file: Path to teacher.csv
+            section_file: Path to section.csv
+            student_enrollment_file: Path to studentEnrollment.csv
+            teacher_roster_file: Path to teacherRoster.csv
+
+        Returns:
+            SDSColumnarData with one frame per entity type
+
+        Raises:
+            FileNotFoundError: If any file does not exist
+            ValueError: If any CSV format is invalid
+        """
+        with stage("parse") as timed:
+            schools = self.parse_schools(school_file)
+            students = self.parse_students(student_file)
+            teachers = self.parse_teachers(teacher_file)
+            sections = self.parse_sections(section_file)
+
+            # Combine student and teacher enrollments
+            enrollments = pd.concat(
+                [
+                    self.parse_enrollments(student_enrollment_file, "student"),
+                    self.parse_enrollments(teacher_roster_file, "teacher"),
+                ],
+                ignore_index=True,
+            )
+            timed.rows = (
+                len(schools) + len(students) + len(teachers) + len(sections) + len(enrollments)
+            )
+
+        return SDSColumnarData(
+            schools=schools,
+            students=students,
+            teachers=teachers,
+            sections=sections,
+            enrollments=enrollments,
+        )
+
+    def _read_csv(
+        self,
+        file_path: Path,
+        fields: dict[str, str],
+        required_columns: tuple[str, ...],
+        extra_columns: tuple[str, ...] = (),
+    ) -> pd.DataFrame:
+        """Read the mapped columns of an SDS CSV file as raw strings.
+
+        Args:
+            file_path: CSV file path, resolved relative to base_path
+            fields: Model field to CSV column mapping
+            required_columns: Columns the header must contain
+            extra_columns: Other raw columns to keep (e.g. Status)
+
+        Returns:
+            Frame of the present wanted columns; empty cells are ""
+
+        Raises:
+            ValueError: If the header lacks a required column (unless validation is off)
+        """
+        full_path = self._resolve_path(file_path)
+        wanted = {*fields.values(), *extra_columns}
+
+        try:
+            with stage(f"parse:{full_path.name}", full_path) as timed:
+                raw = pd.read_csv(
+                    full_path,
+                    dtype=STRING_DTYPE,
+                    usecols=lambda column: column in wanted,
+                    keep_default_na=False,
+                    na_filter=False,
+                    encoding="utf-8",
+                )
+                timed.rows = len(raw)
+        except pd.errors.EmptyDataError:
+            # A completely empty file has no header and no rows
+            return pd.DataFrame()
+
+        if self.validation is not ValidationLevel.OFF:
+            missing = [name for name in required_columns if name not in raw.columns]
+            if missing:
+                raise ValueError(
+                    f"{full_path.name}: missing required columns: {', '.join(missing)}"
+                )
+
+        return raw
+
+    @staticmethod
+    def _text_columns(raw: pd.DataFrame, fields: dict[str, str]) -> pd.DataFrame:
+        """Build stripped text columns named after model fields.
+
+        Columns absent from the file become all-NA, like ``row.get`` returning None.
+        """
+        columns = {}
+        for field, column in fields.items():
+            if column in raw.columns:
+                columns[field] = raw[column].str.strip()
+            else:
+                columns[field] = pd.Series(pd.NA, index=raw.index, dtype=STRING_DTYPE)
+        return pd.DataFrame(columns, index=raw.index)
+
+    @staticmethod
+    def _status_column(raw: pd.DataFrame) -> pd.Series:
+        """Normalize the optional Status column: empty or "active" -> Active."""
+        if "Status" not in raw.columns:
+            return pd.Series(SDSStatus.ACTIVE.value, index=raw.index, dtype=STATUS_DTYPE)
+
+        status = raw["Status"]
+        active = (status == "") | (status.str.lower() == "active")
+        return (
+            active.map({True: SDSStatus.ACTIVE.value, False: SDSStatus.INACTIVE.value})
+            .astype(STATUS_DTYPE)
+        )
+
+    @staticmethod
+    def _date_column(raw: pd.DataFrame, column: str) -> pd.Series:
+        """Parse an optional ISO 8601 date column; empty cells become missing."""
+        if column not in raw.columns:
+            return pd.Series(pd.NaT, index=raw.index, dtype="datetime64[us]")
+
+        values = raw[column]
+        present = values.where(values != "")
+        try:
+            return pd.to_datetime(present, format="ISO8601")
+        except (ValueError, TypeError):
+            # Mixed UTC offsets cannot share one datetime64 column; fall back to
+            # per-value parsing, which also raises the row parser's errors
+            return values.map(lambda value: datetime.fromisoformat(value) if value else None)
+
+    def _check_required(self, frame: pd.DataFrame, model_cls: Any, file_path: Path) -> None:
+        """Check that no required field is empty, one column at a time.
+
+        Raises:
+            ValueError: Naming the field, file and row of the first empty value
+        """
+        if self.validation is ValidationLevel.OFF:
+            return
+
+        first: Optional[tuple[int, str]] = None
+        for field in TrustedModelBuilder(model_cls).required_fields:
+            column = frame[field]
+            empty = column.isna() | (column == "")
+            if empty.any():
+                position = int(empty.to_numpy().argmax())
+                if first is None or position < first[0]:
+                    first = (position, field)
+
+        if first is not None:
+            position, field = first
+            raise ValueError(
+                f"Field cannot be empty: {field} ({Path(file_path).name}, row {position + 1})"
+            )
+
+    def _resolve_path(self, file_path: Path) -> Path:
+        """Resolve file path relative to base_path if not absolute.
+
+        Args:
+            file_path: File path to resolve
+
+        Returns:
+            Absolute file path
+        """
+        if file_path.is_absolute():
+            return file_path
+        return self.base_path / file_path
+
+
+def frame_to_models(frame: pd.DataFrame, model_cls: Any, validation: ValidationLevel) -> list:
+    """Build one model per frame row.
+
+    Columns are matched to model fields by name. NA values become None, datetime
+    columns become ``datetime`` objects and columns of Enum-typed fields become
+    members of that Enum.
+
+    Args:
+        frame: Frame with one column per model field
+        model_cls: Pydantic model class to build
+        validation: ``full`` validates every row; other levels build trusted models
+
+    Returns:
+        Models in frame row order
+    """
+    if frame.empty:
+        return []
+
+    fields = list(frame.columns)
+    columns: list[list[Any]] = []
+    for field in fields:
+        column = frame[field]
+        enum_cls = _enum_type(model_cls.model_fields[field].annotation)
+        if enum_cls is not None:
+            members = {member.value: member for member in enum_cls}
+            columns.append([None if pd.isna(value) else members[value] for value in column])
+        elif pd.api.types.is_datetime64_any_dtype(column.dtype):
+            columns.append(
+                [None if value is pd.NaT else value for value in column.dt.to_pydatetime()]
+            )
+        else:
+            columns.append(column.astype(object).where(column.notna(), None).tolist())
+
+    if validation is ValidationLevel.FULL:
+        return [model_cls(**dict(zip(fields, values))) for values in zip(*columns)]
+
+    build = TrustedModelBuilder(model_cls).build
+    return [build(dict(zip(fields, values))) for values in zip(*columns)]
+
+
+def _enum_type(annotation: Any) -> Optional[type[Enum]]:
+    """Return the Enum class of an ``Enum`` or ``Optional[Enum]`` annotation."""
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, Enum):
+            return candidate
+    return None
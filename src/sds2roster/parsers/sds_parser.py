@@ -5,9 +5,28 @@ CSV files into SDS data models.
 """
 
 import csv
+import gc
+import io
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
 
+from ..instrumentation import stage
+from ..models.records import record_type, records_from_tuples, to_record
 from ..models.sds import (
     SDSDataModel,
     SDSEnrollment,
@@ -17,6 +36,69 @@ from ..models.sds import (
     SDSStudent,
     SDSTeacher,
 )
+from ..models.trusted import TrustedModelBuilder, model_to_tuple, models_from_tuples
+from ..utils.interning import ValuePool
+from ..utils.validators import ValidationLevel, find_empty_value
+
+_SDSEntity = TypeVar("_SDSEntity", SDSSchool, SDSStudent, SDSTeacher, SDSSection, SDSEnrollment)
+
+# An SDS file: a path (resolved relative to base_path) or an open text stream
+SDSInput = Union[Path, IO[str]]
+
+# Columns that must be present in each SDS file (checked at the schema-once level)
+SCHOOL_COLUMNS = ("SIS ID", "Name")
+STUDENT_COLUMNS = ("SIS ID", "School SIS ID", "Username", "First Name", "Last Name")
+TEACHER_COLUMNS = ("SIS ID", "School SIS ID", "Username", "First Name", "Last Name")
+SECTION_COLUMNS = ("SIS ID", "School SIS ID", "Section Name")
+ENROLLMENT_COLUMNS = ("Section SIS ID", "SIS ID")
+
+# Number of rows checked together at the schema-once level
+CHECK_BATCH_SIZE = 8192
+
+# With several workers, files larger than this are split into byte ranges of
+# about this size that are parsed by separate workers
+PARALLEL_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Block size of the scan for record boundaries
+_SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Parallel parse task: job index, task size, worker function and its arguments
+_ParseTask = tuple[int, int, Callable[..., list[tuple]], tuple]
+
+# Low-cardinality fields whose values are shared between the parsed entities
+SHARED_FIELDS: dict[type, tuple[str, ...]] = {
+    SDSSchool: ("sis_id",),
+    SDSStudent: ("school_sis_id", "grade"),
+    SDSTeacher: ("school_sis_id",),
+    SDSSection: (
+        "sis_id",
+        "school_sis_id",
+        "term_sis_id",
+        "term_name",
+        "term_start_date",
+        "term_end_date",
+        "course_name",
+        "course_number",
+    ),
+    SDSEnrollment: ("section_sis_id", "role"),
+}
+
+
+class _EmptyFieldError(ValueError):
+    """A required field is empty (schema-once level).
+
+    Carries the row number separately, so that errors from a byte range of a
+    file can be renumbered relative to the whole file.
+    """
+
+    def __init__(self, field: str, file_name: str, row: int) -> None:
+        super().__init__(field, file_name, row)
+        self.field = field
+        self.file_name = file_name
+        self.row = row
+
+    def __str__(self) -> str:
+        return f"Field cannot be empty: {self.field} ({self.file_name}, row {self.row})"
 
 
 class SDSCSVParser:
@@ -24,24 +106,55 @@ class SDSCSVParser:
 
     This class reads SDS CSV files and creates SDSDataModel instances.
     Supports all SDS entity types: schools, students, teachers, sections, and enrollments.
+
+    Each ``parse_*`` method has an ``iter_*`` counterpart that yields entities one
+    row at a time, so callers can process files without holding them in memory.
+    Files are given as paths or as text streams, such as
+    ``BlobStorageClient.open_text`` streams that decode a blob while it downloads.
+    Streams are read from their current position and are not closed.
+
+    The validation level controls how rows become models. ``full`` validates
+    every row with its Pydantic model. ``schema-once`` checks the CSV header once
+    per file and the required fields in bulk, one batch of rows at a time, then
+    builds the models without validation. ``off`` skips all checks. Valid input
+    gives equal models at every level.
+
+    With ``compact=True`` the parser returns slotted records
+    (``sds2roster.models.records``) instead of Pydantic models. They have the
+    same attributes and need a fraction of the memory; rows are still validated
+    at the chosen level.
+
+    Values of the low-cardinality fields in ``SHARED_FIELDS`` (school, section
+    and term IDs, grades, course names) are dictionary encoded: every entity
+    repeating a value refers to one shared object instead of its own copy.
     """
 
-    def __init__(self, base_path: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        base_path: Optional[Path] = None,
+        validation: ValidationLevel = ValidationLevel.FULL,
+        compact: bool = False,
+    ) -> None:
         """Initialize SDS CSV parser.
 
         Args:
             base_path: Base directory path containing SDS CSV files.
                       If None, file paths must be provided as absolute paths.
+            validation: How thoroughly rows are validated (default: full)
+            compact: Return compact records instead of Pydantic models
         """
         self.base_path = base_path or Path.cwd()
+        self.validation = ValidationLevel(validation)
+        self.compact = compact
+        self._values = ValuePool()
 
-    def parse_schools(self, file_path: Path) -> list[SDSSchool]:
+    def parse_schools(self, file_path: SDSInput) -> list[SDSSchool]:
         """Parse school.csv file.
 
         Expected columns: SIS ID, Name, School Number
 
         Args:
-            file_path: Path to school.csv file
+            file_path: Path to school.csv file, or a text stream of it
 
         Returns:
             List of SDSSchool objects
@@ -50,22 +163,36 @@ class SDSCSVParser:
             FileNotFoundError: If file does not exist
             ValueError: If CSV format is invalid
         """
-        schools = []
-        full_path = self._resolve_path(file_path)
+        return self._collect(file_path, self.iter_schools(file_path))
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                school = SDSSchool(
-                    sis_id=row["SIS ID"],
-                    name=row["Name"],
-                    school_number=row.get("School Number"),
-                )
-                schools.append(school)
+    def iter_schools(self, file_path: SDSInput) -> Iterator[SDSSchool]:
+        """Iterate over schools in school.csv one row at a time.
+
+        Args:
+            file_path: Path to school.csv file, or a text stream of it
 
-        return schools
+        Yields:
+            SDSSchool objects in file order
 
-    def parse_students(self, file_path: Path) -> list[SDSStudent]:
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid
+        """
+        rows = self._iter_rows(file_path, SCHOOL_COLUMNS)
+        yield from self._build_models(
+            SDSSchool,
+            file_path,
+            (
+                {
+                    "sis_id": row["SIS ID"],
+                    "name": row["Name"],
+                    "school_number": row.get("School Number"),
+                }
+                for row in rows
+            ),
+        )
+
+    def parse_students(self, file_path: SDSInput) -> list[SDSStudent]:
         """Parse student.csv file.
 
         Expected columns: SIS ID, School SIS ID, Username, First Name, Last Name,
@@ -73,7 +200,7 @@ class SDSCSVParser:
                          Student Number (optional), Status (optional)
 
         Args:
-            file_path: Path to student.csv file
+            file_path: Path to student.csv file, or a text stream of it
 
         Returns:
             List of SDSStudent objects
@@ -82,39 +209,43 @@ class SDSCSVParser:
             FileNotFoundError: If file does not exist
             ValueError: If CSV format is invalid
         """
-        students = []
-        full_path = self._resolve_path(file_path)
+        return self._collect(file_path, self.iter_students(file_path))
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Parse status if provided
-                status = SDSStatus.ACTIVE
-                if row.get("Status"):
-                    status_value = row["Status"]
-                    status = (
-                        SDSStatus.ACTIVE
-                        if status_value.lower() == "active"
-                        else SDSStatus.INACTIVE
-                    )
+    def iter_students(self, file_path: SDSInput) -> Iterator[SDSStudent]:
+        """Iterate over students in student.csv one row at a time.
 
-                student = SDSStudent(
-                    sis_id=row["SIS ID"],
-                    school_sis_id=row["School SIS ID"],
-                    username=row["Username"],
-                    first_name=row["First Name"],
-                    last_name=row["Last Name"],
-                    middle_name=row.get("Middle Name"),
-                    grade=row.get("Grade"),
-                    secondary_email=row.get("Secondary Email"),
-                    student_number=row.get("Student Number"),
-                    status=status,
-                )
-                students.append(student)
+        Args:
+            file_path: Path to student.csv file, or a text stream of it
 
-        return students
+        Yields:
+            SDSStudent objects in file order
 
-    def parse_teachers(self, file_path: Path) -> list[SDSTeacher]:
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid
+        """
+        rows = self._iter_rows(file_path, STUDENT_COLUMNS)
+        yield from self._build_models(
+            SDSStudent,
+            file_path,
+            (
+                {
+                    "sis_id": row["SIS ID"],
+                    "school_sis_id": row["School SIS ID"],
+                    "username": row["Username"],
+                    "first_name": row["First Name"],
+                    "last_name": row["Last Name"],
+                    "middle_name": row.get("Middle Name"),
+                    "grade": row.get("Grade"),
+                    "secondary_email": row.get("Secondary Email"),
+                    "student_number": row.get("Student Number"),
+                    "status": self._parse_status(row),
+                }
+                for row in rows
+            ),
+        )
+
+    def parse_teachers(self, file_path: SDSInput) -> list[SDSTeacher]:
         """Parse teacher.csv file.
 
         Expected columns: SIS ID, School SIS ID, Username, First Name, Last Name,
@@ -122,7 +253,7 @@ class SDSCSVParser:
                          Teacher Number (optional), Status (optional)
 
         Args:
-            file_path: Path to teacher.csv file
+            file_path: Path to teacher.csv file, or a text stream of it
 
         Returns:
             List of SDSTeacher objects
@@ -131,38 +262,42 @@ class SDSCSVParser:
             FileNotFoundError: If file does not exist
             ValueError: If CSV format is invalid
         """
-        teachers = []
-        full_path = self._resolve_path(file_path)
+        return self._collect(file_path, self.iter_teachers(file_path))
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Parse status if provided
-                status = SDSStatus.ACTIVE
-                if row.get("Status"):
-                    status_value = row["Status"]
-                    status = (
-                        SDSStatus.ACTIVE
-                        if status_value.lower() == "active"
-                        else SDSStatus.INACTIVE
-                    )
+    def iter_teachers(self, file_path: SDSInput) -> Iterator[SDSTeacher]:
+        """Iterate over teachers in teacher.csv one row at a time.
 
-                teacher = SDSTeacher(
-                    sis_id=row["SIS ID"],
-                    school_sis_id=row["School SIS ID"],
-                    username=row["Username"],
-                    first_name=row["First Name"],
-                    last_name=row["Last Name"],
-                    middle_name=row.get("Middle Name"),
-                    secondary_email=row.get("Secondary Email"),
-                    teacher_number=row.get("Teacher Number"),
-                    status=status,
-                )
-                teachers.append(teacher)
+        Args:
+            file_path: Path to teacher.csv file, or a text stream of it
+
+        Yields:
+            SDSTeacher objects in file order
 
-        return teachers
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid
+        """
+        rows = self._iter_rows(file_path, TEACHER_COLUMNS)
+        yield from self._build_models(
+            SDSTeacher,
+            file_path,
+            (
+                {
+                    "sis_id": row["SIS ID"],
+                    "school_sis_id": row["School SIS ID"],
+                    "username": row["Username"],
+                    "first_name": row["First Name"],
+                    "last_name": row["Last Name"],
+                    "middle_name": row.get("Middle Name"),
+                    "secondary_email": row.get("Secondary Email"),
+                    "teacher_number": row.get("Teacher Number"),
+                    "status": self._parse_status(row),
+                }
+                for row in rows
+            ),
+        )
 
-    def parse_sections(self, file_path: Path) -> list[SDSSection]:
+    def parse_sections(self, file_path: SDSInput) -> list[SDSSection]:
         """Parse section.csv file.
 
         Expected columns: SIS ID, School SIS ID, Section Name, Section Number (optional),
@@ -171,7 +306,7 @@ class SDSCSVParser:
                          Course Description (optional), Status (optional)
 
         Args:
-            file_path: Path to section.csv file
+            file_path: Path to section.csv file, or a text stream of it
 
         Returns:
             List of SDSSection objects
@@ -180,57 +315,35 @@ class SDSCSVParser:
             FileNotFoundError: If file does not exist
             ValueError: If CSV format is invalid
         """
-        from datetime import datetime
+        return self._collect(file_path, self.iter_sections(file_path))
 
-        sections = []
-        full_path = self._resolve_path(file_path)
+    def iter_sections(self, file_path: SDSInput) -> Iterator[SDSSection]:
+        """Iterate over sections in section.csv one row at a time.
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Parse dates if provided
-                term_start_date = None
-                term_end_date = None
-                if row.get("Term Start Date"):
-                    term_start_date = datetime.fromisoformat(row["Term Start Date"])
-                if row.get("Term End Date"):
-                    term_end_date = datetime.fromisoformat(row["Term End Date"])
-
-                # Parse status if provided
-                status = SDSStatus.ACTIVE
-                if row.get("Status"):
-                    status_value = row["Status"]
-                    status = (
-                        SDSStatus.ACTIVE
-                        if status_value.lower() == "active"
-                        else SDSStatus.INACTIVE
-                    )
+        Args:
+            file_path: Path to section.csv file, or a text stream of it
 
-                section = SDSSection(
-                    sis_id=row["SIS ID"],
-                    school_sis_id=row["School SIS ID"],
-                    section_name=row["Section Name"],
-                    section_number=row.get("Section Number"),
-                    term_sis_id=row.get("Term SIS ID"),
-                    term_name=row.get("Term Name"),
-                    term_start_date=term_start_date,
-                    term_end_date=term_end_date,
-                    course_name=row.get("Course Name"),
-                    course_number=row.get("Course Number"),
-                    course_description=row.get("Course Description"),
-                    status=status,
-                )
-                sections.append(section)
+        Yields:
+            SDSSection objects in file order
 
-        return sections
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid
+        """
+        rows = self._iter_rows(file_path, SECTION_COLUMNS)
+        yield from self._build_models(
+            SDSSection, file_path, (self._section_values(row) for row in rows)
+        )
 
-    def parse_enrollments(self, file_path: Path, role: str = "student") -> list[SDSEnrollment]:
+    def parse_enrollments(
+        self, file_path: SDSInput, role: str = "student"
+    ) -> list[SDSEnrollment]:
         """Parse enrollment CSV file (studentEnrollment.csv or teacherRoster.csv).
 
         Expected columns: Section SIS ID, SIS ID
 
         Args:
-            file_path: Path to enrollment CSV file
+            file_path: Path to enrollment CSV file, or a text stream of it
             role: Role type - "student" or "teacher"
 
         Returns:
@@ -243,29 +356,48 @@ class SDSCSVParser:
         if role.lower() not in ("student", "teacher"):
             raise ValueError("Role must be 'student' or 'teacher'")
 
-        enrollments = []
-        full_path = self._resolve_path(file_path)
+        return self._collect(file_path, self.iter_enrollments(file_path, role))
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                enrollment = SDSEnrollment(
-                    section_sis_id=row["Section SIS ID"],
-                    sis_id=row["SIS ID"],
-                    role=role.lower(),
-                )
-                enrollments.append(enrollment)
+    def iter_enrollments(
+        self, file_path: SDSInput, role: str = "student"
+    ) -> Iterator[SDSEnrollment]:
+        """Iterate over enrollments in an enrollment CSV file one row at a time.
 
-        return enrollments
+        Args:
+            file_path: Path to enrollment CSV file, or a text stream of it
+            role: Role type - "student" or "teacher"
+
+        Yields:
+            SDSEnrollment objects in file order
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            ValueError: If CSV format is invalid or role is invalid
+        """
+        role = role.lower()
+        if role not in ("student", "teacher"):
+            raise ValueError("Role must be 'student' or 'teacher'")
+
+        rows = self._iter_rows(file_path, ENROLLMENT_COLUMNS)
+        yield from self._build_models(
+            SDSEnrollment,
+            file_path,
+            (
+                {"section_sis_id": row["Section SIS ID"], "sis_id": row["SIS ID"], "role": role}
+                for row in rows
+            ),
+        )
 
     def parse_all(
         self,
-        school_file: Path,
-        student_file: Path,
-        teacher_file: Path,
-        section_file: Path,
-        student_enrollment_file: Path,
-        teacher_roster_file: Path,
+        school_file: SDSInput,
+        student_file: SDSInput,
+        teacher_file: SDSInput,
+        section_file: SDSInput,
+        student_enrollment_file: SDSInput,
+        teacher_roster_file: SDSInput,
+        workers: Optional[int] = None,
+        chunk_size: int = PARALLEL_CHUNK_SIZE,
     ) -> SDSDataModel:
         """Parse all SDS CSV files and create a complete data model.
 
@@ -276,6 +408,13 @@ class SDSCSVParser:
             section_file: Path to section.csv
             student_enrollment_file: Path to studentEnrollment.csv
             teacher_roster_file: Path to teacherRoster.csv
+            workers: Number of worker processes. If greater than 1, the six files
+                are parsed concurrently on a process pool; otherwise, or if any
+                file is given as a stream, they are parsed one after another in
+                the current process.
+            chunk_size: With several workers, files larger than this many bytes
+                are split into ranges of whole records that are parsed by
+                separate workers
 
         Returns:
             Complete SDSDataModel with all entities
@@ -284,6 +423,61 @@ class SDSCSVParser:
             FileNotFoundError: If any file does not exist
             ValueError: If any CSV format is invalid
         """
+        with stage("parse") as timed:
+            sds_data = self._parse_all(
+                school_file,
+                student_file,
+                teacher_file,
+                section_file,
+                student_enrollment_file,
+                teacher_roster_file,
+                workers,
+                chunk_size,
+            )
+            timed.rows = (
+                len(sds_data.schools)
+                + len(sds_data.students)
+                + len(sds_data.teachers)
+                + len(sds_data.sections)
+                + len(sds_data.enrollments)
+            )
+        return sds_data
+
+    def _parse_all(
+        self,
+        school_file: SDSInput,
+        student_file: SDSInput,
+        teacher_file: SDSInput,
+        section_file: SDSInput,
+        student_enrollment_file: SDSInput,
+        teacher_roster_file: SDSInput,
+        workers: Optional[int],
+        chunk_size: int,
+    ) -> SDSDataModel:
+        """Parse all SDS CSV files; see ``parse_all``."""
+        files = (
+            school_file,
+            student_file,
+            teacher_file,
+            section_file,
+            student_enrollment_file,
+            teacher_roster_file,
+        )
+        # Worker processes open files by path; streams are read here
+        if workers is not None and workers > 1 and all(isinstance(f, Path) for f in files):
+            return self._parse_all_parallel(
+                [
+                    ("parse_schools", school_file),
+                    ("parse_students", student_file),
+                    ("parse_teachers", teacher_file),
+                    ("parse_sections", section_file),
+                    ("parse_enrollments", student_enrollment_file, "student"),
+                    ("parse_enrollments", teacher_roster_file, "teacher"),
+                ],
+                workers,
+                chunk_size,
+            )
+
         schools = self.parse_schools(school_file)
         students = self.parse_students(student_file)
         teachers = self.parse_teachers(teacher_file)
@@ -296,7 +490,13 @@ class SDSCSVParser:
         # Combine all enrollments
         all_enrollments = student_enrollments + teacher_enrollments
 
-        return SDSDataModel(
+        # The entities are already validated (or trusted) at this point
+        build_model = (
+            SDSDataModel
+            if self.validation is ValidationLevel.FULL and not self.compact
+            else SDSDataModel.model_construct
+        )
+        return build_model(
             schools=schools,
             students=students,
             teachers=teachers,
@@ -304,6 +504,310 @@ class SDSCSVParser:
             enrollments=all_enrollments,
         )
 
+    def _parse_all_parallel(
+        self, jobs: list[tuple], workers: int, chunk_size: int = PARALLEL_CHUNK_SIZE
+    ) -> SDSDataModel:
+        """Parse SDS files concurrently on a process pool.
+
+        Each worker parses its file at this parser's validation level and sends
+        back plain tuples of field values, which pickle much faster than model
+        instances. The parent rebuilds the models without validating them a
+        second time.
+
+        Files larger than chunk_size are split into byte ranges that start and
+        end on record boundaries (see ``_record_ranges``), and each range is
+        parsed by its own worker. Results are joined in range order, so the
+        models keep the file's row order.
+
+        Errors are reported deterministically: if several files fail, the error of
+        the file that comes first in ``parse_all`` order is raised, exactly as in
+        sequential mode. Row numbers in errors count from the start of the file.
+
+        Args:
+            jobs: (parse method name, file path, *extra args) in parse_all order
+            workers: Maximum number of worker processes
+            chunk_size: Files larger than this many bytes are split into ranges
+
+        Returns:
+            Complete SDSDataModel with all entities
+        """
+        tasks = self._parallel_tasks(jobs, chunk_size)
+
+        # Start the largest tasks first so they do not queue behind small ones
+        submit_order = sorted(range(len(tasks)), key=lambda t: tasks[t][1], reverse=True)
+
+        # Unpickling and rebuilding allocate millions of acyclic objects; pausing
+        # the cyclic garbage collector meanwhile more than halves that cost
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            futures: dict[int, Future] = {}
+            results: list[list[tuple]] = [[] for _ in jobs]
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                for t in submit_order:
+                    _, _, function, args = tasks[t]
+                    futures[t] = executor.submit(function, *args)
+
+                try:
+                    for t, (i, *_) in enumerate(tasks):
+                        try:
+                            results[i] += futures[t].result()
+                        except _EmptyFieldError as e:
+                            # Count rows from the start of the file, not of the range
+                            raise _EmptyFieldError(
+                                e.field, e.file_name, e.row + len(results[i])
+                            ) from None
+                except BaseException:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+
+            (
+                schools,
+                students,
+                teachers,
+                sections,
+                student_enrollments,
+                teacher_enrollments,
+            ) = results
+
+            # Pickling keeps the values shared within each worker's result
+            from_tuples = records_from_tuples if self.compact else models_from_tuples
+            return SDSDataModel.model_construct(
+                schools=from_tuples(SDSSchool, schools),
+                students=from_tuples(SDSStudent, students),
+                teachers=from_tuples(SDSTeacher, teachers),
+                sections=from_tuples(SDSSection, sections),
+                enrollments=from_tuples(SDSEnrollment, student_enrollments + teacher_enrollments),
+            )
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _parallel_tasks(self, jobs: list[tuple], chunk_size: int) -> list[_ParseTask]:
+        """Split parse jobs into worker tasks of whole files or record ranges.
+
+        Args:
+            jobs: (parse method name, file path, *extra args) in parse_all order
+            chunk_size: Files larger than this many bytes are split into ranges
+
+        Returns:
+            (job index, task size, worker function, worker arguments) in file order
+        """
+        tasks: list[_ParseTask] = []
+        for i, (method, file_path, *extra) in enumerate(jobs):
+            path = self._resolve_path(file_path)
+            # Missing files are left to the worker, so the error order is kept
+            size = path.stat().st_size if path.is_file() else 0
+            if size <= chunk_size:
+                tasks.append(
+                    (i, size, _parse_file_as_tuples, (self.validation, method, path, *extra))
+                )
+                continue
+
+            header_end, ranges = _record_ranges(path, chunk_size)
+            for start, end in ranges:
+                tasks.append(
+                    (
+                        i,
+                        end - start,
+                        _parse_range_as_tuples,
+                        (self.validation, method, path, header_end, start, end, *extra),
+                    )
+                )
+        return tasks
+
+    def _collect(self, file_path: SDSInput, models: Iterator[_SDSEntity]) -> list[_SDSEntity]:
+        """Parse a whole file into a list as an instrumented stage.
+
+        Args:
+            file_path: Parsed file, used for the stage name and byte count
+            models: Models of the file, parsed lazily
+
+        Returns:
+            List of the models
+        """
+        path = self._resolve_path(file_path) if isinstance(file_path, Path) else None
+        with stage(f"parse:{_input_name(file_path)}", path) as timed:
+            parsed = list(models)
+            timed.rows = len(parsed)
+        return parsed
+
+    def _iter_rows(
+        self, file_path: SDSInput, required_columns: tuple[str, ...] = ()
+    ) -> Iterator[dict[str, str]]:
+        """Iterate over the rows of a CSV file as dictionaries.
+
+        Args:
+            file_path: CSV file path, resolved relative to base_path, or a text
+                stream that is read but not closed
+            required_columns: Columns the header must contain. Checked at the
+                schema-once level only.
+
+        Yields:
+            One dictionary per CSV row, keyed by column header
+
+        Raises:
+            ValueError: If the header lacks a required column
+        """
+        source: ContextManager[IO[str]]
+        if isinstance(file_path, Path):
+            source = self._open(self._resolve_path(file_path))
+        else:
+            source = nullcontext(file_path)
+
+        with source as f:
+            reader = csv.DictReader(f)
+
+            if self.validation is ValidationLevel.SCHEMA_ONCE and reader.fieldnames:
+                missing = [name for name in required_columns if name not in reader.fieldnames]
+                if missing:
+                    raise ValueError(
+                        f"{_input_name(file_path)}: missing required columns: "
+                        f"{', '.join(missing)}"
+                    )
+
+            yield from reader
+
+    def _build_models(
+        self,
+        model_cls: type[_SDSEntity],
+        file_path: SDSInput,
+        values: Iterable[dict[str, Any]],
+    ) -> Iterator[_SDSEntity]:
+        """Build models from field values at the parser's validation level.
+
+        Args:
+            model_cls: SDS model class
+            file_path: Source file, used in error messages
+            values: Field values keyed by field name, one dictionary per row
+
+        Yields:
+            Models (or compact records) in row order
+
+        Raises:
+            ValueError: If a row is invalid (full and schema-once levels)
+        """
+        shared = SHARED_FIELDS[model_cls]
+        if self.validation is ValidationLevel.FULL:
+            yield from self._validate_models(model_cls, values, shared)
+            return
+
+        builder = _trusted_builder(model_cls)
+        build = self._trusted_build(model_cls, builder)
+        if self.validation is ValidationLevel.OFF:
+            share_items = self._values.share_items
+            clean = builder.clean
+            for row_values in values:
+                yield build(share_items(clean(row_values), shared))
+            return
+
+        yield from self._check_and_build(builder, build, file_path, values, shared)
+
+    def _validate_models(
+        self,
+        model_cls: type[_SDSEntity],
+        values: Iterable[dict[str, Any]],
+        shared: tuple[str, ...],
+    ) -> Iterator[_SDSEntity]:
+        """Build models with full Pydantic validation; see ``_build_models``."""
+        # Validation copies strings, so values are shared after building
+        share_fields = self._values.share_fields
+        if self.compact:
+            for row_values in values:
+                yield share_fields(to_record(model_cls(**row_values)), shared)
+        else:
+            for row_values in values:
+                yield share_fields(model_cls(**row_values), shared)
+
+    def _trusted_build(
+        self, model_cls: type[_SDSEntity], builder: TrustedModelBuilder[_SDSEntity]
+    ) -> Callable[[dict[str, Any]], Any]:
+        """Return the function that builds a model (or compact record) without validation."""
+        if not self.compact:
+            return builder.build
+
+        record_cls = record_type(model_cls)
+
+        def build(row_values: dict[str, Any]) -> Any:
+            return record_cls(**row_values)
+
+        return build
+
+    def _check_and_build(
+        self,
+        builder: TrustedModelBuilder[_SDSEntity],
+        build: Callable[[dict[str, Any]], Any],
+        file_path: SDSInput,
+        values: Iterable[dict[str, Any]],
+        shared: tuple[str, ...],
+    ) -> Iterator[Any]:
+        """Build models at the schema-once level; see ``_build_models``.
+
+        The required fields of a whole batch are checked in one pass before the
+        batch is built.
+        """
+        share_items = self._values.share_items
+        clean = builder.clean
+        rows = iter(values)
+        row_number = 1
+        while True:
+            batch = [clean(row_values) for row_values in islice(rows, CHECK_BATCH_SIZE)]
+            if not batch:
+                return
+
+            empty = find_empty_value(batch, builder.required_fields)
+            if empty is not None:
+                index, field = empty
+                raise _EmptyFieldError(field, _input_name(file_path), row_number + index)
+
+            for row_values in batch:
+                yield build(share_items(row_values, shared))
+            row_number += len(batch)
+
+    def _section_values(self, row: dict[str, str]) -> dict[str, Any]:
+        """Map a section.csv row to SDSSection field values."""
+        # Parse dates if provided
+        term_start_date = None
+        term_end_date = None
+        if row.get("Term Start Date"):
+            term_start_date = datetime.fromisoformat(row["Term Start Date"])
+        if row.get("Term End Date"):
+            term_end_date = datetime.fromisoformat(row["Term End Date"])
+
+        return {
+            "sis_id": row["SIS ID"],
+            "school_sis_id": row["School SIS ID"],
+            "section_name": row["Section Name"],
+            "section_number": row.get("Section Number"),
+            "term_sis_id": row.get("Term SIS ID"),
+            "term_name": row.get("Term Name"),
+            "term_start_date": term_start_date,
+            "term_end_date": term_end_date,
+            "course_name": row.get("Course Name"),
+            "course_number": row.get("Course Number"),
+            "course_description": row.get("Course Description"),
+            "status": self._parse_status(row),
+        }
+
+    @staticmethod
+    def _parse_status(row: dict[str, str]) -> SDSStatus:
+        """Parse the optional Status column, defaulting to Active."""
+        status_value = row.get("Status")
+        if not status_value:
+            return SDSStatus.ACTIVE
+        return SDSStatus.ACTIVE if status_value.lower() == "active" else SDSStatus.INACTIVE
+
+    def _open(self, full_path: Path) -> IO[str]:
+        """Open a CSV file for reading.
+
+        Args:
+            full_path: Resolved file path
+
+        Returns:
+            Text stream of the file
+        """
+        return open(full_path, "r", encoding="utf-8")
+
     def _resolve_path(self, file_path: Path) -> Path:
         """Resolve file path relative to base_path if not absolute.
 
@@ -316,3 +820,149 @@ class SDSCSVParser:
         if file_path.is_absolute():
             return file_path
         return self.base_path / file_path
+
+
+def _input_name(file_path: SDSInput) -> str:
+    """Return the file name of an SDS input, used in stage names and errors."""
+    if isinstance(file_path, Path):
+        return file_path.name
+    name = getattr(file_path, "name", None)
+    return Path(name).name if isinstance(name, str) else "<stream>"
+
+
+@lru_cache(maxsize=None)
+def _trusted_builder(model_cls: type[_SDSEntity]) -> TrustedModelBuilder[_SDSEntity]:
+    """Return the shared TrustedModelBuilder of an SDS model class."""
+    return TrustedModelBuilder(model_cls)
+
+
+def _parse_file_as_tuples(
+    validation: ValidationLevel, method: str, file_path: Path, *args: Any
+) -> list[tuple]:
+    """Parse one SDS file in a worker process and return compact field tuples.
+
+    Args:
+        validation: Validation level of the worker's parser
+        method: Name of the SDSCSVParser parse method to call
+        file_path: Absolute path of the file to parse
+        *args: Extra arguments for the parse method
+
+    Returns:
+        One tuple of field values per parsed entity, in model field order
+    """
+    models = getattr(SDSCSVParser(validation=validation), method)(file_path, *args)
+    return [model_to_tuple(model) for model in models]
+
+
+def _parse_range_as_tuples(
+    validation: ValidationLevel,
+    method: str,
+    file_path: Path,
+    header_end: int,
+    start: int,
+    end: int,
+    *args: Any,
+) -> list[tuple]:
+    """Parse one byte range of an SDS file in a worker process.
+
+    Args:
+        validation: Validation level of the worker's parser
+        method: Name of the SDSCSVParser parse method to call
+        file_path: Absolute path of the file to parse
+        header_end: Offset of the first byte after the header record
+        start: Offset of the first byte of the range
+        end: Offset of the first byte after the range
+        *args: Extra arguments for the parse method
+
+    Returns:
+        One tuple of field values per parsed entity in the range, in model field order
+    """
+    parser = _RangeParser(validation, header_end, start, end)
+    models = getattr(parser, method)(file_path, *args)
+    return [model_to_tuple(model) for model in models]
+
+
+class _RangeParser(SDSCSVParser):
+    """Parser that reads the header and one byte range of every file it opens."""
+
+    def __init__(
+        self, validation: ValidationLevel, header_end: int, start: int, end: int
+    ) -> None:
+        """Initialize the range parser.
+
+        Args:
+            validation: Validation level
+            header_end: Offset of the first byte after the header record
+            start: Offset of the first byte of the range
+            end: Offset of the first byte after the range
+        """
+        super().__init__(validation=validation)
+        self.header_end = header_end
+        self.start = start
+        self.end = end
+
+    def _open(self, full_path: Path) -> IO[str]:
+        """Open the header and byte range of a CSV file as one text stream."""
+        with open(full_path, "rb") as f:
+            header = f.read(self.header_end)
+            f.seek(self.start)
+            data = f.read(self.end - self.start)
+
+        # Ranges end on newlines, so they never split a UTF-8 sequence
+        return io.TextIOWrapper(io.BytesIO(header + data), encoding="utf-8")
+
+
+def _record_ranges(file_path: Path, chunk_size: int) -> tuple[int, list[tuple[int, int]]]:
+    """Split the records of a CSV file into byte ranges of about chunk_size bytes.
+
+    A newline ends a record only if an even number of quote characters precede
+    it; otherwise it is inside a quoted field. This holds for CSV files that
+    quote every field containing quotes, as the csv module writes them.
+
+    Args:
+        file_path: CSV file
+        chunk_size: Approximate size of each range in bytes
+
+    Returns:
+        Offset of the first byte after the header record, and the (start, end)
+        byte ranges of the data records in file order
+    """
+    boundaries: list[int] = []
+    target = 0  # The first boundary ends the header
+    offset = 0
+    quotes = 0
+
+    with open(file_path, "rb") as f:
+        while block := f.read(_SCAN_BLOCK_SIZE):
+            # Searching is several times faster than counting, and most blocks
+            # of large exports contain no quotes at all
+            has_quotes = b'"' in block
+            position = max(target - offset, 0)
+            block_quotes = quotes + (block.count(b'"', 0, position) if has_quotes else 0)
+            while position < len(block):
+                newline = block.find(b"\n", position)
+                if newline < 0:
+                    break
+                if has_quotes:
+                    block_quotes += block.count(b'"', position, newline)
+                position = newline + 1
+                if block_quotes % 2 == 0:
+                    boundaries.append(offset + position)
+                    target = offset + position + chunk_size
+                    if target - offset >= len(block):
+                        break
+                    if has_quotes:
+                        block_quotes += block.count(b'"', position, target - offset)
+                    position = target - offset
+
+            if has_quotes:
+                quotes += block.count(b'"')
+            offset += len(block)
+
+    if not boundaries:
+        return offset, []
+
+    header_end = boundaries[0]
+    starts = [header_end] + [b for b in boundaries[1:] if b < offset]
+    ends = starts[1:] + [offset]
+    return header_end, [(start, end) for start, end in zip(starts, ends) if start < end]
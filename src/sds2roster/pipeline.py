@@ -0,0 +1,233 @@
+"""Streaming SDS to OneRoster conversion pipeline.
+
+This module connects the generator-based ``SDSCSVParser`` readers to the
+per-entity converters and the row-by-row ``OneRosterCSVWriter`` so that a
+conversion never holds a complete SDS or OneRoster data model in memory.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .converter import SDSToOneRosterConverter
+from .instrumentation import stage
+from .models.sds import SDSEnrollment, SDSSection
+from .parsers.oneroster_writer import OneRosterCSVWriter
+from .parsers.sds_parser import SDSCSVParser
+
+
+class StreamingResult:
+    """Outcome of a streaming conversion."""
+
+    def __init__(self) -> None:
+        """Initialize an empty result."""
+        self.written_files: dict[str, Path] = {}
+        self.counts: dict[str, int] = {}
+
+    def record(self, file_type: str, file_path: Optional[Path], count: int) -> None:
+        """Record the outcome of writing one OneRoster file.
+
+        Args:
+            file_type: OneRoster file type (e.g. "users")
+            file_path: Written file, or None if there were no records
+            count: Number of rows written
+        """
+        self.counts[file_type] = count
+        if file_path is not None:
+            self.written_files[file_type] = file_path
+
+
+class StreamingPipeline:
+    """Convert SDS CSV files to OneRoster CSV files with bounded memory.
+
+    Each OneRoster file is produced by a single pass over the SDS file(s) it is
+    derived from. Only small lookup tables stay resident: the section to school
+    mapping needed by enrollments, and the course and term ID sets used for
+    deduplication. Peak memory therefore does not grow with the number of users
+    or enrollments.
+
+    The output is identical to parsing with ``SDSCSVParser.parse_all``, converting
+    with ``SDSToOneRosterConverter.convert`` and writing with
+    ``OneRosterCSVWriter.write_all``. As invalid rows of a later file are only
+    found after earlier files were written, local files are written into a
+    hidden sibling directory of the output directory and moved into place once
+    every file was written; on an error the output directory is left as it
+    was. A writer with a sink writes straight to the sink's streams, and
+    undoing those is up to the sink.
+    """
+
+    def __init__(
+        self,
+        parser: SDSCSVParser,
+        writer: OneRosterCSVWriter,
+        converter: Optional[SDSToOneRosterConverter] = None,
+    ) -> None:
+        """Initialize the streaming pipeline.
+
+        Args:
+            parser: Parser used to read SDS CSV files
+            writer: Writer used to write OneRoster CSV files
+            converter: Converter used for each record (default: a new converter)
+        """
+        self.parser = parser
+        self.writer = writer
+        self.converter = converter or SDSToOneRosterConverter()
+
+    def run(
+        self,
+        school_file: Path,
+        student_file: Path,
+        teacher_file: Path,
+        section_file: Path,
+        student_enrollment_file: Path,
+        teacher_roster_file: Path,
+    ) -> StreamingResult:
+        """Stream all SDS CSV files through conversion into OneRoster CSV files.
+
+        Args:
+            school_file: Path to school.csv
+            student_file: Path to student.csv
+            teacher_file: Path to teacher.csv
+            section_file: Path to section.csv
+            student_enrollment_file: Path to studentEnrollment.csv
+            teacher_roster_file: Path to teacherRoster.csv
+
+        Returns:
+            StreamingResult with written files and row counts per file type
+
+        Raises:
+            FileNotFoundError: If any file does not exist
+            ValueError: If any CSV format is invalid
+        """
+        output_dir = self.writer.output_dir
+        staging_dir = None
+        if self.writer.sink is None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            staging_dir = Path(
+                tempfile.mkdtemp(prefix=f".{output_dir.name}.", dir=output_dir.parent)
+            )
+            self.writer.output_dir = staging_dir
+
+        try:
+            with stage("stream") as timed:
+                result = self._run(
+                    school_file,
+                    student_file,
+                    teacher_file,
+                    section_file,
+                    student_enrollment_file,
+                    teacher_roster_file,
+                )
+                timed.rows = sum(result.counts.values())
+            if staging_dir is not None:
+                for file_type, file_path in result.written_files.items():
+                    published = output_dir / file_path.name
+                    os.replace(file_path, published)
+                    result.written_files[file_type] = published
+        finally:
+            self.writer.output_dir = output_dir
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+        return result
+
+    def _run(
+        self,
+        school_file: Path,
+        student_file: Path,
+        teacher_file: Path,
+        section_file: Path,
+        student_enrollment_file: Path,
+        teacher_roster_file: Path,
+    ) -> StreamingResult:
+        """Write every OneRoster file in turn; see ``run``."""
+        parser = self.parser
+        converter = self.converter
+        writer = self.writer
+        result = StreamingResult()
+
+        # Always write manifest first
+        result.written_files["manifest"] = writer.write_manifest()
+
+        result.record(
+            "orgs",
+            *writer.write_records("orgs", converter.iter_orgs(parser.iter_schools(school_file))),
+        )
+
+        result.record(
+            "users",
+            *writer.write_records(
+                "users",
+                converter.iter_users(
+                    parser.iter_students(student_file), parser.iter_teachers(teacher_file)
+                ),
+            ),
+        )
+
+        result.record(
+            "courses",
+            *writer.write_records(
+                "courses", converter.iter_courses(parser.iter_sections(section_file))
+            ),
+        )
+
+        # The classes pass also collects the section -> school lookup table
+        section_schools: dict[str, str] = {}
+        result.record(
+            "classes",
+            *writer.write_records(
+                "classes",
+                converter.iter_classes(
+                    self._collect_section_schools(
+                        parser.iter_sections(section_file), section_schools
+                    )
+                ),
+            ),
+        )
+
+        enrollments = converter.iter_enrollments(
+            self._chain_enrollments(student_enrollment_file, teacher_roster_file),
+            section_schools.get,
+        )
+        result.record("enrollments", *writer.write_records("enrollments", enrollments))
+
+        result.record(
+            "academicSessions",
+            *writer.write_records(
+                "academicSessions",
+                converter.iter_academic_sessions(parser.iter_sections(section_file)),
+            ),
+        )
+
+        result.record(
+            "roles",
+            *writer.write_records(
+                "roles",
+                converter.iter_roles(
+                    parser.iter_students(student_file), parser.iter_teachers(teacher_file)
+                ),
+            ),
+        )
+
+        return result
+
+    def _chain_enrollments(
+        self, student_enrollment_file: Path, teacher_roster_file: Path
+    ) -> Iterator[SDSEnrollment]:
+        """Yield student enrollments followed by teacher enrollments."""
+        yield from self.parser.iter_enrollments(student_enrollment_file, "student")
+        yield from self.parser.iter_enrollments(teacher_roster_file, "teacher")
+
+    @staticmethod
+    def _collect_section_schools(
+        sections: Iterator[SDSSection], section_schools: dict[str, str]
+    ) -> Iterator[SDSSection]:
+        """Pass sections through while recording each section's school.
+
+        The first section with a given SIS ID wins, matching
+        ``SDSDataModel.get_section_by_sis_id``.
+        """
+        for section in sections:
+            section_schools.setdefault(section.sis_id, section.school_sis_id)
+            yield section
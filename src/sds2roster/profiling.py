@@ -0,0 +1,164 @@
+"""CPU profiling of whole conversions.
+
+Two profilers cover everything a conversion runs in the current process:
+
+- ``cprofile``: deterministic ``cProfile`` capture written in pstats format,
+  for ``python -m pstats``, snakeviz and similar tools. It records every call,
+  so per-row functions run noticeably slower while it is active.
+- ``sampling``: a background thread that records the Python stack of every
+  other thread at a fixed interval and writes them as collapsed stacks
+  (``frame;frame;frame count`` per line), the input format of flamegraph.pl,
+  speedscope and inferno. The root frame of each stack names its thread, so
+  idle helper threads such as the progress display can be told apart. The
+  profiled code itself is not slowed down apart from the sampler briefly
+  holding the GIL.
+
+Work done in ``--jobs`` worker processes is not captured by either profiler.
+"""
+
+import cProfile
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Iterator, Optional
+
+#: Default interval between two stack samples, in seconds
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+class CPUProfileMode(str, Enum):
+    """CPU profiler used by ``cpu_profile``."""
+
+    CPROFILE = "cprofile"
+    SAMPLING = "sampling"
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples thread stacks from a background thread.
+
+    Example:
+        profiler = SamplingProfiler()
+        profiler.start()
+        run_conversion()
+        profiler.stop()
+        profiler.write(Path("stacks.txt"))
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        """Initialize the profiler.
+
+        Args:
+            interval: Seconds between two samples
+        """
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._labels: dict[CodeType, str] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sds2roster-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self) -> None:
+        """Record the current stack of every thread except the sampler."""
+        sampler_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id != sampler_id:
+                thread_name = names.get(thread_id, str(thread_id)).replace(" ", "_")
+                self.stacks[f"thread:{thread_name};{self._collapse(frame)}"] += 1
+        self.samples += 1
+
+    def write(self, path: Path) -> Path:
+        """Write the samples as collapsed stacks, most frequent first.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path to the written file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        next_sample = time.perf_counter()
+        while not self._stopped.is_set():
+            self.sample()
+            next_sample += self.interval
+            delay = next_sample - time.perf_counter()
+            if delay > 0:
+                self._stopped.wait(delay)
+            else:
+                # Sampling fell behind; skip the missed samples
+                next_sample = time.perf_counter()
+
+    def _collapse(self, frame: Optional[FrameType]) -> str:
+        """Return a stack as ``outermost;...;innermost`` frame labels."""
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                # ";" separates frames and the last space separates the count
+                name = getattr(code, "co_qualname", code.co_name)
+                label = f"{Path(code.co_filename).name}:{name}"
+                label = label.replace(";", ":").replace(" ", "_")
+                self._labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+
+@contextmanager
+def cpu_profile(
+    path: Path,
+    mode: CPUProfileMode = CPUProfileMode.CPROFILE,
+    interval: float = DEFAULT_SAMPLE_INTERVAL,
+) -> Iterator[None]:
+    """Profile the body of a with block and write the result to path.
+
+    The profile is written also if the body raises an exception.
+
+    Args:
+        path: Output file (pstats format for cprofile, collapsed stacks for sampling)
+        mode: Profiler to use
+        interval: Seconds between two samples in sampling mode
+    """
+    if CPUProfileMode(mode) is CPUProfileMode.SAMPLING:
+        sampler = SamplingProfiler(interval)
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            sampler.write(path)
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(path)
@@ -1,17 +1,31 @@
 """Utility functions for SDS to OneRoster conversion."""
 
+from .interning import ValuePool
 from .validators import (
+    ValidationLevel,
+    create_metadata_jsons,
+    create_user_ids_jsons,
+    find_empty_value,
+    format_iso8601,
     generate_guid,
+    generate_guid_cached,
+    generate_guids,
     validate_date,
     validate_email,
     validate_guid,
-    format_iso8601,
 )
 
 __all__ = [
+    "ValuePool",
+    "ValidationLevel",
+    "create_metadata_jsons",
+    "create_user_ids_jsons",
+    "find_empty_value",
+    "format_iso8601",
     "generate_guid",
+    "generate_guid_cached",
+    "generate_guids",
     "validate_date",
     "validate_email",
     "validate_guid",
-    "format_iso8601",
 ]
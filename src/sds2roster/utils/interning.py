@@ -0,0 +1,99 @@
+"""Dictionary encoding of repeated field values.
+
+Every CSV row, and every Pydantic validation, produces fresh objects even when
+the value was seen before: each student of a school gets its own copy of the
+school SIS ID, each enrollment its own copy of the class GUID. A ``ValuePool``
+maps each distinct value to one canonical object, so entities that repeat a
+value share it. Only low-cardinality fields should go through a pool, as the
+pool holds every distinct value it has seen.
+
+Values that compare equal are only interchangeable if they also have the same
+type and, for aware datetimes, the same UTC offset: ``1 == 1.0`` and
+``10:00+00:00 == 19:00+09:00``, but they print differently.
+"""
+
+from datetime import datetime
+from typing import Any, Hashable, Iterable, Optional, TypeVar
+
+_Entity = TypeVar("_Entity")
+_Value = TypeVar("_Value", bound=Optional[Hashable])
+
+
+class ValuePool:
+    """Canonical objects for repeated values.
+
+    Example:
+        pool = ValuePool()
+        a = pool.share("".join(["SCH", "001"]))
+        b = pool.share("".join(["SCH", "001"]))
+        assert a is b
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._values: dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        """Return the number of distinct values in the pool."""
+        return len(self._values)
+
+    def share(self, value: _Value) -> _Value:
+        """Return the canonical object equal to value, adding value if it is new."""
+        if value is None:
+            return value
+        shared: _Value = self._values.setdefault(_pool_key(value), value)
+        return shared
+
+    def share_items(self, values: dict[str, Any], fields: Iterable[str]) -> dict[str, Any]:
+        """Replace the named values of a field dictionary in place.
+
+        Args:
+            values: Field values keyed by field name
+            fields: Names of the fields to share; missing names are skipped
+
+        Returns:
+            The same dictionary
+        """
+        pooled = self._values
+        for name in fields:
+            value = values.get(name)
+            if value is not None:
+                key = value if type(value) is str else _pool_key(value)
+                values[name] = pooled.setdefault(key, value)
+        return values
+
+    def share_fields(self, entity: _Entity, fields: Iterable[str]) -> _Entity:
+        """Replace the named field values of a model or compact record in place.
+
+        Args:
+            entity: Pydantic model instance or compact record
+            fields: Names of the fields to share
+
+        Returns:
+            The same entity
+        """
+        state = getattr(entity, "__dict__", None)
+        if state is not None:
+            # Pydantic models keep their values in __dict__; writing it directly
+            # skips validate_assignment and frozen checks for equal values
+            self.share_items(state, fields)
+            return entity
+
+        pooled = self._values
+        for name in fields:
+            value = getattr(entity, name)
+            if value is not None:
+                key = value if type(value) is str else _pool_key(value)
+                setattr(entity, name, pooled.setdefault(key, value))
+        return entity
+
+
+def _pool_key(value: Hashable) -> Hashable:
+    """Return the pool key of a value: the value itself for strings, else with its type."""
+    if type(value) is str:
+        return value
+    if isinstance(value, datetime):
+        return (datetime, value, value.utcoffset())
+    return (type(value), value)
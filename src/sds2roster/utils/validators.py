@@ -1,21 +1,46 @@
 """Validation and utility functions for SDS to OneRoster conversion.
 
 This module provides helper functions for:
-- GUID generation using UUID v5
+- GUID generation using UUID v5 (plain, LRU-cached and batched)
+- Validation levels and bulk required-field checks
 - Date validation and formatting
 - Email validation
 - String sanitization
 """
 
+import hashlib
 import re
 import uuid
 from datetime import datetime
-from typing import Optional
+from enum import Enum
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii as _json_string
+from operator import itemgetter
+from typing import Any, Iterable, Optional, Sequence
 
 
 # OneRoster namespace UUID for generating deterministic GUIDs
 ONEROSTER_NAMESPACE = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
 
+# UUID v5 is SHA-1(namespace bytes + name). Hashing the namespace once and
+# copying the state skips re-hashing it for every GUID.
+_NAMESPACE_SHA1 = hashlib.sha1(ONEROSTER_NAMESPACE.bytes)
+
+# Maximum number of entries kept by generate_guid_cached
+GUID_CACHE_SIZE = 131072
+
+
+def _format_uuid5(digest: bytes) -> str:
+    """Format a SHA-1 digest as a lowercase UUID v5 string.
+
+    Equivalent to ``str(uuid.UUID(bytes=digest[:16], version=5))``.
+    """
+    raw = bytearray(digest[:16])
+    raw[6] = (raw[6] & 0x0F) | 0x50  # version 5
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
 
 def generate_guid(entity_type: str, sis_id: str) -> str:
     """Generate a deterministic GUID using UUID v5.
@@ -42,10 +67,113 @@ def generate_guid(entity_type: str, sis_id: str) -> str:
     name = f"{entity_type}:{sis_id}"
 
     # Generate UUID v5 using OneRoster namespace
-    generated_uuid = uuid.uuid5(ONEROSTER_NAMESPACE, name)
+    sha1 = _NAMESPACE_SHA1.copy()
+    sha1.update(name.encode("utf-8"))
 
     # Return as lowercase string
-    return str(generated_uuid).lower()
+    return _format_uuid5(sha1.digest())
+
+
+@lru_cache(maxsize=GUID_CACHE_SIZE)
+def generate_guid_cached(entity_type: str, sis_id: str) -> str:
+    """Generate a deterministic GUID using UUID v5, memoizing recent results.
+
+    Same result as ``generate_guid``. Use it for identifiers that are generated
+    many times per run, such as the org GUID of a school that is referenced by
+    every user, class and enrollment. Repeated calls also return the same string
+    object, so references share memory.
+
+    Args:
+        entity_type: Type of entity (e.g., "org", "user", "class", "course", "term")
+        sis_id: Source system identifier
+
+    Returns:
+        A GUID string in lowercase format
+    """
+    return generate_guid(entity_type, sis_id)
+
+
+def generate_guids(entity_type: str, sis_ids: Iterable[str]) -> list[str]:
+    """Generate deterministic GUIDs for many SIS IDs of one entity type.
+
+    Same results as calling ``generate_guid`` for each SIS ID, but the SHA-1
+    state for the namespace and the ``"<entity_type>:"`` prefix is computed once
+    and reused.
+
+    Args:
+        entity_type: Type of entity shared by all SIS IDs
+        sis_ids: Source system identifiers
+
+    Returns:
+        GUID strings in the same order as sis_ids
+
+    Example:
+        >>> generate_guids("user", ["STU001", "STU002"]) == [
+        ...     generate_guid("user", "STU001"), generate_guid("user", "STU002")
+        ... ]
+        True
+    """
+    if not entity_type:
+        raise ValueError("entity_type cannot be empty")
+
+    prefix_sha1 = _NAMESPACE_SHA1.copy()
+    prefix_sha1.update(f"{entity_type}:".encode("utf-8"))
+
+    guids = []
+    for sis_id in sis_ids:
+        if not sis_id:
+            raise ValueError("sis_id cannot be empty")
+        sha1 = prefix_sha1.copy()
+        sha1.update(sis_id.encode("utf-8"))
+        guids.append(_format_uuid5(sha1.digest()))
+
+    return guids
+
+
+class ValidationLevel(str, Enum):
+    """How thoroughly input rows are validated.
+
+    - ``full``: every row goes through the Pydantic model constructor
+    - ``schema-once``: CSV headers are checked once per file and required fields
+      in one bulk pass; models are built without per-row validation
+    - ``off``: no checks at all, for input that was validated upstream
+    """
+
+    FULL = "full"
+    SCHEMA_ONCE = "schema-once"
+    OFF = "off"
+
+
+def find_empty_value(
+    rows: Sequence[dict[str, Any]], fields: Iterable[str]
+) -> Optional[tuple[int, str]]:
+    """Find the first row with an empty required value.
+
+    The rows are checked one column at a time, so the common case of valid input
+    costs a single ``all()`` pass per field instead of per-row validation.
+
+    Args:
+        rows: Field values keyed by field name
+        fields: Names of the fields that must not be empty
+
+    Returns:
+        (row index, field name) of the first empty value, or None if there is none
+
+    Example:
+        >>> find_empty_value([{"sis_id": "S1"}, {"sis_id": ""}], ["sis_id"])
+        (1, 'sis_id')
+    """
+    first: Optional[tuple[int, str]] = None
+
+    for field in fields:
+        if all(map(itemgetter(field), rows)):
+            continue
+
+        index = next(i for i, row in enumerate(rows) if not row[field])
+        if first is None or index < first[0]:
+            first = (index, field)
+
+    return first
 
 
 def validate_guid(guid_string: str) -> bool:
@@ -242,3 +370,42 @@ def create_user_ids_json(sis_id: str, identifier_type: str = "sisId") -> str:
 
     # Return compact JSON
     return json.dumps(user_ids, separators=(",", ":"))
+
+
+def create_metadata_jsons(sis_ids: Iterable[str]) -> list[str]:
+    """Create metadata JSON strings for many SIS IDs.
+
+    Same results as calling ``create_metadata_json`` without additional data for
+    each SIS ID, without going through ``json.dumps`` per value.
+
+    Args:
+        sis_ids: Source system identifiers
+
+    Returns:
+        JSON strings in the same order as sis_ids
+
+    Example:
+        >>> create_metadata_jsons(["SCH001"])
+        ['{"sis_id":"SCH001"}']
+    """
+    return ['{"sis_id":' + _json_string(sis_id) + "}" for sis_id in sis_ids]
+
+
+def create_user_ids_jsons(sis_ids: Iterable[str], identifier_type: str = "sisId") -> list[str]:
+    """Create userIds JSON arrays for many SIS IDs.
+
+    Same results as calling ``create_user_ids_json`` for each SIS ID.
+
+    Args:
+        sis_ids: Source system identifiers
+        identifier_type: Type of identifier (default: "sisId")
+
+    Returns:
+        JSON array strings in the same order as sis_ids
+
+    Example:
+        >>> create_user_ids_jsons(["STU001"])
+        ['[{"type":"sisId","identifier":"STU001"}]']
+    """
+    prefix = '[{"type":' + _json_string(identifier_type) + ',"identifier":'
+    return [prefix + _json_string(sis_id) + "}]" for sis_id in sis_ids]
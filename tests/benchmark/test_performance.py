@@ -5,6 +5,8 @@ These tests measure performance metrics for various dataset sizes.
 Run with: pytest tests/benchmark/ -v
 """
 
+import gc
+import os
 import time
 from datetime import datetime
 from pathlib import Path
@@ -170,7 +172,7 @@ class TestPerformance:
         records_per_sec = total_records / convert_time if convert_time > 0 else 0
 
         # Print results
-        print(f"\nConversion Results:")
+        print("\nConversion Results:")
         print(f"  • Total time: {convert_time:.2f}s")
         print(f"  • Records/second: {records_per_sec:,.0f}")
         print(f"  • Organizations: {len(result.orgs)}")
@@ -214,6 +216,42 @@ class TestPerformance:
                 writer.writerows(data)
 
 
+class TestStageBenchmark:
+    """Stage-level timings of the NFR dataset sizes (``sds2roster bench``)."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize(
+        "size",
+        [
+            "1k",
+            "10k",
+            pytest.param("100k", marks=pytest.mark.slow),
+            pytest.param("1m", marks=pytest.mark.slow),
+        ],
+    )
+    def test_stage_benchmark(self, tmp_path, size):
+        """Benchmark every parse, convert and write stage with medians of 3 runs."""
+        import json
+
+        from sds2roster.benchmark import SIZES, run_benchmark
+
+        report = run_benchmark([SIZES[size]], repetitions=3, work_dir=tmp_path)
+        (tmp_path / f"bench_{size}.json").write_text(json.dumps(report, indent=2))
+
+        result = report["results"][0]
+        print(f"\nStage medians, {result['students']:,} students:")
+        for name, stage in result["stages"].items():
+            print(
+                f"  • {name:<26} {stage['median_s']:8.3f}s"
+                f"  {stage['tracemalloc_peak_bytes'] / 1024 / 1024:8.1f} MB"
+            )
+        if result["peak_rss_bytes"]:
+            print(f"  • peak RSS {result['peak_rss_bytes'] / 1024 / 1024:.0f} MB")
+
+        assert result["stages"]["convert_users"]["rows"] > result["students"]
+        assert all(stage["median_s"] >= 0 for stage in result["stages"].values())
+
+
 class TestMemoryUsage:
     """Memory usage tests."""
 
@@ -244,9 +282,404 @@ class TestMemoryUsage:
         tracemalloc.stop()
 
         # Print results
-        print(f"\nMemory Usage:")
+        print("\nMemory Usage:")
         print(f"  • Current: {current / 1024 / 1024:.2f} MB")
         print(f"  • Peak: {peak / 1024 / 1024:.2f} MB")
 
         # Memory should be reasonable (< 500MB for 10K students)
         assert peak < 500 * 1024 * 1024, f"Peak memory too high: {peak / 1024 / 1024:.2f}MB"
+
+    @pytest.mark.benchmark
+    def test_bytes_per_record(self, tmp_path):
+        """Compare the memory of Pydantic models and compact records per entity."""
+        import tracemalloc
+
+        from sds2roster.models.records import to_record
+        from sds2roster.parsers.sds_parser import SDSCSVParser
+
+        sds_dir = write_sds_csv_files(tmp_path / "sds", 10_000, 500)
+        files = {
+            "school_file": sds_dir / "school.csv",
+            "student_file": sds_dir / "student.csv",
+            "teacher_file": sds_dir / "teacher.csv",
+            "section_file": sds_dir / "section.csv",
+            "student_enrollment_file": sds_dir / "studentEnrollment.csv",
+            "teacher_roster_file": sds_dir / "teacherRoster.csv",
+        }
+
+        sds_data = SDSCSVParser().parse_all(**files)
+        oneroster_data = SDSToOneRosterConverter().convert(sds_data)
+        entities = {
+            "SDSStudent": sds_data.students,
+            "SDSEnrollment": sds_data.enrollments,
+            "OneRosterUser": oneroster_data.users,
+            "OneRosterEnrollment": oneroster_data.enrollments,
+        }
+
+        def bytes_per_record(build):
+            gc.collect()
+            tracemalloc.start()
+            built = build()
+            size = tracemalloc.get_traced_memory()[0] / len(built)
+            tracemalloc.stop()
+            return size
+
+        print("\nBytes per record (model -> compact record):")
+        for name, models in entities.items():
+            # Field values are shared by both copies, so only the containers count
+            model_bytes = bytes_per_record(lambda: [model.model_copy() for model in models])
+            record_bytes = bytes_per_record(lambda: [to_record(model) for model in models])
+            print(f"  • {name}: {model_bytes:.0f} -> {record_bytes:.0f}")
+            assert record_bytes < model_bytes / 3
+
+        peaks = {}
+        for compact in (False, True):
+            gc.collect()
+            tracemalloc.start()
+            parsed = SDSCSVParser(compact=compact).parse_all(**files)
+            SDSToOneRosterConverter(compact=compact).convert(parsed)
+            peaks[compact] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del parsed
+
+        print(
+            f"  • Parse + convert peak, 10K students: {peaks[False] / 1024 / 1024:.1f} MB -> "
+            f"{peaks[True] / 1024 / 1024:.1f} MB"
+        )
+        assert peaks[True] < peaks[False] / 2
+
+
+def write_sds_csv_files(directory: Path, num_students: int, num_sections: int) -> Path:
+    """Write an SDS CSV dataset with the real SDS column headers."""
+    from sds2roster.benchmark import write_sds_dataset
+
+    return write_sds_dataset(directory, num_students, num_sections)
+
+
+class TestStreamingMemory:
+    """Peak memory of the streaming pipeline."""
+
+    @pytest.mark.benchmark
+    def test_streaming_peak_memory_is_flat(self, tmp_path):
+        """Peak memory should not grow with the number of users and enrollments."""
+        import tracemalloc
+
+        from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+        from sds2roster.parsers.sds_parser import SDSCSVParser
+        from sds2roster.pipeline import StreamingPipeline
+
+        peaks = {}
+        for num_students in (1_000, 10_000):
+            sds_dir = write_sds_csv_files(tmp_path / f"sds_{num_students}", num_students, 200)
+
+            tracemalloc.start()
+            pipeline = StreamingPipeline(
+                SDSCSVParser(), OneRosterCSVWriter(tmp_path / f"out_{num_students}")
+            )
+            result = pipeline.run(
+                school_file=sds_dir / "school.csv",
+                student_file=sds_dir / "student.csv",
+                teacher_file=sds_dir / "teacher.csv",
+                section_file=sds_dir / "section.csv",
+                student_enrollment_file=sds_dir / "studentEnrollment.csv",
+                teacher_roster_file=sds_dir / "teacherRoster.csv",
+            )
+            _, peaks[num_students] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            assert result.counts["enrollments"] == num_students * 3 + 200
+
+        print("\nStreaming peak memory:")
+        for num_students, peak in peaks.items():
+            print(f"  • {num_students:,} students: {peak / 1024 / 1024:.2f} MB")
+
+        # 10x the rows must not need anywhere near 10x the memory
+        assert peaks[10_000] < peaks[1_000] * 2
+
+
+class TestGuidGeneration:
+    """Microbenchmark for GUID generation during a conversion run."""
+
+    @pytest.mark.benchmark
+    def test_cached_and_batched_guid_saving(self):
+        """Compare per-run GUID cost of uuid.uuid5, the cached variant and the batch API.
+
+        The call pattern mirrors one conversion of 20,000 students in 20 schools
+        with 3 enrollments each: every user, enrollment and role references an
+        org GUID, and every enrollment references a class and a user GUID.
+        """
+        import uuid
+
+        from sds2roster.utils.validators import (
+            ONEROSTER_NAMESPACE,
+            generate_guid_cached,
+            generate_guids,
+        )
+
+        num_students = 20_000
+        calls = []
+        for i in range(num_students):
+            student, school = f"STU{i:07d}", f"SCH{i % 20:04d}"
+            calls += [("org", school), ("user", student)]  # users.csv
+            calls += [("org", school), ("user", student)]  # roles.csv
+            for k in range(3):  # enrollments.csv
+                calls += [("class", f"SEC{(i + k) % 500:06d}"), ("user", student), ("org", school)]
+
+        def run_uuid5():
+            return [str(uuid.uuid5(ONEROSTER_NAMESPACE, f"{e}:{s}")) for e, s in calls]
+
+        def run_cached():
+            generate_guid_cached.cache_clear()
+            return [generate_guid_cached(e, s) for e, s in calls]
+
+        def run_batched():
+            by_type: Dict[str, List[str]] = {}
+            for e, s in calls:
+                by_type.setdefault(e, []).append(s)
+            return {e: generate_guids(e, ids) for e, ids in by_type.items()}
+
+        timings = {}
+        runs = (("uuid.uuid5", run_uuid5), ("cached", run_cached), ("batched", run_batched))
+        for name, fn in runs:
+            start = time.perf_counter()
+            fn()
+            timings[name] = time.perf_counter() - start
+
+        assert run_cached() == run_uuid5()
+
+        print(f"\nGUID generation for {len(calls):,} calls per run:")
+        for name, seconds in timings.items():
+            saving = 1 - seconds / timings["uuid.uuid5"]
+            print(f"  • {name:<10} {seconds * 1000:8.1f} ms  ({saving:+.0%} saved)")
+
+        assert timings["cached"] < timings["uuid.uuid5"]
+        assert timings["batched"] < timings["uuid.uuid5"]
+
+
+class TestValidationLevels:
+    """Parse and convert time at each validation level."""
+
+    @pytest.mark.benchmark
+    def test_validation_levels_10k(self, tmp_path):
+        """Benchmark: 10,000 students at full, schema-once and off."""
+        self._run_levels(tmp_path, num_students=10_000, num_sections=500)
+
+    @pytest.mark.benchmark
+    @pytest.mark.slow
+    def test_validation_levels_100k(self, tmp_path):
+        """Benchmark: 100,000 students at full, schema-once and off."""
+        self._run_levels(tmp_path, num_students=100_000, num_sections=2_000)
+
+    def _run_levels(self, tmp_path: Path, num_students: int, num_sections: int):
+        """Time parsing and conversion per level and check the output is identical."""
+        from sds2roster.parsers.sds_parser import SDSCSVParser
+        from sds2roster.utils.validators import ValidationLevel
+
+        sds_dir = write_sds_csv_files(tmp_path / "sds", num_students, num_sections)
+        files = {
+            "school_file": sds_dir / "school.csv",
+            "student_file": sds_dir / "student.csv",
+            "teacher_file": sds_dir / "teacher.csv",
+            "section_file": sds_dir / "section.csv",
+            "student_enrollment_file": sds_dir / "studentEnrollment.csv",
+            "teacher_roster_file": sds_dir / "teacherRoster.csv",
+        }
+        timestamp = datetime(2025, 4, 1)
+
+        timings = {}
+        digests = {}
+        for level in ValidationLevel:
+            # Start every level from the same heap so GC work is comparable
+            gc.collect()
+
+            start = time.perf_counter()
+            sds_data = SDSCSVParser(validation=level).parse_all(**files)
+            parsed = time.perf_counter()
+
+            converter = SDSToOneRosterConverter(validation=level)
+            converter.conversion_timestamp = timestamp
+            result = converter.convert(sds_data)
+            converted = time.perf_counter()
+
+            timings[level] = (parsed - start, converted - parsed)
+            digests[level] = hash(repr(result))
+            del sds_data, result
+
+        print(f"\nValidation levels, {num_students:,} students:")
+        full_total = sum(timings[ValidationLevel.FULL])
+        for level, (parse_time, convert_time) in timings.items():
+            total = parse_time + convert_time
+            print(
+                f"  • {level.value:<12} parse {parse_time:6.2f}s  convert {convert_time:6.2f}s"
+                f"  total {total:6.2f}s  ({1 - total / full_total:+.0%} saved)"
+            )
+
+        assert digests[ValidationLevel.SCHEMA_ONCE] == digests[ValidationLevel.FULL]
+        assert digests[ValidationLevel.OFF] == digests[ValidationLevel.FULL]
+
+
+class TestShardedConversion:
+    """Sequential versus per-school sharded conversion."""
+
+    @pytest.mark.benchmark
+    def test_sharded_conversion_10k(self):
+        """Benchmark: convert 10,000 students sequentially and on 4 worker processes."""
+        test_data = generate_test_data(10_000, 500)
+        sds_data = SDSDataModel(**test_data)
+        del test_data
+        converter = SDSToOneRosterConverter()
+
+        gc.collect()
+        start = time.perf_counter()
+        sequential = converter.convert(sds_data)
+        sequential_time = time.perf_counter() - start
+        sequential_digest = hash(repr(sequential))
+        del sequential
+
+        gc.collect()
+        start = time.perf_counter()
+        sharded = converter.convert(sds_data, workers=4)
+        sharded_time = time.perf_counter() - start
+
+        cpus = os.cpu_count() or 1
+        print(f"\nConversion, 10,000 students ({cpus} CPUs):")
+        print(f"  • sequential       {sequential_time:6.2f}s")
+        print(
+            f"  • 4 school shards  {sharded_time:6.2f}s"
+            f"  ({sequential_time / sharded_time:.1f}x)"
+        )
+
+        assert hash(repr(sharded)) == sequential_digest
+        if cpus >= 4:
+            assert sharded_time < sequential_time
+
+
+class TestChunkedParsing:
+    """Parallel parsing of whole files versus byte ranges of one large file."""
+
+    @pytest.mark.benchmark
+    def test_chunked_enrollment_parsing_10k(self, tmp_path):
+        """Benchmark: parse studentEnrollment.csv in 4 byte ranges on 4 worker processes."""
+        from sds2roster.parsers.sds_parser import SDSCSVParser
+
+        sds_dir = write_sds_csv_files(tmp_path / "sds", 10_000, 500)
+        files = {
+            "school_file": sds_dir / "school.csv",
+            "student_file": sds_dir / "student.csv",
+            "teacher_file": sds_dir / "teacher.csv",
+            "section_file": sds_dir / "section.csv",
+            "student_enrollment_file": sds_dir / "studentEnrollment.csv",
+            "teacher_roster_file": sds_dir / "teacherRoster.csv",
+        }
+        enrollment_size = files["student_enrollment_file"].stat().st_size
+        parser = SDSCSVParser()
+
+        gc.collect()
+        start = time.perf_counter()
+        whole = parser.parse_all(**files, workers=4)
+        whole_time = time.perf_counter() - start
+        whole_digest = hash(repr(whole))
+        del whole
+
+        gc.collect()
+        start = time.perf_counter()
+        chunked = parser.parse_all(**files, workers=4, chunk_size=enrollment_size // 4 + 1)
+        chunked_time = time.perf_counter() - start
+
+        cpus = os.cpu_count() or 1
+        print(f"\nParallel parsing, 10,000 students ({cpus} CPUs):")
+        print(f"  • whole files      {whole_time:6.2f}s")
+        print(
+            f"  • 4 byte ranges    {chunked_time:6.2f}s"
+            f"  ({whole_time / chunked_time:.1f}x)"
+        )
+
+        assert hash(repr(chunked)) == whole_digest
+        if cpus >= 4:
+            assert chunked_time < whole_time
+
+
+class TestColumnarParsing:
+    """Row-based versus columnar SDS parsing."""
+
+    @pytest.mark.benchmark
+    def test_columnar_parsing_10k(self, tmp_path):
+        """Benchmark: parse 10,000 students with SDSCSVParser and SDSColumnarParser."""
+        from sds2roster.parsers.sds_columnar import SDSColumnarParser
+        from sds2roster.parsers.sds_parser import SDSCSVParser
+
+        sds_dir = write_sds_csv_files(tmp_path / "sds", 10_000, 500)
+        files = {
+            "school_file": sds_dir / "school.csv",
+            "student_file": sds_dir / "student.csv",
+            "teacher_file": sds_dir / "teacher.csv",
+            "section_file": sds_dir / "section.csv",
+            "student_enrollment_file": sds_dir / "studentEnrollment.csv",
+            "teacher_roster_file": sds_dir / "teacherRoster.csv",
+        }
+
+        start = time.perf_counter()
+        rows = SDSCSVParser().parse_all(**files)
+        row_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columnar = SDSColumnarParser().parse_all(**files)
+        columnar_time = time.perf_counter() - start
+
+        print("\nSDS parsing, 10,000 students:")
+        print(f"  • SDSCSVParser      {row_time:6.2f}s")
+        print(f"  • SDSColumnarParser {columnar_time:6.2f}s  ({row_time / columnar_time:.1f}x)")
+
+        assert columnar.to_data_model() == rows
+        assert columnar_time < row_time
+
+
+class TestColumnarConversion:
+    """Object-based versus vectorized SDS to OneRoster conversion."""
+
+    @pytest.mark.benchmark
+    def test_columnar_conversion_10k(self, tmp_path):
+        """Benchmark: parse, convert and write 10,000 students with both paths."""
+        from sds2roster.columnar_converter import ColumnarConverter
+        from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+        from sds2roster.parsers.sds_columnar import SDSColumnarParser
+        from sds2roster.parsers.sds_parser import SDSCSVParser
+
+        sds_dir = write_sds_csv_files(tmp_path / "sds", 10_000, 500)
+        files = {
+            "school_file": sds_dir / "school.csv",
+            "student_file": sds_dir / "student.csv",
+            "teacher_file": sds_dir / "teacher.csv",
+            "section_file": sds_dir / "section.csv",
+            "student_enrollment_file": sds_dir / "studentEnrollment.csv",
+            "teacher_roster_file": sds_dir / "teacherRoster.csv",
+        }
+
+        gc.collect()
+        start = time.perf_counter()
+        converter = SDSToOneRosterConverter()
+        written = OneRosterCSVWriter(tmp_path / "objects").write_all(
+            converter.convert(SDSCSVParser().parse_all(**files))
+        )
+        object_time = time.perf_counter() - start
+
+        gc.collect()
+        start = time.perf_counter()
+        columnar = ColumnarConverter()
+        columnar_written = OneRosterCSVWriter(tmp_path / "frames").write_frames(
+            columnar.convert(SDSColumnarParser().parse_all(**files))
+        )
+        columnar_time = time.perf_counter() - start
+
+        print("\nSDS to OneRoster files, 10,000 students:")
+        print(f"  • object converter   {object_time:6.2f}s")
+        print(
+            f"  • columnar converter {columnar_time:6.2f}s"
+            f"  ({object_time / columnar_time:.1f}x)"
+        )
+
+        # CSV output carries no timestamps, so the files match across runs
+        assert list(columnar_written) == list(written)
+        for file_type, path in written.items():
+            assert columnar_written[file_type].read_bytes() == path.read_bytes()
+        assert columnar_time < object_time
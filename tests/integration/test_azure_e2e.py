@@ -15,11 +15,23 @@ To skip these tests (default for local):
     pytest tests/unit/
 """
 
+import os
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
 import pytest
 from azure.core.exceptions import ResourceNotFoundError
 
 from sds2roster.azure.blob_storage import BlobStorageClient
 from sds2roster.azure.table_storage import TableStorageClient
+from sds2roster.models.oneroster import (
+    OneRosterDataModel,
+    OneRosterStatus,
+    OneRosterUser,
+    RoleType,
+)
+from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter, ZipPackage
 
 # Azurite connection string (well-known development account)
 AZURITE_CONNECTION_STRING = (
@@ -168,6 +180,163 @@ class TestBlobStorageE2E:
         assert (download_dir / "subdir" / "file3.txt").read_text() == "content3"
 
 
+class TestConcurrentTransfersE2E:
+    """End-to-end tests for concurrent Blob transfers with Azurite."""
+
+    def test_upload_directory_concurrent(self, blob_client, tmp_path):
+        """Test that a concurrent directory upload stores every file."""
+        source = tmp_path / "oneroster"
+        source.mkdir()
+        for i in range(8):
+            (source / f"file{i}.csv").write_text(f"id,name\n{i},name{i}\n" * 1000)
+
+        urls = blob_client.upload_directory(source, prefix="tenant1/", workers=4)
+
+        assert sorted(urls) == sorted(path.name for path in source.glob("*.csv"))
+        assert sorted(blob_client.list_blobs(prefix="tenant1/")) == sorted(
+            f"tenant1/{path.name}" for path in source.glob("*.csv")
+        )
+        for path in source.glob("*.csv"):
+            assert blob_client.read_csv_content(f"tenant1/{path.name}") == path.read_text()
+
+    @pytest.mark.slow
+    def test_upload_large_file_in_parallel_blocks(self, blob_client, tmp_path):
+        """Test that a file above the single-request size is uploaded as blocks."""
+        large = tmp_path / "enrollments.csv"
+        with open(large, "wb") as f:
+            for i in range(72):
+                f.write(bytes([65 + i % 26]) * (1024 * 1024))
+
+        blob_client.upload_file(large, "large.csv", max_concurrency=4)
+
+        committed, _ = blob_client.container_client.get_blob_client("large.csv").get_block_list()
+        assert len(committed) > 1
+        properties = blob_client.container_client.get_blob_client("large.csv").get_blob_properties()
+        assert properties.size == large.stat().st_size
+
+    def test_download_directory_concurrent(self, blob_client, tmp_path):
+        """Test that a concurrent directory download restores every file."""
+        for i in range(8):
+            blob_client.write_csv_content(f"tenant1/file{i}.csv", f"id\n{i}\n" * 1000)
+
+        files = blob_client.download_directory(tmp_path / "out", prefix="tenant1/", workers=4)
+
+        assert [path.name for path in files] == [f"file{i}.csv" for i in range(8)]
+        for i, path in enumerate(files):
+            assert path.read_text() == f"id\n{i}\n" * 1000
+
+    @pytest.mark.slow
+    def test_download_large_file_in_ranges(self, blob_client, tmp_path):
+        """Test that a blob above the single-request size is streamed back intact."""
+        large = tmp_path / "enrollments.csv"
+        with open(large, "wb") as f:
+            for i in range(40):
+                f.write(bytes([65 + i % 26]) * (1024 * 1024))
+        blob_client.upload_file(large, "large.csv")
+
+        downloaded = blob_client.download_file(
+            "large.csv", tmp_path / "downloaded.csv", max_concurrency=4
+        )
+
+        assert downloaded.read_bytes() == large.read_bytes()
+
+    def test_write_oneroster_files_in_blocks(self, blob_client, tmp_path):
+        """Test that the writer uploads the OneRoster files through block streams."""
+        data_model = OneRosterDataModel(
+            users=[
+                OneRosterUser(
+                    sourced_id=f"user-{i:05d}",
+                    status=OneRosterStatus.ACTIVE,
+                    date_last_modified=datetime(2025, 10, 27),
+                    enabled_user=True,
+                    org_sourced_ids="org-1",
+                    role=RoleType.STUDENT,
+                    username=f"student{i}",
+                    given_name="Taro",
+                    family_name="Yamada",
+                )
+                for i in range(5000)
+            ]
+        )
+        local = OneRosterCSVWriter(tmp_path / "local").write_all(data_model)
+
+        def open_output(path):
+            return blob_client.open_write(path.as_posix(), block_size=64 * 1024)
+
+        uploaded = OneRosterCSVWriter(Path("tenant1"), sink=open_output).write_all(data_model)
+
+        assert list(uploaded) == list(local)
+        users = blob_client.container_client.get_blob_client("tenant1/users.csv")
+        committed, _ = users.get_block_list()
+        assert len(committed) > 1
+        for file_type, path in local.items():
+            assert blob_client.read_csv_content(uploaded[file_type].as_posix()) == (
+                path.read_text(encoding="utf-8")
+            )
+
+
+class TestCompressedTransfersE2E:
+    """End-to-end tests for gzip-encoded Blob transfers with Azurite."""
+
+    def test_upload_and_download_gzip(self, blob_client, tmp_path):
+        """Test that a gzip upload is stored compressed and downloads as the original."""
+        source = tmp_path / "users.csv"
+        source.write_text("sourcedId,username\n" + "".join(f"u{i},user{i}\n" for i in range(20000)))
+
+        blob_client.upload_file(source, "gzip/users.csv", compress=True)
+
+        properties = blob_client.container_client.get_blob_client(
+            "gzip/users.csv"
+        ).get_blob_properties()
+        assert properties.content_settings.content_encoding == "gzip"
+        assert properties.size < source.stat().st_size / 2
+        downloaded = blob_client.download_file("gzip/users.csv", tmp_path / "out.csv")
+        assert downloaded.read_bytes() == source.read_bytes()
+        assert blob_client.read_csv_content("gzip/users.csv") == source.read_text()
+
+    @pytest.mark.slow
+    def test_download_large_gzip_blob_in_ranges(self, blob_client, tmp_path):
+        """Test that a gzip blob fetched in several ranges is decompressed as one stream."""
+        large = tmp_path / "enrollments.csv"
+        with open(large, "wb") as f:
+            f.write(os.urandom(40 * 1024 * 1024))
+
+        blob_client.upload_file(large, "gzip/large.csv", compress=True)
+        downloaded = blob_client.download_file(
+            "gzip/large.csv", tmp_path / "downloaded.csv", max_concurrency=4
+        )
+
+        assert downloaded.read_bytes() == large.read_bytes()
+
+    def test_upload_zip_package(self, blob_client, tmp_path):
+        """Test that a zip package is streamed into one blob without seeking."""
+        data_model = OneRosterDataModel(
+            users=[
+                OneRosterUser(
+                    sourced_id=f"user-{i:05d}",
+                    status=OneRosterStatus.ACTIVE,
+                    date_last_modified=datetime(2025, 10, 27),
+                    enabled_user=True,
+                    org_sourced_ids="org-1",
+                    role=RoleType.STUDENT,
+                    username=f"student{i}",
+                    given_name="Taro",
+                    family_name="Yamada",
+                )
+                for i in range(5000)
+            ]
+        )
+        local = OneRosterCSVWriter(tmp_path / "local").write_all(data_model)
+
+        with ZipPackage(blob_client.open_write("tenant1/oneroster.zip")) as package:
+            OneRosterCSVWriter(Path("oneroster"), sink=package).write_all(data_model)
+
+        archive = blob_client.download_file("tenant1/oneroster.zip", tmp_path / "oneroster.zip")
+        with zipfile.ZipFile(archive) as package_file:
+            for path in local.values():
+                assert package_file.read(path.name) == path.read_bytes()
+
+
 class TestTableStorageE2E:
     """End-to-end tests for TableStorageClient with Azurite."""
 
@@ -273,3 +442,48 @@ class TestTableStorageE2E:
         # In a real scenario, we'd create old records and verify deletion
         deleted_count = table_client.cleanup_old_records(days=30)
         assert deleted_count >= 0
+
+    def test_cleanup_old_records_in_batches(self, table_client):
+        """Test that records older than the cutoff are deleted across partitions."""
+        for i in range(150):
+            table_client.log_conversion(f"job-{i:03d}", "SDS", "OneRoster", "success")
+        for i in range(3):
+            table_client.log_entity_counts(f"job-{i:03d}", "SDS", {"users": i})
+
+        # No record is 1 day in the future, so keeping -1 days deletes them all
+        assert table_client.cleanup_old_records(days=1) == 0
+        assert table_client.cleanup_old_records(days=-1, workers=2) == 153
+        assert list(table_client.table_client.list_entities()) == []
+
+    def test_list_conversions_newest_first_in_pages(self):
+        """Test that reverse-time RowKeys list the newest jobs first, page by page."""
+        client = TableStorageClient(
+            connection_string=AZURITE_CONNECTION_STRING,
+            table_name="testnewestfirst",
+            newest_first=True,
+        )
+        try:
+            for i in range(5):
+                client.log_conversion(f"job-{i}", "SDS", "OneRoster", "success")
+
+            first, token = client.list_conversions_page(source_type="SDS", limit=2)
+            second, token = client.list_conversions_page(
+                source_type="SDS", limit=2, continuation_token=token
+            )
+            last, token = client.list_conversions_page(
+                source_type="SDS", limit=2, continuation_token=token
+            )
+
+            assert [c["ConversionId"] for c in first + second + last] == [
+                "job-4",
+                "job-3",
+                "job-2",
+                "job-1",
+                "job-0",
+            ]
+            assert token is None
+            assert isinstance(first[0]["Timestamp"], datetime)
+            assert client.get_conversion("job-3", "SDS")["Status"] == "success"
+            assert client.get_conversion_stats("SDS")["success"] == 5
+        finally:
+            client.table_client.delete_table()
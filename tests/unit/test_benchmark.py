@@ -0,0 +1,88 @@
+"""Unit tests for the stage-level benchmark harness."""
+
+import csv
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from sds2roster.benchmark import (
+    CONVERT_STAGES,
+    WRITE_STAGES,
+    run_benchmark,
+    run_stages,
+    write_sds_dataset,
+)
+from sds2roster.cli import app
+
+
+def _row_count(path: Path) -> int:
+    with open(path, newline="", encoding="utf-8") as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
+class TestBenchmark:
+    """Test suite for the benchmark harness."""
+
+    def test_write_sds_dataset(self, tmp_path: Path) -> None:
+        """Test the generated dataset sizes."""
+        sds_dir = write_sds_dataset(tmp_path / "sds", 2_000)
+
+        assert _row_count(sds_dir / "school.csv") == 2
+        assert _row_count(sds_dir / "student.csv") == 2_000
+        assert _row_count(sds_dir / "section.csv") == 100
+        assert _row_count(sds_dir / "studentEnrollment.csv") == 6_000
+        assert _row_count(sds_dir / "teacherRoster.csv") == 100
+
+    def test_run_stages_times_every_stage(self, tmp_path: Path) -> None:
+        """Test that every stage is timed in pipeline order with its row count."""
+        sds_dir = write_sds_dataset(tmp_path / "sds", 100)
+
+        stages = run_stages(sds_dir, tmp_path / "out", trace_memory=True)
+
+        assert list(stages) == (
+            ["parse_all"]
+            + [f"convert_{name}" for name in CONVERT_STAGES]
+            + [f"write_{name}" for name in WRITE_STAGES]
+        )
+        assert stages["convert_users"]["rows"] == 110
+        assert stages["write_enrollments"]["rows"] == 350
+        assert all(stage["tracemalloc_peak_bytes"] >= 0 for stage in stages.values())
+        assert _row_count(tmp_path / "out" / "users.csv") == 110
+
+    def test_run_benchmark_reports_medians(self, tmp_path: Path) -> None:
+        """Test the JSON-serializable report of several repetitions."""
+        report = run_benchmark([100], repetitions=3, work_dir=tmp_path, isolate=False)
+
+        assert report["repetitions"] == 3
+        assert report["validation"] == "full"
+        (result,) = report["results"]
+        assert result["students"] == 100
+        parse = result["stages"]["parse_all"]
+        assert len(parse["runs_s"]) == 3
+        assert parse["min_s"] <= parse["median_s"]
+        assert parse["rows_per_s"] > 0
+        json.dumps(report)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_bench_command_writes_json(self, tmp_path: Path) -> None:
+        """Test that sds2roster bench runs each size and writes the JSON report."""
+        output = tmp_path / "bench.json"
+
+        result = CliRunner().invoke(
+            app,
+            ["bench", "--size", "100", "-r", "1", "--validation-level", "off", "-o", str(output)],
+        )
+
+        assert result.exit_code == 0
+        assert "parse_all" in result.stdout
+        report = json.loads(output.read_text())
+        assert report["validation"] == "off"
+        assert [r["students"] for r in report["results"]] == [100]
+
+    def test_bench_command_rejects_unknown_size(self) -> None:
+        """Test that an unknown size name is rejected."""
+        result = CliRunner().invoke(app, ["bench", "--size", "huge"])
+
+        assert result.exit_code == 1
+        assert "Unknown size" in result.stdout
@@ -1,10 +1,89 @@
 """Unit tests for Azure Blob Storage client."""
 
+import csv
+import gzip
+import io
+import random
+import re
+import threading
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import BlobBlock, BlobClient
+from requests.adapters import BaseAdapter
+from urllib3.response import HTTPResponse
 
 from sds2roster.azure.blob_storage import BlobStorageClient
+from sds2roster.converter import SDSToOneRosterConverter
+from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+from sds2roster.parsers.sds_parser import SDSCSVParser
+
+SDS_FILES = [
+    "school.csv",
+    "student.csv",
+    "teacher.csv",
+    "section.csv",
+    "studentEnrollment.csv",
+    "teacherRoster.csv",
+]
+
+
+class RangedBlobAdapter(BaseAdapter):
+    """HTTP adapter serving ranged GETs of one gzip-encoded blob, as the service does."""
+
+    def __init__(self, content: bytes) -> None:
+        super().__init__()
+        self.content = content
+        self.ranges: list[tuple[int, int]] = []
+
+    def send(self, request, **kwargs):
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers["x-ms-range"])
+        start, end = int(match[1]), min(int(match[2]), len(self.content) - 1)
+        self.ranges.append((start, end))
+        body = self.content[start : end + 1]
+        headers = {
+            "Content-Range": f"bytes {start}-{end}/{len(self.content)}",
+            "Content-Length": str(len(body)),
+            "Content-Encoding": "gzip",
+            "Content-Type": "text/csv",
+            "ETag": '"0x1"',
+            "Last-Modified": "Fri, 16 Oct 2026 00:00:00 GMT",
+            "x-ms-blob-type": "BlockBlob",
+        }
+        response = requests.Response()
+        response.status_code = 206
+        response.reason = "Partial Content"
+        response.raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=206,
+            preload_content=False,
+            decode_content=False,
+        )
+        response.headers = requests.structures.CaseInsensitiveDict(headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def ranged_blob_client(adapter: RangedBlobAdapter, name: str) -> BlobClient:
+    """Return a real BlobClient that downloads through adapter in 1 KiB ranges."""
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return BlobClient(
+        "https://test.blob.core.windows.net",
+        "container",
+        name,
+        transport=RequestsTransport(session=session),
+        max_single_get_size=1024,
+        max_chunk_get_size=1024,
+    )
 
 
 @pytest.fixture
@@ -76,7 +155,7 @@ def test_download_file(mock_blob_service, tmp_path):
     """Test file download."""
     mock_blob_client = mock_blob_service["blob"]
     mock_download = MagicMock()
-    mock_download.readall.return_value = b"test data"
+    mock_download.readinto.side_effect = lambda stream: stream.write(b"test data")
     mock_blob_client.download_blob.return_value = mock_download
 
     destination = tmp_path / "download.csv"
@@ -85,7 +164,9 @@ def test_download_file(mock_blob_service, tmp_path):
     )
     result = client.download_file("test.csv", str(destination))
 
-    mock_blob_client.download_blob.assert_called_once()
+    mock_blob_client.download_blob.assert_called_once_with(max_concurrency=4, decompress=False)
+    # Streamed to the file instead of buffered with readall
+    mock_download.readall.assert_not_called()
     assert result.exists()
     assert result.read_text() == "test data"
 
@@ -139,7 +220,7 @@ def test_read_csv_content(mock_blob_service):
     """Test reading CSV content."""
     mock_blob_client = mock_blob_service["blob"]
     mock_download = MagicMock()
-    mock_download.readall.return_value = b"test,data\n1,2"
+    mock_download.readinto.side_effect = lambda stream: stream.write(b"test,data\n1,2")
     mock_blob_client.download_blob.return_value = mock_download
 
     client = BlobStorageClient(
@@ -198,7 +279,7 @@ def test_download_directory(mock_blob_service, tmp_path):
     
     # Mock downloads
     mock_download = MagicMock()
-    mock_download.readall.return_value = b"test data"
+    mock_download.readinto.side_effect = lambda stream: stream.write(b"test data")
     mock_blob_client.download_blob.return_value = mock_download
 
     client = BlobStorageClient(
@@ -232,3 +313,308 @@ def test_upload_file_not_found(mock_blob_service, tmp_path):
     
     with pytest.raises(FileNotFoundError):
         client.upload_file(str(non_existent), "test.csv")
+
+
+def test_upload_directory_concurrent(mock_blob_service, tmp_path):
+    """Test that files are uploaded at the same time and returned in listing order."""
+    mock_blob_client = mock_blob_service["blob"]
+    mock_blob_client.url = "https://test.blob.core.windows.net/container/file.csv"
+    # Each upload waits for the other, so sequential uploads would time out
+    barrier = threading.Barrier(2, timeout=5)
+    mock_blob_client.upload_blob.side_effect = lambda *args, **kwargs: barrier.wait()
+
+    (tmp_path / "file1.csv").write_text("data1")
+    (tmp_path / "file2.csv").write_text("data2")
+
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    urls = client.upload_directory(tmp_path, workers=2, max_concurrency=3)
+
+    assert list(urls) == [path.name for path in tmp_path.glob("*.csv")]
+    assert mock_blob_client.upload_blob.call_count == 2
+    assert all(
+        call.kwargs["max_concurrency"] == 3 for call in mock_blob_client.upload_blob.call_args_list
+    )
+
+
+def test_upload_directory_concurrent_error(mock_blob_service, tmp_path):
+    """Test that a failed concurrent upload is raised to the caller."""
+    mock_blob_client = mock_blob_service["blob"]
+    mock_blob_client.upload_blob.side_effect = RuntimeError("upload failed")
+
+    for i in range(4):
+        (tmp_path / f"file{i}.csv").write_text("data")
+
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    with pytest.raises(RuntimeError, match="upload failed"):
+        client.upload_directory(tmp_path, workers=2)
+
+
+def test_download_directory_concurrent(mock_blob_service, tmp_path):
+    """Test that blobs are downloaded at the same time and returned in listing order."""
+    mock_container = mock_blob_service["container"]
+    blobs = []
+    for name in ["out/users.csv", "out/orgs.csv", "out/notes.txt"]:
+        blob = MagicMock()
+        blob.name = name
+        blobs.append(blob)
+    mock_container.list_blobs.return_value = blobs
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def blob_client(name):
+        client = MagicMock()
+
+        def readinto(stream):
+            # Each download waits for the other, so sequential downloads would time out
+            barrier.wait()
+            return stream.write(name.encode())
+
+        client.download_blob.return_value.readinto.side_effect = readinto
+        return client
+
+    mock_container.get_blob_client.side_effect = blob_client
+
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    files = client.download_directory(tmp_path, prefix="out/", workers=2)
+
+    assert files == [tmp_path / "users.csv", tmp_path / "orgs.csv"]
+    assert (tmp_path / "users.csv").read_text() == "out/users.csv"
+    assert (tmp_path / "orgs.csv").read_text() == "out/orgs.csv"
+
+
+def test_open_text_decodes_chunks(mock_blob_service):
+    """Test that a blob is decoded while its chunks download, including split characters."""
+    mock_blob_client = mock_blob_service["blob"]
+    data = "SIS ID,Name\nSCH001,Schüle\nSCH002,東京校\n".encode("utf-8")
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+    mock_blob_client.download_blob.return_value.chunks.return_value = iter(chunks)
+
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    stream = client.open_text("tenant1/school.csv")
+
+    # The download starts on the first read
+    mock_blob_client.download_blob.assert_not_called()
+    assert stream.name == "tenant1/school.csv"
+    assert list(csv.reader(stream)) == [
+        ["SIS ID", "Name"],
+        ["SCH001", "Schüle"],
+        ["SCH002", "東京校"],
+    ]
+    mock_blob_client.download_blob.assert_called_once()
+    stream.close()
+
+
+def test_open_text_parses_with_sds_parser(mock_blob_service):
+    """Test that SDSCSVParser reads a Blob text stream in place of a file."""
+    mock_blob_client = mock_blob_service["blob"]
+    data = Path("tests/fixtures/sds/student.csv").read_bytes()
+    mock_blob_client.download_blob.return_value.chunks.return_value = iter(
+        [data[:100], data[100:]]
+    )
+
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    with client.open_text("student.csv") as stream:
+        students = SDSCSVParser().parse_students(stream)
+
+    assert students == SDSCSVParser().parse_students(Path("tests/fixtures/sds/student.csv"))
+
+
+class FakeBlockBlob:
+    """In-memory block blob that records staged and committed blocks."""
+
+    def __init__(self, blob_name: str) -> None:
+        self.blob_name = blob_name
+        self.blocks: dict[str, bytes] = {}
+        self.committed: list[str] = []
+        self.content: bytes | None = None
+        self.content_settings = None
+        self.url = f"https://test.blob.core.windows.net/container/{blob_name}"
+
+    def stage_block(self, block_id: str, data: bytes) -> None:
+        self.blocks[block_id] = data
+
+    def commit_block_list(self, block_list: list[BlobBlock], content_settings=None) -> None:
+        block_ids = [block.id for block in block_list]
+        self.committed = block_ids
+        self.content_settings = content_settings
+        self.content = b"".join(self.blocks[block_id] for block_id in block_ids)
+
+
+def test_open_write_stages_blocks(mock_blob_service):
+    """Test that written bytes are staged in fixed-size blocks and committed in order."""
+    blob = FakeBlockBlob("out/users.csv")
+    mock_blob_service["container"].get_blob_client.return_value = blob
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    data = bytes(range(256)) * 40
+
+    with client.open_write("out/users.csv", block_size=1000) as stream:
+        for start in range(0, len(data), 333):
+            stream.write(data[start : start + 333])
+        assert stream.tell() == len(data)
+        # Full blocks are uploaded before the stream is closed
+        assert len(blob.blocks) >= 9
+        assert blob.content is None
+
+    assert blob.content == data
+    assert len(blob.committed) == 11
+    assert all(len(blob.blocks[block_id]) == 1000 for block_id in blob.committed[:-1])
+    assert len({len(block_id) for block_id in blob.committed}) == 1
+
+
+def test_open_write_bounds_blocks_in_flight(mock_blob_service):
+    """Test that writing waits while max_concurrency blocks are uploading."""
+    blob = FakeBlockBlob("users.csv")
+    release = threading.Event()
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    stage_block = blob.stage_block
+
+    def slow_stage_block(block_id: str, data: bytes) -> None:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        release.wait(timeout=5)
+        stage_block(block_id, data)
+        with lock:
+            in_flight -= 1
+
+    blob.stage_block = slow_stage_block
+    mock_blob_service["container"].get_blob_client.return_value = blob
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    stream = client.open_write("users.csv", block_size=10, max_concurrency=2)
+
+    writer = threading.Thread(target=lambda: [stream.write(b"x" * 10) for _ in range(5)])
+    writer.start()
+    writer.join(timeout=0.5)
+    # Two blocks are uploading and the third write waits for a free slot
+    assert writer.is_alive()
+    assert peak == 2
+
+    release.set()
+    writer.join(timeout=5)
+    stream.close()
+
+    assert peak == 2
+    assert blob.content == b"x" * 50
+
+
+def test_open_write_discards_on_error(mock_blob_service):
+    """Test that a failed with block or block upload does not commit the blob."""
+    mock_blob_client = mock_blob_service["blob"]
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+
+    with pytest.raises(RuntimeError):
+        with client.open_write("users.csv", block_size=4) as stream:
+            stream.write(b"sourcedId\n")
+            raise RuntimeError("formatting failed")
+    mock_blob_client.commit_block_list.assert_not_called()
+
+    mock_blob_client.stage_block.side_effect = ConnectionError("upload failed")
+    with pytest.raises(ConnectionError):
+        with client.open_write("users.csv", block_size=4) as stream:
+            stream.write(b"sourcedId\n")
+    mock_blob_client.commit_block_list.assert_not_called()
+
+
+def test_open_write_as_writer_sink(mock_blob_service, tmp_path):
+    """Test that OneRosterCSVWriter writes the same files through Blob block streams."""
+    blobs: dict[str, FakeBlockBlob] = {}
+    mock_blob_service["container"].get_blob_client.side_effect = (
+        lambda name: blobs.setdefault(name, FakeBlockBlob(name))
+    )
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    sds_data = SDSCSVParser().parse_all(
+        *(Path("tests/fixtures/sds") / name for name in SDS_FILES)
+    )
+    data_model = SDSToOneRosterConverter().convert(sds_data)
+
+    local = OneRosterCSVWriter(tmp_path / "local").write_all(data_model)
+    uploaded = OneRosterCSVWriter(
+        Path("tenant1/out"),
+        sink=lambda path: client.open_write(path.as_posix(), block_size=256),
+    ).write_all(data_model, workers=3)
+
+    assert not Path("tenant1").exists()
+    assert list(uploaded) == list(local)
+    assert sorted(blobs) == sorted(f"tenant1/out/{path.name}" for path in local.values())
+    for file_type, path in local.items():
+        assert blobs[uploaded[file_type].as_posix()].content == path.read_bytes()
+
+
+def test_upload_and_download_gzip(mock_blob_service, tmp_path):
+    """Test that compress=True uploads gzip blocks that download as the original file."""
+    blob = FakeBlockBlob("out/users.csv")
+    mock_blob_service["container"].get_blob_client.return_value = blob
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    source = tmp_path / "users.csv"
+    source.write_text("sourcedId,username\n" + "".join(f"u{i},user{i}\n" for i in range(5000)))
+
+    client.upload_file(source, "out/users.csv", compress=True)
+
+    assert blob.content_settings.content_encoding == "gzip"
+    assert blob.content_settings.content_type == "text/csv"
+    assert gzip.decompress(blob.content) == source.read_bytes()
+    assert len(blob.content) < source.stat().st_size / 2
+
+    # Downloaded by the SDK in several ranges with parallel GETs enabled
+    adapter = RangedBlobAdapter(blob.content)
+    mock_blob_service["container"].get_blob_client.side_effect = (
+        lambda name: ranged_blob_client(adapter, name)
+    )
+
+    result = client.download_file("out/users.csv", tmp_path / "downloaded.csv", max_concurrency=4)
+
+    assert len(adapter.ranges) > 2
+    assert result.read_bytes() == source.read_bytes()
+    assert client.read_csv_content("out/users.csv") == source.read_text()
+
+    adapter.content = blob.content[:-20]
+    with pytest.raises(ValueError, match="gzip"):
+        client.download_file("out/users.csv", tmp_path / "truncated.csv")
+
+
+def test_open_text_decodes_gzip_ranges(mock_blob_service):
+    """Test that a gzip blob arriving in several ranges is decompressed while read."""
+    rng = random.Random(0)
+    rows = [f"STU{rng.getrandbits(64):020d},学生{rng.getrandbits(32)}\n" for _ in range(200)]
+    data = ("SIS ID,Name\n" + "".join(rows)).encode("utf-8")
+    adapter = RangedBlobAdapter(gzip.compress(data))
+    mock_blob_service["container"].get_blob_client.side_effect = (
+        lambda name: ranged_blob_client(adapter, name)
+    )
+    client = BlobStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+
+    with client.open_text("student.csv") as stream:
+        text = stream.read()
+
+    assert len(adapter.ranges) > 2
+    assert text == data.decode("utf-8")
+
+    adapter.content = adapter.content[:-20]
+    with pytest.raises(ValueError, match="gzip"):
+        with client.open_text("student.csv") as stream:
+            stream.read()
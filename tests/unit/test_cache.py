@@ -0,0 +1,155 @@
+"""Unit tests for the conversion cache."""
+
+import json
+import os
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from sds2roster.cache import (
+    ENTRY_FILE_NAME,
+    BlobConversionCache,
+    LocalConversionCache,
+    cache_key,
+    conversion_date,
+)
+
+
+@pytest.fixture
+def output_files(tmp_path: Path) -> list[Path]:
+    """Write two output files."""
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    (output_dir / "manifest.csv").write_text("propertyName,value\n")
+    (output_dir / "users.csv").write_text("sourcedId\nabc\n")
+    return sorted(output_dir.iterdir())
+
+
+class TestCacheKey:
+    """Test suite for cache_key."""
+
+    def test_key_depends_on_content_name_and_profile(self, tmp_path: Path) -> None:
+        """Test that the key changes with any input and is stable otherwise."""
+        school = tmp_path / "school.csv"
+        school.write_text("SIS ID,Name\nSCH001,North\n")
+
+        key = cache_key([school], profile="validate=full")
+
+        assert len(key) == 64
+        assert cache_key([school], profile="validate=full") == key
+        assert cache_key([school], profile="validate=off") != key
+
+        renamed = tmp_path / "student.csv"
+        renamed.write_text("SIS ID,Name\nSCH001,North\n")
+        assert cache_key([renamed], profile="validate=full") != key
+
+        school.write_text("SIS ID,Name\nSCH001,South\n")
+        assert cache_key([school], profile="validate=full") != key
+
+    def test_key_of_undated_terms_depends_on_date(self, tmp_path: Path) -> None:
+        """Test that terms filled in from the conversion date key on that date."""
+        section = tmp_path / "section.csv"
+        section.write_text(
+            "SIS ID,Term SIS ID,Term Start Date,Term End Date\n"
+            "SEC001,TERM001,2025-09-01,2025-12-20\n"
+            "SEC002,,,\n"
+        )
+        assert conversion_date(section) is None
+
+        section.write_text(
+            "SIS ID,Term SIS ID,Term Start Date,Term End Date\n"
+            "SEC001,TERM001,2025-09-01,2025-12-20\n"
+            "SEC002,TERM002,2025-09-01,\n"
+        )
+        assert conversion_date(section) == datetime.now(timezone.utc).date()
+
+        key = cache_key([section], conversion_date=date(2026, 10, 16))
+        assert cache_key([section], conversion_date=date(2026, 10, 16)) == key
+        assert cache_key([section], conversion_date=date(2026, 10, 17)) != key
+        assert cache_key([section]) != key
+
+
+class TestLocalConversionCache:
+    """Test suite for LocalConversionCache."""
+
+    def test_miss_then_hit(self, tmp_path: Path, output_files: list[Path]) -> None:
+        """Test that stored files and metadata are restored."""
+        cache = LocalConversionCache(tmp_path / "cache")
+        restored = tmp_path / "restored"
+
+        assert cache.get("k1", restored) is None
+
+        cache.put("k1", output_files, {"counts": {"users": 1}})
+
+        assert cache.get("k1", restored) == {"counts": {"users": 1}}
+        for path in output_files:
+            assert (restored / path.name).read_bytes() == path.read_bytes()
+
+    def test_put_existing_entry_is_kept(self, tmp_path: Path, output_files: list[Path]) -> None:
+        """Test that storing a key twice keeps the first entry."""
+        cache = LocalConversionCache(tmp_path / "cache")
+
+        cache.put("k1", output_files, {"run": 1})
+        cache.put("k1", output_files, {"run": 2})
+
+        assert cache.get("k1", tmp_path / "restored") == {"run": 1}
+        assert [p.name for p in (tmp_path / "cache").iterdir()] == ["k1"]
+
+    def test_evicts_least_recently_used(self, tmp_path: Path, output_files: list[Path]) -> None:
+        """Test that the least recently used entries are evicted beyond max_bytes."""
+        cache = LocalConversionCache(tmp_path / "cache")
+        cache.put("k1", output_files, {})
+        entry_size = sum(p.stat().st_size for p in (tmp_path / "cache" / "k1").iterdir())
+
+        # Room for two entries
+        cache.max_bytes = 2 * entry_size
+        cache.put("k2", output_files, {})
+        os.utime(tmp_path / "cache" / "k1" / ENTRY_FILE_NAME, (1, 1))
+        os.utime(tmp_path / "cache" / "k2" / ENTRY_FILE_NAME, (2, 2))
+
+        # A hit makes k1 the most recently used entry
+        assert cache.get("k1", tmp_path / "restored") is not None
+
+        cache.put("k3", output_files, {})
+
+        assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == ["k1", "k3"]
+
+
+class TestBlobConversionCache:
+    """Test suite for BlobConversionCache."""
+
+    def test_put_uploads_entry_last(self, output_files: list[Path]) -> None:
+        """Test that files are uploaded under the key and the entry file last."""
+        client = MagicMock()
+        cache = BlobConversionCache(client, prefix="cache/")
+
+        cache.put("k1", output_files, {"counts": {}})
+
+        assert [c.args[1] for c in client.upload_file.call_args_list] == [
+            "cache/k1/manifest.csv",
+            "cache/k1/users.csv",
+        ]
+        blob_name, content = client.write_csv_content.call_args.args
+        assert blob_name == "cache/k1/entry.json"
+        assert json.loads(content) == {
+            "files": ["manifest.csv", "users.csv"],
+            "metadata": {"counts": {}},
+        }
+
+    def test_get(self, tmp_path: Path) -> None:
+        """Test a miss and a hit that downloads every file of the entry."""
+        client = MagicMock()
+        cache = BlobConversionCache(client)
+
+        client.blob_exists.return_value = False
+        assert cache.get("k1", tmp_path) is None
+
+        client.blob_exists.return_value = True
+        client.read_csv_content.return_value = json.dumps(
+            {"files": ["users.csv"], "metadata": {"counts": {"users": 1}}}
+        )
+
+        assert cache.get("k1", tmp_path) == {"counts": {"users": 1}}
+        client.download_file.assert_called_once_with("cache/k1/users.csv", tmp_path / "users.csv")
@@ -1,11 +1,15 @@
 """Unit tests for CLI module."""
 
+import io
+import json
+import pstats
+import zipfile
 from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
 
-from sds2roster.cli import app
+from sds2roster.cli import REQUIRED_FILES, app
 
 runner = CliRunner()
 
@@ -169,3 +173,482 @@ class TestCLI:
 
         assert result.exit_code == 1
         assert "Validation failed" in result.stdout
+
+    def test_convert_stream_matches_default(self, tmp_path: Path) -> None:
+        """Test that convert --stream writes the same files as the default mode."""
+        fixtures_path = Path("tests/fixtures/sds")
+        if not fixtures_path.exists():
+            pytest.skip("Test fixtures not available")
+
+        default_output = tmp_path / "default"
+        stream_output = tmp_path / "stream"
+
+        result = runner.invoke(app, ["convert", str(fixtures_path), str(default_output)])
+        assert result.exit_code == 0
+
+        result = runner.invoke(
+            app, ["convert", str(fixtures_path), str(stream_output), "--stream", "-v"]
+        )
+        assert result.exit_code == 0
+        assert "Conversion completed successfully" in result.stdout
+        assert "Generated 5 users" in result.stdout
+
+        default_files = sorted(p.name for p in default_output.iterdir())
+        assert sorted(p.name for p in stream_output.iterdir()) == default_files
+        for name in default_files:
+            assert (stream_output / name).read_bytes() == (default_output / name).read_bytes()
+
+    def test_convert_from_input_container(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that --input-container parses Blob streams and writes the same files."""
+        fixtures_path = Path("tests/fixtures/sds")
+        opened: list[str] = []
+
+        class FakeBlobStorageClient:
+            def __init__(self, connection_string: str, container_name: str) -> None:
+                assert container_name == "sds-files"
+
+            def blob_exists(self, blob_name: str) -> bool:
+                return blob_name.startswith("tenant1/sds/")
+
+            def open_text(self, blob_name: str):
+                opened.append(blob_name)
+                return open(fixtures_path / Path(blob_name).name, encoding="utf-8")
+
+        monkeypatch.setenv("AZURE_STORAGE_CONNECTION_STRING", "UseDevelopmentStorage=true")
+        monkeypatch.setattr(
+            "sds2roster.azure.blob_storage.BlobStorageClient", FakeBlobStorageClient
+        )
+        default_output = tmp_path / "default"
+        blob_output = tmp_path / "blob"
+
+        result = runner.invoke(app, ["convert", str(fixtures_path), str(default_output)])
+        assert result.exit_code == 0
+        result = runner.invoke(
+            app,
+            ["convert", "tenant1/sds", str(blob_output), "--input-container", "sds-files"],
+        )
+
+        assert result.exit_code == 0
+        assert sorted(opened) == sorted(f"tenant1/sds/{name}" for name in REQUIRED_FILES)
+        default_files = sorted(p.name for p in default_output.iterdir())
+        assert sorted(p.name for p in blob_output.iterdir()) == default_files
+        for name in default_files:
+            assert (blob_output / name).read_bytes() == (default_output / name).read_bytes()
+
+        result = runner.invoke(
+            app,
+            ["convert", "other", str(blob_output), "--input-container", "sds-files"],
+        )
+        assert result.exit_code == 1
+        assert "Missing required SDS files" in result.stdout
+
+        result = runner.invoke(
+            app,
+            ["convert", "tenant1/sds", str(blob_output), "--input-container", "x", "--stream"],
+        )
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.stdout
+
+    def test_convert_to_output_container(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that --output-container uploads the same files without a local copy."""
+        fixtures_path = Path("tests/fixtures/sds").absolute()
+        uploaded: dict[str, bytes] = {}
+
+        class BlobOutput(io.BytesIO):
+            def __init__(self, blob_name: str) -> None:
+                super().__init__()
+                self.blob_name = blob_name
+
+            def close(self) -> None:
+                if not self.closed:
+                    uploaded[self.blob_name] = self.getvalue()
+                super().close()
+
+        class FakeBlobStorageClient:
+            def __init__(self, connection_string: str, container_name: str) -> None:
+                assert container_name == "oneroster"
+
+            def open_write(self, blob_name: str) -> BlobOutput:
+                return BlobOutput(blob_name)
+
+        monkeypatch.setenv("AZURE_STORAGE_CONNECTION_STRING", "UseDevelopmentStorage=true")
+        monkeypatch.setattr(
+            "sds2roster.azure.blob_storage.BlobStorageClient", FakeBlobStorageClient
+        )
+        default_output = tmp_path / "default"
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(
+            app, ["convert", str(fixtures_path), str(default_output)]
+        )
+        assert result.exit_code == 0
+        result = runner.invoke(
+            app,
+            [
+                "convert",
+                str(fixtures_path),
+                "tenant1/oneroster",
+                "--output-container",
+                "oneroster",
+                "--stream",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "oneroster/tenant1/oneroster" in result.stdout
+        assert not (tmp_path / "tenant1").exists()
+        assert uploaded == {
+            f"tenant1/oneroster/{path.name}": path.read_bytes()
+            for path in default_output.iterdir()
+        }
+
+        result = runner.invoke(
+            app,
+            [
+                "convert",
+                str(fixtures_path),
+                "tenant1/oneroster",
+                "--output-container",
+                "oneroster",
+                "--save-state",
+            ],
+        )
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.stdout
+
+    def test_convert_to_zip(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that --zip packages the same files, locally and in a Blob container."""
+        fixtures_path = Path("tests/fixtures/sds")
+        default_output = tmp_path / "default"
+        uploaded: dict[str, bytes] = {}
+
+        class BlobOutput(io.BytesIO):
+            def __init__(self, blob_name: str) -> None:
+                super().__init__()
+                self.blob_name = blob_name
+
+            def close(self) -> None:
+                if not self.closed:
+                    uploaded[self.blob_name] = self.getvalue()
+                super().close()
+
+        class FakeBlobStorageClient:
+            def __init__(self, connection_string: str, container_name: str) -> None:
+                pass
+
+            def open_write(self, blob_name: str) -> BlobOutput:
+                return BlobOutput(blob_name)
+
+        monkeypatch.setenv("AZURE_STORAGE_CONNECTION_STRING", "UseDevelopmentStorage=true")
+        monkeypatch.setattr(
+            "sds2roster.azure.blob_storage.BlobStorageClient", FakeBlobStorageClient
+        )
+
+        result = runner.invoke(app, ["convert", str(fixtures_path), str(default_output)])
+        assert result.exit_code == 0
+        result = runner.invoke(
+            app,
+            ["convert", str(fixtures_path), str(tmp_path / "out" / "oneroster.zip"), "--zip"],
+        )
+        assert result.exit_code == 0
+        result = runner.invoke(
+            app,
+            [
+                "convert",
+                str(fixtures_path),
+                "tenant1/oneroster.zip",
+                "--zip",
+                "--output-container",
+                "oneroster",
+                "--jobs",
+                "3",
+            ],
+        )
+        assert result.exit_code == 0
+
+        expected = {path.name: path.read_bytes() for path in default_output.iterdir()}
+        packages = [
+            (tmp_path / "out" / "oneroster.zip").read_bytes(),
+            uploaded["tenant1/oneroster.zip"],
+        ]
+        for package in packages:
+            with zipfile.ZipFile(io.BytesIO(package)) as archive:
+                assert archive.testzip() is None
+                assert archive.namelist()[0] == "manifest.csv"
+                assert {name: archive.read(name) for name in archive.namelist()} == expected
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["oneroster.zip"]
+
+        result = runner.invoke(
+            app,
+            ["convert", str(fixtures_path), str(tmp_path / "x.zip"), "--zip", "--save-state"],
+        )
+        assert result.exit_code == 1
+        assert "--zip cannot be combined" in result.stdout
+
+    def test_convert_with_jobs(self, tmp_path: Path) -> None:
+        """Test that convert --jobs parses in parallel and writes the same files."""
+        fixtures_path = Path("tests/fixtures/sds")
+        if not fixtures_path.exists():
+            pytest.skip("Test fixtures not available")
+
+        default_output = tmp_path / "default"
+        jobs_output = tmp_path / "jobs"
+
+        result = runner.invoke(app, ["convert", str(fixtures_path), str(default_output)])
+        assert result.exit_code == 0
+
+        result = runner.invoke(
+            app, ["convert", str(fixtures_path), str(jobs_output), "--jobs", "3"]
+        )
+        assert result.exit_code == 0
+        assert "Conversion completed successfully" in result.stdout
+
+        for path in default_output.iterdir():
+            assert (jobs_output / path.name).read_bytes() == path.read_bytes()
+
+    def test_convert_columnar_matches_default(self, tmp_path: Path) -> None:
+        """Test that convert --columnar writes the same files as the default mode."""
+        fixtures_path = Path("tests/fixtures/sds")
+        if not fixtures_path.exists():
+            pytest.skip("Test fixtures not available")
+
+        default_output = tmp_path / "default"
+        columnar_output = tmp_path / "columnar"
+
+        result = runner.invoke(app, ["convert", str(fixtures_path), str(default_output)])
+        assert result.exit_code == 0
+
+        result = runner.invoke(
+            app,
+            ["convert", str(fixtures_path), str(columnar_output), "--columnar", "-j", "2", "-v"],
+        )
+        assert result.exit_code == 0
+        assert "Generated 5 users" in result.stdout
+
+        default_files = sorted(p.name for p in default_output.iterdir())
+        assert sorted(p.name for p in columnar_output.iterdir()) == default_files
+        for name in default_files:
+            assert (columnar_output / name).read_bytes() == (default_output / name).read_bytes()
+
+    def test_convert_stream_and_columnar_rejected(self, tmp_path: Path) -> None:
+        """Test that --stream and --columnar cannot be combined."""
+        result = runner.invoke(
+            app, ["convert", "tests/fixtures/sds", str(tmp_path), "--stream", "--columnar"]
+        )
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.stdout
+
+    def test_convert_stream_and_jobs_rejected(self, tmp_path: Path) -> None:
+        """Test that --stream cannot run with parallel jobs."""
+        result = runner.invoke(
+            app, ["convert", "tests/fixtures/sds", str(tmp_path), "--stream", "-j", "2"]
+        )
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.stdout
+
+    @pytest.mark.parametrize(
+        "options",
+        [["--validation-level", "schema-once"], ["--no-validate"], ["--validate"]],
+    )
+    def test_convert_with_validation_level(self, tmp_path: Path, options: list[str]) -> None:
+        """Test that the cheaper validation levels write the same files."""
+        fixtures_path = Path("tests/fixtures/sds")
+        if not fixtures_path.exists():
+            pytest.skip("Test fixtures not available")
+
+        default_output = tmp_path / "default"
+        trusted_output = tmp_path / "trusted"
+
+        result = runner.invoke(app, ["convert", str(fixtures_path), str(default_output)])
+        assert result.exit_code == 0
+
+        result = runner.invoke(
+            app, ["convert", str(fixtures_path), str(trusted_output), *options]
+        )
+        assert result.exit_code == 0
+        assert "Conversion completed successfully" in result.stdout
+
+        for path in default_output.iterdir():
+            assert (trusted_output / path.name).read_bytes() == path.read_bytes()
+
+    def test_convert_invalid_validation_level(self, tmp_path: Path) -> None:
+        """Test that an unknown validation level is rejected."""
+        result = runner.invoke(
+            app, ["convert", "tests/fixtures/sds", str(tmp_path), "--validation-level", "some"]
+        )
+        assert result.exit_code != 0
+
+    @pytest.mark.parametrize("options", [[], ["--stream"], ["--columnar"]])
+    def test_convert_since_writes_delta(self, tmp_path: Path, options: list[str]) -> None:
+        """Test that --since writes only the changed and removed rows."""
+        fixtures_path = Path("tests/fixtures/sds")
+        if not fixtures_path.exists():
+            pytest.skip("Test fixtures not available")
+
+        input_path = tmp_path / "sds"
+        input_path.mkdir()
+        for path in fixtures_path.iterdir():
+            (input_path / path.name).write_bytes(path.read_bytes())
+
+        bulk_output = tmp_path / "bulk"
+        result = runner.invoke(
+            app, ["convert", str(input_path), str(bulk_output), "--save-state"]
+        )
+        assert result.exit_code == 0
+        assert (bulk_output / ".sds2roster-state.json.gz").exists()
+
+        # Rename the first student and drop the second one
+        student_file = input_path / "student.csv"
+        lines = student_file.read_text().splitlines()
+        lines[1] = lines[1].replace(",Taro,", ",Jiro,")
+        del lines[2]
+        student_file.write_text("\n".join(lines) + "\n")
+
+        delta_output = tmp_path / "delta"
+        result = runner.invoke(
+            app,
+            ["convert", str(input_path), str(delta_output), "--since", str(bulk_output), *options],
+        )
+        assert result.exit_code == 0
+        assert "users: 0 added, 1 changed, 1 removed" in result.stdout
+
+        rows = (delta_output / "users.csv").read_text().splitlines()
+        assert len(rows) == 3
+        assert ",active," in rows[1] and ",Jiro," in rows[1]
+        assert ",tobedeleted," in rows[2]
+        assert (delta_output / "orgs.csv").read_text().count("\n") == 1
+        assert "file.users,delta" in (delta_output / "manifest.csv").read_text()
+        assert (delta_output / ".sds2roster-state.json.gz").exists()
+
+    def test_convert_since_missing_state(self, tmp_path: Path) -> None:
+        """Test that --since without a saved state is rejected."""
+        result = runner.invoke(
+            app, ["convert", "tests/fixtures/sds", str(tmp_path / "out"), "--since", str(tmp_path)]
+        )
+        assert result.exit_code == 1
+        assert "Previous state not found" in result.stdout
+
+    def test_convert_with_cache(self, tmp_path: Path) -> None:
+        """Test that a second run restores the output from the cache."""
+        fixtures_path = Path("tests/fixtures/sds")
+        if not fixtures_path.exists():
+            pytest.skip("Test fixtures not available")
+
+        cache_dir = tmp_path / "cache"
+        first_output = tmp_path / "first"
+        second_output = tmp_path / "second"
+        # A file left by an earlier run is not part of the output
+        first_output.mkdir()
+        (first_output / "stale.csv").write_text("sourcedId\n")
+
+        result = runner.invoke(
+            app, ["convert", str(fixtures_path), str(first_output), "--cache", str(cache_dir)]
+        )
+        assert result.exit_code == 0
+        assert "Restored output from cache" not in result.stdout
+
+        result = runner.invoke(
+            app, ["convert", str(fixtures_path), str(second_output), "--cache", str(cache_dir)]
+        )
+        assert result.exit_code == 0
+        assert "Restored output from cache" in result.stdout
+        assert "Conversion Summary" in result.stdout
+
+        first_files = sorted(p.name for p in first_output.iterdir() if p.name != "stale.csv")
+        assert sorted(p.name for p in second_output.iterdir()) == first_files
+        for name in first_files:
+            assert (second_output / name).read_bytes() == (first_output / name).read_bytes()
+
+    def test_convert_cache_and_since_rejected(self, tmp_path: Path) -> None:
+        """Test that the cache cannot be combined with delta conversion."""
+        result = runner.invoke(
+            app,
+            [
+                "convert", "tests/fixtures/sds", str(tmp_path / "out"),
+                "--save-state", "--cache", str(tmp_path / "cache"),
+            ],
+        )
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.stdout
+
+    @pytest.mark.parametrize("mode", [[], ["--stream"], ["--columnar"]])
+    def test_convert_profile(self, tmp_path: Path, mode: list[str]) -> None:
+        """Test that --profile writes a per-stage report."""
+        profile = tmp_path / "profile.json"
+        result = runner.invoke(
+            app,
+            ["convert", "tests/fixtures/sds", str(tmp_path / "out"), "--profile", str(profile)]
+            + mode,
+        )
+        assert result.exit_code == 0
+        assert "Profile written to" in result.stdout
+
+        report = json.loads(profile.read_text())
+        names = [stage["name"] for stage in report["stages"]]
+        assert "write:users.csv" in names
+        if mode == ["--stream"]:
+            assert list(report["steps"]) == ["stream"]
+        else:
+            assert list(report["steps"]) == ["parse", "convert", "write"]
+            assert "parse:student.csv" in names
+
+        users = next(stage for stage in report["stages"] if stage["name"] == "write:users.csv")
+        assert users["rows"] == 5
+        assert users["bytes"] == (tmp_path / "out" / "users.csv").stat().st_size
+
+    @pytest.mark.parametrize("mode", ["cprofile", "sampling"])
+    def test_convert_profile_cpu(self, tmp_path: Path, mode: str) -> None:
+        """Test that --profile-cpu writes a CPU profile of the conversion."""
+        profile = tmp_path / "cpu.out"
+        result = runner.invoke(
+            app,
+            [
+                "convert", "tests/fixtures/sds", str(tmp_path / "out"),
+                "--profile-cpu", str(profile), "--profile-cpu-mode", mode,
+            ],
+        )
+        assert result.exit_code == 0
+        assert "CPU profile written to" in result.stdout
+        assert profile.exists()
+        if mode == "cprofile":
+            functions = {name for _, _, name in pstats.Stats(str(profile)).stats}
+            assert "parse_all" in functions
+            assert "write_all" in functions
+
+    def test_azure_list_jobs_pages(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that list-jobs fetches one page and prints the token of the next one."""
+        calls: list[dict] = []
+
+        class FakeTableStorageClient:
+            def __init__(self, connection_string: str) -> None:
+                pass
+
+            def list_conversions_page(self, **kwargs):
+                calls.append(kwargs)
+                if kwargs["continuation_token"]:
+                    return [{"RowKey": "job-1", "Status": "failed"}], None
+                jobs = [{"RowKey": "0001_job-2", "ConversionId": "job-2", "Status": "success"}]
+                return jobs, "TOKEN"
+
+        monkeypatch.setenv("AZURE_TABLE_CONNECTION_STRING", "UseDevelopmentStorage=true")
+        monkeypatch.setattr(
+            "sds2roster.azure.table_storage.TableStorageClient", FakeTableStorageClient
+        )
+
+        result = runner.invoke(app, ["azure", "list-jobs", "--limit", "1"])
+        assert result.exit_code == 0
+        assert "job-2" in result.stdout
+        assert "0001_job-2" not in result.stdout
+        assert "--next-token TOKEN" in result.stdout
+        assert calls[0]["limit"] == 1
+        assert "Status" in calls[0]["select"]
+
+        result = runner.invoke(app, ["azure", "list-jobs", "-n", "1", "--next-token", "TOKEN"])
+        assert result.exit_code == 0
+        assert "job-1" in result.stdout
+        assert "--next-token" not in result.stdout
+        assert calls[1]["continuation_token"] == "TOKEN"
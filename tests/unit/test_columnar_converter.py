@@ -0,0 +1,164 @@
+"""Unit tests for the vectorized columnar converter."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sds2roster.columnar_converter import ColumnarConverter, OneRosterColumnarData
+from sds2roster.converter import SDSToOneRosterConverter
+from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+from sds2roster.parsers.sds_columnar import SDSColumnarData, SDSColumnarParser
+from sds2roster.parsers.sds_parser import SDSCSVParser
+from sds2roster.utils.validators import ValidationLevel
+
+SDS_FILES = {
+    "school.csv": (
+        "SIS ID,Name,School Number\n"
+        "SCH001,North High,N-001\n"
+        "SCH002,South High,\n"
+    ),
+    "student.csv": (
+        "SIS ID,School SIS ID,Username,First Name,Last Name,Middle Name,Grade,"
+        "Secondary Email,Status\n"
+        "STU001,SCH001,alice,Alice,Able,Ann,10,alice@example.com,Active\n"
+        "STU002,SCH002,bob,Bob,Baker,,11,,Inactive\n"
+        "STU003,SCH002,carol,Carol,Cole,,,,\n"
+    ),
+    "teacher.csv": (
+        "SIS ID,School SIS ID,Username,First Name,Last Name\n"
+        "TEA001,SCH001,dave,Dave,Dunn\n"
+        "TEA002,SCH002,erin,Erin,Eck\n"
+    ),
+    "section.csv": (
+        "SIS ID,School SIS ID,Section Name,Section Number,Term SIS ID,Term Name,"
+        "Term Start Date,Term End Date,Course Name,Course Number,Course Description\n"
+        "SEC001,SCH001,Math P1,1,T1,Fall,2025-09-01,2025-12-20,Math,MATH1,\"Algebra, \"\"I\"\"\"\n"
+        "SEC002,SCH002,Math P2,2,T1,Fall,2025-09-01,2025-12-20,Math,MATH1,\n"
+        "SEC003,SCH002,\"Art, Studio\",,T2,,,,,,Dessin 日本\n"
+        "SEC004,SCH001,Homeroom,,,,,,,,\n"
+    ),
+    "studentEnrollment.csv": (
+        "Section SIS ID,SIS ID\n"
+        "SEC001,STU001\n"
+        "SEC002,STU002\n"
+        "SEC999,STU003\n"
+        "SEC003,STU003\n"
+    ),
+    "teacherRoster.csv": (
+        "Section SIS ID,SIS ID\n"
+        "SEC001,TEA001\n"
+        "SEC003,TEA002\n"
+    ),
+}
+
+
+@pytest.fixture
+def sds_dir(tmp_path: Path) -> Path:
+    """Write an SDS dataset with duplicate courses, missing terms and an unknown section."""
+    directory = tmp_path / "sds"
+    directory.mkdir()
+    for file_name, content in SDS_FILES.items():
+        (directory / file_name).write_text(content, encoding="utf-8")
+    return directory
+
+
+def _sds_paths(directory: Path) -> dict[str, Path]:
+    return {
+        "school_file": directory / "school.csv",
+        "student_file": directory / "student.csv",
+        "teacher_file": directory / "teacher.csv",
+        "section_file": directory / "section.csv",
+        "student_enrollment_file": directory / "studentEnrollment.csv",
+        "teacher_roster_file": directory / "teacherRoster.csv",
+    }
+
+
+def _convert_both(sds_dir: Path) -> tuple[OneRosterColumnarData, SDSToOneRosterConverter]:
+    """Convert with both converters, sharing the conversion timestamp."""
+    columnar = ColumnarConverter()
+    converted = columnar.convert(SDSColumnarParser().parse_all(**_sds_paths(sds_dir)))
+
+    converter = SDSToOneRosterConverter()
+    converter.conversion_timestamp = columnar.conversion_timestamp
+    return converted, converter
+
+
+class TestColumnarConverter:
+    """Test suite for ColumnarConverter."""
+
+    def test_view_matches_object_converter(self, sds_dir: Path) -> None:
+        """Test that the data model view equals the object converter's result."""
+        converted, converter = _convert_both(sds_dir)
+        expected = converter.convert(SDSCSVParser().parse_all(**_sds_paths(sds_dir)))
+
+        assert converted.to_data_model() == expected
+        assert converted.to_data_model(ValidationLevel.FULL) == expected
+
+    def test_csv_bytes_match_object_converter(self, sds_dir: Path, tmp_path: Path) -> None:
+        """Test that write_frames writes the same files and bytes as write_all."""
+        converted, converter = _convert_both(sds_dir)
+        expected = converter.convert(SDSCSVParser().parse_all(**_sds_paths(sds_dir)))
+
+        expected_files = OneRosterCSVWriter(tmp_path / "objects").write_all(expected)
+        written = OneRosterCSVWriter(tmp_path / "frames").write_frames(converted, workers=3)
+
+        assert list(written) == list(expected_files)
+        for file_type, path in expected_files.items():
+            assert written[file_type].read_bytes() == path.read_bytes()
+
+    def test_lookups_and_deduplication(self, sds_dir: Path) -> None:
+        """Test the section join, course and term dedup and the term fallbacks."""
+        converted, _ = _convert_both(sds_dir)
+
+        # SEC999 is unknown, so one student enrollment is skipped
+        assert len(converted.enrollments) == 5
+        assert converted.enrollments["primary"].tolist() == [None, None, None, True, True]
+
+        # MATH1 is shared by two sections; SEC003 and SEC004 fall back to their SIS ID
+        assert len(converted.courses) == 3
+        assert converted.courses["title"].tolist() == ["Math", "Art, Studio", "Homeroom"]
+
+        # SEC004 has no term
+        assert converted.classes["term_sourced_ids"].isna().tolist() == [
+            False, False, False, True
+        ]
+        sessions = converted.academic_sessions
+        assert sessions["title"].tolist() == ["Fall", "T2"]
+        assert sessions["school_year"].tolist() == [
+            "2025",
+            str(converted.academic_sessions["date_last_modified"].iloc[0].year),
+        ]
+
+    def test_frames_have_model_columns(self, sds_dir: Path) -> None:
+        """Test that frames hold one column per OneRoster model field."""
+        converted, _ = _convert_both(sds_dir)
+
+        assert list(converted.users.columns[:4]) == [
+            "sourced_id", "status", "date_last_modified", "enabled_user"
+        ]
+        assert converted.users["role"].tolist() == ["student"] * 3 + ["teacher"] * 2
+        assert converted.roles["role"].tolist() == ["student"] * 3 + ["teacher"] * 2
+
+    def test_empty_frames(self, tmp_path: Path) -> None:
+        """Test that empty input gives empty frames and only the manifest is written."""
+        empty = pd.DataFrame()
+        sds_data = SDSColumnarData(
+            schools=empty, students=empty, teachers=empty, sections=empty, enrollments=empty
+        )
+
+        converted = ColumnarConverter().convert(sds_data)
+
+        assert converted.users.empty
+        assert converted.to_data_model().users == []
+        assert list(OneRosterCSVWriter(tmp_path).write_frames(converted)) == ["manifest"]
+
+    def test_empty_sis_id_raises_error(self, sds_dir: Path) -> None:
+        """Test that an empty SIS ID fails GUID generation like the object converter."""
+        (sds_dir / "school.csv").write_text("SIS ID,Name\n,Nameless\n")
+        sds_data = SDSColumnarParser(validation=ValidationLevel.OFF).parse_all(
+            **_sds_paths(sds_dir)
+        )
+
+        with pytest.raises(ValueError, match="sis_id cannot be empty"):
+            ColumnarConverter().convert(sds_data)
@@ -2,7 +2,10 @@
 
 from datetime import datetime, timezone
 
+import pytest
+
 from sds2roster.converter import SDSToOneRosterConverter
+from sds2roster.instrumentation import ProfileReport, registered
 from sds2roster.models.oneroster import (
     ClassType,
     EnrollmentRole,
@@ -10,7 +13,9 @@ from sds2roster.models.oneroster import (
     OrgType,
     RoleType,
 )
+from sds2roster.models.records import OneRosterUserRecord, to_model_data, to_record
 from sds2roster.models.sds import SDSDataModel, SDSEnrollment, SDSSchool, SDSSection, SDSStudent, SDSTeacher
+from sds2roster.utils.validators import ValidationLevel
 
 
 class TestSDSToOneRosterConverter:
@@ -315,3 +320,185 @@ class TestSDSToOneRosterConverter:
         assert any(e.role == EnrollmentRole.TEACHER for e in result.enrollments)
         assert result.academic_sessions[0].title == "Fall 2024"
 
+    def test_convert_trusted_matches_full(self) -> None:
+        """Test that trusted conversion builds the same records without validation."""
+        sds_data = SDSDataModel(
+            schools=[SDSSchool(sis_id="school001", name="Test School")],
+            students=[
+                SDSStudent(
+                    sis_id="student001",
+                    school_sis_id="school001",
+                    username="john.doe",
+                    first_name="John",
+                    last_name="Doe",
+                    grade="10",
+                )
+            ],
+            teachers=[
+                SDSTeacher(
+                    sis_id="teacher001",
+                    school_sis_id="school001",
+                    username="jane.smith",
+                    first_name="Jane",
+                    last_name="Smith",
+                )
+            ],
+            sections=[
+                SDSSection(
+                    sis_id="section001",
+                    school_sis_id="school001",
+                    section_name="Math 101",
+                    course_number="MATH101",
+                    term_sis_id="fall2024",
+                )
+            ],
+            enrollments=[
+                SDSEnrollment(sis_id="student001", section_sis_id="section001", role="student"),
+                SDSEnrollment(sis_id="teacher001", section_sis_id="section001", role="teacher"),
+            ],
+        )
+
+        full_converter = SDSToOneRosterConverter()
+        trusted_converter = SDSToOneRosterConverter(validation=ValidationLevel.OFF)
+        trusted_converter.conversion_timestamp = full_converter.conversion_timestamp
+
+        full = full_converter.convert(sds_data)
+        trusted = trusted_converter.convert(sds_data)
+
+        assert trusted == full
+        assert trusted.users[0].sms is None
+        assert trusted.enrollments[1].primary is True
+
+    @staticmethod
+    def _multi_school_data() -> SDSDataModel:
+        """Build data spread over three schools with a course and term shared between them."""
+        schools = [SDSSchool(sis_id=f"school{i}", name=f"School {i}") for i in range(3)]
+        students = [
+            SDSStudent(
+                sis_id=f"student{i}",
+                school_sis_id=f"school{i % 3}",
+                username=f"student{i}",
+                first_name="First",
+                last_name=f"Last{i}",
+                grade=str(9 + i % 4),
+            )
+            for i in range(12)
+        ]
+        teachers = [
+            SDSTeacher(
+                sis_id=f"teacher{i}",
+                school_sis_id=f"school{(i + 1) % 3}",
+                username=f"teacher{i}",
+                first_name="First",
+                last_name=f"Last{i}",
+            )
+            for i in range(3)
+        ]
+        sections = [
+            SDSSection(
+                sis_id=f"section{i}",
+                school_sis_id=f"school{(2 - i) % 3}",
+                section_name=f"Section {i}",
+                course_number="MATH101" if i % 2 else f"COURSE{i}",
+                term_sis_id="fall2024" if i < 4 else None,
+                term_start_date=datetime(2024, 9, 1) if i == 3 else None,
+            )
+            for i in range(6)
+        ]
+        enrollments = [
+            SDSEnrollment(sis_id=f"student{i}", section_sis_id=f"section{i % 7}", role="student")
+            for i in range(12)
+        ] + [
+            SDSEnrollment(sis_id=f"teacher{i}", section_sis_id=f"section{i}", role="teacher")
+            for i in range(3)
+        ]
+        return SDSDataModel(
+            schools=schools,
+            students=students,
+            teachers=teachers,
+            sections=sections,
+            enrollments=enrollments,
+        )
+
+    @pytest.mark.parametrize("validation", [ValidationLevel.FULL, ValidationLevel.OFF])
+    def test_convert_sharded_matches_sequential(self, validation: ValidationLevel) -> None:
+        """Test that converting per-school shards in parallel gives the same result."""
+        sds_data = self._multi_school_data()
+        converter = SDSToOneRosterConverter(validation=validation)
+
+        sequential = converter.convert(sds_data)
+        sharded = converter.convert(sds_data, workers=2)
+
+        assert sharded == sequential
+        # section6 does not exist, so its enrollment is skipped in both modes
+        assert len(sharded.enrollments) == 14
+        assert [course.title for course in sharded.courses] == [
+            "Section 0", "Section 1", "Section 2", "Section 4"
+        ]
+        assert len(sharded.academic_sessions) == 1
+        for sharded_user, user in zip(sharded.users, sequential.users):
+            assert sharded_user.model_fields_set == user.model_fields_set
+
+    @pytest.mark.parametrize("validation", [ValidationLevel.FULL, ValidationLevel.OFF])
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_convert_compact_matches_models(
+        self, validation: ValidationLevel, workers: int
+    ) -> None:
+        """Test that compact conversion of records builds records equal to the models."""
+        sds_data = self._multi_school_data()
+        compact_sds_data = SDSDataModel.model_construct(
+            schools=[to_record(school) for school in sds_data.schools],
+            students=[to_record(student) for student in sds_data.students],
+            teachers=[to_record(teacher) for teacher in sds_data.teachers],
+            sections=[to_record(section) for section in sds_data.sections],
+            enrollments=[to_record(enrollment) for enrollment in sds_data.enrollments],
+        )
+        converter = SDSToOneRosterConverter(validation=validation)
+        compact_converter = SDSToOneRosterConverter(validation=validation, compact=True)
+        compact_converter.conversion_timestamp = converter.conversion_timestamp
+
+        expected = converter.convert(sds_data)
+        compact = compact_converter.convert(compact_sds_data, workers=workers)
+
+        assert type(compact.users[0]) is OneRosterUserRecord
+        assert to_model_data(compact) == expected
+
+    @pytest.mark.parametrize("validation", [ValidationLevel.FULL, ValidationLevel.OFF])
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_repeated_values_are_shared(self, validation: ValidationLevel, compact: bool) -> None:
+        """Test that records repeating an org, class or grade value share one object."""
+        sds_data = self._multi_school_data()
+
+        data_model = SDSToOneRosterConverter(validation=validation, compact=compact).convert(
+            sds_data
+        )
+
+        users = data_model.users
+        assert users[0].org_sourced_ids is users[3].org_sourced_ids
+        assert users[0].grades is users[4].grades
+        assert users[0].date_last_modified is users[1].date_last_modified
+        first, *others = [
+            enrollment
+            for enrollment in data_model.enrollments
+            if enrollment.class_sourced_id == data_model.enrollments[0].class_sourced_id
+        ]
+        assert others
+        assert all(other.class_sourced_id is first.class_sourced_id for other in others)
+
+    def test_convert_sharded_without_shards_is_one_stage(self) -> None:
+        """Test that data without schools is converted in a single convert stage."""
+        report = ProfileReport()
+
+        with registered(report):
+            data_model = SDSToOneRosterConverter().convert(SDSDataModel(), workers=2)
+
+        assert data_model.users == []
+        assert [s.name for s in report.stages].count("convert") == 1
+
+    def test_convert_sharded_raises_errors(self) -> None:
+        """Test that a validation error in a shard is raised to the caller."""
+        sds_data = self._multi_school_data()
+        sds_data.schools.append(SDSSchool.model_construct(sis_id="school9", name=""))
+
+        with pytest.raises(ValueError, match="Field cannot be empty"):
+            SDSToOneRosterConverter().convert(sds_data, workers=2)
@@ -0,0 +1,177 @@
+"""Unit tests for incremental (delta) output."""
+
+import gzip
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from sds2roster.delta import (
+    STATE_FILE_NAME,
+    DeltaTracker,
+    FingerprintStore,
+    fingerprint_row,
+)
+from sds2roster.models.oneroster import (
+    OneRosterDataModel,
+    OneRosterOrg,
+    OneRosterStatus,
+    OrgType,
+)
+from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+
+FIELDNAMES = ["sourcedId", "status", "dateLastModified", "name"]
+TIMESTAMP = datetime(2025, 1, 15, 10, 30)
+
+
+def _rows(*names: str) -> list[tuple[str, ...]]:
+    return [(f"id-{name}", "", "", name) for name in names]
+
+
+def _org(sourced_id: str, name: str) -> OneRosterOrg:
+    return OneRosterOrg(
+        sourced_id=sourced_id,
+        status=OneRosterStatus.ACTIVE,
+        date_last_modified=TIMESTAMP,
+        name=name,
+        type=OrgType.SCHOOL,
+        identifier=sourced_id,
+    )
+
+
+class TestFingerprintStore:
+    """Test suite for FingerprintStore."""
+
+    def test_fingerprint_row(self) -> None:
+        """Test that fingerprints are short and separate cell boundaries."""
+        assert len(fingerprint_row(("a", "b"))) == 16
+        assert fingerprint_row(("a", "b")) == fingerprint_row(["a", "b"])
+        assert fingerprint_row(("ab", "")) != fingerprint_row(("a", "b"))
+
+    def test_save_and_load_directory(self, tmp_path: Path) -> None:
+        """Test a round trip through an output directory."""
+        store = FingerprintStore({"orgs": {"id-a": "0123456789abcdef"}})
+
+        path = store.save(tmp_path)
+
+        assert path == tmp_path / STATE_FILE_NAME
+        assert FingerprintStore.load(tmp_path).files == store.files
+        assert FingerprintStore.load(path).files == store.files
+
+    def test_load_missing_file(self, tmp_path: Path) -> None:
+        """Test that a missing state raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            FingerprintStore.load(tmp_path)
+
+    @pytest.mark.parametrize(
+        "content", [b"not gzip", gzip.compress(b"{"), gzip.compress(b'{"version": 99}')]
+    )
+    def test_load_invalid_file(self, tmp_path: Path, content: bytes) -> None:
+        """Test that a file that is not a supported state raises ValueError."""
+        path = tmp_path / "state.json.gz"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError, match="fingerprint state file"):
+            FingerprintStore.load(path)
+
+
+class TestDeltaTracker:
+    """Test suite for DeltaTracker."""
+
+    def test_bulk_passes_rows_through(self) -> None:
+        """Test that without a previous store all rows are written and fingerprinted."""
+        tracker = DeltaTracker()
+        rows = _rows("a", "b")
+
+        assert list(tracker.track("orgs", FIELDNAMES, rows)) == rows
+        assert not tracker.incremental
+        assert list(tracker.current.files["orgs"]) == ["id-a", "id-b"]
+
+    def test_incremental_emits_changes(self) -> None:
+        """Test added, changed, unchanged and removed rows."""
+        previous = DeltaTracker()
+        list(previous.track("orgs", FIELDNAMES, _rows("a", "b", "c")))
+
+        tracker = DeltaTracker(previous.current, timestamp=TIMESTAMP)
+        rows = [("id-a", "", "", "a"), ("id-b", "", "", "B"), ("id-d", "", "", "d")]
+
+        emitted = list(tracker.track("orgs", FIELDNAMES, rows))
+
+        assert emitted == [
+            ("id-b", "active", "2025-01-15T10:30:00Z", "B"),
+            ("id-d", "active", "2025-01-15T10:30:00Z", "d"),
+            ("id-c", "tobedeleted", "2025-01-15T10:30:00Z", ""),
+        ]
+        assert tracker.changes["orgs"] == {"added": 1, "changed": 1, "removed": 1}
+        assert list(tracker.current.files["orgs"]) == ["id-a", "id-b", "id-d"]
+
+    def test_duplicate_sourced_ids_keep_first_row(self) -> None:
+        """Test that unchanged input with duplicate sourcedIds yields no changes."""
+        rows = [("id-a", "", "", "a"), ("id-b", "", "", "b"), ("id-a", "", "", "A")]
+        previous = DeltaTracker()
+        assert list(previous.track("orgs", FIELDNAMES, rows)) == rows
+
+        tracker = DeltaTracker(previous.current, timestamp=TIMESTAMP)
+
+        assert list(tracker.track("orgs", FIELDNAMES, rows)) == []
+        assert tracker.changes["orgs"] == {"added": 0, "changed": 0, "removed": 0}
+        assert tracker.current.files == previous.current.files
+
+    def test_has_previous_rows(self) -> None:
+        """Test which file types must be written to delete previous rows."""
+        tracker = DeltaTracker(FingerprintStore({"orgs": {"id-a": "0"}, "roles": {}}))
+
+        assert tracker.has_previous_rows("orgs")
+        assert not tracker.has_previous_rows("roles")
+        assert not tracker.has_previous_rows("users")
+        assert not DeltaTracker().has_previous_rows("orgs")
+
+
+class TestDeltaWriter:
+    """Test suite for OneRosterCSVWriter with a delta tracker."""
+
+    def test_manifest_lists_delta_files(self, tmp_path: Path) -> None:
+        """Test that entity files are marked delta only in incremental mode."""
+        bulk = OneRosterCSVWriter(tmp_path / "bulk", delta=DeltaTracker())
+        incremental = OneRosterCSVWriter(
+            tmp_path / "delta", delta=DeltaTracker(FingerprintStore())
+        )
+
+        assert "file.orgs,bulk" in bulk.write_manifest().read_text()
+        manifest = incremental.write_manifest().read_text()
+        assert "file.orgs,delta" in manifest
+        assert "file.users,delta" in manifest
+        assert "file.demographics,absent" in manifest
+
+    def test_write_all_deletes_removed_file_type(self, tmp_path: Path) -> None:
+        """Test that a file type without current records still deletes previous rows."""
+        bulk = DeltaTracker()
+        OneRosterCSVWriter(tmp_path / "bulk", delta=bulk).write_all(
+            OneRosterDataModel(orgs=[_org("org-1", "North")])
+        )
+
+        tracker = DeltaTracker(bulk.current, timestamp=TIMESTAMP)
+        written = OneRosterCSVWriter(tmp_path / "delta", delta=tracker).write_all(
+            OneRosterDataModel()
+        )
+
+        assert list(written) == ["manifest", "orgs"]
+        lines = written["orgs"].read_text().splitlines()
+        assert lines[1] == "org-1,tobedeleted,2025-01-15T10:30:00Z,,,,"
+
+    def test_write_records_skips_unchanged_rows(self, tmp_path: Path) -> None:
+        """Test that streamed records go through the tracker."""
+        bulk = DeltaTracker()
+        writer = OneRosterCSVWriter(tmp_path / "bulk", delta=bulk)
+        writer.write_records("orgs", [_org("org-1", "North"), _org("org-2", "South")])
+
+        tracker = DeltaTracker(bulk.current, timestamp=TIMESTAMP)
+        writer = OneRosterCSVWriter(tmp_path / "delta", delta=tracker)
+        path, count = writer.write_records(
+            "orgs", [_org("org-1", "North"), _org("org-2", "South High")]
+        )
+
+        assert count == 2
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert lines[1].startswith("org-2,active,2025-01-15T10:30:00Z,South High,")
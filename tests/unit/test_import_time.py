@@ -0,0 +1,93 @@
+"""Import-time regression tests for the CLI."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import sds2roster
+
+# Cumulative import time budget of sds2roster.cli, in microseconds. Importing it
+# takes ~80 ms on a development machine (~225 ms when it loaded every model);
+# the budget leaves room for slow CI hosts.
+CLI_IMPORT_BUDGET_US = 400_000
+
+# Modules that no command may need at startup
+HEAVY_MODULES = (
+    "pydantic",
+    "pandas",
+    "azure.storage.blob",
+    "azure.data.tables",
+    "sds2roster.converter",
+    "sds2roster.models.sds",
+    "sds2roster.models.oneroster",
+    "sds2roster.parsers.sds_parser",
+)
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Run Python with -X importtime and return the cumulative import time per module.
+
+    Args:
+        *args: Arguments after ``python -X importtime``
+
+    Returns:
+        Cumulative import time in microseconds, keyed by module name
+    """
+    env = dict(os.environ, PYTHONPATH=str(Path(sds2roster.__file__).parents[1]))
+    env.pop("AZURE_TABLE_CONNECTION_STRING", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """Test suite for CLI startup imports."""
+
+    def test_cli_import_within_budget(self) -> None:
+        """Test that importing the CLI loads no heavy module and stays within budget."""
+        times = _import_times("-c", "import sds2roster.cli")
+
+        assert "sds2roster.cli" in times
+        assert not [name for name in HEAVY_MODULES if name in times]
+        assert times["sds2roster.cli"] < CLI_IMPORT_BUDGET_US
+
+    @pytest.mark.parametrize(
+        "command", [["version"], ["azure", "list-jobs"], ["convert", "--help"]]
+    )
+    def test_short_commands_skip_models(self, command: list[str]) -> None:
+        """Test that short commands run without importing models or the Blob SDK."""
+        times = _import_times("-m", "sds2roster.cli", *command)
+
+        # The CLI module itself runs as __main__
+        assert "typer" in times
+        assert "pydantic" not in times
+        assert "sds2roster.converter" not in times
+        assert "azure.storage.blob" not in times
+
+    def test_package_exports_are_lazy(self) -> None:
+        """Test that the package exports still resolve to the real classes."""
+        from sds2roster import SDSDataModel, SDSToOneRosterConverter
+        from sds2roster.azure import BlobStorageClient
+        from sds2roster.converter import SDSToOneRosterConverter as Converter
+        from sds2roster.models.sds import SDSDataModel as DataModel
+
+        assert SDSToOneRosterConverter is Converter
+        assert SDSDataModel is DataModel
+        assert BlobStorageClient.__module__ == "sds2roster.azure.blob_storage"
+        with pytest.raises(AttributeError):
+            sds2roster.missing_name
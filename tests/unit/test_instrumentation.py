@@ -0,0 +1,140 @@
+"""Unit tests for stage instrumentation."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from sds2roster.azure.blob_storage import BlobStorageClient
+from sds2roster.converter import SDSToOneRosterConverter
+from sds2roster.instrumentation import (
+    ProfileReport,
+    Stage,
+    add_hook,
+    registered,
+    remove_hook,
+    stage,
+)
+from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+from sds2roster.parsers.sds_parser import SDSCSVParser
+
+FIXTURES = Path("tests/fixtures/sds")
+
+
+class RecordingHook:
+    """Hook that records every event."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.finished: list[Stage] = []
+
+    def stage_started(self, started: Stage) -> None:
+        self.events.append(("started", started.name))
+
+    def stage_finished(self, finished: Stage) -> None:
+        self.events.append(("finished", finished.name))
+        self.finished.append(finished)
+
+
+class TestStage:
+    """Test suite for stage and hook registration."""
+
+    def test_no_hook_returns_shared_null_stage(self) -> None:
+        """Test that without hooks nothing is measured."""
+        rows = [1, 2, 3]
+
+        with stage("parse") as timed:
+            timed.rows = 3
+            assert timed.count(rows) is rows
+
+        assert stage("parse") is stage("write")
+
+    def test_hook_receives_nested_stages(self, tmp_path: Path) -> None:
+        """Test start and finish events with rows, bytes and duration."""
+        path = tmp_path / "users.csv"
+        path.write_text("sourcedId\nabc\n")
+        hook = RecordingHook()
+
+        with registered(hook):
+            with stage("write"):
+                with stage("write:users.csv", path) as timed:
+                    assert list(timed.count(["a", "b"])) == ["a", "b"]
+
+        assert hook.events == [
+            ("started", "write"),
+            ("started", "write:users.csv"),
+            ("finished", "write:users.csv"),
+            ("finished", "write"),
+        ]
+        users = hook.finished[0]
+        assert users.rows == 2
+        assert users.bytes == path.stat().st_size
+        assert users.duration_s > 0
+        assert not users.failed
+        assert hook.finished[1].rows is None
+
+        # The hook is unregistered after the with block
+        assert not isinstance(stage("write"), Stage)
+
+    def test_failed_stage_is_reported(self) -> None:
+        """Test that a stage raising an exception is finished and marked failed."""
+        hook = RecordingHook()
+        add_hook(hook)
+        try:
+            with pytest.raises(ValueError):
+                with stage("parse:school.csv"):
+                    raise ValueError("bad row")
+        finally:
+            remove_hook(hook)
+
+        assert hook.finished[0].failed
+
+
+class TestProfileReport:
+    """Test suite for ProfileReport."""
+
+    def test_report_of_conversion(self, tmp_path: Path) -> None:
+        """Test that parse, convert and write stages are reported."""
+        report = ProfileReport()
+
+        with registered(report):
+            sds_data = SDSCSVParser().parse_all(
+                FIXTURES / "school.csv",
+                FIXTURES / "student.csv",
+                FIXTURES / "teacher.csv",
+                FIXTURES / "section.csv",
+                FIXTURES / "studentEnrollment.csv",
+                FIXTURES / "teacherRoster.csv",
+            )
+            data_model = SDSToOneRosterConverter().convert(sds_data)
+            OneRosterCSVWriter(tmp_path).write_all(data_model)
+
+        path = report.write(tmp_path / "profile.json")
+        result = json.loads(path.read_text())
+
+        assert list(result["steps"]) == ["parse", "convert", "write"]
+        stages = {entry["name"]: entry for entry in result["stages"]}
+        assert stages["parse:student.csv"]["rows"] == 3
+        assert stages["parse:student.csv"]["bytes"] == (FIXTURES / "student.csv").stat().st_size
+        assert stages["convert:users"]["rows"] == 5
+        assert stages["write:users.csv"]["rows"] == 5
+        assert stages["parse"]["rows_per_s"] > 0
+        assert "memory_delta_bytes" in stages["convert"]
+
+    def test_azure_blob_stages(self, tmp_path: Path) -> None:
+        """Test that Blob Storage transfers are reported with their size."""
+        client = BlobStorageClient.__new__(BlobStorageClient)
+        client.container_client = MagicMock()
+        source = tmp_path / "users.csv"
+        source.write_text("sourcedId\nabc\n")
+        report = ProfileReport()
+
+        with registered(report):
+            client.upload_file(source, "users.csv")
+            client.write_csv_content("entry.json", "{}")
+
+        assert [(s.name, s.bytes) for s in report.stages] == [
+            ("azure.blob.upload", source.stat().st_size),
+            ("azure.blob.upload", 2),
+        ]
@@ -0,0 +1,81 @@
+"""Unit tests for value interning."""
+
+from datetime import datetime, timedelta, timezone
+
+from sds2roster.models.records import to_record
+from sds2roster.models.sds import SDSStudent
+from sds2roster.utils.interning import ValuePool
+
+
+def _copy(value: str) -> str:
+    """Return an equal string that is a distinct object."""
+    return "".join(list(value))
+
+
+class TestValuePool:
+    """Test suite for ValuePool."""
+
+    def test_share(self) -> None:
+        """Test that equal values map to the first object seen."""
+        pool = ValuePool()
+        first = _copy("SCH001")
+
+        assert pool.share(first) is first
+        assert pool.share(_copy("SCH001")) is first
+        assert pool.share(None) is None
+        assert len(pool) == 1
+
+    def test_share_keeps_equal_values_of_other_types_and_offsets(self) -> None:
+        """Test that equal values that print differently are not collapsed."""
+        pool = ValuePool()
+        utc = datetime(2024, 9, 1, 10, tzinfo=timezone.utc)
+        tokyo = datetime(2024, 9, 1, 19, tzinfo=timezone(timedelta(hours=9)))
+        assert utc == tokyo
+
+        assert pool.share(utc) is utc
+        assert pool.share(tokyo) is tokyo
+        assert pool.share(datetime(2024, 9, 1, 10, tzinfo=timezone.utc)) is utc
+        assert pool.share(1) == 1
+        assert type(pool.share(1.0)) is float
+        values = {"term_start_date": datetime(2024, 9, 1, 19, tzinfo=timezone(timedelta(hours=9)))}
+        pool.share_items(values, ("term_start_date",))
+        assert values["term_start_date"] is tokyo
+        assert len(pool) == 4
+
+    def test_share_items(self) -> None:
+        """Test that only the named, present and non-None values are replaced."""
+        pool = ValuePool()
+        school = pool.share(_copy("SCH001"))
+        values = {"school_sis_id": _copy("SCH001"), "sis_id": _copy("STU001"), "grade": None}
+
+        pool.share_items(values, ("school_sis_id", "grade", "term_sis_id"))
+
+        assert values["school_sis_id"] is school
+        assert values["grade"] is None
+        assert "term_sis_id" not in values
+        assert len(pool) == 1
+
+    def test_share_fields_of_models_and_records(self) -> None:
+        """Test that fields are replaced on Pydantic models and compact records."""
+        pool = ValuePool()
+        students = [
+            SDSStudent(
+                sis_id=f"STU00{i}",
+                school_sis_id=_copy("SCH001"),
+                username=f"student{i}",
+                first_name="First",
+                last_name="Last",
+                grade=_copy("10"),
+            )
+            for i in range(3)
+        ]
+        record = to_record(students.pop())
+
+        model = pool.share_fields(students[0], ("school_sis_id", "grade"))
+        other = pool.share_fields(students[1], ("school_sis_id", "grade"))
+        shared = pool.share_fields(record, ("school_sis_id", "grade"))
+
+        assert model is students[0]
+        assert other.school_sis_id is model.school_sis_id
+        assert shared.grade is model.grade
+        assert other.sis_id == "STU001"
@@ -1,8 +1,11 @@
 """Unit tests for OneRoster CSV writer."""
 
 import csv
+import io
+import zipfile
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -19,7 +22,7 @@ from sds2roster.models.oneroster import (
     OrgType,
     RoleType,
 )
-from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter, ZipPackage
 
 
 @pytest.fixture
@@ -365,3 +368,97 @@ class TestOneRosterCSVWriter:
         assert manifest_dict["oneroster.version"] == "1.2"
         assert manifest_dict["source.systemName"] == "SDS2Roster"
         assert manifest_dict["source.systemCode"] == "v0.2.0"
+
+    def test_write_records_matches_write_users(
+        self, writer: OneRosterCSVWriter, sample_data_model: OneRosterDataModel, output_dir: Path
+    ) -> None:
+        """Test that write_records writes the same bytes as the model-based writer."""
+        expected = writer.write_users(sample_data_model, file_name="expected_users.csv")
+
+        file_path, count = writer.write_records("users", iter(sample_data_model.users))
+
+        assert count == 1
+        assert file_path == output_dir / "users.csv"
+        assert file_path.read_bytes() == expected.read_bytes()
+
+    def test_write_records_without_records(
+        self, writer: OneRosterCSVWriter, output_dir: Path
+    ) -> None:
+        """Test that write_records does not create a file when there are no records."""
+        file_path, count = writer.write_records("enrollments", iter([]))
+
+        assert file_path is None
+        assert count == 0
+        assert not (output_dir / "enrollments.csv").exists()
+
+    def test_write_records_unknown_file_type(self, writer: OneRosterCSVWriter) -> None:
+        """Test that write_records rejects unknown file types."""
+        with pytest.raises(ValueError, match="Unknown OneRoster file type"):
+            writer.write_records("demographics", [])
+
+    def test_write_all_parallel_matches_sequential(
+        self, sample_data_model: OneRosterDataModel, tmp_path: Path
+    ) -> None:
+        """Test that concurrent writing returns the same mapping and bytes."""
+        sequential = OneRosterCSVWriter(tmp_path / "sequential").write_all(sample_data_model)
+        parallel = OneRosterCSVWriter(tmp_path / "parallel").write_all(
+            sample_data_model, workers=4
+        )
+
+        assert list(parallel) == list(sequential)
+        for file_type, path in sequential.items():
+            assert parallel[file_type] == tmp_path / "parallel" / path.name
+            assert parallel[file_type].read_bytes() == path.read_bytes()
+
+    def test_write_all_parallel_raises_errors(
+        self, writer: OneRosterCSVWriter, sample_data_model: OneRosterDataModel, output_dir: Path
+    ) -> None:
+        """Test that a failing file write is raised from concurrent mode."""
+        (output_dir / "users.csv").mkdir()
+
+        with pytest.raises(IsADirectoryError):
+            writer.write_all(sample_data_model, workers=3)
+
+    def test_write_all_to_sink(
+        self, sample_data_model: OneRosterDataModel, tmp_path: Path
+    ) -> None:
+        """Test that a sink receives the same bytes and output_dir is not created."""
+        written: dict[Path, bytes] = {}
+
+        class MemoryOutput(io.BytesIO):
+            def __init__(self, path: Path) -> None:
+                super().__init__()
+                self.path = path
+
+            def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+                if exc_type is None:
+                    written[self.path] = self.getvalue()
+                self.close()
+
+        local = OneRosterCSVWriter(tmp_path / "local").write_all(sample_data_model)
+        sink_dir = tmp_path / "sink"
+        paths = OneRosterCSVWriter(sink_dir, sink=MemoryOutput).write_all(sample_data_model)
+
+        assert not sink_dir.exists()
+        assert paths == {file_type: sink_dir / path.name for file_type, path in local.items()}
+        assert written == {sink_dir / path.name: path.read_bytes() for path in local.values()}
+
+    def test_write_all_to_zip_package(
+        self, sample_data_model: OneRosterDataModel, tmp_path: Path
+    ) -> None:
+        """Test that concurrent writers take turns on the entries of one zip archive."""
+        local = OneRosterCSVWriter(tmp_path / "local").write_all(sample_data_model)
+        archive = io.BytesIO()
+        archive.close = lambda: None  # type: ignore[method-assign]
+
+        with ZipPackage(archive) as package:
+            OneRosterCSVWriter(tmp_path / "zip", sink=package).write_all(
+                sample_data_model, workers=4
+            )
+
+        with zipfile.ZipFile(archive) as package_file:
+            assert sorted(package_file.namelist()) == sorted(path.name for path in local.values())
+            for path in local.values():
+                assert package_file.read(path.name) == path.read_bytes()
+                assert package_file.getinfo(path.name).compress_type == zipfile.ZIP_DEFLATED
+                assert package_file.getinfo(path.name).extract_version >= zipfile.ZIP64_VERSION
@@ -0,0 +1,148 @@
+"""Unit tests for the streaming conversion pipeline."""
+
+from pathlib import Path
+
+import pytest
+
+from sds2roster.converter import SDSToOneRosterConverter
+from sds2roster.parsers.oneroster_writer import OneRosterCSVWriter
+from sds2roster.parsers.sds_parser import SDSCSVParser
+from sds2roster.pipeline import StreamingPipeline
+
+SDS_FILES = {
+    "school.csv": (
+        "SIS ID,Name,School Number\n"
+        "SCH001,North High,N-001\n"
+        "SCH002,South High,S-002\n"
+    ),
+    "student.csv": (
+        "SIS ID,School SIS ID,Username,First Name,Last Name,Grade,Status\n"
+        "STU001,SCH001,alice,Alice,Able,10,Active\n"
+        "STU002,SCH002,bob,Bob,Baker,11,Inactive\n"
+        "STU003,SCH002,carol,Carol,Cole,12,\n"
+    ),
+    "teacher.csv": (
+        "SIS ID,School SIS ID,Username,First Name,Last Name\n"
+        "TEA001,SCH001,dave,Dave,Dunn\n"
+        "TEA002,SCH002,erin,Erin,Eck\n"
+    ),
+    "section.csv": (
+        "SIS ID,School SIS ID,Section Name,Term SIS ID,Term Name,Term Start Date,"
+        "Term End Date,Course Name,Course Number\n"
+        "SEC001,SCH001,Math P1,T1,Fall,2025-09-01,2025-12-20,Math,MATH1\n"
+        "SEC002,SCH002,Math P2,T1,Fall,2025-09-01,2025-12-20,Math,MATH1\n"
+        "SEC003,SCH002,\"Art, Studio\",T2,Spring,2026-01-10,2026-05-30,,\n"
+    ),
+    "studentEnrollment.csv": (
+        "Section SIS ID,SIS ID\n"
+        "SEC001,STU001\n"
+        "SEC002,STU002\n"
+        "SEC999,STU003\n"
+        "SEC003,STU003\n"
+    ),
+    "teacherRoster.csv": (
+        "Section SIS ID,SIS ID\n"
+        "SEC001,TEA001\n"
+        "SEC003,TEA002\n"
+    ),
+}
+
+
+@pytest.fixture
+def sds_dir(tmp_path: Path) -> Path:
+    """Write a small SDS dataset with duplicate courses and an unknown section."""
+    directory = tmp_path / "sds"
+    directory.mkdir()
+    for file_name, content in SDS_FILES.items():
+        (directory / file_name).write_text(content, encoding="utf-8")
+    return directory
+
+
+def _sds_paths(directory: Path) -> dict[str, Path]:
+    return {
+        "school_file": directory / "school.csv",
+        "student_file": directory / "student.csv",
+        "teacher_file": directory / "teacher.csv",
+        "section_file": directory / "section.csv",
+        "student_enrollment_file": directory / "studentEnrollment.csv",
+        "teacher_roster_file": directory / "teacherRoster.csv",
+    }
+
+
+class TestStreamingPipeline:
+    """Tests for StreamingPipeline."""
+
+    def test_output_matches_in_memory_conversion(self, sds_dir: Path, tmp_path: Path) -> None:
+        """Test that streaming writes the same files and bytes as the in-memory path."""
+        converter = SDSToOneRosterConverter()
+
+        sds_data = SDSCSVParser().parse_all(**_sds_paths(sds_dir))
+        expected_files = OneRosterCSVWriter(tmp_path / "memory").write_all(
+            converter.convert(sds_data)
+        )
+
+        pipeline = StreamingPipeline(
+            SDSCSVParser(), OneRosterCSVWriter(tmp_path / "stream"), converter
+        )
+        result = pipeline.run(**_sds_paths(sds_dir))
+
+        assert list(result.written_files) == list(expected_files)
+        for file_type, expected_path in expected_files.items():
+            assert result.written_files[file_type].read_bytes() == expected_path.read_bytes()
+
+    def test_counts(self, sds_dir: Path, tmp_path: Path) -> None:
+        """Test that row counts reflect deduplication and skipped enrollments."""
+        pipeline = StreamingPipeline(SDSCSVParser(), OneRosterCSVWriter(tmp_path / "out"))
+        result = pipeline.run(**_sds_paths(sds_dir))
+
+        assert result.counts == {
+            "orgs": 2,
+            "users": 5,
+            "courses": 2,
+            "classes": 3,
+            "enrollments": 5,
+            "academicSessions": 2,
+            "roles": 5,
+        }
+
+    def test_empty_entity_file_not_written(self, sds_dir: Path, tmp_path: Path) -> None:
+        """Test that file types without records are skipped like write_all does."""
+        (sds_dir / "teacherRoster.csv").write_text("Section SIS ID,SIS ID\n")
+        (sds_dir / "studentEnrollment.csv").write_text("Section SIS ID,SIS ID\n")
+
+        pipeline = StreamingPipeline(SDSCSVParser(), OneRosterCSVWriter(tmp_path / "out"))
+        result = pipeline.run(**_sds_paths(sds_dir))
+
+        assert result.counts["enrollments"] == 0
+        assert "enrollments" not in result.written_files
+        assert not (tmp_path / "out" / "enrollments.csv").exists()
+        assert "manifest" in result.written_files
+
+    def test_missing_file_raises(self, sds_dir: Path, tmp_path: Path) -> None:
+        """Test that a missing SDS file raises FileNotFoundError."""
+        (sds_dir / "teacher.csv").unlink()
+
+        pipeline = StreamingPipeline(SDSCSVParser(), OneRosterCSVWriter(tmp_path / "out"))
+        with pytest.raises(FileNotFoundError):
+            pipeline.run(**_sds_paths(sds_dir))
+
+    def test_invalid_later_file_leaves_output_unchanged(
+        self, sds_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that an error after the first files were written publishes nothing."""
+        (sds_dir / "teacher.csv").write_text(
+            "SIS ID,School SIS ID,Username,First Name,Last Name\nTEA001,SCH001,dave,,Dunn\n"
+        )
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        (output_dir / "orgs.csv").write_text("previous run\n")
+
+        writer = OneRosterCSVWriter(output_dir)
+        pipeline = StreamingPipeline(SDSCSVParser(), writer)
+        with pytest.raises(ValueError):
+            pipeline.run(**_sds_paths(sds_dir))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["out", "sds"]
+        assert [p.name for p in output_dir.iterdir()] == ["orgs.csv"]
+        assert (output_dir / "orgs.csv").read_text() == "previous run\n"
+        assert writer.output_dir == output_dir
@@ -0,0 +1,80 @@
+"""Unit tests for CPU profiling."""
+
+import pstats
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from sds2roster.profiling import CPUProfileMode, SamplingProfiler, cpu_profile
+
+
+def _busy_loop(seconds: float) -> int:
+    """Keep the CPU busy in a recognizable function."""
+    total = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+class TestSamplingProfiler:
+    """Test suite for SamplingProfiler."""
+
+    def test_collapse_stack(self) -> None:
+        """Test that stacks are collapsed outermost first with file:qualname labels."""
+        profiler = SamplingProfiler()
+
+        def inner() -> str:
+            return profiler._collapse(sys._getframe())
+
+        frames = inner().split(";")
+
+        assert frames[-2:] == [
+            "test_profiling.py:TestSamplingProfiler.test_collapse_stack",
+            "test_profiling.py:TestSamplingProfiler.test_collapse_stack.<locals>.inner",
+        ]
+        assert not any(" " in frame for frame in frames)
+
+    def test_background_sampling(self, tmp_path: Path) -> None:
+        """Test that the sampler thread finds a busy function and writes counts."""
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        _busy_loop(0.2)
+        profiler.stop()
+
+        assert profiler.samples > 10
+        path = profiler.write(tmp_path / "stacks.txt")
+        lines = path.read_text().splitlines()
+        busy = [line for line in lines if "test_profiling.py:_busy_loop" in line]
+        assert busy
+        assert all(line.startswith("thread:MainThread;") for line in busy)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        # The sampler does not sample itself
+        assert not any("SamplingProfiler._run" in line for line in lines)
+
+
+class TestCPUProfile:
+    """Test suite for cpu_profile."""
+
+    def test_cprofile_writes_pstats(self, tmp_path: Path) -> None:
+        """Test that the cProfile mode writes a pstats file."""
+        path = tmp_path / "out.prof"
+
+        with cpu_profile(path):
+            _busy_loop(0.01)
+
+        functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+        assert "_busy_loop" in functions
+
+    def test_sampling_writes_profile_on_error(self, tmp_path: Path) -> None:
+        """Test that the sampling mode writes its file also when the body raises."""
+        path = tmp_path / "stacks.txt"
+
+        with pytest.raises(RuntimeError):
+            with cpu_profile(path, CPUProfileMode.SAMPLING, interval=0.001):
+                _busy_loop(0.05)
+                raise RuntimeError("conversion failed")
+
+        assert "_busy_loop" in path.read_text()
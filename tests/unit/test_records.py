@@ -0,0 +1,76 @@
+"""Unit tests for compact records."""
+
+import pickle
+import sys
+
+from sds2roster.models.oneroster import OneRosterDataModel
+from sds2roster.models.records import (
+    SDSEnrollmentRecord,
+    SDSStudentRecord,
+    is_record,
+    record_type,
+    records_from_tuples,
+    to_model_data,
+    to_models,
+    to_record,
+)
+from sds2roster.models.sds import SDSDataModel, SDSEnrollment, SDSStatus, SDSStudent
+from sds2roster.models.trusted import model_to_tuple
+
+
+def _student() -> SDSStudent:
+    return SDSStudent(
+        sis_id="STU001",
+        school_sis_id="SCH001",
+        username="john.doe",
+        first_name="John",
+        last_name="Doe",
+        grade="10",
+    )
+
+
+class TestRecords:
+    """Test suite for compact records."""
+
+    def test_record_type_mirrors_model(self) -> None:
+        """Test that records have the model's fields and defaults but no __dict__."""
+        record = SDSStudentRecord(sis_id="STU001")
+
+        assert record_type(SDSStudent) is SDSStudentRecord
+        assert SDSStudentRecord.__slots__ == tuple(SDSStudent.model_fields)
+        assert SDSStudentRecord.model_cls is SDSStudent
+        assert record.status is SDSStatus.ACTIVE
+        assert record.grade is None
+        assert not hasattr(record, "__dict__")
+        assert sys.getsizeof(record) < sys.getsizeof(_student().__dict__)
+
+    def test_round_trip(self) -> None:
+        """Test model -> record -> model and tuple conversions."""
+        student = _student()
+
+        record = to_record(student)
+
+        assert record.sis_id == "STU001"
+        assert record.to_model() == student
+        assert model_to_tuple(record) == model_to_tuple(student)
+        assert records_from_tuples(SDSStudent, [model_to_tuple(student)]) == [record]
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_to_models_and_data(self) -> None:
+        """Test building models at the API boundary."""
+        enrollment = SDSEnrollment(section_sis_id="SEC001", sis_id="STU001", role="student")
+        records = [to_record(_student())]
+        data = SDSDataModel.model_construct(
+            students=records,
+            enrollments=[SDSEnrollmentRecord("SEC001", "STU001", "student")],
+        )
+
+        assert to_models([*records, enrollment]) == [_student(), enrollment]
+        assert is_record(records[0])
+        assert not is_record(enrollment)
+
+        models = to_model_data(data)
+
+        assert models == SDSDataModel(students=[_student()], enrollments=[enrollment])
+        model_only = OneRosterDataModel()
+        assert to_model_data(model_only) is model_only
@@ -0,0 +1,149 @@
+"""Unit tests for the columnar SDS CSV parser."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from sds2roster.models.sds import SDSStatus
+from sds2roster.parsers.sds_columnar import SDSColumnarData, SDSColumnarParser
+from sds2roster.parsers.sds_parser import SDSCSVParser
+from sds2roster.utils.validators import ValidationLevel
+
+SDS_FILES = {
+    "school_file": Path("school.csv"),
+    "student_file": Path("student.csv"),
+    "teacher_file": Path("teacher.csv"),
+    "section_file": Path("section.csv"),
+    "student_enrollment_file": Path("studentEnrollment.csv"),
+    "teacher_roster_file": Path("teacherRoster.csv"),
+}
+
+
+@pytest.fixture
+def fixtures_dir() -> Path:
+    """Get path to test fixtures directory."""
+    return Path(__file__).parent.parent / "fixtures" / "sds"
+
+
+@pytest.fixture
+def parser(fixtures_dir: Path) -> SDSColumnarParser:
+    """Create columnar SDS parser with fixtures directory."""
+    return SDSColumnarParser(fixtures_dir)
+
+
+class TestSDSColumnarParser:
+    """Test suite for SDSColumnarParser."""
+
+    def test_parse_all_view_matches_row_parser(
+        self, parser: SDSColumnarParser, fixtures_dir: Path
+    ) -> None:
+        """Test that the data model view equals the row parser's data model."""
+        columnar = parser.parse_all(**SDS_FILES)
+        expected = SDSCSVParser(fixtures_dir).parse_all(**SDS_FILES)
+
+        assert isinstance(columnar, SDSColumnarData)
+        assert columnar.to_data_model() == expected
+        assert columnar.to_data_model(ValidationLevel.FULL) == expected
+
+    def test_frames_have_model_columns(self, parser: SDSColumnarParser) -> None:
+        """Test that frames hold one typed column per model field."""
+        sections = parser.parse_sections(Path("section.csv"))
+
+        assert list(sections.columns[:3]) == ["sis_id", "school_sis_id", "section_name"]
+        assert pd.api.types.is_datetime64_any_dtype(sections["term_start_date"])
+        assert isinstance(sections["status"].dtype, pd.CategoricalDtype)
+        assert pd.api.types.is_string_dtype(sections["sis_id"])
+
+    def test_parse_enrollments_combined(self, parser: SDSColumnarParser) -> None:
+        """Test that student enrollments come before teacher enrollments."""
+        columnar = parser.parse_all(**SDS_FILES)
+
+        roles = columnar.enrollments["role"].tolist()
+        assert roles == sorted(roles)
+        assert set(roles) == {"student", "teacher"}
+
+    def test_extra_columns_are_dropped(self, tmp_path: Path) -> None:
+        """Test that columns without a model field are not kept."""
+        test_file = tmp_path / "school.csv"
+        test_file.write_text("SIS ID,Name,Zip,Phone\nSCH001,Test School,123,456\n")
+
+        schools = SDSColumnarParser().parse_schools(test_file)
+
+        assert list(schools.columns) == ["sis_id", "name", "school_number"]
+        assert schools["school_number"].isna().all()
+
+    def test_status_and_dates_are_vectorized(self, tmp_path: Path) -> None:
+        """Test Status normalization and term date parsing."""
+        test_file = tmp_path / "section.csv"
+        test_file.write_text(
+            "SIS ID,School SIS ID,Section Name,Term Start Date,Status\n"
+            "SEC001,SCH001, Math ,2024-09-01,\n"
+            "SEC002,SCH001,Art,,INACTIVE\n"
+            "SEC003,SCH001,Music,2024-09-01T08:30:00,Active\n"
+        )
+
+        sections = SDSColumnarParser().parse_sections(test_file)
+        empty = pd.DataFrame()
+        models = SDSColumnarData(
+            schools=empty, students=empty, teachers=empty, sections=sections, enrollments=empty
+        )
+
+        assert sections["section_name"].tolist() == ["Math", "Art", "Music"]
+        assert sections["status"].tolist() == ["Active", "Inactive", "Active"]
+        assert models.to_data_model().sections == SDSCSVParser().parse_sections(test_file)
+        assert models.to_data_model().sections[2].term_start_date == datetime(2024, 9, 1, 8, 30)
+        assert models.to_data_model().sections[1].status == SDSStatus.INACTIVE
+
+    def test_empty_required_field_raises_error(self, tmp_path: Path) -> None:
+        """Test that the bulk check names the first empty field, file and row."""
+        test_file = tmp_path / "student.csv"
+        test_file.write_text(
+            "SIS ID,School SIS ID,Username,First Name,Last Name\n"
+            "STU001,SCH001,a,A,One\n"
+            "STU002,SCH001,b,,Two\n"
+            "   ,SCH001,c,C,Three\n"
+        )
+
+        with pytest.raises(
+            ValueError, match=r"Field cannot be empty: first_name \(student.csv, row 2\)"
+        ):
+            SDSColumnarParser().parse_students(test_file)
+
+    def test_missing_required_column_raises_error(self, tmp_path: Path) -> None:
+        """Test that the header is checked for required columns."""
+        test_file = tmp_path / "teacherRoster.csv"
+        test_file.write_text("Section SIS ID\nSEC001\n")
+
+        with pytest.raises(ValueError, match="missing required columns: SIS ID"):
+            SDSColumnarParser().parse_enrollments(test_file, "teacher")
+
+    def test_validation_off_skips_checks(self, tmp_path: Path) -> None:
+        """Test that no checks run when validation is off."""
+        test_file = tmp_path / "school.csv"
+        test_file.write_text("SIS ID,Name\nSCH001,\n")
+
+        schools = SDSColumnarParser(validation=ValidationLevel.OFF).parse_schools(test_file)
+
+        assert schools["name"].tolist() == [""]
+
+    def test_invalid_role_raises_error(self, parser: SDSColumnarParser) -> None:
+        """Test that an invalid role is rejected."""
+        with pytest.raises(ValueError, match="Role must be"):
+            parser.parse_enrollments(Path("studentEnrollment.csv"), "admin")
+
+    def test_file_not_found(self, parser: SDSColumnarParser) -> None:
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            parser.parse_schools(Path("nonexistent.csv"))
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Test that an empty file gives an empty frame."""
+        test_file = tmp_path / "school.csv"
+        test_file.write_text("")
+
+        schools = SDSColumnarParser().parse_schools(test_file)
+
+        assert schools.empty
+        assert list(schools.columns) == ["sis_id", "name", "school_number"]
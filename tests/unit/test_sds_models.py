@@ -268,3 +268,68 @@ class TestSDSDataModel:
         found_student = model.get_student_by_sis_id("STU001")
         assert found_student is not None
         assert found_student.username == "test"
+
+    def test_get_section_by_sis_id_returns_first_match(self) -> None:
+        """Test that duplicate SIS IDs resolve to the first entity, like a linear scan."""
+        first = SDSSection(sis_id="SEC001", school_sis_id="SCH001", section_name="First")
+        second = SDSSection(sis_id="SEC001", school_sis_id="SCH002", section_name="Second")
+        model = SDSDataModel(sections=[first, second])
+
+        found_section = model.get_section_by_sis_id("SEC001")
+        assert found_section is not None
+        assert found_section.section_name == "First"
+
+    def test_index_tracks_appended_entities(self) -> None:
+        """Test that lookups see entities appended after the index was built."""
+        model = SDSDataModel(schools=[SDSSchool(sis_id="SCH001", name="School 1")])
+        assert model.get_school_by_sis_id("SCH002") is None
+
+        model.schools.append(SDSSchool(sis_id="SCH002", name="School 2"))
+
+        found_school = model.get_school_by_sis_id("SCH002")
+        assert found_school is not None
+        assert found_school.name == "School 2"
+
+    def test_index_tracks_reassigned_and_removed_entities(self) -> None:
+        """Test that lookups see list reassignment and removal."""
+        teacher = SDSTeacher(
+            sis_id="TEA001",
+            school_sis_id="SCH001",
+            username="teacher1",
+            first_name="Test",
+            last_name="Teacher",
+        )
+        model = SDSDataModel(teachers=[teacher])
+        assert model.get_teacher_by_sis_id("TEA001") is not None
+
+        model.teachers.pop()
+        assert model.get_teacher_by_sis_id("TEA001") is None
+
+        model.teachers = [teacher]
+        assert model.get_teacher_by_sis_id("TEA001") is teacher
+
+    def test_index_tracks_in_place_replacement(self) -> None:
+        """Test that replacing an indexed entity in place needs a stale hit or invalidation."""
+        model = SDSDataModel(schools=[SDSSchool(sis_id="SCH001", name="School 1")])
+        assert model.get_school_by_sis_id("SCH001") is not None
+
+        model.schools[0] = SDSSchool(sis_id="SCH009", name="School 9")
+        # Misses are trusted until the index is invalidated or a stale hit rebuilds it
+        assert model.get_school_by_sis_id("SCH009") is None
+        assert model.get_school_by_sis_id("SCH001") is None
+        assert model.get_school_by_sis_id("SCH009") is model.schools[0]
+
+        model.schools[0] = SDSSchool(sis_id="SCH010", name="School 10")
+        model.invalidate_indexes()
+        found_school = model.get_school_by_sis_id("SCH010")
+        assert found_school is not None
+        assert found_school.name == "School 10"
+
+    def test_index_does_not_affect_equality(self) -> None:
+        """Test that a built index is ignored by model equality and copies."""
+        model = SDSDataModel(schools=[SDSSchool(sis_id="SCH001", name="School 1")])
+        copy = model.model_copy(deep=True)
+
+        model.get_school_by_sis_id("SCH001")
+
+        assert model == copy
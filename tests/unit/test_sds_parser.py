@@ -1,11 +1,15 @@
 """Unit tests for SDS CSV parser."""
 
+import io
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
+from sds2roster.models.records import SDSStudentRecord, to_model_data
 from sds2roster.models.sds import SDSStatus
 from sds2roster.parsers.sds_parser import SDSCSVParser
+from sds2roster.utils.validators import ValidationLevel
 
 
 @pytest.fixture
@@ -161,3 +165,257 @@ class TestSDSCSVParser:
         schools = parser.parse_schools(test_file)
         assert len(schools) == 1
         assert schools[0].sis_id == "TEST"
+
+    def test_iter_students_is_lazy(self, parser: SDSCSVParser) -> None:
+        """Test that iter_students yields students one at a time in file order."""
+        students = parser.iter_students(Path("student.csv"))
+
+        first = next(students)
+        assert first.sis_id == "STU001"
+        assert [s.sis_id for s in students] == ["STU002", "STU003"]
+
+    def test_iter_enrollments_matches_parse(self, parser: SDSCSVParser) -> None:
+        """Test that iter_enrollments yields the same enrollments as parse_enrollments."""
+        parsed = parser.parse_enrollments(Path("teacherRoster.csv"), "teacher")
+        iterated = list(parser.iter_enrollments(Path("teacherRoster.csv"), "Teacher"))
+
+        assert iterated == parsed
+
+    def test_parse_all_parallel_matches_sequential(self, parser: SDSCSVParser) -> None:
+        """Test that parsing on a process pool yields the same data model."""
+        files = {
+            "school_file": Path("school.csv"),
+            "student_file": Path("student.csv"),
+            "teacher_file": Path("teacher.csv"),
+            "section_file": Path("section.csv"),
+            "student_enrollment_file": Path("studentEnrollment.csv"),
+            "teacher_roster_file": Path("teacherRoster.csv"),
+        }
+
+        sequential = parser.parse_all(**files)
+        parallel = parser.parse_all(**files, workers=3)
+
+        assert parallel == sequential
+        assert parallel.get_section_by_sis_id("SEC002") == sequential.sections[1]
+
+    def test_parse_all_parallel_reports_first_error_in_file_order(
+        self, fixtures_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test that the error of the earliest failing file is raised."""
+        for name in ["school.csv", "student.csv", "section.csv", "studentEnrollment.csv"]:
+            (tmp_path / name).write_bytes((fixtures_dir / name).read_bytes())
+        # teacher.csv is invalid and teacherRoster.csv is missing
+        (tmp_path / "teacher.csv").write_text(
+            "SIS ID,School SIS ID,Username,First Name,Last Name\nTEA001,SCH001,,John,Smith\n"
+        )
+
+        parser = SDSCSVParser(tmp_path)
+        files = {
+            "school_file": Path("school.csv"),
+            "student_file": Path("student.csv"),
+            "teacher_file": Path("teacher.csv"),
+            "section_file": Path("section.csv"),
+            "student_enrollment_file": Path("studentEnrollment.csv"),
+            "teacher_roster_file": Path("teacherRoster.csv"),
+        }
+
+        for _ in range(3):
+            with pytest.raises(ValueError, match="Field cannot be empty"):
+                parser.parse_all(**files, workers=6)
+
+    @pytest.mark.parametrize("validation", list(ValidationLevel))
+    def test_parse_all_chunked_matches_sequential(
+        self, fixtures_dir: Path, tmp_path: Path, validation: ValidationLevel
+    ) -> None:
+        """Test that byte ranges split inside and around quoted newlines keep row order."""
+        for path in fixtures_dir.iterdir():
+            (tmp_path / path.name).write_bytes(path.read_bytes())
+        rows = [
+            f'SEC{i:03d},SCH001,Section {i},,,,,,,,"{description}"'
+            for i, description in enumerate(
+                ["plain", "two\nlines", 'say ""hi""', "", "crlf\r\nline", '"",\n\n""'] * 20
+            )
+        ]
+        (tmp_path / "section.csv").write_text(
+            "SIS ID,School SIS ID,Section Name,Section Number,Term SIS ID,Term Name,"
+            "Term Start Date,Term End Date,Course Name,Course Number,Course Description\n"
+            + "\n".join(rows)
+            + "\n",
+            newline="",
+        )
+
+        parser = SDSCSVParser(tmp_path, validation=validation)
+        files = {
+            "school_file": Path("school.csv"),
+            "student_file": Path("student.csv"),
+            "teacher_file": Path("teacher.csv"),
+            "section_file": Path("section.csv"),
+            "student_enrollment_file": Path("studentEnrollment.csv"),
+            "teacher_roster_file": Path("teacherRoster.csv"),
+        }
+
+        sequential = parser.parse_all(**files)
+        for chunk_size in (1, 100, 1000):
+            assert parser.parse_all(**files, workers=3, chunk_size=chunk_size) == sequential
+        assert sequential.sections[1].course_description == "two\nlines"
+
+    def test_parse_all_chunked_error_row_counts_from_file_start(self, tmp_path: Path) -> None:
+        """Test that an error in a later byte range reports its row in the whole file."""
+        rows = [f"SCH{i:03d},School {i}" for i in range(50)]
+        rows[42] = "SCH042,"
+        (tmp_path / "school.csv").write_text("SIS ID,Name\n" + "\n".join(rows) + "\n")
+
+        parser = SDSCSVParser(tmp_path, validation=ValidationLevel.SCHEMA_ONCE)
+        files = {
+            "school_file": Path("school.csv"),
+            "student_file": Path("student.csv"),
+            "teacher_file": Path("teacher.csv"),
+            "section_file": Path("section.csv"),
+            "student_enrollment_file": Path("studentEnrollment.csv"),
+            "teacher_roster_file": Path("teacherRoster.csv"),
+        }
+
+        with pytest.raises(ValueError, match=r"Field cannot be empty: name \(school.csv, row 43\)"):
+            parser.parse_all(**files, workers=2, chunk_size=64)
+
+    @pytest.mark.parametrize("validation", [ValidationLevel.SCHEMA_ONCE, ValidationLevel.OFF])
+    def test_trusted_levels_match_full_validation(
+        self, fixtures_dir: Path, validation: ValidationLevel
+    ) -> None:
+        """Test that the cheaper validation levels build equal models."""
+        files = {
+            "school_file": Path("school.csv"),
+            "student_file": Path("student.csv"),
+            "teacher_file": Path("teacher.csv"),
+            "section_file": Path("section.csv"),
+            "student_enrollment_file": Path("studentEnrollment.csv"),
+            "teacher_roster_file": Path("teacherRoster.csv"),
+        }
+
+        full = SDSCSVParser(fixtures_dir).parse_all(**files)
+        trusted = SDSCSVParser(fixtures_dir, validation=validation).parse_all(**files)
+        parallel = SDSCSVParser(fixtures_dir, validation=validation).parse_all(**files, workers=2)
+
+        assert trusted == full
+        assert parallel == full
+        assert trusted.get_student_by_sis_id("STU002") == full.students[1]
+
+    @pytest.mark.parametrize("validation", list(ValidationLevel))
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_compact_records_match_models(
+        self, fixtures_dir: Path, validation: ValidationLevel, workers: Optional[int]
+    ) -> None:
+        """Test that compact parsing holds records equal to the models."""
+        files = {
+            "school_file": Path("school.csv"),
+            "student_file": Path("student.csv"),
+            "teacher_file": Path("teacher.csv"),
+            "section_file": Path("section.csv"),
+            "student_enrollment_file": Path("studentEnrollment.csv"),
+            "teacher_roster_file": Path("teacherRoster.csv"),
+        }
+
+        models = SDSCSVParser(fixtures_dir, validation=validation).parse_all(**files)
+        compact = SDSCSVParser(fixtures_dir, validation=validation, compact=True).parse_all(
+            **files, workers=workers
+        )
+
+        assert type(compact.students[0]) is SDSStudentRecord
+        assert compact.get_student_by_sis_id("STU002") is compact.students[1]
+        assert to_model_data(compact) == models
+
+    @pytest.mark.parametrize("validation", list(ValidationLevel))
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_repeated_values_are_shared(
+        self, fixtures_dir: Path, validation: ValidationLevel, compact: bool
+    ) -> None:
+        """Test that entities repeating a low-cardinality value share one object."""
+        parser = SDSCSVParser(fixtures_dir, validation=validation, compact=compact)
+
+        students = parser.parse_students(Path("student.csv"))
+        sections = parser.parse_sections(Path("section.csv"))
+        enrollments = parser.parse_enrollments(Path("studentEnrollment.csv"))
+
+        assert students[0].school_sis_id == "SCH001"
+        assert students[0].school_sis_id is students[1].school_sis_id
+        assert sections[0].school_sis_id is students[0].school_sis_id
+        assert enrollments[0].section_sis_id is enrollments[1].section_sis_id
+        assert enrollments[0].section_sis_id is sections[0].sis_id
+
+    def test_parse_all_from_streams(self, fixtures_dir: Path) -> None:
+        """Test that text streams parse like paths, also when workers are requested."""
+        names = {
+            "school_file": "school.csv",
+            "student_file": "student.csv",
+            "teacher_file": "teacher.csv",
+            "section_file": "section.csv",
+            "student_enrollment_file": "studentEnrollment.csv",
+            "teacher_roster_file": "teacherRoster.csv",
+        }
+        expected = SDSCSVParser(fixtures_dir).parse_all(
+            **{argument: Path(name) for argument, name in names.items()}
+        )
+        streams = {
+            argument: io.StringIO((fixtures_dir / name).read_text(encoding="utf-8"))
+            for argument, name in names.items()
+        }
+
+        # Streams cannot be handed to worker processes, so they are parsed here
+        assert SDSCSVParser().parse_all(**streams, workers=2) == expected
+        assert not any(stream.closed for stream in streams.values())
+
+    def test_stream_errors_name_the_stream(self, tmp_path: Path) -> None:
+        """Test that errors in a named stream refer to its file name."""
+        test_file = tmp_path / "school.csv"
+        test_file.write_text("SIS ID,Name\nSCH001,School 1\n,School 2\n")
+        parser = SDSCSVParser(validation=ValidationLevel.SCHEMA_ONCE)
+
+        with open(test_file, encoding="utf-8") as stream:
+            with pytest.raises(ValueError, match=r"school.csv, row 2"):
+                parser.parse_schools(stream)
+
+    def test_trusted_levels_strip_whitespace(self, tmp_path: Path) -> None:
+        """Test that values are stripped like Pydantic's str_strip_whitespace."""
+        test_file = tmp_path / "school.csv"
+        test_file.write_text("SIS ID,Name,School Number\n SCH001 , Test School ,  \n")
+
+        full = SDSCSVParser().parse_schools(test_file)
+        schema_once = SDSCSVParser(validation=ValidationLevel.SCHEMA_ONCE).parse_schools(test_file)
+
+        assert schema_once == full
+        assert schema_once[0].sis_id == "SCH001"
+        assert schema_once[0].school_number == ""
+
+    def test_schema_once_reports_empty_required_field(self, tmp_path: Path) -> None:
+        """Test that the bulk check names the field, file and row."""
+        test_file = tmp_path / "teacher.csv"
+        test_file.write_text(
+            "SIS ID,School SIS ID,Username,First Name,Last Name\n"
+            "TEA001,SCH001,jsmith,John,Smith\n"
+            "TEA002,SCH001,  ,Jane,Doe\n"
+        )
+        parser = SDSCSVParser(validation=ValidationLevel.SCHEMA_ONCE)
+
+        with pytest.raises(
+            ValueError, match=r"Field cannot be empty: username \(teacher.csv, row 2\)"
+        ):
+            parser.parse_teachers(test_file)
+
+    def test_schema_once_reports_missing_columns(self, tmp_path: Path) -> None:
+        """Test that the header is checked before any row is read."""
+        test_file = tmp_path / "studentEnrollment.csv"
+        test_file.write_text("Section SIS ID,Student SIS ID\nSEC001,STU001\n")
+        parser = SDSCSVParser(validation=ValidationLevel.SCHEMA_ONCE)
+
+        with pytest.raises(ValueError, match="missing required columns: SIS ID"):
+            parser.parse_enrollments(test_file)
+
+    def test_validation_off_skips_checks(self, tmp_path: Path) -> None:
+        """Test that no checks run when validation is off."""
+        test_file = tmp_path / "school.csv"
+        test_file.write_text("SIS ID,Name\nSCH001,\n")
+
+        schools = SDSCSVParser(validation=ValidationLevel.OFF).parse_schools(test_file)
+
+        assert schools[0].sis_id == "SCH001"
+        assert schools[0].name == ""
@@ -1,10 +1,26 @@
 """Unit tests for Azure Table Storage client."""
 
+import threading
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from sds2roster.azure.table_storage import TableStorageClient
+from sds2roster.azure.table_storage import TableStorageClient, reverse_time_key
+
+
+class FakePages:
+    """Page iterator of a query returning one page, as ItemPaged.by_page does."""
+
+    def __init__(self, entities, continuation_token=None):
+        self.pages = iter([entities])
+        self.continuation_token = continuation_token
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.pages)
 
 
 @pytest.fixture
@@ -109,10 +125,12 @@ def test_get_conversion(mock_table_service):
 def test_list_conversions(mock_table_service):
     """Test listing conversions."""
     mock_table = mock_table_service["table"]
-    mock_table.query_entities.return_value = [
-        {"PartitionKey": "SDS", "RowKey": "id1", "Status": "success"},
-        {"PartitionKey": "SDS", "RowKey": "id2", "Status": "failed"},
-    ]
+    mock_table.query_entities.return_value.by_page.return_value = FakePages(
+        [
+            {"PartitionKey": "SDS", "RowKey": "id1", "Status": "success"},
+            {"PartitionKey": "SDS", "RowKey": "id2", "Status": "failed"},
+        ]
+    )
 
     client = TableStorageClient(
         connection_string="DefaultEndpointsProtocol=https;AccountName=test"
@@ -121,6 +139,87 @@ def test_list_conversions(mock_table_service):
 
     assert len(entities) == 2
     assert entities[0]["Status"] == "success"
+    args, kwargs = mock_table.query_entities.call_args
+    assert args == ("PartitionKey eq @source_type",)
+    assert kwargs["parameters"] == {"source_type": "SDS"}
+    assert kwargs["results_per_page"] == 100
+
+
+def test_list_conversions_fetches_only_limit(mock_table_service):
+    """Test that a short page is completed by a request for the missing records only."""
+    mock_table = mock_table_service["table"]
+    resume = {"PartitionKey": "SDS", "RowKey": "id2"}
+    last = {"PartitionKey": "SDS", "RowKey": "id3"}
+    mock_table.query_entities.return_value.by_page.side_effect = [
+        FakePages([{"RowKey": "id1"}, {"RowKey": "id2"}], resume),
+        FakePages([{"RowKey": "id3"}], last),
+    ]
+
+    client = TableStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    entities, token = client.list_conversions_page(
+        status="failed", limit=3, select=["RowKey", "Status"]
+    )
+
+    assert [entity["RowKey"] for entity in entities] == ["id1", "id2", "id3"]
+    calls = mock_table.query_entities.call_args_list
+    assert [call.kwargs["results_per_page"] for call in calls] == [3, 1]
+    assert calls[0].args == ("Status eq @status",)
+    assert calls[0].kwargs["select"] == ["RowKey", "Status"]
+    by_page = mock_table.query_entities.return_value.by_page.call_args_list
+    assert [call.kwargs["continuation_token"] for call in by_page] == [None, resume]
+
+    # The token continues after the last record returned
+    mock_table.query_entities.return_value.by_page.side_effect = [FakePages([{"RowKey": "id4"}])]
+    entities, next_token = client.list_conversions_page(limit=3, continuation_token=token)
+
+    assert [entity["RowKey"] for entity in entities] == ["id4"]
+    assert next_token is None
+    assert mock_table.query_entities.call_args.args == (None,)
+    assert mock_table.query_entities.return_value.by_page.call_args.kwargs == {
+        "continuation_token": last
+    }
+
+
+def test_list_conversions_invalid_token(mock_table_service):
+    """Test that a token not returned by list_conversions_page is rejected."""
+    client = TableStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+
+    with pytest.raises(ValueError, match="Invalid continuation token"):
+        client.list_conversions_page(continuation_token="not-a-token")
+    mock_table_service["table"].query_entities.assert_not_called()
+
+
+def test_log_conversion_newest_first(mock_table_service):
+    """Test that reverse-time RowKeys sort newer conversions first."""
+    mock_table = mock_table_service["table"]
+    client = TableStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test",
+        newest_first=True,
+    )
+
+    entity = client.log_conversion(
+        conversion_id="job-2", source_type="SDS", target_type="OneRoster", status="success"
+    )
+
+    assert entity["RowKey"].endswith("_job-2")
+    assert entity["ConversionId"] == "job-2"
+    older = reverse_time_key("job-1", datetime.now(UTC) - timedelta(seconds=1))
+    assert entity["RowKey"] < older
+    assert len(older.split("_")[0]) == 19
+
+    # Lookups by conversion ID find the RowKey through the ConversionId property
+    mock_table.query_entities.return_value = iter([{"RowKey": entity["RowKey"]}])
+    client.get_conversion(conversion_id="job-2", source_type="SDS")
+
+    assert mock_table.query_entities.call_args.kwargs["parameters"] == {
+        "source_type": "SDS",
+        "conversion_id": "job-2",
+    }
+    mock_table.get_entity.assert_called_once_with(partition_key="SDS", row_key=entity["RowKey"])
 
 
 def test_delete_conversion(mock_table_service):
@@ -150,6 +249,9 @@ def test_get_conversion_stats(mock_table_service):
     )
     stats = client.get_conversion_stats(source_type="SDS")
 
+    kwargs = mock_table.query_entities.call_args.kwargs
+    assert kwargs["select"] == ["Status"]
+    assert kwargs["results_per_page"] == 1000
     assert stats["total"] == 4
     assert stats["success"] == 2
     assert stats["failed"] == 1
@@ -188,20 +290,62 @@ def test_get_conversion_not_found(mock_table_service):
 
 
 def test_cleanup_old_records(mock_table_service):
-    """Test cleaning up old records."""
+    """Test that old records are selected by the service and deleted in batches."""
     mock_table = mock_table_service["table"]
-    
-    # Mock old entities
-    old_entity = {
-        "PartitionKey": "SDS",
-        "RowKey": "old-job",
-        "Timestamp": MagicMock(timestamp=MagicMock(return_value=0))
-    }
-    mock_table.list_entities.return_value = [old_entity]
+    old_entities = [{"PartitionKey": "SDS", "RowKey": f"job-{i:03d}"} for i in range(230)] + [
+        {"PartitionKey": "SDS_counts", "RowKey": f"job-{i:03d}"} for i in range(5)
+    ]
+    mock_table.query_entities.return_value = iter(old_entities)
 
     client = TableStorageClient(
         connection_string="DefaultEndpointsProtocol=https;AccountName=test"
     )
     deleted = client.cleanup_old_records(days=30)
 
-    assert deleted >= 0
+    assert deleted == 235
+    kwargs = mock_table.query_entities.call_args.kwargs
+    assert kwargs["query_filter"] == "Timestamp lt @cutoff"
+    cutoff_age = datetime.now(UTC) - kwargs["parameters"]["cutoff"]
+    assert timedelta(days=30) <= cutoff_age < timedelta(days=30, minutes=1)
+    assert kwargs["select"] == ["PartitionKey", "RowKey"]
+    mock_table.list_entities.assert_not_called()
+    mock_table.delete_entity.assert_not_called()
+
+    batches = [call.args[0] for call in mock_table.submit_transaction.call_args_list]
+    assert [len(batch) for batch in batches] == [100, 100, 30, 5]
+    assert all(len({keys["PartitionKey"] for _, keys in batch}) == 1 for batch in batches)
+    assert batches[3][0] == ("delete", {"PartitionKey": "SDS_counts", "RowKey": "job-000"})
+
+
+def test_cleanup_old_records_concurrent(mock_table_service):
+    """Test that transactions run concurrently and every record is deleted once."""
+    mock_table = mock_table_service["table"]
+    mock_table.query_entities.return_value = iter(
+        {"PartitionKey": f"P{i % 4}", "RowKey": f"job-{i:04d}"}
+        for i in sorted(range(1000), key=lambda i: i % 4)
+    )
+    barrier = threading.Barrier(2, timeout=5)
+    lock = threading.Lock()
+    started = 0
+    deleted_keys: list[tuple[str, str]] = []
+
+    def submit_transaction(batch):
+        nonlocal started
+        with lock:
+            started += 1
+            first_two = started <= 2
+        # The first two transactions only finish if they run at the same time
+        if first_two:
+            barrier.wait()
+        with lock:
+            deleted_keys.extend((keys["PartitionKey"], keys["RowKey"]) for _, keys in batch)
+
+    mock_table.submit_transaction.side_effect = submit_transaction
+
+    client = TableStorageClient(
+        connection_string="DefaultEndpointsProtocol=https;AccountName=test"
+    )
+    deleted = client.cleanup_old_records(days=30, workers=4)
+
+    assert deleted == 1000
+    assert len(set(deleted_keys)) == 1000
@@ -0,0 +1,52 @@
+"""Unit tests for trusted model construction."""
+
+from sds2roster.models.oneroster import OneRosterUser
+from sds2roster.models.sds import SDSEnrollment, SDSStatus, SDSStudent
+from sds2roster.models.trusted import TrustedModelBuilder
+
+
+class TestTrustedModelBuilder:
+    """Test suite for TrustedModelBuilder."""
+
+    def test_build_equals_validated_model(self) -> None:
+        """Test that built models compare equal to validated ones."""
+        values = {
+            "sis_id": " STU001 ",
+            "school_sis_id": "SCH001",
+            "username": "john.doe",
+            "first_name": "John",
+            "last_name": "Doe",
+            "middle_name": " ",
+            "grade": None,
+        }
+
+        built = TrustedModelBuilder(SDSStudent)(**values)
+
+        assert built == SDSStudent(**values)
+        assert built.sis_id == "STU001"
+        assert built.middle_name == ""
+        assert built.status == SDSStatus.ACTIVE
+        assert list(built.__dict__) == list(SDSStudent.model_fields)
+
+    def test_fields_set_matches_model_construct(self) -> None:
+        """Test that only passed fields are marked as set."""
+        built = TrustedModelBuilder(SDSEnrollment)(section_sis_id="SEC001", sis_id="STU001")
+
+        assert built.model_fields_set == {"section_sis_id", "sis_id"}
+        assert built.role is None
+
+    def test_required_fields(self) -> None:
+        """Test that required string fields are derived from the model."""
+        assert TrustedModelBuilder(SDSStudent).required_fields == (
+            "sis_id",
+            "school_sis_id",
+            "username",
+            "first_name",
+            "last_name",
+        )
+
+    def test_strip_disabled(self) -> None:
+        """Test that stripping can be turned off for already clean values."""
+        builder = TrustedModelBuilder(OneRosterUser, strip=False)
+
+        assert builder.clean({"username": " x "}) == {"username": " x "}
@@ -1,14 +1,22 @@
 """Unit tests for validation utilities."""
 
+import uuid
 from datetime import datetime
 
 import pytest
 
 from sds2roster.utils.validators import (
+    ONEROSTER_NAMESPACE,
+    ValidationLevel,
     create_metadata_json,
+    create_metadata_jsons,
     create_user_ids_json,
+    create_user_ids_jsons,
+    find_empty_value,
     format_iso8601,
     generate_guid,
+    generate_guid_cached,
+    generate_guids,
     sanitize_string,
     validate_date,
     validate_email,
@@ -54,6 +62,61 @@ class TestGenerateGuid:
         with pytest.raises(ValueError, match="sis_id cannot be empty"):
             generate_guid("org", "")
 
+    def test_generate_guid_matches_uuid5(self) -> None:
+        """Test that GUIDs are identical to uuid.uuid5 over "<type>:<sis_id>"."""
+        for sis_id in ["SCH001", "学校-01", "a,b \"quoted\"", "x" * 200]:
+            expected = str(uuid.uuid5(ONEROSTER_NAMESPACE, f"user:{sis_id}"))
+            assert generate_guid("user", sis_id) == expected
+
+
+class TestGenerateGuidCached:
+    """Tests for memoized GUID generation."""
+
+    def test_matches_generate_guid(self) -> None:
+        """Test that cached GUIDs equal uncached GUIDs."""
+        assert generate_guid_cached("org", "SCH001") == generate_guid("org", "SCH001")
+
+    def test_returns_shared_object(self) -> None:
+        """Test that repeated calls return the same string object."""
+        assert generate_guid_cached("org", "SCH042") is generate_guid_cached("org", "SCH042")
+
+    def test_empty_sis_id_raises_error(self) -> None:
+        """Test that validation errors are raised and not cached."""
+        with pytest.raises(ValueError, match="sis_id cannot be empty"):
+            generate_guid_cached("org", "")
+        with pytest.raises(ValueError, match="sis_id cannot be empty"):
+            generate_guid_cached("org", "")
+
+
+class TestGenerateGuids:
+    """Tests for batched GUID generation."""
+
+    def test_matches_generate_guid(self) -> None:
+        """Test that batched GUIDs equal per-ID GUIDs in input order."""
+        sis_ids = ["STU003", "STU001", "STU002", "STU001"]
+
+        assert generate_guids("user", sis_ids) == [generate_guid("user", s) for s in sis_ids]
+
+    def test_accepts_iterables(self) -> None:
+        """Test that any iterable of SIS IDs is accepted."""
+        assert generate_guids("class", (f"SEC{i}" for i in range(3))) == [
+            generate_guid("class", f"SEC{i}") for i in range(3)
+        ]
+
+    def test_empty_input(self) -> None:
+        """Test that an empty input yields an empty list."""
+        assert generate_guids("org", []) == []
+
+    def test_empty_entity_type_raises_error(self) -> None:
+        """Test that empty entity type raises error."""
+        with pytest.raises(ValueError, match="entity_type cannot be empty"):
+            generate_guids("", ["SCH001"])
+
+    def test_empty_sis_id_raises_error(self) -> None:
+        """Test that an empty SIS ID in the batch raises error."""
+        with pytest.raises(ValueError, match="sis_id cannot be empty"):
+            generate_guids("org", ["SCH001", ""])
+
 
 class TestValidateGuid:
     """Tests for GUID validation."""
@@ -240,3 +303,55 @@ class TestCreateUserIdsJson:
         assert len(parsed) == 1
         assert parsed[0]["type"] == "sisId"
         assert parsed[0]["identifier"] == "STU001"
+
+
+class TestBatchJson:
+    """Tests for batched metadata and userIds JSON creation."""
+
+    SIS_IDS = ["SCH001", 'quote " and \\ backslash', "日本語", "tab\there"]
+
+    def test_create_metadata_jsons_matches_single(self) -> None:
+        """Test that batched metadata equals create_metadata_json per SIS ID."""
+        assert create_metadata_jsons(self.SIS_IDS) == [
+            create_metadata_json(sis_id) for sis_id in self.SIS_IDS
+        ]
+
+    def test_create_user_ids_jsons_matches_single(self) -> None:
+        """Test that batched userIds equal create_user_ids_json per SIS ID."""
+        assert create_user_ids_jsons(self.SIS_IDS) == [
+            create_user_ids_json(sis_id) for sis_id in self.SIS_IDS
+        ]
+        assert create_user_ids_jsons(["T1"], "customId") == [
+            create_user_ids_json("T1", "customId")
+        ]
+
+
+class TestFindEmptyValue:
+    """Tests for the bulk required-field check."""
+
+    def test_no_empty_values(self) -> None:
+        """Test that valid rows pass."""
+        rows = [{"sis_id": "S1", "name": "A"}, {"sis_id": "S2", "name": "B"}]
+        assert find_empty_value(rows, ["sis_id", "name"]) is None
+
+    def test_returns_first_empty_row(self) -> None:
+        """Test that the earliest row wins across fields."""
+        rows = [
+            {"sis_id": "S1", "name": "A"},
+            {"sis_id": "S2", "name": ""},
+            {"sis_id": None, "name": "C"},
+        ]
+        assert find_empty_value(rows, ["sis_id", "name"]) == (1, "name")
+
+    def test_empty_batch(self) -> None:
+        """Test that an empty batch passes."""
+        assert find_empty_value([], ["sis_id"]) is None
+
+
+class TestValidationLevel:
+    """Tests for validation levels."""
+
+    def test_values(self) -> None:
+        """Test that levels parse from their CLI names."""
+        assert ValidationLevel("schema-once") is ValidationLevel.SCHEMA_ONCE
+        assert [level.value for level in ValidationLevel] == ["full", "schema-once", "off"]